@@ -18,6 +18,7 @@
 from python_path import PythonPath
 
 with PythonPath('py_matter_idl', relative_to=__file__):
+    from matter.idl.generators.cache import GeneratorCache, RecordingStorage
     from matter.idl.generators.path_resolution import expand_path_for_idl
     from matter.idl.generators.registry import GENERATORS, CodeGenerator
     from matter.idl.generators.storage import FileSystemGeneratorStorage, GeneratorStorage
@@ -97,10 +98,17 @@ __LOG_LEVELS__ = {
     type=click.Path(exists=True),
     default=None,
     help='A file containing all expected outputs. Script will fail if outputs do not match')
+@click.option(
+    '--cache-dir',
+    type=click.Path(file_okay=False),
+    default=None,
+    help='A directory to cache generated outputs in. Generation from unchanged inputs (IDL, generator, options '
+         'and templates) restores the cached outputs without parsing or rendering. Parsed IDL files are '
+         'cached there as well.')
 @click.argument(
     'idl_path',
     type=click.Path(exists=True))
-def main(log_level, generator, option, output_dir, dry_run, name_only, expected_outputs, idl_path):
+def main(log_level, generator, option, output_dir, dry_run, name_only, expected_outputs, cache_dir, idl_path):
     """
     Parses MATTER IDL files (.matter) and performs SDK code generation
     as set up by the program arguments.
@@ -120,9 +128,6 @@ def main(log_level, generator, option, output_dir, dry_run, name_only, expected_
     else:
         storage = FileSystemGeneratorStorage(output_dir)
 
-    logging.info("Parsing idl from %s" % idl_path)
-    idl_tree = CreateParser().parse(open(idl_path, "rt").read(), file_name=idl_path)
-
     plugin_module = None
     if generator.startswith('custom:'):
         # check that the plugin path is provided
@@ -144,6 +149,21 @@ def main(log_level, generator, option, output_dir, dry_run, name_only, expected_
         key, value = o.split(':')
         extra_args[key] = value
 
+    # Custom generators load code and templates the cache does not know about.
+    cache = None
+    if cache_dir and not dry_run and generator != 'CUSTOM':
+        cache = GeneratorCache(cache_dir)
+        cache_key = cache.key(idl_path, generator, extra_args, expected_outputs)
+        restored = cache.restore(cache_key, storage)
+        cache.log_stats()
+        if restored:
+            logging.info("Restored outputs of %s for %s from the cache" % (generator, idl_path))
+            return
+        storage = RecordingStorage(storage)
+
+    logging.info("Parsing idl from %s" % idl_path)
+    idl_tree = CreateParser(cache_directory=cache_dir).parse(open(idl_path, "rt").read(), file_name=idl_path)
+
     logging.info("Running code generator %s" % generator)
     generator = CodeGenerator.FromString(generator).Create(storage, idl=idl_tree, plugin_module=plugin_module, **extra_args)
     generator.render(dry_run)
@@ -170,6 +190,9 @@ def main(log_level, generator, option, output_dir, dry_run, name_only, expected_
 
                 sys.exit(1)
 
+    if cache:
+        cache.store(cache_key, storage.outputs)
+
     logging.info("Done")
 
 
@@ -29,6 +29,7 @@ except ImportError:
     from pregenerate import FindPregenerationTargets, TargetFilter
 
 from pregenerate.executors import DryRunner, ShellRunner
+from pregenerate.in_process import GenerateInProcess
 from pregenerate.type_definitions import IdlFileType
 
 try:
@@ -65,6 +66,11 @@ def _ParallelGenerateOne(arg):
     '--parallel/--no-parallel',
     default=True,
     help='Do parallel/multiprocessing codegen.')
+@click.option(
+    '--in-process/--no-in-process',
+    default=False,
+    help='Run the code generators in this process (or its worker pool) instead of a codegen.py process per target, '
+         'parsing every .matter file once for all its generators.')
 @click.option(
     '--dry-run/--no-dry-run',
     default=False,
@@ -89,7 +95,7 @@ def _ParallelGenerateOne(arg):
     multiple=True,
     help='Path to an external app root (where .zap/.matter files exist).')
 @click.argument('output_dir')
-def main(log_level, parallel, dry_run, generator, input_glob, sdk_root, external_root, output_dir):
+def main(log_level, parallel, in_process, dry_run, generator, input_glob, sdk_root, external_root, output_dir):
     if _has_coloredlogs:
         coloredlogs.install(level=__LOG_LEVELS__[
                             log_level], fmt='%(asctime)s %(levelname)-7s %(message)s')
@@ -128,7 +134,9 @@ def main(log_level, parallel, dry_run, generator, input_glob, sdk_root, external
     targets = FindPregenerationTargets(sdk_root, external_root, filter, runner)
 
     runner.ensure_directory_exists(output_dir)
-    if parallel:
+    if in_process:
+        GenerateInProcess(targets, output_dir, parallel=parallel, dry_run=dry_run)
+    elif parallel:
         target_and_dir = zip(targets, itertools.repeat(output_dir))
         with multiprocessing.Pool() as pool:
             for _ in pool.imap_unordered(_ParallelGenerateOne, target_and_dir):
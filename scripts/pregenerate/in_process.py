@@ -0,0 +1,146 @@
+# Copyright (c) 2026 Project CHIP Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Runs pre-generation targets without a `codegen.py` process per target.
+
+Codegen targets are grouped by their `.matter` file: every group is handled by
+a single task, which parses the IDL once and renders all the generators of the
+group from the same parsed `Idl`. Tasks run in a pool of worker processes, so
+jinja and lark are only imported once per worker. ZAP targets still run
+`generate.py`, as tasks of the same pool.
+"""
+
+import contextlib
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from .using_codegen import CodegenTarget
+
+try:
+    from matter.idl.matter_idl_parser import CreateParser
+except ImportError:
+    sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'py_matter_idl')))
+    from matter.idl.matter_idl_parser import CreateParser
+
+
+@dataclass
+class StageTiming:
+    count: int = 0
+    seconds: float = 0
+
+
+@dataclass
+class GenerationTimings:
+    """Time spent in every stage of the generation, summed over all the tasks"""
+    stages: Dict[str, StageTiming] = field(default_factory=dict)
+
+    @contextlib.contextmanager
+    def Measure(self, stage: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            timing = self.stages.setdefault(stage, StageTiming())
+            timing.count += 1
+            timing.seconds += time.perf_counter() - start
+
+    def Merge(self, other: 'GenerationTimings'):
+        for stage, timing in other.stages.items():
+            total = self.stages.setdefault(stage, StageTiming())
+            total.count += timing.count
+            total.seconds += timing.seconds
+
+    def Log(self, wall_seconds: float):
+        for stage, timing in sorted(self.stages.items(), key=lambda item: -item[1].seconds):
+            logging.info(f"  {stage:<14} {timing.count:4d} runs, {timing.seconds:8.2f}s")
+        logging.info(f"  {'total':<14} {sum(timing.seconds for timing in self.stages.values()):19.2f}s "
+                     f"in {wall_seconds:.2f}s elapsed")
+
+
+@dataclass
+class _Task:
+    targets: List
+    output_dir: str
+    dry_run: bool
+
+
+def _InitWorker():
+    # codegen.py runs with `--log-level fatal`: keep the generators as quiet.
+    logging.getLogger('matter.idl').setLevel(logging.WARNING)
+
+
+def _RunTask(task: _Task) -> GenerationTimings:
+    timings = GenerationTimings()
+    if not isinstance(task.targets[0], CodegenTarget):
+        for target in task.targets:
+            with timings.Measure('zap'):
+                target.Generate(task.output_dir)
+        return timings
+
+    idl_path = task.targets[0].idl.full_path
+    with timings.Measure('parse'):
+        with open(idl_path, 'rt') as f:
+            idl_tree = CreateParser().parse(f.read(), file_name=idl_path)
+
+    for target in task.targets:
+        with timings.Measure(target.generator):
+            target.GenerateFromIdl(task.output_dir, idl_tree, task.dry_run)
+    return timings
+
+
+def _CreateTasks(targets, output_dir: str, dry_run: bool) -> List[_Task]:
+    codegen_targets: Dict[str, List[CodegenTarget]] = {}
+    tasks = []
+    for target in targets:
+        if isinstance(target, CodegenTarget):
+            codegen_targets.setdefault(target.idl.full_path, []).append(target)
+        else:
+            tasks.append(_Task(targets=[target], output_dir=output_dir, dry_run=dry_run))
+
+    # Largest files first, for the pool to end with short tasks.
+    for path in sorted(codegen_targets, key=lambda path: -os.path.getsize(path)):
+        tasks.append(_Task(targets=codegen_targets[path], output_dir=output_dir, dry_run=dry_run))
+    return tasks
+
+
+def GenerateInProcess(targets, output_dir: str, parallel: bool = True, dry_run: bool = False,
+                      jobs: Optional[int] = None) -> GenerationTimings:
+    """
+    Generates all the given targets into output_dir, parsing every `.matter`
+    file once and sharing the parsed IDL between its generators.
+
+    Returns the time spent in every stage (parsing, every generator, zap).
+    """
+    tasks = _CreateTasks(targets, output_dir, dry_run)
+    timings = GenerationTimings()
+    start = time.perf_counter()
+
+    if parallel:
+        with multiprocessing.Pool(processes=jobs, initializer=_InitWorker) as pool:
+            for task_timings in pool.imap_unordered(_RunTask, tasks):
+                timings.Merge(task_timings)
+    else:
+        _InitWorker()
+        for task in tasks:
+            timings.Merge(_RunTask(task))
+
+    logging.info(f"Generated {len(tasks)} inputs in process, time per stage:")
+    timings.Log(time.perf_counter() - start)
+    return timings
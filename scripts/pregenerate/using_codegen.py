@@ -35,11 +35,13 @@ class CodegenTarget:
             raise Exception(
                 f"Can only code generate for `*.matter` input files, not for {idl}")
 
+    def OutputDir(self, output_root: str):
+        return os.path.join(output_root, self.idl.pregen_subdir, self.generator)
+
     def Generate(self, output_root: str):
         '''Runs codegen.py to generate in the specified directory'''
 
-        output_dir = os.path.join(
-            output_root, self.idl.pregen_subdir, self.generator)
+        output_dir = self.OutputDir(output_root)
 
         logging.info(
             f"Generating: {self.generator}:{self.idl.full_path} into {output_dir}")
@@ -59,6 +61,28 @@ class CodegenTarget:
         logging.debug(f"Executing {cmd}")
         self.runner.run(cmd)
 
+    def GenerateFromIdl(self, output_root: str, idl_tree, dry_run: bool = False):
+        '''Generates in the specified directory in the current process, from the already parsed IDL file'''
+
+        # Imported here, as only in-process generation requires py_matter_idl to be importable.
+        from matter.idl.generators.registry import CodeGenerator
+        from matter.idl.generators.storage import FileSystemGeneratorStorage
+
+        output_dir = self.OutputDir(output_root)
+
+        logging.info(
+            f"Generating in process: {self.generator}:{self.idl.full_path} into {output_dir}")
+
+        # Same parsing of the options as codegen.py
+        extra_args = {}
+        for option in self.options:
+            key, value = option.split(':')
+            extra_args[key] = value
+
+        storage = FileSystemGeneratorStorage(output_dir)
+        generator = CodeGenerator.FromString(self.generator).Create(storage, idl=idl_tree, plugin_module=None, **extra_args)
+        generator.render(dry_run)
+
 
 class CodegenJavaJNIPregenerator:
     """Pregeneration logic for "java" codegen.py outputs"""
@@ -12,11 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import concurrent.futures
 import dataclasses
 import enum
+import hashlib
 import logging
+import os
 import sys
-from typing import Callable, Dict, List, Optional, Protocol, TypeVar
+import time
+from typing import Callable, Dict, List, Optional, Protocol, Tuple, TypeVar
 
 import click
 import coloredlogs
@@ -343,6 +347,133 @@ def is_backwards_compatible(original: Idl, updated: Idl):
     return checker.check() == Compatibility.COMPATIBLE
 
 
+class IndexedCompatibilityChecker(CompatibilityChecker):
+    """A CompatibilityChecker skipping the clusters and global types that did not change.
+
+    Clusters, enums, bitmaps and structs are indexed by name, and only the ones
+    that differ from the updated item of the same name are checked, with the
+    same rules (and the same errors) as CompatibilityChecker: identical items
+    are always compatible. Errors are only collected, not logged.
+    """
+
+    def __init__(self, original: Idl, updated: Idl):
+        super().__init__(original, updated)
+        self.checked = 0
+        self.skipped = 0
+
+    def _mark_incompatible(self, reason: str):
+        # Reported by log_summary, with the files they were found in
+        self.errors.append(reason)
+        self.compatible = Compatibility.INCOMPATIBLE
+
+    def _changed(self, original: List[NAMED], updated: List[NAMED]) -> List[NAMED]:
+        """Returns the original items that are not identical to the updated item of the same name."""
+        # Comparing is cheaper than checking, and parse locations are not compared
+        updated_items = group_list_by_name(updated)
+        changed = [item for item in original if updated_items.get(item.name) != item]
+        self.checked += len(changed)
+        self.skipped += len(original) - len(changed)
+        return changed
+
+    def _check_enum_list_compatible(self, cluster_name: str, original: List[Enum], updated: List[Enum]):
+        super()._check_enum_list_compatible(cluster_name, self._changed(original, updated), updated)
+
+    def _check_bitmap_list_compatible(self, cluster_name: str, original: List[Bitmap], updated: List[Bitmap]):
+        super()._check_bitmap_list_compatible(cluster_name, self._changed(original, updated), updated)
+
+    def _check_struct_list_compatible(self, cluster_name: str, original: List[Struct], updated: List[Struct]):
+        super()._check_struct_list_compatible(cluster_name, self._changed(original, updated), updated)
+
+    def _check_cluster_list_compatible(self, original: List[Cluster], updated: List[Cluster]):
+        super()._check_cluster_list_compatible(self._changed(original, updated), updated)
+
+
+@dataclasses.dataclass
+class PairResult:
+    """The result of checking the compatibility of a pair of .matter files."""
+    original_path: str
+    updated_path: str
+    compatible: bool
+    errors: List[str] = dataclasses.field(default_factory=list)
+    identical_files: bool = False
+    checked: int = 0
+    skipped: int = 0
+    parse_seconds: float = 0
+    check_seconds: float = 0
+
+
+def _file_digest(path: str) -> str:
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def check_pair(original_path: str, updated_path: str, cache_directory: Optional[str] = None) -> PairResult:
+    """Checks that `updated_path` is backwards compatible with `original_path`."""
+    if _file_digest(original_path) == _file_digest(updated_path):
+        return PairResult(original_path, updated_path, compatible=True, identical_files=True)
+
+    start = time.perf_counter()
+    with open(original_path, 'rt') as f:
+        original = CreateParser(cache_directory=cache_directory).parse(f.read(), file_name=original_path)
+    with open(updated_path, 'rt') as f:
+        updated = CreateParser(cache_directory=cache_directory).parse(f.read(), file_name=updated_path)
+    parsed = time.perf_counter()
+
+    checker = IndexedCompatibilityChecker(original, updated)
+    compatible = checker.check() == Compatibility.COMPATIBLE
+    return PairResult(original_path, updated_path, compatible=compatible, errors=checker.errors,
+                      checked=checker.checked, skipped=checker.skipped,
+                      parse_seconds=parsed - start, check_seconds=time.perf_counter() - parsed)
+
+
+def check_pairs(pairs: List[Tuple[str, str]], jobs: int = 1, cache_directory: Optional[str] = None) -> List[PairResult]:
+    """Checks many (original, updated) pairs of .matter files, in a pool of `jobs` processes.
+
+    Results are returned in the order of the pairs.
+    """
+    if jobs <= 1 or len(pairs) <= 1:
+        return [check_pair(original, updated, cache_directory) for original, updated in pairs]
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=min(jobs, len(pairs))) as executor:
+        futures = [executor.submit(check_pair, original, updated, cache_directory) for original, updated in pairs]
+        return [future.result() for future in futures]
+
+
+def _matter_files_pairs(original_dir: str, updated_dir: str) -> List[Tuple[str, str]]:
+    """Pairs every .matter file under original_dir with the file of the same relative path under updated_dir."""
+    pairs = []
+    for root, dirs, files in os.walk(original_dir):
+        dirs.sort()
+        for name in sorted(files):
+            if not name.endswith('.matter'):
+                continue
+            original = os.path.join(root, name)
+            updated = os.path.join(updated_dir, os.path.relpath(original, original_dir))
+            if os.path.exists(updated):
+                pairs.append((original, updated))
+            else:
+                LOGGER.warning("%s has no updated version, not checked", original)
+    return pairs
+
+
+def log_summary(results: List[PairResult], seconds: float):
+    for result in results:
+        if result.identical_files:
+            LOGGER.debug("%s: identical files", result.updated_path)
+            continue
+        LOGGER.info("%s: %s (%d changed and %d unchanged items, parsed in %.2fs, checked in %.3fs)",
+                    result.updated_path, 'compatible' if result.compatible else 'NOT COMPATIBLE',
+                    result.checked, result.skipped, result.parse_seconds, result.check_seconds)
+        for error in result.errors:
+            LOGGER.error("  %s", error)
+
+    LOGGER.info("Checked %d file pairs in %.2fs: %d identical, %d incompatible. "
+                "%d changed and %d unchanged items, %.2fs parsing, %.2fs checking",
+                len(results), seconds, sum(r.identical_files for r in results), sum(not r.compatible for r in results),
+                sum(r.checked for r in results), sum(r.skipped for r in results),
+                sum(r.parse_seconds for r in results), sum(r.check_seconds for r in results))
+
+
 # Supported log levels, mapping string values required for argument
 # parsing into logging constants
 __LOG_LEVELS__ = {
@@ -359,25 +490,46 @@ __LOG_LEVELS__ = {
     default='INFO',
     type=click.Choice(list(__LOG_LEVELS__.keys()), case_sensitive=False),
     help='Determines the verbosity of script output')
+@click.option(
+    '--jobs',
+    default=1,
+    show_default=True,
+    type=int,
+    help='Number of file pairs checked in parallel, when comparing directories')
+@click.option(
+    '--cache-dir',
+    default=None,
+    type=click.Path(file_okay=False),
+    help='Directory where parsed .matter files are cached, when comparing directories')
 @click.argument(
     'old_idl',
     type=click.Path(exists=True))
 @click.argument(
     'new_idl',
     type=click.Path(exists=True))
-def main(log_level, old_idl, new_idl):
+def main(log_level, jobs, cache_dir, old_idl, new_idl):
     """
     Parses MATTER IDL files (.matter) and validates that <new_idl> is backwards compatible
     when compared to <old_idl>.
 
     Generally additions are safe, but not deletes or id changes. Actual set of rules
     defined in `backwards_compatibility` module.
+
+    If <old_idl> and <new_idl> are directories, every .matter file in <old_idl>
+    is compared with the file at the same relative path in <new_idl>, only
+    checking what changed, and a summary is reported.
     """
     coloredlogs.install(
         level=__LOG_LEVELS__[log_level],
         fmt='%(asctime)s %(levelname)-7s %(message)s',
     )
 
+    if os.path.isdir(old_idl) and os.path.isdir(new_idl):
+        start = time.perf_counter()
+        results = check_pairs(_matter_files_pairs(old_idl, new_idl), jobs=jobs, cache_directory=cache_dir)
+        log_summary(results, time.perf_counter() - start)
+        sys.exit(0 if all(result.compatible for result in results) else 1)
+
     LOGGER.info("Parsing OLD idl from %s" % old_idl)
     old_tree = CreateParser().parse(open(old_idl, "rt").read())
 
@@ -84,6 +84,7 @@ class Context:
         self.file_name = None
         self._not_handled: set[str] = set()
         self._idl_post_processors: list[IdlPostProcessor] = []
+        self._priority_idl_post_processors: list[IdlPostProcessor] = []
         self.abstract_base_clusters: dict[str, Cluster] = {}
 
     def AddAbstractBaseCluster(self, name: str, parse_meta: Optional[ParseMetaData] = None) -> Cluster:
@@ -126,12 +127,31 @@ class Context:
 
     def AddIdlPostProcessor(self, processor: IdlPostProcessor, has_priority: bool = False):
         if has_priority:
-            self._idl_post_processors.insert(0, processor)
+            self._priority_idl_post_processors.append(processor)
         else:
             self._idl_post_processors.append(processor)
 
+    def Merge(self, other: 'Context'):
+        """Adds the shared data and post-processors of a context used to parse other sources.
+
+        Post-processing afterwards is the same as if the other sources had been
+        parsed with this context.
+        """
+        for name, cluster in other.abstract_base_clusters.items():
+            assert name not in self.abstract_base_clusters  # be unique
+            self.abstract_base_clusters[name] = cluster
+        # Post-processors of the other context find base clusters in it
+        other.abstract_base_clusters = self.abstract_base_clusters
+        self._not_handled |= other._not_handled
+        self._priority_idl_post_processors.extend(other._priority_idl_post_processors)
+        self._idl_post_processors.extend(other._idl_post_processors)
+
     def PostProcess(self, idl: Idl):
+        # Priority processors run first, the last added first.
+        for p in reversed(self._priority_idl_post_processors):
+            p.FinalizeProcessing(idl)
         for p in self._idl_post_processors:
             p.FinalizeProcessing(idl)
 
+        self._priority_idl_post_processors = []
         self._idl_post_processors = []
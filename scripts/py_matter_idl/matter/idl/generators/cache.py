@@ -0,0 +1,152 @@
+# Copyright (c) 2026 Project CHIP Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from typing import Dict, Optional
+
+from .storage import GeneratorStorage
+
+LOGGER = logging.getLogger(__name__)
+
+# Bump when the format of the cache entries changes.
+_CACHE_VERSION = 1
+
+
+@functools.lru_cache(maxsize=None)
+def _sources_digest() -> str:
+    """
+    Digest of the parser, the generators and their templates: outputs are only
+    valid for the code which generated them.
+    """
+    digest = hashlib.sha256()
+    idl_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    for root, dirs, files in os.walk(idl_dir):
+        dirs[:] = sorted(d for d in dirs if d not in ('__pycache__', 'tests'))
+        for name in sorted(files):
+            if name.startswith('test_') or name.endswith('.pyc'):
+                continue
+            path = os.path.join(root, name)
+            digest.update(os.path.relpath(path, idl_dir).encode())
+            with open(path, 'rb') as f:
+                digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()
+
+
+class RecordingStorage(GeneratorStorage):
+    """
+    A storage that forwards everything to another storage, and records the
+    content of every output file, whether it had to be written or not.
+    """
+
+    def __init__(self, storage: GeneratorStorage):
+        super().__init__()
+        self.storage = storage
+        self.outputs: Dict[str, str] = {}
+
+    def report_output_file(self, relative_path: str):
+        super().report_output_file(relative_path)
+        self.storage.report_output_file(relative_path)
+
+    def get_existing_data(self, relative_path: str):
+        # Generators only write the files which changed: the existing data is
+        # the output unless new data is written after this.
+        data = self.storage.get_existing_data(relative_path)
+        if data is not None:
+            self.outputs[relative_path] = data
+        return data
+
+    def write_new_data(self, relative_path: str, content: str):
+        self.outputs[relative_path] = content
+        self.storage.write_new_data(relative_path, content)
+
+
+class GeneratorCache:
+    """
+    Content-addressed cache of the outputs of code generators.
+
+    Entries are keyed by the content of the IDL file, the generator and its
+    options, and the parser/generator sources and templates, so that an entry
+    never needs to be invalidated: when any of those changes, the key changes.
+    On a hit, outputs are restored into the storage without parsing the IDL or
+    rendering any template.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, idl_path: str, generator: str, options: Dict[str, str], expected_outputs: Optional[str] = None) -> str:
+        digest = hashlib.sha256()
+        digest.update(f'{_CACHE_VERSION}\0{_sources_digest()}\0{generator.lower()}\0'.encode())
+        digest.update(json.dumps(options, sort_keys=True).encode())
+        for path in (idl_path, expected_outputs):
+            if path is None:
+                digest.update(b'\0')
+                continue
+            with open(path, 'rb') as f:
+                digest.update(hashlib.sha256(f.read()).digest())
+        return digest.hexdigest()
+
+    def restore(self, key: str, storage: GeneratorStorage) -> bool:
+        """Restores the outputs cached for the given key into storage, returns False if there are none."""
+        start = time.perf_counter()
+        try:
+            with open(self._path(key), 'rt') as f:
+                outputs = json.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            LOGGER.debug("Codegen cache miss for %s", key)
+            return False
+        except (OSError, ValueError) as e:
+            self.misses += 1
+            LOGGER.warning("Ignoring unreadable codegen cache entry %s: %s", key, e)
+            return False
+
+        written = 0
+        for relative_path, content in outputs.items():
+            storage.report_output_file(relative_path)
+            if content != storage.get_existing_data(relative_path):
+                storage.write_new_data(relative_path, content)
+                written += 1
+
+        self.hits += 1
+        LOGGER.debug("Codegen cache hit for %s: %d outputs (%d written) restored in %.1f ms",
+                     key, len(outputs), written, (time.perf_counter() - start) * 1000)
+        return True
+
+    def store(self, key: str, outputs: Dict[str, str]):
+        # Written to a temporary file first, as several generations may share the cache.
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(fd, 'wt') as f:
+                json.dump(outputs, f)
+            os.replace(tmp_path, self._path(key))
+        except OSError as e:
+            LOGGER.warning("Failed to store codegen cache entry %s: %s", key, e)
+            return
+        LOGGER.debug("Codegen cache stored %d outputs for %s", len(outputs), key)
+
+    def log_stats(self):
+        LOGGER.debug("Codegen cache %s: %d hits, %d misses", self.directory, self.hits, self.misses)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + '.json')
@@ -14,8 +14,13 @@
 
 import dataclasses
 import functools
+import hashlib
 import logging
+import os
+import pickle
 import pprint
+import sys
+import tempfile
 from typing import Dict, List, Optional
 
 import click
@@ -647,27 +652,118 @@ def _merge_global_types_into_clusters(idl: Idl) -> Idl:
     return dataclasses.replace(idl, clusters=[mapping.merge_global_types_into_cluster(cluster) for cluster in idl.clusters])
 
 
+# Bump when the format of the cached IDL changes.
+_IDL_CACHE_VERSION = 1
+
+# Default directory of the parsed IDL cache, used when CreateParser is not given one.
+IDL_CACHE_DIR_ENV = 'MATTER_IDL_CACHE_DIR'
+
+
+@functools.lru_cache(maxsize=None)
+def _parser_sources_digest() -> str:
+    """Digest of the grammar and the code building an Idl: cached Idl objects are only valid for it."""
+    digest = hashlib.sha256(f'{_IDL_CACHE_VERSION}\0{sys.version_info[:2]}\0'.encode())
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    for name in ('matter_grammar.lark', 'matter_idl_parser.py', 'matter_idl_types.py'):
+        with open(os.path.join(base_dir, name), 'rb') as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()
+
+
+class IdlCache:
+    """
+    On-disk cache of parsed Idl objects.
+
+    Entries are keyed by the content of the parsed file, the parser flags and
+    the parser sources, so that they never need to be invalidated. Entries are
+    pickles, only use a cache directory that is trusted.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, file: str, skip_meta: bool, merge_globals: bool) -> str:
+        digest = hashlib.sha256(f'{_parser_sources_digest()}\0{skip_meta}\0{merge_globals}\0'.encode())
+        digest.update(file.encode())
+        return digest.hexdigest()
+
+    def load(self, key: str) -> Optional[Idl]:
+        try:
+            with open(self._path(key), 'rb') as f:
+                idl = pickle.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception as e:
+            self.misses += 1
+            LOGGER.warning("Ignoring unreadable IDL cache entry %s: %s", key, e)
+            return None
+        self.hits += 1
+        return idl
+
+    def store(self, key: str, idl: Idl):
+        # Written to a temporary file first, as several parsers may share the cache.
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(idl, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._path(key))
+        except OSError as e:
+            LOGGER.warning("Failed to store IDL cache entry %s: %s", key, e)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + '.pickle')
+
+
 class ParserWithLines:
-    def __init__(self, skip_meta: bool, merge_globals: bool):
+    def __init__(self, skip_meta: bool, merge_globals: bool, cache_directory: Optional[str] = None):
+        self.skip_meta = skip_meta
         self.transformer = MatterIdlTransformer(skip_meta)
         self.merge_globals = merge_globals
-
-        # NOTE: LALR parser is fast. While Earley could parse more ambigous grammars,
-        #       earley is much slower:
-        #    - 0.39s LALR parsing of all-clusters-app.matter
-        #    - 2.26s Earley parsing of the same thing.
-        # For this reason, every attempt should be made to make the grammar context free
-        self.parser = Lark.open(
-            'matter_grammar.lark', rel_to=__file__, start='idl', parser='lalr', propagate_positions=True,
-            maybe_placeholders=True,
-            # separate callbacks to ignore from regular parsing (no tokens)
-            # while still getting notified about them
-            lexer_callbacks={
-                'C_COMMENT': self.transformer.c_comment,
-            }
-        )
+        self.cache = IdlCache(cache_directory) if cache_directory else None
+        self._parser = None
+
+    @property
+    def parser(self) -> Lark:
+        # Only built when a file is actually parsed, as cached files do not need it.
+        if self._parser is None:
+            # NOTE: LALR parser is fast. While Earley could parse more ambigous grammars,
+            #       earley is much slower:
+            #    - 0.39s LALR parsing of all-clusters-app.matter
+            #    - 2.26s Earley parsing of the same thing.
+            # For this reason, every attempt should be made to make the grammar context free
+            self._parser = Lark.open(
+                'matter_grammar.lark', rel_to=__file__, start='idl', parser='lalr', propagate_positions=True,
+                maybe_placeholders=True,
+                # the LALR tables are saved in the temporary directory, instead of
+                # being computed again by every process creating a parser
+                cache=True,
+                # separate callbacks to ignore from regular parsing (no tokens)
+                # while still getting notified about them
+                lexer_callbacks={
+                    'C_COMMENT': self.transformer.c_comment,
+                }
+            )
+        return self._parser
 
     def parse(self, file: str, file_name: Optional[str] = None):
+        if self.cache is None:
+            return self._parse(file, file_name)
+
+        key = self.cache.key(file, self.skip_meta, self.merge_globals)
+        idl = self.cache.load(key)
+        if idl is None:
+            idl = self._parse(file, file_name)
+            self.cache.store(key, idl)
+        idl.parse_file_name = file_name
+        return idl
+
+    def _parse(self, file: str, file_name: Optional[str]):
+        # Only the doc comments of this file apply to it.
+        self.transformer.doc_comments = []
         idl = self.transformer.transform(self.parser.parse(file))
         idl.parse_file_name = file_name
 
@@ -702,7 +798,7 @@ class ParserWithLines:
         return idl
 
 
-def CreateParser(skip_meta: bool = False, merge_globals=True):
+def CreateParser(skip_meta: bool = False, merge_globals=True, cache_directory: Optional[str] = None):
     """
     Generates a parser that will process a ".matter" file into a IDL
 
@@ -716,8 +812,15 @@ def CreateParser(skip_meta: bool = False, merge_globals=True):
                        are self-sufficient. Useful as a backwards-compatible
                        code generation if global definitions are not supported.
 
+       cache_directory - directory where parsed files are cached, so that
+                         parsing the same content again only loads the
+                         result. Defaults to the MATTER_IDL_CACHE_DIR
+                         environment variable, no caching if neither is set.
+
     """
-    return ParserWithLines(skip_meta, merge_globals)
+    if cache_directory is None:
+        cache_directory = os.environ.get(IDL_CACHE_DIR_ENV)
+    return ParserWithLines(skip_meta, merge_globals, cache_directory)
 
 
 # Supported log levels, mapping string values required for argument
@@ -14,7 +14,10 @@
 # limitations under the License.
 
 import logging
+import os
+import shutil
 import sys
+import tempfile
 import unittest
 from enum import Flag, auto
 from pathlib import Path
@@ -25,7 +28,8 @@ except ImportError:
     sys.path.append(str(Path(__file__).resolve().parent / ".." / ".."))
     from matter.idl.matter_idl_parser import CreateParser
 
-from matter.idl.backwards_compatibility import CompatibilityChecker, is_backwards_compatible
+from matter.idl.backwards_compatibility import (CompatibilityChecker, IndexedCompatibilityChecker, check_pairs,
+                                                is_backwards_compatible)
 from matter.idl.matter_idl_types import Idl
 
 
@@ -47,6 +51,12 @@ class TestCompatibilityChecks(unittest.TestCase):
 
     def _AssumeCompatiblity(self, old: str, new: str, old_idl: Idl, new_idl: Idl, expect_compatible: bool):
         with DisableLogger():
+            # Skipping unchanged items must not change the result
+            checker = CompatibilityChecker(old_idl, new_idl)
+            indexed_checker = IndexedCompatibilityChecker(old_idl, new_idl)
+            self.assertEqual(indexed_checker.check(), checker.check())
+            self.assertEqual(indexed_checker.errors, checker.errors)
+
             if expect_compatible == is_backwards_compatible(old_idl, new_idl):
                 return
 
@@ -446,5 +456,41 @@ class TestCompatibilityChecks(unittest.TestCase):
             Compatibility.FORWARD_FAIL | Compatibility.BACKWARD_FAIL)
 
 
+class TestCheckPairs(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+
+    def _write(self, name: str, content: str) -> str:
+        path = os.path.join(self.dir, name)
+        with open(path, 'wt') as f:
+            f.write(content)
+        return path
+
+    def test_pairs(self):
+        base = "client cluster X = 1 { enum E: ENUM8 { A = 1; } readonly attribute int8u a = 1; }\n"
+        base_path = self._write('base.matter', base)
+        pairs = [
+            (base_path, self._write('same.matter', base)),
+            (base_path, self._write('added.matter', base + "client cluster Y = 2 { }\n")),
+            (base_path, self._write('deleted.matter', "client cluster Y = 2 { }\n")),
+            (base_path, self._write('moved.matter', "\n\n" + base.replace('= 1;', '= 2;'))),
+        ]
+
+        for jobs in (1, 2):
+            with self.subTest(jobs=jobs), DisableLogger():
+                results = check_pairs(pairs, jobs=jobs, cache_directory=os.path.join(self.dir, 'cache'))
+
+                self.assertEqual([r.updated_path for r in results], [updated for _, updated in pairs])
+                self.assertEqual([r.compatible for r in results], [True, True, False, False])
+                self.assertTrue(results[0].identical_files)
+                self.assertEqual((results[1].checked, results[1].skipped), (0, 1))
+                self.assertEqual(results[2].errors, ["Cluster X was deleted"])
+                self.assertEqual(results[3].errors, [
+                    "Enumeration X::E changed code for entry A from 1 to 2",
+                    "Attribute X::a changed its code.",
+                ])
+
+
 if __name__ == '__main__':
     unittest.main()
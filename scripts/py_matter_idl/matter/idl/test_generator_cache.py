@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026 Project CHIP Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+try:
+    from matter.idl.matter_idl_parser import CreateParser
+except ImportError:
+    sys.path.append(str(Path(__file__).resolve().parent / ".." / ".."))
+    from matter.idl.matter_idl_parser import CreateParser
+
+from matter.idl.generators.cache import GeneratorCache, RecordingStorage
+from matter.idl.generators.cpp.application import CppApplicationGenerator
+from matter.idl.generators.storage import FileSystemGeneratorStorage
+
+TESTS_DIR = os.path.join(os.path.dirname(__file__), "tests")
+
+
+class WriteCountingStorage(FileSystemGeneratorStorage):
+    def __init__(self, output_dir: str):
+        super().__init__(output_dir)
+        self.writes = 0
+
+    def write_new_data(self, relative_path: str, content: str):
+        self.writes += 1
+        super().write_new_data(relative_path, content)
+
+
+class TestGeneratorCache(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.cache = GeneratorCache(os.path.join(self.dir, 'cache'))
+        self.idl_path = os.path.join(self.dir, 'input.matter')
+        shutil.copy(os.path.join(TESTS_DIR, 'inputs', 'several_clusters.matter'), self.idl_path)
+
+    def _generate(self, output_dir: str) -> WriteCountingStorage:
+        """Generates as codegen.py does, returns the storage generated into."""
+        storage = WriteCountingStorage(os.path.join(self.dir, output_dir))
+        key = self.cache.key(self.idl_path, 'cpp-app', {})
+        if self.cache.restore(key, storage):
+            return storage
+
+        recording = RecordingStorage(storage)
+        with open(self.idl_path, 'rt') as f:
+            idl = CreateParser().parse(f.read(), file_name=self.idl_path)
+        CppApplicationGenerator(recording, idl).render(dry_run=False)
+        self.cache.store(key, recording.outputs)
+        return storage
+
+    def _read_all(self, output_dir: str):
+        result = {}
+        root = os.path.join(self.dir, output_dir)
+        for dir_path, _, files in os.walk(root):
+            for name in files:
+                with open(os.path.join(dir_path, name), 'rt') as f:
+                    result[os.path.relpath(os.path.join(dir_path, name), root)] = f.read()
+        return result
+
+    def test_restores_identical_outputs(self):
+        generated = self._generate('generated')
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 1))
+
+        restored = self._generate('restored')
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        self.assertEqual(restored.generated_paths, generated.generated_paths)
+        self.assertEqual(self._read_all('restored'), self._read_all('generated'))
+
+    def test_unchanged_outputs_are_not_written(self):
+        # Outputs which were already up to date are cached too.
+        generated = self._generate('out')
+        self.cache = GeneratorCache(os.path.join(self.dir, 'other-cache'))
+        self.assertEqual(self._generate('out').writes, 0)
+
+        restored = self._generate('out')
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(restored.writes, 0)
+        self.assertEqual(restored.generated_paths, generated.generated_paths)
+
+    def test_key_depends_on_inputs(self):
+        key = self.cache.key(self.idl_path, 'cpp-app', {})
+        self.assertEqual(key, self.cache.key(self.idl_path, 'CPP-APP', {}))
+        self.assertNotEqual(key, self.cache.key(self.idl_path, 'java-jni', {}))
+        self.assertNotEqual(key, self.cache.key(self.idl_path, 'cpp-app', {'table_name': 'x'}))
+        self.assertNotEqual(key, self.cache.key(self.idl_path, 'cpp-app', {}, expected_outputs=self.idl_path))
+
+        with open(self.idl_path, 'at') as f:
+            f.write('\n// changed\n')
+        self.assertNotEqual(key, self.cache.key(self.idl_path, 'cpp-app', {}))
+
+
+if __name__ == '__main__':
+    unittest.main()
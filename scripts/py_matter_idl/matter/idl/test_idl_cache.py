@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026 Project CHIP Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+try:
+    from matter.idl.matter_idl_parser import CreateParser
+except ImportError:
+    sys.path.append(str(Path(__file__).resolve().parent / ".." / ".."))
+    from matter.idl.matter_idl_parser import CreateParser
+
+TESTS_DIR = os.path.join(os.path.dirname(__file__), "tests")
+
+
+class TestIdlCache(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+        with open(os.path.join(TESTS_DIR, 'inputs', 'several_clusters.matter'), 'rt') as f:
+            self.content = f.read()
+
+    def test_cached_idl_is_identical(self):
+        for skip_meta in (False, True):
+            for merge_globals in (False, True):
+                expected = CreateParser(skip_meta, merge_globals).parse(self.content, file_name='a.matter')
+
+                parser = CreateParser(skip_meta, merge_globals, cache_directory=self.dir)
+                self.assertEqual(parser.parse(self.content, file_name='a.matter'), expected)
+                self.assertEqual((parser.cache.hits, parser.cache.misses), (0, 1))
+
+                parser = CreateParser(skip_meta, merge_globals, cache_directory=self.dir)
+                self.assertEqual(parser.parse(self.content, file_name='a.matter'), expected)
+                self.assertEqual((parser.cache.hits, parser.cache.misses), (1, 0))
+                # The grammar is not needed to load a cached file.
+                self.assertIsNone(parser._parser)
+
+    def test_file_name_is_not_cached(self):
+        CreateParser(cache_directory=self.dir).parse(self.content, file_name='a.matter')
+        idl = CreateParser(cache_directory=self.dir).parse(self.content, file_name='b.matter')
+        self.assertEqual(idl.parse_file_name, 'b.matter')
+
+    def test_changed_content_is_parsed(self):
+        parser = CreateParser(cache_directory=self.dir)
+        parser.parse(self.content)
+        idl = parser.parse(self.content + '\n/** Doc */\ncluster Extra = 0x1234 { }\n')
+        self.assertEqual((parser.cache.hits, parser.cache.misses), (0, 2))
+        self.assertEqual(idl.clusters[-1].name, 'Extra')
+        self.assertEqual(idl.clusters[-1].description, 'Doc')
+
+    def test_unreadable_entries_are_ignored(self):
+        parser = CreateParser(cache_directory=self.dir)
+        expected = parser.parse(self.content)
+        for name in os.listdir(self.dir):
+            with open(os.path.join(self.dir, name), 'wb') as f:
+                f.write(b'garbage')
+
+        parser = CreateParser(cache_directory=self.dir)
+        self.assertEqual(parser.parse(self.content), expected)
+        self.assertEqual(parser.cache.misses, 1)
+
+    def test_environment_default(self):
+        os.environ['MATTER_IDL_CACHE_DIR'] = self.dir
+        self.addCleanup(os.environ.pop, 'MATTER_IDL_CACHE_DIR')
+        self.assertEqual(CreateParser().cache.directory, self.dir)
+
+
+if __name__ == '__main__':
+    unittest.main()
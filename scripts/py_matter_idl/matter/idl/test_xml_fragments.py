@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026 Project CHIP Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from typing import List
+
+try:
+    from matter.idl import zapxml
+except ImportError:
+    sys.path.append(str(Path(__file__).resolve().parent / ".." / ".."))
+    from matter.idl import zapxml
+
+from matter.idl import data_model_xml
+
+ZAP_GLOBALS = '''<?xml version="1.0"?>
+<configurator>
+  <global>
+    <attribute side="server" code="0xFFFD" type="int16u" default="1">ClusterRevision</attribute>
+    <attribute side="server" code="0xFFFC" type="bitmap32" default="0">FeatureMap</attribute>
+  </global>
+  <struct name="GlobalStruct">
+    <item name="Value" type="int8u"/>
+  </struct>
+</configurator>
+'''
+
+ZAP_CLUSTER = '''<?xml version="1.0"?>
+<configurator>
+  <cluster>
+    <name>Test</name>
+    <code>0x1234</code>
+    <attribute side="server" code="1" type="INT8U">SomeValue</attribute>
+    <globalAttribute side="either" code="0xFFFD" value="3"/>
+  </cluster>
+</configurator>
+'''
+
+ZAP_CLUSTER_TYPES = '''<?xml version="1.0"?>
+<configurator>
+  <struct name="ClusterStruct">
+    <cluster code="0x1234"/>
+    <item name="Value" type="int8u"/>
+  </struct>
+  <clusterExtension code="0x1234">
+    <attribute side="server" code="2" type="INT16U">ExtraValue</attribute>
+  </clusterExtension>
+</configurator>
+'''
+
+DATA_MODEL_BASE = '''
+<cluster id="" name="Mode Base" revision="2">
+  <classification hierarchy="base" role="application" picsCode="MODB" scope="Endpoint"/>
+  <attributes>
+    <attribute id="0x0000" name="SupportedModes" type="uint8" default="MS">
+      <access read="true" readPrivilege="view"/>
+      <mandatoryConform/>
+    </attribute>
+  </attributes>
+</cluster>
+'''
+
+DATA_MODEL_DERIVED = '''
+<cluster id="0x0059" name="Dishwasher Mode" revision="2">
+  <classification hierarchy="derived" baseCluster="Mode Base" role="application" picsCode="DISHM" scope="Endpoint"/>
+  <attributes>
+    <attribute id="0x0000" name="SupportedModes">
+      <mandatoryConform/>
+    </attribute>
+  </attributes>
+</cluster>
+'''
+
+
+class TestXmlFragments(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+
+    def _write(self, contents: List[str]) -> List[str]:
+        paths = []
+        for index, content in enumerate(contents):
+            path = os.path.join(self.dir, f'input{index}.xml')
+            with open(path, 'wt') as f:
+                f.write(content)
+            paths.append(path)
+        return paths
+
+    def _assertSameAllWays(self, module, paths: List[str]):
+        """Parses the paths sequentially, in a pool and from the cache, returns the sequential result."""
+        sources = [module.ParseSource(source=path) for path in paths]
+        expected = module.ParseXmls(sources, cache_directory='')
+
+        cache_directory = os.path.join(self.dir, 'cache')
+        self.assertEqual(module.ParseXmls(sources, jobs=2, cache_directory=cache_directory), expected)
+        self.assertEqual(len(os.listdir(cache_directory)), len(paths))
+        self.assertEqual(module.ParseXmls(sources, cache_directory=cache_directory), expected)
+        return expected
+
+    def testZapXmlCrossFileReferences(self):
+        paths = self._write([ZAP_GLOBALS, ZAP_CLUSTER, ZAP_CLUSTER_TYPES])
+        idl = self._assertSameAllWays(zapxml, paths)
+
+        self.assertEqual(idl.parse_file_name, paths[-1])
+        self.assertEqual([s.name for s in idl.global_structs], ['GlobalStruct'])
+        cluster = idl.clusters[0]
+        self.assertEqual([s.name for s in cluster.structs], ['ClusterStruct'])
+        self.assertEqual([a.definition.name for a in cluster.attributes],
+                         ['SomeValue', 'ClusterRevision', 'FeatureMap', 'ExtraValue'])
+
+    def testDataModelXmlDerivedCluster(self):
+        idl = self._assertSameAllWays(data_model_xml, self._write([DATA_MODEL_BASE, DATA_MODEL_DERIVED]))
+
+        self.assertEqual([c.name for c in idl.clusters], ['DishwasherMode'])
+        supported_modes = idl.clusters[0].attributes[0]
+        self.assertEqual(supported_modes.definition.name, 'supportedModes')
+        self.assertEqual(supported_modes.definition.data_type.name, 'int8u')
+
+    def testStreamsAreNotCached(self):
+        cache_directory = os.path.join(self.dir, 'cache')
+        sources = [zapxml.ParseSource(source=self._write([ZAP_GLOBALS])[0]),
+                   zapxml.ParseSource(source=io.StringIO(ZAP_CLUSTER), name='cluster')]
+        idl = zapxml.ParseXmls(sources, jobs=2, cache_directory=cache_directory)
+
+        self.assertEqual(idl.parse_file_name, 'cluster')
+        self.assertEqual(len(idl.clusters[0].attributes), 3)
+        self.assertEqual(len(os.listdir(cache_directory)), 1)
+
+    def testChangedFilesAreParsedAgain(self):
+        paths = self._write([ZAP_GLOBALS, ZAP_CLUSTER])
+        sources = [zapxml.ParseSource(source=path) for path in paths]
+        cache_directory = os.path.join(self.dir, 'cache')
+        zapxml.ParseXmls(sources, cache_directory=cache_directory)
+
+        with open(paths[1], 'wt') as f:
+            f.write(ZAP_CLUSTER.replace('SomeValue', 'OtherValue'))
+        idl = zapxml.ParseXmls(sources, cache_directory=cache_directory)
+        self.assertEqual(idl.clusters[0].attributes[0].definition.name, 'OtherValue')
+        self.assertEqual(len(os.listdir(cache_directory)), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,170 @@
+# Copyright (c) 2026 Project CHIP Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Per-file parsing of XML data definitions.
+
+Every XML source is parsed on its own into an `XmlFragment`: the partial Idl
+of that source, and the parsing context holding the data shared between files
+(e.g. global attributes) and the post-processors which resolve references
+between files. Fragments are then merged in the order of the sources and
+post-processed as if all sources had been parsed one after the other.
+
+As fragments are independent, they can be parsed in a pool of processes, and
+cached on disk by the content of their source.
+"""
+
+import concurrent.futures
+import functools
+import hashlib
+import logging
+import os
+import pickle
+import sys
+import tempfile
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional
+
+from matter.idl.matter_idl_types import Idl
+
+LOGGER = logging.getLogger(__name__)
+
+# Bump when the format of the cached fragments changes.
+_CACHE_VERSION = 1
+
+
+@dataclass
+class XmlFragment:
+    """The result of parsing a single XML source, to be merged with the other sources."""
+    file_name: str
+    idl: Idl
+    # Context of the parser: shared data and post-processors of the source
+    context: Any
+
+
+@functools.lru_cache(maxsize=None)
+def _sources_digest(parser_dir: str) -> str:
+    """Digest of the code building fragments: cached fragments are only valid for it."""
+    digest = hashlib.sha256(f'{_CACHE_VERSION}\0{sys.version_info[:2]}\0'.encode())
+    idl_dir = os.path.dirname(os.path.abspath(__file__))
+    paths = [os.path.join(idl_dir, 'matter_idl_types.py'), os.path.abspath(__file__)]
+    for root, dirs, files in os.walk(parser_dir):
+        dirs[:] = sorted(d for d in dirs if d != '__pycache__')
+        paths.extend(os.path.join(root, name) for name in sorted(files) if name.endswith('.py'))
+
+    for path in paths:
+        digest.update(os.path.relpath(path, idl_dir).encode())
+        with open(path, 'rb') as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()
+
+
+class XmlFragmentCache:
+    """
+    On-disk cache of parsed fragments, keyed by the content of the source, the
+    parser sources and the parsing options. Entries are pickles, only use a
+    cache directory that is trusted.
+    """
+
+    def __init__(self, directory: str, parser_dir: str, include_meta_data: bool):
+        self.directory = directory
+        self._prefix = f'{_sources_digest(parser_dir)}\0{include_meta_data}\0'.encode()
+
+    def key(self, file_name: str) -> Optional[str]:
+        try:
+            with open(file_name, 'rb') as f:
+                content = f.read()
+        except OSError:
+            return None
+        return hashlib.sha256(self._prefix + content).hexdigest()
+
+    def load(self, key: str) -> Optional[XmlFragment]:
+        try:
+            with open(self._path(key), 'rb') as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            LOGGER.warning("Ignoring unreadable XML cache entry %s: %s", key, e)
+            return None
+
+    def store(self, key: str, fragment: XmlFragment):
+        # Written to a temporary file first, as several parsers may share the cache.
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(fragment, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._path(key))
+        except OSError as e:
+            LOGGER.warning("Failed to store XML cache entry %s: %s", key, e)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + '.pickle')
+
+
+def _ParseAndStore(parse: Callable, source, include_meta_data: bool, cache: Optional[XmlFragmentCache],
+                   key: Optional[str]) -> XmlFragment:
+    fragment = parse(source, include_meta_data)
+    if cache and key:
+        cache.store(key, fragment)
+    return fragment
+
+
+def ParseFragments(parse: Callable, parser_dir: str, sources: List, include_meta_data: bool = True,
+                   jobs: int = 1, cache_directory: Optional[str] = None) -> List[XmlFragment]:
+    """Parses every source into a fragment, returns the fragments in the order of the sources.
+
+    Params:
+       parse - module level function parsing a source into a fragment: parse(source, include_meta_data)
+       parser_dir - directory of the parser handlers, cached fragments are only valid for its content
+       sources - ParseSource objects to parse
+       jobs - number of processes parsing sources. Only named sources (i.e. files) are parsed in other
+              processes, streams are always parsed in this process.
+       cache_directory - directory where fragments of named sources are cached
+    """
+    cache = XmlFragmentCache(cache_directory, parser_dir, include_meta_data) if cache_directory else None
+
+    fragments: List[Optional[XmlFragment]] = [None] * len(sources)
+    to_parse = []
+    for index, source in enumerate(sources):
+        key = None
+        if cache and isinstance(source.source, str):
+            key = cache.key(source.source)
+            if key:
+                fragments[index] = cache.load(key)
+        if fragments[index] is None:
+            to_parse.append((index, source, key))
+
+    if cache:
+        LOGGER.info("Loaded %d of %d XML sources from %s", len(sources) - len(to_parse), len(sources), cache_directory)
+
+    in_pool, in_process = [], []
+    for item in to_parse:
+        (in_pool if jobs > 1 and isinstance(item[1].source, str) else in_process).append(item)
+
+    if in_pool:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=min(jobs, len(in_pool))) as executor:
+            futures = [(index, executor.submit(_ParseAndStore, parse, source, include_meta_data, cache, key))
+                       for index, source, key in in_pool]
+            # Streams are parsed while the pool parses files.
+            for index, source, key in in_process:
+                fragments[index] = _ParseAndStore(parse, source, include_meta_data, cache, key)
+            for index, future in futures:
+                fragments[index] = future.result()
+    else:
+        for index, source, key in in_process:
+            fragments[index] = _ParseAndStore(parse, source, include_meta_data, cache, key)
+
+    return fragments
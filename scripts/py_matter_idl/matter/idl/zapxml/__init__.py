@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import logging
+import os
 import typing
 import xml.sax.handler
 from dataclasses import dataclass
@@ -22,7 +23,9 @@ import click
 
 from matter.idl.generators.idl import IdlGenerator
 from matter.idl.generators.storage import InMemoryStorage
+from matter.idl.matter_idl_parser import IDL_CACHE_DIR_ENV
 from matter.idl.matter_idl_types import Idl
+from matter.idl.xml_fragments import ParseFragments, XmlFragment
 from matter.idl.zapxml.handlers import Context, ZapXmlHandler
 
 LOGGER = logging.getLogger(__name__)
@@ -58,6 +61,22 @@ class ParseHandler(xml.sax.handler.ContentHandler):
 
         self._context.file_name = filename
 
+    def Fragment(self) -> XmlFragment:
+        """The partial result of parsing the current source, to be merged into another handler."""
+        # The SAX locator is only valid during parsing, and cannot be pickled
+        self._context.locator = None
+        return XmlFragment(file_name=self._context.file_name, idl=self._idl, context=self._context)
+
+    def Merge(self, fragment: XmlFragment):
+        """Merges the result of parsing a source with another handler, as if it had been parsed by this one."""
+        self.PrepareParsing(fragment.file_name)
+        self._idl.clusters.extend(fragment.idl.clusters)
+        self._idl.endpoints.extend(fragment.idl.endpoints)
+        self._idl.global_bitmaps.extend(fragment.idl.global_bitmaps)
+        self._idl.global_enums.extend(fragment.idl.global_enums)
+        self._idl.global_structs.extend(fragment.idl.global_structs)
+        self._context.Merge(fragment.context)
+
     def Finish(self) -> Idl:
         self._context.PostProcess(self._idl)
         return self._idl
@@ -108,24 +127,44 @@ class ParseSource:
         return self.source  # assume string
 
 
-def ParseXmls(sources: List[ParseSource], include_meta_data=True) -> Idl:
+def ParseFragment(source: ParseSource, include_meta_data=True) -> XmlFragment:
+    """Parse a single XML input into a fragment, to be merged with the other inputs by MergeFragments."""
+    LOGGER.info('Parsing %s...' % source.source_file_name)
+    handler = ParseHandler(include_meta_data=include_meta_data)
+    handler.PrepareParsing(source.source_file_name)
+
+    parser = xml.sax.make_parser()
+    parser.setContentHandler(handler)
+    parser.parse(source.source)
+
+    return handler.Fragment()
+
+
+def MergeFragments(fragments: List[XmlFragment], include_meta_data=True) -> Idl:
+    """Merge parsed fragments, in order, into the resulting Idl data."""
+    handler = ParseHandler(include_meta_data=include_meta_data)
+    for fragment in fragments:
+        handler.Merge(fragment)
+    return handler.Finish()
+
+
+def ParseXmls(sources: List[ParseSource], include_meta_data=True, jobs: int = 1,
+              cache_directory: Optional[str] = None) -> Idl:
     """Parse one or more XML inputs and return the resulting Idl data.
 
     Params:
        sources - what to parse
        include_meta_data - if parsing location data should be included in the Idl
+       jobs - number of processes parsing the input files
+       cache_directory - where the parsing results of input files are cached. Defaults to
+                         the MATTER_IDL_CACHE_DIR environment variable, no caching if not set.
     """
-    handler = ParseHandler(include_meta_data=include_meta_data)
+    if cache_directory is None:
+        cache_directory = os.environ.get(IDL_CACHE_DIR_ENV)
 
-    for source in sources:
-        LOGGER.info('Parsing %s...' % source.source_file_name)
-        handler.PrepareParsing(source.source_file_name)
-
-        parser = xml.sax.make_parser()
-        parser.setContentHandler(handler)
-        parser.parse(source.source)
-
-    return handler.Finish()
+    fragments = ParseFragments(ParseFragment, os.path.dirname(__file__), sources,
+                               include_meta_data=include_meta_data, jobs=jobs, cache_directory=cache_directory)
+    return MergeFragments(fragments, include_meta_data=include_meta_data)
 
 
 # Supported log levels, mapping string values required for argument
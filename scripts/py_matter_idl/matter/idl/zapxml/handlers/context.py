@@ -86,6 +86,7 @@ class Context:
         self.file_name = None
         self._not_handled = set()
         self._idl_post_processors = []
+        self._priority_idl_post_processors = []
 
         # Map of code -> attribute
         self._global_attributes = {}
@@ -138,12 +139,29 @@ class Context:
 
     def AddIdlPostProcessor(self, processor: IdlPostProcessor, has_priority: bool = False):
         if has_priority:
-            self._idl_post_processors.insert(0, processor)
+            self._priority_idl_post_processors.append(processor)
         else:
             self._idl_post_processors.append(processor)
 
+    def Merge(self, other: 'Context'):
+        """Adds the shared data and post-processors of a context used to parse other sources.
+
+        Post-processing afterwards is the same as if the other sources had been
+        parsed with this context.
+        """
+        self._global_attributes.update(other._global_attributes)
+        # Post-processors of the other context get global attributes from it
+        other._global_attributes = self._global_attributes
+        self._not_handled |= other._not_handled
+        self._priority_idl_post_processors.extend(other._priority_idl_post_processors)
+        self._idl_post_processors.extend(other._idl_post_processors)
+
     def PostProcess(self, idl: Idl):
+        # Priority processors run first, the last added first.
+        for p in reversed(self._priority_idl_post_processors):
+            p.FinalizeProcessing(idl)
         for p in self._idl_post_processors:
             p.FinalizeProcessing(idl)
 
+        self._priority_idl_post_processors = []
         self._idl_post_processors = []
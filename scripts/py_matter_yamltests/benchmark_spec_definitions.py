@@ -0,0 +1,68 @@
+#!/usr/bin/env -S python3 -B
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the 'License');
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an 'AS IS' BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+'''
+Measures how long the yaml test runners take to get the SpecDefinitions of the clusters at start-up: parsing the
+cluster definitions, and loading them from the cache. Example, from the root of the repository:
+
+    python3 scripts/py_matter_yamltests/benchmark_spec_definitions.py --runs 5
+'''
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+from matter.yamltests.definitions import SpecDefinitionsFromPaths
+from matter.yamltests.pseudo_clusters.pseudo_clusters import get_default_pseudo_clusters
+
+_DEFAULT_SPECIFICATIONS_PATHS = 'src/app/zap-templates/zcl/data-model/chip/*.xml'
+
+
+def _measure(runs: int, paths, pseudo_clusters, cache_directory):
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        SpecDefinitionsFromPaths(paths, pseudo_clusters, cache_directory)
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5, help='Number of times the definitions are loaded')
+    parser.add_argument('--specifications_paths', default=_DEFAULT_SPECIFICATIONS_PATHS,
+                        help='Comma separated paths of the clusters definitions')
+    args = parser.parse_args()
+
+    paths = args.specifications_paths.split(',')
+    pseudo_clusters = get_default_pseudo_clusters()
+    with tempfile.TemporaryDirectory() as cache_directory:
+        results = {
+            'parse': _measure(args.runs, paths, pseudo_clusters, None),
+            'cache miss': _measure(1, paths, pseudo_clusters, cache_directory),
+            'cache hit': _measure(args.runs, paths, pseudo_clusters, cache_directory),
+        }
+        cache_size = sum(os.path.getsize(os.path.join(cache_directory, name)) for name in os.listdir(cache_directory))
+
+    for name, durations in results.items():
+        print(f'{name:<12} median {statistics.median(durations) * 1000:8.1f} ms, min {min(durations) * 1000:8.1f} ms')
+    print(f'cache size   {cache_size / 1024:8.1f} KiB')
+
+
+if __name__ == '__main__':
+    main()
@@ -15,15 +15,29 @@
 
 import enum
 import glob
+import hashlib
 import io
+import logging
+import os
+import pickle
+import sys
+import tempfile
 from typing import List, Optional
 
+import matter.idl.matter_idl_types
+import matter.idl.xml_fragments
+import matter.idl.zapxml
 from matter.idl.matter_idl_types import (Attribute, Bitmap, Cluster, Command, Enum, Event, FieldQuality, Struct, StructQuality,
                                          StructTag)
 from matter.idl.zapxml import ParseSource, ParseXmls
 
 from .pseudo_clusters.pseudo_clusters import PseudoClusters
 
+LOGGER = logging.getLogger(__name__)
+
+# Bump when the content of the pickled SpecDefinitions changes in a way the parser sources hash does not catch.
+_CACHE_VERSION = 1
+
 
 class _ItemType(enum.Enum):
     Cluster = 0
@@ -55,6 +69,9 @@ class SpecDefinitions:
         self.__enums_by_name: dict[str, dict[str, Enum]] = {}
         self.__structs_by_name: dict[str, dict[str, Struct]] = {}
 
+        # Identifies the sources the definitions were built from, when known.
+        self.digest: Optional[str] = None
+
         idl = ParseXmls(sources)
 
         for cluster in idl.clusters:
@@ -283,14 +300,86 @@ class SpecDefinitions:
         return target | global_target
 
 
-def SpecDefinitionsFromPaths(paths: str, pseudo_clusters: Optional[PseudoClusters] = PseudoClusters([])):
+def default_cache_directory() -> str:
+    """Directory SpecDefinitions are cached in by the yaml test runners."""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'matter-yamltests')
+
+
+def _parser_files() -> List[str]:
+    # The cached definitions are only valid for the parser which built them.
+    # Walks the whole zapxml package, as its handlers live in the handlers sub-package.
+    files = []
+    for root, dirs, names in os.walk(os.path.dirname(matter.idl.zapxml.__file__)):
+        dirs[:] = sorted(d for d in dirs if d != '__pycache__')
+        files.extend(os.path.join(root, name) for name in sorted(names) if name.endswith('.py'))
+    return files + [matter.idl.xml_fragments.__file__, matter.idl.matter_idl_types.__file__, __file__]
+
+
+def _cache_key(filenames: List[str], pseudo_clusters: PseudoClusters) -> str:
+    digest = hashlib.sha256()
+    digest.update(f'{_CACHE_VERSION} {sys.version_info[:2]} {pickle.HIGHEST_PROTOCOL}'.encode())
+    for name in _parser_files() + filenames:
+        with open(name, 'rb') as f:
+            content = f.read()
+        digest.update(f'{name} {len(content)}'.encode())
+        digest.update(content)
+    for pseudo_cluster in pseudo_clusters.clusters:
+        if pseudo_cluster.definition is not None:
+            digest.update(f'{pseudo_cluster.name} {len(pseudo_cluster.definition)}'.encode())
+            digest.update(pseudo_cluster.definition.encode())
+    return digest.hexdigest()
+
+
+def _load_cached(path: str) -> Optional[SpecDefinitions]:
+    try:
+        with open(path, 'rb') as f:
+            definitions = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        LOGGER.warning(f'Ignoring unreadable cached specifications {path}: {e}')
+        return None
+    return definitions if isinstance(definitions, SpecDefinitions) else None
+
+
+def _store_cached(path: str, definitions: SpecDefinitions):
+    # Written to a temporary file first, as other runners may be loading the same definitions concurrently.
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(definitions, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        LOGGER.warning(f'Failed to cache specifications in {path}: {e}')
+
+
+def SpecDefinitionsFromPaths(paths: str, pseudo_clusters: Optional[PseudoClusters] = PseudoClusters([]),
+                             cache_directory: Optional[str] = None):
+    """
+    Build the SpecDefinitions of the cluster definitions in the given paths (which may be glob patterns), and of the
+    given pseudo clusters.
+
+    When a cache directory is given, the built definitions are stored in it, keyed by a hash of the content of the
+    definition files, of the pseudo clusters definitions and of the parser, and later calls with the same inputs load
+    them from there instead of parsing the definitions again.
+    """
     filenames = []
     for path in paths:
         if '*' in path or '?' in path:
-            filenames.extend(glob.glob(path, recursive=False))
+            filenames.extend(sorted(glob.glob(path, recursive=False)))
         else:
             filenames.append(path)
 
+    key = _cache_key(filenames, pseudo_clusters)
+    cache_path = None
+    if cache_directory:
+        cache_path = os.path.join(cache_directory, key + '.pickle')
+        definitions = _load_cached(cache_path)
+        if definitions is not None:
+            return definitions
+
     sources = [ParseSource(source=name) for name in filenames]
 
     for pseudo_cluster in pseudo_clusters.clusters:
@@ -300,4 +389,8 @@ def SpecDefinitionsFromPaths(paths: str, pseudo_clusters: Optional[PseudoCluster
             sources = (
                 sources + [ParseSource(source=io.StringIO(definition), name=name)])
 
-    return SpecDefinitions(sources)
+    definitions = SpecDefinitions(sources)
+    definitions.digest = key
+    if cache_path:
+        _store_cached(cache_path, definitions)
+    return definitions
@@ -43,6 +43,25 @@ class TestParserHooks():
         """
         pass
 
+    def preparsing_stop(self, count: int, cached: int, jobs: int, duration: int):
+        """
+        This method is called when the parser is done parsing a set of files
+        up-front, before the files are iterated over.
+
+        Parameters
+        ----------
+        count: int
+            The number of files successfully parsed. Files which failed to
+            parse are parsed again, and reported, when iterated over.
+        cached: int
+            How many of those files were loaded from the cache.
+        jobs: int
+            The number of processes the files were parsed by.
+        duration: int
+            How long it took to parse the set of files, in milliseconds.
+        """
+        pass
+
     def test_parsing_start(self, name: str):
         """
         This method is called when the parser starts parsing a single file.
@@ -13,14 +13,29 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import concurrent.futures
 import copy
+import glob
+import hashlib
+import io
+import logging
+import os
+import pickle
+import sys
+import tempfile
 import time
 from dataclasses import dataclass, field
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
+from .definitions import SpecDefinitions
 from .hooks import TestParserHooks
 from .parser import TestParser, TestParserConfig
 
+LOGGER = logging.getLogger(__name__)
+
+# Bump when the content of the pickled TestParser changes in a way the parser sources hash does not catch.
+_CACHE_VERSION = 1
+
 
 @dataclass
 class TestParserBuilderOptions:
@@ -31,8 +46,21 @@ class TestParserBuilderOptions:
     stop_on_error: If set to False the parser will continue parsing
                    the next test instead of aborting if an error is
                    encountered while parsing a particular test file.
+
+    jobs: If greater than 1, all the tests are parsed up-front, by that
+          many processes, instead of one after the other as they are
+          iterated over.
+
+    cache_directory: If set, all the tests are parsed up-front, and the
+                     parsed tests are cached in this directory, keyed by
+                     a hash of the test file, of the parser configuration
+                     and of the definitions. Tests which did not change
+                     are then loaded from the cache instead of being
+                     parsed again.
     """
     stop_on_error: bool = True
+    jobs: int = 1
+    cache_directory: Optional[str] = None
 
 
 @dataclass
@@ -58,6 +86,116 @@ class TestParserBuilderConfig:
         default_factory=TestParserBuilderOptions)
 
 
+class _Pickler(pickle.Pickler):
+    # The definitions are shared by all the tests, they are not pickled with every parsed test.
+    def __init__(self, file, definitions: SpecDefinitions):
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        self.__definitions = definitions
+
+    def persistent_id(self, obj):
+        if obj is not None and obj is self.__definitions:
+            return 'definitions'
+        return None
+
+
+class _Unpickler(pickle.Unpickler):
+    def __init__(self, file, definitions: SpecDefinitions):
+        super().__init__(file)
+        self.__definitions = definitions
+
+    def persistent_load(self, pid):
+        if pid != 'definitions':
+            raise pickle.UnpicklingError(f'Unsupported persistent id: {pid}')
+        return self.__definitions
+
+
+def _dumps(parser: TestParser, definitions: SpecDefinitions) -> bytes:
+    data = io.BytesIO()
+    _Pickler(data, definitions).dump(parser)
+    return data.getvalue()
+
+
+def _loads(data: bytes, definitions: SpecDefinitions) -> TestParser:
+    return _Unpickler(io.BytesIO(data), definitions).load()
+
+
+# The parser configuration of the processes parsing tests up-front.
+_worker_parser_config: Optional[TestParserConfig] = None
+
+
+def _init_worker(parser_config: TestParserConfig):
+    global _worker_parser_config
+    _worker_parser_config = parser_config
+
+
+def _parse(test_file: str) -> Tuple[str, Optional[bytes], int]:
+    """
+    Parse a test up-front and return it pickled, with how long it took to parse it in milliseconds.
+
+    Tests which fail to parse are returned as None, to be parsed again when iterated over, so that the failure is
+    reported with the exception raised by the parser.
+    """
+    start = time.time()
+    try:
+        parser = TestParser(test_file, _worker_parser_config)
+        data = _dumps(parser, _worker_parser_config.definitions)
+    except Exception:
+        return test_file, None, 0
+    return test_file, data, round((time.time() - start) * 1000, 0)
+
+
+class _TestParserCache:
+    def __init__(self, directory: str, parser_config: TestParserConfig):
+        self.__directory = directory
+        self.__config_digest = self.__digest_config(parser_config)
+
+    def load(self, path: str) -> Optional[bytes]:
+        try:
+            with open(path, 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def store(self, path: str, data: bytes):
+        # Written to a temporary file first, as other runners may be loading the same tests concurrently.
+        try:
+            os.makedirs(self.__directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.__directory, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            LOGGER.warning(f'Failed to cache the parsed test in {path}: {e}')
+
+    def path(self, test_file: str) -> Optional[str]:
+        digest = hashlib.sha256(self.__config_digest.encode())
+        digest.update(os.path.abspath(test_file).encode())
+        try:
+            with open(test_file, 'rb') as f:
+                digest.update(f.read())
+        except OSError:
+            # Reported by the parser.
+            return None
+        return os.path.join(self.__directory, digest.hexdigest() + '.pickle')
+
+    @staticmethod
+    def __digest_config(parser_config: TestParserConfig) -> str:
+        digest = hashlib.sha256()
+        digest.update(f'{_CACHE_VERSION} {sys.version_info[:2]} {pickle.HIGHEST_PROTOCOL}'.encode())
+        # The parsed tests are only valid for the parser which parsed them.
+        for name in sorted(glob.glob(os.path.join(os.path.dirname(__file__), '**', '*.py'), recursive=True)):
+            with open(name, 'rb') as f:
+                digest.update(f.read())
+        if parser_config.pics is not None:
+            with open(parser_config.pics, 'rb') as f:
+                digest.update(f.read())
+        digest.update(repr(sorted(parser_config.config_override.items())).encode())
+        definitions = parser_config.definitions
+        if definitions is not None:
+            digest.update((definitions.digest or hashlib.sha256(pickle.dumps(definitions)).hexdigest()).encode())
+        return digest.hexdigest()
+
+
 class TestParserBuilder:
     """
     TestParserBuilder is an iterator over a set of tests using a common configuration.
@@ -67,6 +205,9 @@ class TestParserBuilder:
         self.__tests = copy.copy(config.tests)
         self.__config = config
         self.__duration = 0
+        # Tests parsed up-front, pickled, with how long it took to parse (or load) them.
+        self.__parsed_tests: Dict[str, Tuple[bytes, int]] = {}
+        self.__prepared = False
         self.done = False
 
     def __iter__(self):
@@ -74,6 +215,9 @@ class TestParserBuilder:
         return self
 
     def __next__(self):
+        if not self.__prepared:
+            self.__prepare()
+
         if len(self.__tests):
             return self.__get_test_parser(self.__tests.pop(0))
 
@@ -83,7 +227,58 @@ class TestParserBuilder:
 
         raise StopIteration
 
+    def __prepare(self):
+        self.__prepared = True
+        options = self.__config.options
+        if options.jobs <= 1 and not options.cache_directory:
+            return
+
+        start = time.time()
+        parser_config = self.__config.parser_config
+        cache = _TestParserCache(options.cache_directory, parser_config) if options.cache_directory else None
+
+        cache_paths = {}
+        pending = []
+        for test_file in dict.fromkeys(self.__tests):
+            load_start = time.time()
+            data = None
+            if cache:
+                cache_paths[test_file] = cache.path(test_file)
+                data = cache.load(cache_paths[test_file]) if cache_paths[test_file] else None
+            if data is None:
+                pending.append(test_file)
+            else:
+                self.__parsed_tests[test_file] = (data, round((time.time() - load_start) * 1000, 0))
+        cached = len(self.__parsed_tests)
+
+        if options.jobs > 1 and len(pending) > 1:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=options.jobs, initializer=_init_worker,
+                                                        initargs=(parser_config,)) as executor:
+                results = list(executor.map(_parse, pending))
+        else:
+            _init_worker(parser_config)
+            results = [_parse(test_file) for test_file in pending]
+
+        for test_file, data, duration in results:
+            if data is None:
+                continue
+            self.__parsed_tests[test_file] = (data, duration)
+            if cache and cache_paths[test_file]:
+                cache.store(cache_paths[test_file], data)
+
+        # Tests are parsed in parallel, only the elapsed time is meaningful for the whole set.
+        self.__duration = round((time.time() - start) * 1000, 0)
+        self.__config.hooks.preparsing_stop(len(self.__parsed_tests), cached, max(options.jobs, 1), self.__duration)
+
     def __get_test_parser(self, test_file: str) -> TestParser:
+        if test_file in self.__parsed_tests:
+            data, duration = self.__parsed_tests[test_file]
+            self.__config.hooks.test_parsing_start(test_file)
+            # Every test gets its own parser, a test listed twice is not iterated over twice by the same parser.
+            parser = _loads(data, self.__config.parser_config.definitions)
+            self.__config.hooks.test_parsing_success(duration)
+            return parser
+
         start = time.time()
 
         parser = None
@@ -14,12 +14,14 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import os
+import tempfile
 import unittest
 from unittest.mock import mock_open, patch
 
 from matter.yamltests.hooks import TestParserHooks
 from matter.yamltests.parser import TestParser
-from matter.yamltests.parser_builder import TestParserBuilder, TestParserBuilderConfig
+from matter.yamltests.parser_builder import TestParserBuilder, TestParserBuilderConfig, TestParserBuilderOptions
 
 simple_yaml = '''
 name: Hello World
@@ -71,6 +73,7 @@ class TestHooks(TestParserHooks):
         self.test_start_count = 0
         self.test_failure_count = 0
         self.test_success_count = 0
+        self.preparsed = []
 
     def parsing_start(self, count):
         self.start_count += 1
@@ -78,6 +81,9 @@ class TestHooks(TestParserHooks):
     def parsing_stop(self, duration):
         self.stop_count += 1
 
+    def preparsing_stop(self, count, cached, jobs, duration):
+        self.preparsed.append((count, cached, jobs))
+
     def test_parsing_start(self, name):
         self.test_start_count += 1
 
@@ -203,5 +209,63 @@ class TestSuiteParserBuilder(unittest.TestCase):
         self.assertEqual(hooks.test_failure_count, 1)
 
 
+class TestSuiteParserBuilderPreparsing(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.cache_directory = os.path.join(directory.name, 'cache')
+
+    def _write(self, name, content):
+        path = os.path.join(self.directory, name)
+        with open(path, 'w') as f:
+            f.write(content)
+        return path
+
+    def _parse(self, tests, **options):
+        hooks = TestHooks()
+        parser_builder_config = TestParserBuilderConfig(tests, hooks=hooks, options=TestParserBuilderOptions(**options))
+        parsers = list(TestParserBuilder(parser_builder_config))
+        return parsers, hooks
+
+    def test_parser_builder_with_jobs(self):
+        tests = [self._write(f'Test_{i}.yaml', valid_yaml) for i in range(4)]
+        tests.append(tests[0])
+
+        parsers, hooks = self._parse(tests, jobs=2)
+        self.assertEqual(hooks.preparsed, [(4, 0, 2)])
+        self.assertEqual(hooks.test_success_count, 5)
+        self.assertEqual([parser.filename for parser in parsers], [os.path.basename(test)[:-5] for test in tests])
+        # A test listed twice gets two parsers, each iterating over all the steps.
+        self.assertIsNot(parsers[0], parsers[4])
+        self.assertEqual(len(list(parsers[0].tests)), 2)
+        self.assertEqual(len(list(parsers[4].tests)), 2)
+
+    def test_parser_builder_with_cache(self):
+        tests = [self._write('Test_1.yaml', valid_yaml), self._write('Test_2.yaml', simple_yaml)]
+
+        _, hooks = self._parse(tests, cache_directory=self.cache_directory)
+        self.assertEqual(hooks.preparsed, [(2, 0, 1)])
+
+        parsers, hooks = self._parse(tests, cache_directory=self.cache_directory)
+        self.assertEqual(hooks.preparsed, [(2, 2, 1)])
+        self.assertEqual([parser.name for parser in parsers], ['TestOnOff', 'Hello World'])
+
+        self._write('Test_2.yaml', valid_yaml)
+        parsers, hooks = self._parse(tests, cache_directory=self.cache_directory)
+        self.assertEqual(hooks.preparsed, [(2, 1, 1)])
+        self.assertEqual([parser.name for parser in parsers], ['TestOnOff', 'TestOnOff'])
+
+    def test_parser_builder_with_jobs_and_errors(self):
+        tests = [self._write('Test_1.yaml', valid_yaml), self._write('Test_2.yaml', invalid_yaml)]
+
+        parsers, hooks = self._parse(tests, jobs=2, cache_directory=self.cache_directory, stop_on_error=False)
+        self.assertEqual(hooks.preparsed, [(1, 0, 2)])
+        self.assertEqual(hooks.test_success_count, 1)
+        self.assertEqual(hooks.test_failure_count, 1)
+        self.assertIsInstance(parsers[0], TestParser)
+        self.assertIsNone(parsers[1])
+
+
 if __name__ == '__main__':
     unittest.main()
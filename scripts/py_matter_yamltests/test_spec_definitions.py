@@ -15,9 +15,17 @@
 #    limitations under the License.
 
 import io
+import os
+import shutil
+import tempfile
 import unittest
+from unittest import mock
 
-from matter.yamltests.definitions import Attribute, Bitmap, Command, Enum, Event, ParseSource, SpecDefinitions, Struct
+from matter.yamltests import definitions as definitions_module
+from matter.yamltests.definitions import (Attribute, Bitmap, Command, Enum, Event, ParseSource, SpecDefinitions,
+                                          SpecDefinitionsFromPaths, Struct)
+from matter.yamltests.pseudo_clusters.pseudo_cluster import PseudoCluster
+from matter.yamltests.pseudo_clusters.pseudo_clusters import PseudoClusters
 
 source_cluster = '''<?xml version="1.0"?>
   <configurator>
@@ -475,5 +483,79 @@ class TestSpecDefinitions(unittest.TestCase):
         self.assertEqual(events, [])
 
 
+class _PseudoCluster(PseudoCluster):
+    name = 'PseudoTest'
+    definition = '''<?xml version="1.0"?>
+  <configurator>
+    <cluster>
+      <name>PseudoTest</name>
+      <code>0xFFF1FC00</code>
+    </cluster>
+  </configurator>
+'''
+
+
+class TestSpecDefinitionsCache(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.cache_directory = os.path.join(directory.name, 'cache')
+        self.source = os.path.join(directory.name, 'test-cluster.xml')
+        with open(self.source, 'w') as f:
+            f.write(source_command)
+
+    def _load(self, pseudo_clusters=PseudoClusters([])):
+        with mock.patch.object(definitions_module, 'ParseXmls', wraps=definitions_module.ParseXmls) as parse:
+            definitions = SpecDefinitionsFromPaths([self.source], pseudo_clusters, self.cache_directory)
+        return definitions, parse.call_count
+
+    def test_definitions_are_cached(self):
+        definitions, builds = self._load()
+        self.assertEqual(builds, 1)
+        self.assertEqual(len(os.listdir(self.cache_directory)), 1)
+
+        definitions, builds = self._load()
+        self.assertEqual(builds, 0)
+        self.assertEqual(definitions.get_command_names('Test'), ['TestCommand'])
+        self.assertIsInstance(definitions.get_command_by_name('Test', 'TestCommand'), Command)
+
+    def test_cache_is_invalidated(self):
+        self._load()
+
+        with open(self.source, 'w') as f:
+            f.write(source_attribute)
+        definitions, builds = self._load()
+        self.assertEqual(builds, 1)
+        self.assertEqual(definitions.get_command_names('Test'), [])
+        self.assertEqual(definitions.get_attribute_names('Test'), ['TestAttribute', 'TestGlobalAttribute'])
+
+        definitions, builds = self._load(PseudoClusters([_PseudoCluster()]))
+        self.assertEqual(builds, 1)
+        self.assertTrue(definitions.has_cluster_by_name('PseudoTest'))
+
+    def test_cache_is_invalidated_by_parser_handlers(self):
+        # Works on a copy of the zapxml parser, as its handlers are in a sub-package of it.
+        zapxml_directory = os.path.join(os.path.dirname(self.cache_directory), 'zapxml')
+        shutil.copytree(os.path.dirname(definitions_module.matter.idl.zapxml.__file__), zapxml_directory,
+                        ignore=shutil.ignore_patterns('__pycache__'))
+        with mock.patch.object(definitions_module.matter.idl.zapxml, '__file__', os.path.join(zapxml_directory, '__init__.py')):
+            key = definitions_module._cache_key([self.source], PseudoClusters([]))
+            with open(os.path.join(zapxml_directory, 'handlers', 'handlers.py'), 'a') as f:
+                f.write('\n# Changed handler\n')
+            self.assertNotEqual(definitions_module._cache_key([self.source], PseudoClusters([])), key)
+
+    def test_unreadable_cache_is_rebuilt(self):
+        self._load()
+        for name in os.listdir(self.cache_directory):
+            with open(os.path.join(self.cache_directory, name), 'wb') as f:
+                f.write(b'not a pickle')
+
+        definitions, builds = self._load()
+        self.assertEqual(builds, 1)
+        self.assertEqual(definitions.get_command_names('Test'), ['TestCommand'])
+        definitions, builds = self._load()
+        self.assertEqual(builds, 0)
+
+
 if __name__ == '__main__':
     unittest.main()
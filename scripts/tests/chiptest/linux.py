@@ -57,6 +57,14 @@ def EnsurePrivateState():
         sys.exit(1)
 
 
+def MountPrivateTmp(path: str):
+    """Mounts the given directory over /tmp, for the applications of a test shard not to share their storage files."""
+    logging.info("Using %s as /tmp", path)
+    if subprocess.run(["mount", "--bind", path, "/tmp"]).returncode != 0:
+        logging.error("Failed to mount %s over /tmp", path)
+        sys.exit(1)
+
+
 class IsolatedNetworkNamespace:
     """Helper class to create and remove network namespaces for tests."""
 
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
 import logging
 import os
 import pty
@@ -22,6 +23,17 @@ import sys
 import threading
 import typing
 
+# Number of output lines kept in memory by a LogPipe. Older lines are dropped.
+DEFAULT_MAX_CAPTURED_LINES = 10000
+
+
+class _LogWatch:
+    """A text waited for in the output captured by a LogPipe."""
+
+    def __init__(self, txt: str):
+        self.txt = txt
+        self.index: typing.Optional[int] = None
+
 
 class LogPipe(threading.Thread):
     """Create PTY-based PIPE for IPC.
@@ -31,9 +43,12 @@ class LogPipe(threading.Thread):
     enable IO buffering in the spawned process. In order to trick such process
     to flush its streams immediately, we are going to create a PIPE based on
     pseudoterminal (PTY).
+
+    Captured lines are numbered from 0 in the order they were received. Only
+    the last max_lines lines are kept in captured_logs.
     """
 
-    def __init__(self, level, capture_delegate=None, name=None):
+    def __init__(self, level, capture_delegate=None, name=None, max_lines=DEFAULT_MAX_CAPTURED_LINES):
         """
         Setup the object with a logger and a loglevel and start the thread.
         """
@@ -43,20 +58,56 @@ class LogPipe(threading.Thread):
         self.level = level
         self.fd_read, self.fd_write = pty.openpty()
         self.reader = open(self.fd_read, encoding='utf-8', errors='ignore')
-        self.captured_logs = []
+        self.captured_logs = collections.deque(maxlen=max_lines)
+        # Number of lines captured so far, which is the index of the next line.
+        self.line_count = 0
+        # Set once the writing side of the pipe is closed (e.g. the process exited).
+        self.closed = False
         self.capture_delegate = capture_delegate
         self.name = name
+        self.cv = threading.Condition()
+        self.watches: typing.List[_LogWatch] = []
 
         self.start()
 
+    def _Find(self, txt: str, index: int):
+        # Must be called with self.cv held.
+        first = self.line_count - len(self.captured_logs)
+        if index < first:
+            logging.warning('%s: lines %d to %d were dropped from the captured output, searching %r from line %d',
+                            self.name, index, first - 1, txt, first)
+            index = first
+        for i in range(index, self.line_count):
+            if txt in self.captured_logs[i - first]:
+                return True, i
+        return False, self.line_count
+
     def CapturedLogContains(self, txt: str, index=0):
-        for i, line in enumerate(self.captured_logs[index:]):
-            if txt in line:
-                return True, index + i
-        return False, len(self.captured_logs)
+        with self.cv:
+            return self._Find(txt, index)
+
+    def WaitForLine(self, txt: str, index=0, timeout: typing.Optional[float] = None) -> typing.Optional[int]:
+        """Waits for a line containing txt, starting at the given line index.
+
+        Returns the index of the line, or None if no such line was received
+        before the timeout or before the pipe was closed.
+        """
+        with self.cv:
+            found, index = self._Find(txt, index)
+            if found:
+                return index
+            watch = _LogWatch(txt)
+            self.watches.append(watch)
+            try:
+                self.cv.wait_for(lambda: watch.index is not None or self.closed, timeout)
+            finally:
+                self.watches.remove(watch)
+            return watch.index
 
     def FindLastMatchingLine(self, matcher):
-        for line in reversed(self.captured_logs):
+        with self.cv:
+            lines = list(self.captured_logs)
+        for line in reversed(lines):
             match = re.match(matcher, line)
             if match:
                 return match
@@ -78,10 +129,22 @@ class LogPipe(threading.Thread):
             except OSError:
                 break
             logging.log(self.level, line.strip('\n'))
-            self.captured_logs.append(line)
+            with self.cv:
+                self.captured_logs.append(line)
+                matched = False
+                for watch in self.watches:
+                    if watch.index is None and watch.txt in line:
+                        watch.index = self.line_count
+                        matched = True
+                self.line_count += 1
+                if matched:
+                    self.cv.notify_all()
             if self.capture_delegate:
                 self.capture_delegate.Log(self.name, line)
         self.reader.close()
+        with self.cv:
+            self.closed = True
+            self.cv.notify_all()
 
     def close(self):
         """Close the write end of the pipe."""
@@ -120,16 +183,17 @@ class RunnerWaitQueue:
 
 class Runner:
 
-    def __init__(self, capture_delegate=None):
+    def __init__(self, capture_delegate=None, max_captured_lines=DEFAULT_MAX_CAPTURED_LINES):
         self.capture_delegate = capture_delegate
+        self.max_captured_lines = max_captured_lines
 
     def RunSubprocess(self, cmd, name, wait=True, dependencies=[], timeout_seconds: typing.Optional[int] = None, stdin=None):
         outpipe = LogPipe(
             logging.DEBUG, capture_delegate=self.capture_delegate,
-            name=name + ' OUT')
+            name=name + ' OUT', max_lines=self.max_captured_lines)
         errpipe = LogPipe(
             logging.INFO, capture_delegate=self.capture_delegate,
-            name=name + ' ERR')
+            name=name + ' ERR', max_lines=self.max_captured_lines)
 
         if sys.platform == 'darwin':
             # Try harder to avoid any stdout buffering in our tests
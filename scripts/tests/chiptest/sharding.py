@@ -0,0 +1,209 @@
+# Copyright (c) 2026 Project CHIP Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Runs the tests of a suite in parallel shards.
+
+Every shard is a separate run of the test suite script, in its own network and
+mount namespaces (see `unshare`): it creates its own 'app' and 'tool' network
+namespaces, runs its own accessory server, and gets its own /tmp, so that the
+applications of different shards do not share storage files or ports.
+
+Tests are assigned to shards longest first, using the durations recorded by
+previous runs, and the results and logs of all shards are reported in the
+order of the tests, whatever the order in which they completed.
+"""
+
+import io
+import json
+import logging
+import os
+import queue
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import typing
+from dataclasses import asdict, dataclass
+
+from .linux import test_environ
+from .test_definition import TestDefinition, TestTag
+
+# Expected duration of tests without a recorded duration.
+DEFAULT_TEST_SECONDS = 10
+SLOW_TEST_SECONDS = 60
+EXTRA_SLOW_TEST_SECONDS = 300
+
+
+@dataclass
+class TestResult:
+    name: str
+    iteration: int
+    passed: bool
+    seconds: float
+    log: str = ''
+
+
+def LoadDurations(path: typing.Optional[str]) -> typing.Dict[str, float]:
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def SaveDurations(path: str, durations: typing.Dict[str, float], results: typing.List[TestResult]):
+    """Records the durations of the tests which passed, for the scheduling of the next runs."""
+    durations = dict(durations)
+    for result in results:
+        if result.passed:
+            durations[result.name] = round(result.seconds, 2)
+    with open(path, 'w') as f:
+        json.dump(durations, f, indent=2, sort_keys=True)
+
+
+def EstimatedSeconds(test: TestDefinition, durations: typing.Dict[str, float]) -> float:
+    if test.name in durations:
+        return durations[test.name]
+    if TestTag.EXTRA_SLOW in test.tags:
+        return EXTRA_SLOW_TEST_SECONDS
+    if TestTag.SLOW in test.tags:
+        return SLOW_TEST_SECONDS
+    return DEFAULT_TEST_SECONDS
+
+
+def ScheduleShards(tests: typing.List[TestDefinition], jobs: int,
+                   durations: typing.Dict[str, float]) -> typing.List[typing.List[TestDefinition]]:
+    """
+    Splits the tests into (at most) `jobs` shards of about the same duration.
+
+    Tests are assigned longest first to the shard with the least work so far,
+    and every shard runs its tests longest first. The result only depends on
+    the tests and the durations.
+    """
+    shards: typing.List[typing.List[TestDefinition]] = [[] for _ in range(min(jobs, len(tests)))]
+    loads = [0.0] * len(shards)
+    for test in sorted(tests, key=lambda test: (-EstimatedSeconds(test, durations), test.name)):
+        shard = loads.index(min(loads))
+        shards[shard].append(test)
+        loads[shard] += EstimatedSeconds(test, durations)
+    return shards
+
+
+class ShardReporter:
+    """Sends the result and the log of every test run by a shard to the parent run."""
+
+    def __init__(self, fd: int):
+        self._results = os.fdopen(fd, 'w', buffering=1)
+        self._log = None
+        self._handler = None
+
+    def StartTest(self):
+        self._log = io.StringIO()
+        self._handler = logging.StreamHandler(self._log)
+        self._handler.setFormatter(logging.Formatter('%(asctime)s.%(msecs)03d %(levelname)-7s %(message)s', '%H:%M:%S'))
+        logging.getLogger().addHandler(self._handler)
+
+    def FinishTest(self, name: str, iteration: int, passed: bool, seconds: float):
+        logging.getLogger().removeHandler(self._handler)
+        result = TestResult(name=name, iteration=iteration, passed=passed, seconds=seconds, log=self._log.getvalue())
+        self._results.write(json.dumps(asdict(result)) + '\n')
+
+
+def ShardCommand(main_command: typing.List[str], run_args: typing.List[str], index: int, tests: typing.List[TestDefinition],
+                 results_fd: int, tmp_dir: str) -> typing.List[str]:
+    """
+    The command of a shard: `main_command run run_args` for the tests of the
+    shard, inside its own namespaces. `main_command` is the test suite script
+    with its options, `run_args` the options of its 'run' command.
+    """
+    if '--internal-inside-unshare' not in main_command:
+        main_command = main_command + ['--internal-inside-unshare']
+    shard_args = [
+        '--internal-shard-index', str(index),
+        '--internal-shard-tests', ','.join(test.name for test in tests),
+        '--internal-shard-results-fd', str(results_fd),
+        '--internal-shard-tmp', tmp_dir,
+    ]
+    return ['unshare', '--map-root-user', '-n', '-m'] + main_command + ['run'] + run_args + shard_args
+
+
+def RunShards(tests: typing.List[TestDefinition], jobs: int, iterations: int, durations: typing.Dict[str, float],
+              main_command: typing.List[str], run_args: typing.List[str]) -> typing.List[TestResult]:
+    """
+    Runs the tests in `jobs` shards of `main_command run run_args` (see
+    ShardCommand), and returns the results of all the tests
+    of every iteration, in the order of the tests. Tests which were not run by
+    their shard (e.g. because it stopped at an earlier failure or crashed) are
+    reported as failed.
+    """
+    shards = ScheduleShards(tests, jobs, durations)
+    for index, shard in enumerate(shards):
+        logging.info('Shard %d: %d tests, about %d seconds', index, len(shard),
+                     sum(EstimatedSeconds(test, durations) for test in shard))
+
+    work_dir = tempfile.mkdtemp(prefix='chip-test-shards-')
+    results: 'queue.Queue[typing.Optional[TestResult]]' = queue.Queue()
+    processes = []
+    try:
+        for index, shard in enumerate(shards):
+            read_fd, write_fd = os.pipe()
+            tmp_dir = os.path.join(work_dir, f'shard-{index}-tmp')
+            os.mkdir(tmp_dir)
+            output = open(os.path.join(work_dir, f'shard-{index}.log'), 'wb')
+            process = subprocess.Popen(ShardCommand(main_command, run_args, index, shard, write_fd, tmp_dir),
+                                       stdout=output, stderr=subprocess.STDOUT, pass_fds=[write_fd], env=test_environ)
+            os.close(write_fd)
+            output.close()
+            processes.append(process)
+
+            def read(read_fd=read_fd):
+                with os.fdopen(read_fd) as f:
+                    for line in f:
+                        results.put(TestResult(**json.loads(line)))
+                results.put(None)
+
+            threading.Thread(target=read, daemon=True).start()
+
+        # Report progress as the tests complete.
+        completed: typing.Dict[typing.Tuple[str, int], TestResult] = {}
+        remaining = len(shards)
+        while remaining:
+            result = results.get()
+            if result is None:
+                remaining -= 1
+                continue
+            completed[(result.name, result.iteration)] = result
+            logging.info('%-30s - %s in %0.2f seconds (%d/%d)', result.name, 'Completed' if result.passed else 'FAILED',
+                         result.seconds, len(completed), len(tests) * iterations)
+
+        for index, process in enumerate(processes):
+            if process.wait() != 0:
+                logging.error('Shard %d exited with code %d, output:', index, process.returncode)
+                with open(os.path.join(work_dir, f'shard-{index}.log'), errors='replace') as f:
+                    sys.stderr.write(f.read())
+    finally:
+        for process in processes:
+            if process.poll() is None:
+                process.kill()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    ordered = []
+    for iteration in range(iterations):
+        for test in tests:
+            result = completed.get((test.name, iteration))
+            if result is None:
+                result = TestResult(name=test.name, iteration=iteration, passed=False, seconds=0, log='Not run\n')
+            ordered.append(result)
+    return ordered
@@ -63,6 +63,8 @@ class App:
             # might fail, so attempts to kill us on failure actually work.
             self.process, self.outpipe, errpipe = self.__startServer(
                 self.runner, self.command)
+            # Lines are numbered from the start of the output of every process.
+            self.lastLogIndex = 0
             self.waitForAnyAdvertisement()
             self.__updateSetUpCode()
             with self.cv_stopped:
@@ -139,25 +141,22 @@ class App:
     def __waitFor(self, waitForString, server_process, outpipe, timeoutInSeconds=10):
         logging.debug('Waiting for %s' % waitForString)
 
-        start_time = time.monotonic()
-        ready, self.lastLogIndex = outpipe.CapturedLogContains(
-            waitForString, self.lastLogIndex)
-        if ready:
-            self.lastLogIndex += 1
-
-        while not ready:
+        # Woken up as soon as the line is received, or the output is closed.
+        index = outpipe.WaitForLine(waitForString, self.lastLogIndex, timeoutInSeconds)
+        if index is None:
+            if outpipe.closed:
+                # The output is closed as the server exits, give it time to be reaped.
+                try:
+                    server_process.wait(1)
+                except subprocess.TimeoutExpired:
+                    pass
             if server_process.poll() is not None:
                 died_str = ('Server died while waiting for %s, returncode %d' %
                             (waitForString, server_process.returncode))
                 logging.error(died_str)
                 raise Exception(died_str)
-            if time.monotonic() - start_time > timeoutInSeconds:
-                raise Exception('Timeout while waiting for %s' % waitForString)
-            time.sleep(0.1)
-            ready, self.lastLogIndex = outpipe.CapturedLogContains(
-                waitForString, self.lastLogIndex)
-            if ready:
-                self.lastLogIndex += 1
+            raise Exception('Timeout while waiting for %s' % waitForString)
+        self.lastLogIndex = index + 1
 
         logging.debug('Success waiting for: %s' % waitForString)
 
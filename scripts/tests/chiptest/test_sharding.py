@@ -0,0 +1,80 @@
+# Copyright (c) 2026 Project CHIP Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from chiptest.sharding import DEFAULT_TEST_SECONDS, SLOW_TEST_SECONDS, EstimatedSeconds, ScheduleShards, ShardCommand
+from chiptest.test_definition import TestDefinition, TestTag, TestTarget
+
+
+def _Test(name, *tags):
+    return TestDefinition(name=name, run_name=name, target=TestTarget.ALL_CLUSTERS, tags=set(tags))
+
+
+def _Names(shards):
+    return [[test.name for test in shard] for shard in shards]
+
+
+class TestScheduleShards(unittest.TestCase):
+
+    def test_balances_recorded_durations(self):
+        tests = [_Test(name) for name in ['A', 'B', 'C', 'D', 'E', 'F']]
+        durations = {'A': 50, 'B': 40, 'C': 30, 'D': 20, 'E': 10, 'F': 10}
+
+        shards = ScheduleShards(tests, 2, durations)
+
+        self.assertEqual(_Names(shards), [['A', 'D', 'E'], ['B', 'C', 'F']])
+        self.assertEqual([sum(durations[test.name] for test in shard) for shard in shards], [80, 80])
+
+    def test_estimates_tests_without_duration(self):
+        slow = _Test('Slow', TestTag.SLOW)
+        tests = [_Test('A'), _Test('B'), slow, _Test('C')]
+        self.assertEqual(EstimatedSeconds(slow, {}), SLOW_TEST_SECONDS)
+        self.assertEqual(EstimatedSeconds(tests[0], {}), DEFAULT_TEST_SECONDS)
+
+        # The slow test gets a shard of its own, the others share the other shard, longest (then by name) first.
+        self.assertEqual(_Names(ScheduleShards(tests, 2, {'C': 12})), [['Slow'], ['C', 'A', 'B']])
+
+    def test_does_not_depend_on_test_order(self):
+        tests = [_Test(name) for name in ['A', 'B', 'C', 'D', 'E']]
+        durations = {'A': 5, 'C': 5, 'E': 1}
+        self.assertEqual(_Names(ScheduleShards(tests, 3, durations)),
+                         _Names(ScheduleShards(list(reversed(tests)), 3, durations)))
+
+    def test_no_empty_shard(self):
+        tests = [_Test('A'), _Test('B')]
+        self.assertEqual(_Names(ScheduleShards(tests, 4, {})), [['A'], ['B']])
+        self.assertEqual(ScheduleShards([], 4, {}), [])
+
+
+class TestShardCommand(unittest.TestCase):
+
+    def test_command(self):
+        command = ShardCommand(['python3', 'run_test_suite.py', '--target', 'TestCluster'],
+                               ['--iterations', '2', '--tv-app', 'run'], 1, [_Test('A'), _Test('B')], 7, '/tmp/shard')
+        self.assertEqual(command, ['unshare', '--map-root-user', '-n', '-m',
+                                   'python3', 'run_test_suite.py', '--target', 'TestCluster', '--internal-inside-unshare',
+                                   'run', '--iterations', '2', '--tv-app', 'run',
+                                   '--internal-shard-index', '1',
+                                   '--internal-shard-tests', 'A,B',
+                                   '--internal-shard-results-fd', '7',
+                                   '--internal-shard-tmp', '/tmp/shard'])
+
+    def test_command_inside_unshare(self):
+        command = ShardCommand(['python3', 'run_test_suite.py', '--internal-inside-unshare'], [], 0, [_Test('A')], 3, '/tmp/shard')
+        self.assertEqual(command.count('--internal-inside-unshare'), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
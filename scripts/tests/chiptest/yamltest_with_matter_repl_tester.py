@@ -38,7 +38,7 @@ import matter.native
 from matter.ChipStack import ChipStack
 from matter.storage import PersistentStorageJSON
 from matter.yaml.runner import ReplTestRunner
-from matter.yamltests.definitions import SpecDefinitionsFromPaths
+from matter.yamltests.definitions import SpecDefinitionsFromPaths, default_cache_directory
 from matter.yamltests.parser import PostProcessCheckStatus, TestParser, TestParserConfig
 
 _DEFAULT_CHIP_ROOT = os.path.abspath(
@@ -131,7 +131,7 @@ async def main(setup_code, yaml_path, node_id, pics_file):
             # Creating Cluster definition.
             clusters_definitions = SpecDefinitionsFromPaths([
                 _CLUSTER_XML_DIRECTORY_PATH + '/chip/*.xml',
-            ])
+            ], cache_directory=default_cache_directory())
 
             # Parsing YAML test and setting up matter-repl yamltests runner.
             parser_config = TestParserConfig(pics_file, clusters_definitions)
@@ -28,7 +28,7 @@ from paths_finder import PathsFinder
 from tests_finder import TestsFinder
 from tests_logger import TestParserLogger, TestRunnerLogger, WebSocketRunnerLogger
 
-from matter.yamltests.definitions import SpecDefinitionsFromPaths
+from matter.yamltests.definitions import SpecDefinitionsFromPaths, default_cache_directory
 from matter.yamltests.parser import TestParserConfig
 from matter.yamltests.parser_builder import TestParserBuilderConfig
 from matter.yamltests.parser_config import TestConfigParser
@@ -68,10 +68,16 @@ def test_parser_options(f):
                      help='Path to the directory containing the tests configuration.')(f)
     f = click.option('--specifications_paths', type=click.Path(), show_default=True, default=_DEFAULT_SPECIFICATIONS_DIR,
                      help='Path to a set of files containing clusters definitions.')(f)
+    f = click.option('--specifications_cache_directory', type=click.Path(), show_default=True, default=default_cache_directory(),
+                     help='Path to a directory to cache the parsed clusters definitions in. An empty path disables the cache.')(f)
     f = click.option('--PICS', type=click.Path(exists=True), show_default=True, default=_DEFAULT_PICS_FILE,
                      help='Path to the PICS file to use.')(f)
     f = click.option('--stop_on_error', type=bool, show_default=True, default=True,
                      help='Stop parsing on first error.')(f)
+    f = click.option('--parse_jobs', type=int, show_default=True, default=1,
+                     help='Number of processes to parse all the tests up-front with. 1 parses the tests one at a time, as they run.')(f)
+    f = click.option('--parse_cache_directory', type=click.Path(), show_default=True, default=None,
+                     help='Path to a directory to cache the parsed tests in. Implies parsing all the tests up-front.')(f)
     f = click.option('--use_default_pseudo_clusters', type=bool, show_default=True, default=True,
                      help='If enable this option use the set of default clusters provided by the matter_yamltests package.')(f)
     f = click.option('--additional_pseudo_clusters_directory', type=click.Path(), show_default=True, default=None,
@@ -255,10 +261,10 @@ CONTEXT_SETTINGS = dict(
 @click.argument('test_name')
 @test_parser_options
 @click.pass_context
-def runner_base(ctx, configuration_directory: str, test_name: str, configuration_name: str, pics: str, specifications_paths: str, stop_on_error: bool, use_default_pseudo_clusters: bool, additional_pseudo_clusters_directory: str, **kwargs):
+def runner_base(ctx, configuration_directory: str, test_name: str, configuration_name: str, pics: str, specifications_paths: str, specifications_cache_directory: str, stop_on_error: bool, parse_jobs: int, parse_cache_directory: str, use_default_pseudo_clusters: bool, additional_pseudo_clusters_directory: str, **kwargs):
     pseudo_clusters = get_custom_pseudo_clusters(
         additional_pseudo_clusters_directory) if use_default_pseudo_clusters else PseudoClusters([])
-    specifications = SpecDefinitionsFromPaths(specifications_paths.split(','), pseudo_clusters)
+    specifications = SpecDefinitionsFromPaths(specifications_paths.split(','), pseudo_clusters, specifications_cache_directory)
     tests_finder = TestsFinder(configuration_directory, configuration_name)
 
     test_list = tests_finder.get(test_name)
@@ -268,6 +274,8 @@ def runner_base(ctx, configuration_directory: str, test_name: str, configuration
     parser_config = TestParserConfig(pics, specifications, kwargs)
     parser_builder_config = TestParserBuilderConfig(test_list, parser_config, hooks=TestParserLogger())
     parser_builder_config.options.stop_on_error = stop_on_error
+    parser_builder_config.options.jobs = parse_jobs
+    parser_builder_config.options.cache_directory = parse_cache_directory
     while ctx:
         ctx.obj = ParserGroup(parser_builder_config, pseudo_clusters)
         ctx = ctx.parent
@@ -56,6 +56,7 @@ class TestColoredLogPrinter():
 class ParserStrings:
     start = 'Parsing {count} files.'
     stop = '{state} Parsing finished in {duration}ms with {successes} success and {errors} errors.'
+    preparsing_stop = 'Parsed {count} files up-front ({cached} from the cache) with {jobs} jobs in {duration}ms.'
     test_start = click.style('\t\tParsing: ', fg='white') + '{name}'
     test_result = '\r{state} ' + click.style('{duration}ms', fg='white')
     error_header = click.style('\t\tError at step {index}:', fg='white', bold=True)
@@ -77,6 +78,9 @@ class TestParserLogger(TestParserHooks):
         errors = click.style(self.__errors, bold=True)
         print(self.__strings.stop.format(state=state, successes=success, errors=errors, duration=duration))
 
+    def preparsing_stop(self, count: int, cached: int, jobs: int, duration: int):
+        print(self.__strings.preparsing_stop.format(count=count, cached=cached, jobs=jobs, duration=duration))
+
     def test_parsing_start(self, name: str):
         print(self.__strings.test_start.format(name=name), end='')
 
@@ -3,7 +3,6 @@
 import io
 import json
 import logging
-import time
 from subprocess import PIPE
 
 import click
@@ -40,20 +39,15 @@ class DarwinToolRunner:
     def waitForMessage(self, message):
         logging.debug('Waiting for %s' % message)
 
-        start_time = time.monotonic()
-        ready, self.lastLogIndex = self.outpipe.CapturedLogContains(
-            message, self.lastLogIndex)
-        while not ready:
+        index = self.outpipe.WaitForLine(message, self.lastLogIndex, 10)
+        if index is None:
             if self.process.poll() is not None:
                 died_str = ('Process died while waiting for %s, returncode %d' %
                             (message, self.process.returncode))
                 logging.error(died_str)
                 raise Exception(died_str)
-            if time.monotonic() - start_time > 10:
-                raise Exception('Timeout while waiting for %s' % message)
-            time.sleep(0.1)
-            ready, self.lastLogIndex = self.outpipe.CapturedLogContains(
-                message, self.lastLogIndex)
+            raise Exception('Timeout while waiting for %s' % message)
+        self.lastLogIndex = index
 
         logging.debug('Success waiting for: %s' % message)
 
@@ -167,9 +167,12 @@ class AppProcessManager:
               help="Do not print output from passing tests. Use this flag in CI to keep GitHub log size manageable.")
 @click.option("--load-from-env", default=None, help="YAML file that contains values for environment variables.")
 @click.option("--run", type=str, multiple=True, help="Run only the specified test run(s).")
+@click.option("--worker-socket", type=str, default=None,
+              help='Run the test script in the test worker listening on this unix socket (see matter.testing.worker), '
+                   'which keeps the Matter stack and the commissioned DUT between scripts.')
 def main(app: str, factory_reset: bool, factory_reset_app_only: bool, app_args: str,
          app_ready_pattern: str, app_stdin_pipe: str, script: str, script_args: str,
-         script_gdb: bool, quiet: bool, load_from_env, run):
+         script_gdb: bool, quiet: bool, load_from_env, run, worker_socket: str):
     if load_from_env:
         reader = MetadataReader(load_from_env)
         runs = reader.parse_script(script)
@@ -210,12 +213,12 @@ def main(app: str, factory_reset: bool, factory_reset_app_only: bool, app_args:
     for run in runs:
         logging.info("Executing %s %s", run.py_script_path.split('/')[-1], run.run)
         main_impl(run.app, run.factory_reset, run.factory_reset_app_only, run.app_args or "", run.app_ready_pattern,
-                  run.app_stdin_pipe, run.py_script_path, run.script_args or "", run.script_gdb, run.quiet)
+                  run.app_stdin_pipe, run.py_script_path, run.script_args or "", run.script_gdb, run.quiet, worker_socket)
 
 
 def main_impl(app: str, factory_reset: bool, factory_reset_app_only: bool, app_args: str,
               app_ready_pattern: str, app_stdin_pipe: str, script: str, script_args: str,
-              script_gdb: bool, quiet: bool):
+              script_gdb: bool, quiet: bool, worker_socket: typing.Optional[str] = None):
 
     app_args = app_args.replace('{SCRIPT_BASE_NAME}', os.path.splitext(os.path.basename(script))[0])
     script_args = script_args.replace('{SCRIPT_BASE_NAME}', os.path.splitext(os.path.basename(script))[0])
@@ -278,6 +281,17 @@ def main_impl(app: str, factory_reset: bool, factory_reset_app_only: bool, app_a
         "--paa-trust-store-path", os.path.join(DEFAULT_CHIP_ROOT, MATTER_DEVELOPMENT_PAA_ROOT_CERTS)
     ] + shlex.split(script_args)
 
+    test_script_process = None
+    if worker_socket and not script_gdb:
+        # Lazy import, as the worker client is only needed (and its dependencies installed) when using a worker.
+        from matter.testing.worker import run_in_worker
+        result = run_in_worker(worker_socket, script, [i.replace('|', ' ') for i in script_command[1:]])
+        if result.incompatible:
+            logging.warning("Running the test script in its own process: %s", result.error)
+            worker_socket = None
+        elif result.error:
+            logging.error("Test worker failed to run the test script: %s", result.error)
+
     if script_gdb:
         #
         # When running through Popen, we need to preserve some space-delimited args to GDB as a single logical argument.
@@ -291,15 +305,19 @@ def main_impl(app: str, factory_reset: bool, factory_reset_app_only: bool, app_a
 
     final_script_command = [i.replace('|', ' ') for i in script_command]
 
-    test_script_process = Subprocess(final_script_command[0], *final_script_command[1:],
-                                     output_cb=process_test_script_output,
-                                     f_stdout=stream_output,
-                                     f_stderr=stream_output)
-    test_script_process.start()
-    test_script_process.p.stdin.close()
+    if not worker_socket or script_gdb:
+        test_script_process = Subprocess(final_script_command[0], *final_script_command[1:],
+                                         output_cb=process_test_script_output,
+                                         f_stdout=stream_output,
+                                         f_stderr=stream_output)
+        test_script_process.start()
+        test_script_process.p.stdin.close()
 
     try:
-        test_script_exit_code = test_script_process.wait()
+        if test_script_process:
+            test_script_exit_code = test_script_process.wait()
+        else:
+            test_script_exit_code = 0 if result.ok else 1
 
         if test_script_exit_code != 0:
             logging.error("Test script exited with returncode %d" % test_script_exit_code)
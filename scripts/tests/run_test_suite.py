@@ -25,6 +25,7 @@ from dataclasses import dataclass, field
 import chiptest
 import click
 import coloredlogs
+from chiptest import sharding
 from chiptest.accessories import AppsRegister
 from chiptest.glob_matcher import GlobMatcher
 from chiptest.test_definition import TestRunTime, TestTag
@@ -66,6 +67,27 @@ class RunContext:
     exclude_tags: set(TestTag) = field(default_factory={})
 
 
+def _CommandLineArgs(context: click.Context, exclude: typing.Iterable[str] = ()) -> typing.List[str]:
+    """Returns the command line options giving the parameters of a command which were not left to their default."""
+    args = []
+    for param in context.command.params:
+        if not isinstance(param, click.Option) or param.name in exclude:
+            continue
+        if context.get_parameter_source(param.name) in (None, click.core.ParameterSource.DEFAULT):
+            continue
+        value = context.params[param.name]
+        option = max(param.opts, key=len)
+        if param.is_flag:
+            if value:
+                args.append(option)
+        elif param.multiple:
+            for item in value:
+                args.extend([option, str(item)])
+        elif value is not None:
+            args.extend([option, str(value)])
+    return args
+
+
 @click.group(chain=True)
 @click.option(
     '--log-level',
@@ -304,15 +326,74 @@ def cmd_list(context):
     default=0,
     show_default=True,
     help='Number of tests that are expected to fail in each iteration.  Overall test will pass if the number of failures matches this.  Nonzero values require --keep-going')
+@click.option(
+    '--jobs',
+    type=int,
+    default=1,
+    show_default=True,
+    help='Number of tests to run in parallel, each in its own network namespaces and with its own /tmp (linux only)')
+@click.option(
+    '--durations-file',
+    type=click.Path(dir_okay=False),
+    default=None,
+    help='JSON file of recorded test durations, used to balance the tests run by --jobs, and updated after the run')
+@click.option('--internal-shard-index', type=int, default=None, hidden=True)
+@click.option('--internal-shard-tests', type=str, default=None, hidden=True)
+@click.option('--internal-shard-results-fd', type=int, default=None, hidden=True)
+@click.option('--internal-shard-tmp', type=str, default=None, hidden=True)
 @click.pass_context
 def cmd_run(context, iterations, all_clusters_app, lock_app, ota_provider_app, ota_requestor_app,
             fabric_bridge_app, tv_app, bridge_app, lit_icd_app, microwave_oven_app, rvc_app, network_manager_app,
             energy_gateway_app, energy_management_app, closure_app, matter_repl_yaml_tester,
-            chip_tool_with_python, pics_file, keep_going, test_timeout_seconds, expected_failures):
+            chip_tool_with_python, pics_file, keep_going, test_timeout_seconds, expected_failures,
+            jobs, durations_file, internal_shard_index, internal_shard_tests, internal_shard_results_fd, internal_shard_tmp):
     if expected_failures != 0 and not keep_going:
         logging.exception(f"'--expected-failures {expected_failures}' used without '--keep-going'")
         sys.exit(2)
 
+    tests = []
+    for test in context.obj.tests:
+        if context.obj.include_tags:
+            if not (test.tags & context.obj.include_tags):
+                logging.debug("Test %s not included" % test.name)
+                continue
+
+        if context.obj.exclude_tags:
+            if test.tags & context.obj.exclude_tags:
+                logging.debug("Test %s excluded" % test.name)
+                continue
+
+        tests.append(test)
+
+    if internal_shard_tests is not None:
+        # Running as one shard of a parallel run: only run the tests of the shard, in the given order.
+        logging.info("Running shard %d" % internal_shard_index)
+        by_name = {test.name: test for test in tests}
+        tests = [by_name[name] for name in internal_shard_tests.split(',')]
+        reporter = sharding.ShardReporter(internal_shard_results_fd)
+    elif jobs > 1:
+        if sys.platform != 'linux':
+            raise click.BadParameter('parallel runs require linux network namespaces', param_hint='--jobs')
+        durations = sharding.LoadDurations(durations_file)
+        # Every shard runs the same command, for its own tests.
+        main_command = ['python3', os.path.realpath(__file__)] + _CommandLineArgs(context.parent)
+        run_args = _CommandLineArgs(context, exclude=['jobs', 'durations_file'])
+        results = sharding.RunShards(tests, jobs, iterations, durations, main_command, run_args)
+        for result in results:
+            logging.info('%-30s - iteration %d - %s', result.name, result.iteration + 1, 'PASSED' if result.passed else 'FAILED')
+            if not result.passed or context.obj.dry_run:
+                sys.stdout.write(result.log)
+        if durations_file and not context.obj.dry_run:
+            sharding.SaveDurations(durations_file, durations, results)
+        for i in range(iterations):
+            observed_failures = sum(1 for result in results if result.iteration == i and not result.passed)
+            if observed_failures != expected_failures:
+                logging.error(f'Iteration {i}: expected failure count {expected_failures}, but got {observed_failures}')
+                sys.exit(2)
+        return
+    else:
+        reporter = None
+
     runner = chiptest.runner.Runner()
 
     paths_finder = PathsFinder()
@@ -393,6 +474,8 @@ def cmd_run(context, iterations, all_clusters_app, lock_app, ota_provider_app, o
         ns = chiptest.linux.IsolatedNetworkNamespace(
             unshared=context.obj.in_unshare)
         paths = chiptest.linux.PathsWithNetworkNamespaces(paths)
+        if internal_shard_tmp:
+            chiptest.linux.MountPrivateTmp(internal_shard_tmp)
 
     logging.info("Each test will be executed %d times" % iterations)
 
@@ -407,18 +490,10 @@ def cmd_run(context, iterations, all_clusters_app, lock_app, ota_provider_app, o
     for i in range(iterations):
         logging.info("Starting iteration %d" % (i+1))
         observed_failures = 0
-        for test in context.obj.tests:
-            if context.obj.include_tags:
-                if not (test.tags & context.obj.include_tags):
-                    logging.debug("Test %s not included" % test.name)
-                    continue
-
-            if context.obj.exclude_tags:
-                if test.tags & context.obj.exclude_tags:
-                    logging.debug("Test %s excluded" % test.name)
-                    continue
-
+        for test in tests:
             test_start = time.monotonic()
+            if reporter:
+                reporter.StartTest()
             try:
                 if context.obj.dry_run:
                     logging.info("Would run test: %s" % test.name)
@@ -427,20 +502,25 @@ def cmd_run(context, iterations, all_clusters_app, lock_app, ota_provider_app, o
                 test.Run(
                     runner, apps_register, paths, pics_file, test_timeout_seconds, context.obj.dry_run,
                     test_runtime=context.obj.runtime)
+                test_end = time.monotonic()
                 if not context.obj.dry_run:
-                    test_end = time.monotonic()
                     logging.info('%-30s - Completed in %0.2f seconds' %
                                  (test.name, (test_end - test_start)))
+                if reporter:
+                    reporter.FinishTest(test.name, i, True, test_end - test_start)
             except Exception:
                 test_end = time.monotonic()
                 logging.exception('%-30s - FAILED in %0.2f seconds' %
                                   (test.name, (test_end - test_start)))
+                if reporter:
+                    reporter.FinishTest(test.name, i, False, test_end - test_start)
                 observed_failures += 1
                 if not keep_going:
                     cleanup()
                     sys.exit(2)
 
-        if observed_failures != expected_failures:
+        # The failures of a shard are counted by the parallel run, over all its shards.
+        if reporter is None and observed_failures != expected_failures:
             logging.exception(f'Iteration {i}: expected failure count {expected_failures}, but got {observed_failures}')
             cleanup()
             sys.exit(2)
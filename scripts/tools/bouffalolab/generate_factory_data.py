@@ -295,7 +295,8 @@ def gen_test_certs(chip_cert: str,
     return cd, pai_cert_der, dac_cert_der, dac_key_der
 
 
-def gen_mfd_partition(args, mfd_output):
+def gen_mfd_data(args, dac_cert, dac_key, pai_cert, cd):
+    """Return the mfd partition of args, with the DER certificates and raw DAC private key given."""
 
     def int_to_2bytearray_l(intvalue):
         src = bytearray(2)
@@ -314,17 +315,6 @@ def gen_mfd_partition(args, mfd_output):
     def gen_efuse_aes_iv():
         return bytes(random.sample(range(0, 0xff), 12) + [0] * 4)
 
-    def read_file(rfile):
-        with open(rfile, 'rb') as _f:
-            return _f.read()
-
-    def get_private_key(der):
-        with open(der, 'rb') as file:
-            keys = load_der_private_key(file.read(), password=None, backend=default_backend())
-            private_key = keys.private_numbers().private_value.to_bytes(32, byteorder='big')
-
-            return private_key
-
     def encrypt_data(data_bytearray, key_bytearray, iv_bytearray):
         data_bytearray += bytes([0] * (16 - (len(data_bytearray) % 16)))
         cryptor = AES.new(key_bytearray, AES.MODE_CBC, iv_bytearray)
@@ -373,11 +363,11 @@ def gen_mfd_partition(args, mfd_output):
 
     mfdDict = {
         "aes_iv": {'sec': False, "id": 1, "len": 16, "data": gen_efuse_aes_iv() if args.key else bytes([0] * 16)},
-        "dac_cert": {'sec': False, "id": 2, "len": None, "data": read_file(args.dac_cert)},
-        "dac_key": {'sec': True, "id": 3, "len": None, "data": get_private_key(args.dac_key)},
+        "dac_cert": {'sec': False, "id": 2, "len": None, "data": dac_cert},
+        "dac_key": {'sec': True, "id": 3, "len": None, "data": dac_key},
         "passcode": {'sec': False, "id": 4, "len": 4, "data": convert_to_bytes(args.passcode)},
-        "pai_cert": {'sec': False, "id": 5, "len": None, "data": read_file(args.pai_cert)},
-        "cd": {'sec': False, "id": 6, "len": None, "data": read_file(args.cd)},
+        "pai_cert": {'sec': False, "id": 5, "len": None, "data": pai_cert},
+        "cd": {'sec': False, "id": 6, "len": None, "data": cd},
         "sn": {'sec': False, "id": 7, "len": 32, "data": convert_to_bytes(args.sn)},
         "discriminator": {'sec': False, "id": 8, "len": 2, "data": convert_to_bytes(args.discriminator)},
         "uid": {'sec': False, "id": 9, "len": 32, "data": convert_to_bytes(args.unique_id)},
@@ -409,10 +399,62 @@ def gen_mfd_partition(args, mfd_output):
     output += raw_tlvs
     output += int_to_4bytearray_l(binascii.crc32(raw_tlvs))
 
+    return output
+
+
+def gen_mfd_partition(args, mfd_output):
+
+    def read_file(rfile):
+        with open(rfile, 'rb') as _f:
+            return _f.read()
+
+    def get_private_key(der):
+        with open(der, 'rb') as file:
+            keys = load_der_private_key(file.read(), password=None, backend=default_backend())
+            private_key = keys.private_numbers().private_value.to_bytes(32, byteorder='big')
+
+            return private_key
+
+    output = gen_mfd_data(args, read_file(args.dac_cert), get_private_key(args.dac_key), read_file(args.pai_cert), read_file(args.cd))
+
     with open(mfd_output, "wb+") as fp:
         fp.write(output)
 
 
+class BouffalolabSerializer:
+    """Serializes a device generated by scripts/tools/factory_data into the mfd partition."""
+
+    primary_file = "mfd.bin"
+
+    def __init__(self, key=None):
+        # AES key, in hex string, to encrypt the private part of the mfd partition
+        self.key = bytes.fromhex(key) if key else None
+
+    def serialize(self, params, device):
+        if device.dac_cert is None or device.cert_dclrn is None:
+            raise Exception("DAC, PAI and certificate declaration are mandatory in the mfd partition.")
+
+        args = argparse.Namespace(key=self.key,
+                                  passcode=device.passcode,
+                                  sn=device.serial_num,
+                                  discriminator=device.discriminator,
+                                  unique_id=device.rd_uid,
+                                  spake2p_it=device.spake2_it,
+                                  spake2p_salt=device.spake2_salt,
+                                  spake2p_verifier=device.spake2_verifier,
+                                  vendor_name=params.vendor_name,
+                                  vendor_id=params.vendor_id,
+                                  product_name=params.product_name,
+                                  product_id=params.product_id,
+                                  product_part_no=params.part_number,
+                                  product_url=params.product_url,
+                                  product_label=params.product_label,
+                                  manufactoring_date=params.mfg_date,
+                                  hardware_version=params.hw_ver,
+                                  hardware_version_string=params.hw_ver_str)
+        return {self.primary_file: gen_mfd_data(args, device.dac_cert, device.dac_key, device.pai_cert, device.cert_dclrn)}
+
+
 def gen_onboarding_data(args, onboard_txt, onboard_png, rendez=6):
 
     try:
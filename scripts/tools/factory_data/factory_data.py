@@ -0,0 +1,488 @@
+#!/usr/bin/env python3
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+"""
+Factory data generation shared by the platform factory data generators.
+
+generate_many() computes the device unique data of a batch of devices in a
+pool of processes: passcode, discriminator, SPAKE2+ verifier, rotating device
+ID unique ID, onboarding codes and a DAC signed by the PAI of the batch. Every
+device is then serialized by a platform serializer, i.e. any picklable object
+with a method:
+
+    serialize(params: FactoryDataParams, device: DeviceFactoryData) -> Dict[str, bytes]
+
+returning the files of the device, and a `primary_file` attribute naming the
+file to index (e.g. the partition image). Serializers of the platforms in
+SERIALIZERS live next to the generator of their platform and are loaded with
+load_serializer().
+
+BatchArchive writes the files of the devices into a single tar archive and a
+CSV index, and resumes an interrupted batch.
+"""
+
+import base64
+import csv
+import datetime
+import importlib
+import io
+import json
+import logging
+import multiprocessing
+import os
+import secrets
+import sys
+import tarfile
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, Optional, Tuple
+
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+TOOLS_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+CHIP_TOPDIR = os.path.dirname(os.path.dirname(TOOLS_DIR))
+sys.path.insert(0, os.path.join(TOOLS_DIR, 'spake2p'))
+from spake2p import generate_verifier  # noqa: E402 isort:skip
+sys.path.insert(0, os.path.join(CHIP_TOPDIR, 'src', 'setup_payload', 'python'))
+from SetupPayload import CommissioningFlow, SetupPayload  # noqa: E402 isort:skip
+
+# Platform -> (directory relative to scripts/tools, module, serializer class)
+SERIALIZERS = {
+    'bouffalolab': ('bouffalolab', 'generate_factory_data', 'BouffalolabSerializer'),
+    'esp32': ('', 'generate_esp32_chip_factory_bin', 'Esp32Serializer'),
+    'nrfconnect': ('nrfconnect', 'generate_nrfconnect_chip_factory_data', 'NrfConnectSerializer'),
+    'nxp': (os.path.join('nxp', 'factory_data_generator'), 'generate', 'NxpSerializer'),
+    'silabs': ('silabs', 'FactoryDataProvider', 'SilabsSerializer'),
+    'telink': ('telink', 'mfg_batch', 'TelinkSerializer'),
+}
+
+INVALID_PASSCODES = [00000000, 11111111, 22222222, 33333333, 44444444, 55555555,
+                     66666666, 77777777, 88888888, 99999999, 12345678, 87654321]
+PASSCODE_MAX = 99999998
+DISCRIMINATOR_MAX = 0xFFF
+ROTATING_DEVICE_ID_UNIQUE_ID_LEN = 16
+
+# Matter DN attributes of attestation certificates
+OID_MATTER_VID = x509.ObjectIdentifier('1.3.6.1.4.1.37244.2.1')
+OID_MATTER_PID = x509.ObjectIdentifier('1.3.6.1.4.1.37244.2.2')
+# Lifetime meaning that the certificate has no well defined expiration date
+LIFETIME_NO_EXPIRY = 4294967295
+
+BATCH_FILE = 'batch.json'
+ARCHIVE_FILE = 'factory_data.tar'
+INDEX_FILE = 'factory_data.csv'
+INDEX_HEADER = ['Index', 'Serial Number', 'Discriminator', 'PIN Code', 'Iteration Count', 'Salt', 'Verifier',
+                'QR Code', 'Manual Code', 'Offset', 'Size', 'End']
+
+
+@dataclass
+class FactoryDataParams:
+    """Parameters shared by all devices of a batch."""
+    vendor_id: int
+    product_id: int
+    vendor_name: Optional[str] = None
+    product_name: Optional[str] = None
+    hw_ver: Optional[int] = None
+    hw_ver_str: Optional[str] = None
+    mfg_date: Optional[str] = None
+    product_label: Optional[str] = None
+    product_url: Optional[str] = None
+    part_number: Optional[str] = None
+    enable_key: Optional[str] = None
+    # Serial number of device i is serial_num_format.format(serial_num + i)
+    serial_num: int = 0
+    serial_num_format: str = '{:x}'
+    # Randomly generated for every device when not set
+    passcode: Optional[int] = None
+    discriminator: Optional[int] = None
+    spake2_it: int = 1000
+    spake2_salt_len: int = 32
+    # Rotating device ID unique ID of all devices, or generated for every device with generate_rd_uid
+    rd_uid: Optional[bytes] = None
+    generate_rd_uid: bool = False
+    # Onboarding payload: discovery capabilities bitmask and commissioning flow
+    discovery: int = 2
+    commissioning_flow: int = 0
+
+
+@dataclass
+class DeviceFactoryData:
+    """The device unique data of a device."""
+    index: int
+    serial_num: str
+    passcode: int
+    discriminator: int
+    spake2_it: int
+    spake2_salt: bytes
+    spake2_verifier: bytes
+    rd_uid: Optional[bytes]
+    qrcode: str
+    manualcode: str
+    # DER certificates and raw private key, None when the batch has no attestation data
+    dac_cert: Optional[bytes]
+    dac_key: Optional[bytes]
+    pai_cert: Optional[bytes]
+    cert_dclrn: Optional[bytes]
+
+
+def random_passcode() -> int:
+    while True:
+        passcode = secrets.randbelow(PASSCODE_MAX) + 1
+        if passcode not in INVALID_PASSCODES:
+            return passcode
+
+
+def load_certificate(data: bytes) -> x509.Certificate:
+    """Loads a PEM or DER certificate."""
+    if data.lstrip().startswith(b'-----'):
+        return x509.load_pem_x509_certificate(data)
+    return x509.load_der_x509_certificate(data)
+
+
+def load_private_key(data: bytes, password: Optional[bytes] = None):
+    """Loads a PEM or DER private key."""
+    if data.lstrip().startswith(b'-----'):
+        return serialization.load_pem_private_key(data, password)
+    return serialization.load_der_private_key(data, password)
+
+
+def private_key_bin(key) -> bytes:
+    return key.private_numbers().private_value.to_bytes(32, byteorder='big')
+
+
+def parse_valid_from(valid_from: Optional[str]) -> datetime.datetime:
+    """Parses a <YYYY>-<MM>-<DD> [ <HH>:<MM>:<SS> ] date, the current time if None."""
+    if valid_from is None:
+        return datetime.datetime.now(datetime.timezone.utc).replace(microsecond=0)
+    for date_format in ('%Y-%m-%d %H:%M:%S', '%Y-%m-%d'):
+        try:
+            return datetime.datetime.strptime(valid_from.strip(), date_format).replace(tzinfo=datetime.timezone.utc)
+        except ValueError:
+            pass
+    raise ValueError('Invalid certificate validity start date: {}'.format(valid_from))
+
+
+def generate_attestation_cert(common_name: str, vendor_id: int, product_id: int, public_key,
+                              ca_cert: x509.Certificate, ca_key, is_ca: bool,
+                              lifetime: int = LIFETIME_NO_EXPIRY, valid_from: Optional[str] = None) -> x509.Certificate:
+    """Generates a PAI (is_ca) or DAC certificate as chip-cert gen-att-cert does."""
+    subject = [
+        x509.NameAttribute(NameOID.COMMON_NAME, common_name),
+        x509.NameAttribute(OID_MATTER_VID, '{:04X}'.format(vendor_id)),
+        x509.NameAttribute(OID_MATTER_PID, '{:04X}'.format(product_id)),
+    ]
+
+    not_before = parse_valid_from(valid_from)
+    if lifetime == LIFETIME_NO_EXPIRY:
+        not_after = datetime.datetime(9999, 12, 31, 23, 59, 59, tzinfo=datetime.timezone.utc)
+    else:
+        not_after = not_before + datetime.timedelta(days=lifetime)
+
+    builder = (x509.CertificateBuilder()
+               .subject_name(x509.Name(subject))
+               .issuer_name(ca_cert.subject)
+               .public_key(public_key)
+               .serial_number(x509.random_serial_number())
+               .not_valid_before(not_before)
+               .not_valid_after(not_after)
+               .add_extension(x509.BasicConstraints(ca=is_ca, path_length=0 if is_ca else None), critical=True)
+               .add_extension(x509.KeyUsage(digital_signature=not is_ca, content_commitment=False,
+                                            key_encipherment=False, data_encipherment=False, key_agreement=False,
+                                            key_cert_sign=is_ca, crl_sign=is_ca, encipher_only=False,
+                                            decipher_only=False), critical=True)
+               .add_extension(x509.SubjectKeyIdentifier.from_public_key(public_key), critical=False)
+               .add_extension(x509.AuthorityKeyIdentifier.from_issuer_public_key(ca_key.public_key()), critical=False))
+    return builder.sign(ca_key, hashes.SHA256())
+
+
+def generate_pai(paa_cert: bytes, paa_key: bytes, vendor_id: int, product_id: int, common_name: str,
+                 lifetime: int = LIFETIME_NO_EXPIRY, valid_from: Optional[str] = None) -> Tuple[bytes, bytes]:
+    """Generates a PAI signed by the given PAA, returns its PEM certificate and PEM private key."""
+    key = ec.generate_private_key(ec.SECP256R1())
+    cert = generate_attestation_cert(common_name, vendor_id, product_id, key.public_key(), load_certificate(paa_cert),
+                                     load_private_key(paa_key), is_ca=True, lifetime=lifetime, valid_from=valid_from)
+    return (cert.public_bytes(serialization.Encoding.PEM),
+            key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.TraditionalOpenSSL,
+                              serialization.NoEncryption()))
+
+
+@dataclass
+class Attestation:
+    """
+    Attestation data shared by all devices of a batch, loaded once and sent
+    once to every worker. DACs are generated and signed by the PAI for every
+    device, unless a DAC shared by all devices is given.
+    """
+    cert_dclrn: Optional[bytes] = None
+    # PEM or DER certificate and key of the PAI
+    pai_cert: Optional[bytes] = None
+    pai_key: Optional[bytes] = None
+    # DER certificate and raw private key of a DAC used by all devices
+    dac_cert: Optional[bytes] = None
+    dac_key: Optional[bytes] = None
+    # Generated DACs
+    cn_prefix: str = 'Matter'
+    lifetime: int = LIFETIME_NO_EXPIRY
+    valid_from: Optional[str] = None
+    # Keys loaded by load()
+    _pai: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+
+    @classmethod
+    def from_files(cls, cert_dclrn: Optional[str] = None, pai_cert: Optional[str] = None,
+                   pai_key: Optional[str] = None, dac_cert: Optional[str] = None, dac_key: Optional[str] = None,
+                   dac_key_password: Optional[str] = None, **kwargs) -> 'Attestation':
+        """Loads the attestation data from PEM or DER files."""
+        def read(path):
+            if path is None:
+                return None
+            with open(path, 'rb') as f:
+                return f.read()
+
+        attestation = cls(cert_dclrn=read(cert_dclrn), pai_cert=read(pai_cert), pai_key=read(pai_key), **kwargs)
+        if dac_cert is not None and dac_key is not None:
+            attestation.dac_cert = load_certificate(read(dac_cert)).public_bytes(serialization.Encoding.DER)
+            password = dac_key_password.encode('utf-8') if dac_key_password else None
+            attestation.dac_key = private_key_bin(load_private_key(read(dac_key), password))
+        return attestation
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_pai'] = None
+        return state
+
+    def load(self):
+        """Loads the PAI certificate and key, once per process."""
+        if self._pai is None and self.pai_cert is not None:
+            cert = load_certificate(self.pai_cert)
+            key = load_private_key(self.pai_key) if self.pai_key is not None and self.dac_cert is None else None
+            self._pai = (cert, cert.public_bytes(serialization.Encoding.DER), key)
+        return self
+
+    def device_credentials(self, params: FactoryDataParams, index: int):
+        """Returns the DER DAC, raw DAC private key and DER PAI of a device, all None without a PAI."""
+        if self.load()._pai is None:
+            return None, None, None
+        pai_cert, pai_cert_der, pai_key = self._pai
+        if self.dac_cert is not None:
+            return self.dac_cert, self.dac_key, pai_cert_der
+
+        key = ec.generate_private_key(ec.SECP256R1())
+        cert = generate_attestation_cert('{} DAC {}'.format(self.cn_prefix, index), params.vendor_id, params.product_id,
+                                         key.public_key(), pai_cert, pai_key, is_ca=False, lifetime=self.lifetime,
+                                         valid_from=self.valid_from)
+        return cert.public_bytes(serialization.Encoding.DER), private_key_bin(key), pai_cert_der
+
+
+def generate_device(params: FactoryDataParams, attestation: Attestation, index: int) -> DeviceFactoryData:
+    """Generates the device unique data of the device at the given index of the batch."""
+    passcode = params.passcode if params.passcode is not None else random_passcode()
+    discriminator = params.discriminator if params.discriminator is not None else secrets.randbelow(DISCRIMINATOR_MAX + 1)
+    salt = secrets.token_bytes(params.spake2_salt_len)
+
+    rd_uid = params.rd_uid
+    if rd_uid is None and params.generate_rd_uid:
+        rd_uid = secrets.token_bytes(ROTATING_DEVICE_ID_UNIQUE_ID_LEN)
+
+    payload = SetupPayload(discriminator, passcode, params.discovery, CommissioningFlow(params.commissioning_flow),
+                           params.vendor_id, params.product_id)
+    dac_cert, dac_key, pai_cert = attestation.device_credentials(params, index)
+
+    return DeviceFactoryData(index=index,
+                             serial_num=params.serial_num_format.format(params.serial_num + index),
+                             passcode=passcode,
+                             discriminator=discriminator,
+                             spake2_it=params.spake2_it,
+                             spake2_salt=salt,
+                             spake2_verifier=generate_verifier(passcode, salt, params.spake2_it),
+                             rd_uid=rd_uid,
+                             qrcode=payload.generate_qrcode(),
+                             manualcode=payload.generate_manualcode(),
+                             dac_cert=dac_cert,
+                             dac_key=dac_key,
+                             pai_cert=pai_cert,
+                             cert_dclrn=attestation.cert_dclrn)
+
+
+class _Generator:
+    def __init__(self, params: FactoryDataParams, attestation: Attestation, serializer):
+        self.params = params
+        self.attestation = attestation.load()
+        self.serializer = serializer
+
+    def __call__(self, index: int) -> Tuple[DeviceFactoryData, Dict[str, bytes]]:
+        device = generate_device(self.params, self.attestation, index)
+        return device, self.serializer.serialize(self.params, device)
+
+
+# Generator of the current worker process
+_GENERATOR: Optional[_Generator] = None
+
+
+def _init_worker(params: FactoryDataParams, attestation: Attestation, serializer):
+    global _GENERATOR
+    _GENERATOR = _Generator(params, attestation, serializer)
+
+
+def _generate_in_worker(index: int):
+    return _GENERATOR(index)
+
+
+def generate_many(params: FactoryDataParams, attestation: Attestation, serializer, count: int, start: int = 0,
+                  jobs: int = 1) -> Iterator[Tuple[DeviceFactoryData, Dict[str, bytes]]]:
+    """
+    Generates and serializes the devices at indexes [start, count) of a batch,
+    yields (device, files) in the order of the indexes.
+
+    With jobs > 1 devices are generated in a pool of processes, started once
+    with the parameters, the loaded attestation data and the serializer.
+    """
+    indexes = range(start, count)
+    jobs = max(1, min(jobs, len(indexes)))
+    if jobs == 1:
+        yield from map(_Generator(params, attestation, serializer), indexes)
+        return
+
+    with multiprocessing.Pool(jobs, initializer=_init_worker, initargs=(params, attestation, serializer)) as pool:
+        # Devices are consumed in order, while the workers generate the next ones
+        yield from pool.imap(_generate_in_worker, indexes, chunksize=max(1, min(64, len(indexes) // (jobs * 4))))
+
+
+def load_serializer(platform: str, **options):
+    """Creates the serializer of the given platform with its options."""
+    directory, module_name, class_name = SERIALIZERS[platform]
+    sys.path.insert(0, os.path.join(TOOLS_DIR, directory))
+    module = importlib.import_module(module_name)
+    return getattr(module, class_name)(**options)
+
+
+def setup_batch(out_dir: str, resume: bool, description: Dict) -> Dict:
+    """
+    Stores the description of a new batch in the output directory, or returns
+    the description stored when a resumed batch was started.
+    """
+    batch_path = os.path.join(out_dir, BATCH_FILE)
+    if resume and os.path.exists(batch_path):
+        with open(batch_path, 'r') as f:
+            return json.load(f)
+
+    os.makedirs(out_dir, exist_ok=True)
+    with open(batch_path, 'w') as f:
+        json.dump(description, f, indent=4)
+    return description
+
+
+class BatchArchive:
+    """
+    The archive of a batch and its CSV index, written device by device.
+
+    Files of a device are stored as <serial number>/<file name>. The index has
+    a row per device with its onboarding data and the offset and size of its
+    primary file in the archive. A row is written once the archive entries of
+    the device are flushed, so a batch can be resumed after the last row.
+    """
+
+    def __init__(self, out_dir: str, resume: bool, primary_file: str):
+        self.archive_path = os.path.join(out_dir, ARCHIVE_FILE)
+        self.index_path = os.path.join(out_dir, INDEX_FILE)
+        self.primary_file = primary_file
+        self.mtime = int(time.time())
+        self.count = 0
+
+        end = 0
+        if resume and os.path.exists(self.index_path):
+            self.count, end = self._recover_index()
+            self._index_file = open(self.index_path, 'a', newline='')
+        else:
+            self._index_file = open(self.index_path, 'w', newline='')
+            csv.writer(self._index_file).writerow(INDEX_HEADER)
+        self._index = csv.writer(self._index_file)
+
+        # Entries of devices missing from the index, and the end of the archive, are dropped
+        self._archive_file = open(self.archive_path, 'r+b' if end else 'wb')
+        self._archive_file.truncate(end)
+        self._archive_file.seek(end)
+        self._archive = tarfile.open(fileobj=self._archive_file, mode='w')
+
+    def _recover_index(self):
+        with open(self.index_path, 'rb') as f:
+            data = f.read()
+        # A row interrupted while being written is dropped
+        complete = data[:data.rfind(b'\n') + 1]
+        with open(self.index_path, 'r+b') as f:
+            f.truncate(len(complete))
+
+        rows = list(csv.reader(io.StringIO(complete.decode('utf-8'))))[1:]
+        if not rows:
+            return 0, 0
+        return len(rows), int(rows[-1][INDEX_HEADER.index('End')])
+
+    def _add_file(self, name: str, data: bytes) -> int:
+        """Adds a file to the archive, returns the offset of its data."""
+        info = tarfile.TarInfo(name)
+        info.size = len(data)
+        info.mtime = self.mtime
+        self._archive.addfile(info, io.BytesIO(data))
+        blocks = (len(data) + tarfile.BLOCKSIZE - 1) // tarfile.BLOCKSIZE
+        return self._archive.offset - blocks * tarfile.BLOCKSIZE
+
+    def add(self, device: DeviceFactoryData, files: Dict[str, bytes]):
+        offsets = {name: self._add_file('/'.join([device.serial_num, name]), data) for name, data in files.items()}
+        # The archive entries must be on disk before the row marking the device as done
+        self._archive_file.flush()
+        self._index.writerow([device.index, device.serial_num, device.discriminator, device.passcode,
+                              device.spake2_it, base64.b64encode(device.spake2_salt).decode(),
+                              base64.b64encode(device.spake2_verifier).decode(), device.qrcode, device.manualcode,
+                              offsets[self.primary_file], len(files[self.primary_file]), self._archive.offset])
+        self._index_file.flush()
+        self.count += 1
+
+    def close(self):
+        self._archive.close()
+        self._archive_file.close()
+        self._index_file.close()
+
+
+def write_batch(out_dir: str, params: FactoryDataParams, attestation: Attestation, serializer, count: int,
+                jobs: int = 1, resume: bool = False) -> BatchArchive:
+    """Generates the devices of a batch missing from the archive in out_dir, returns the closed archive."""
+    archive = BatchArchive(out_dir, resume, serializer.primary_file)
+    if archive.count:
+        logging.info('Resuming batch after {} devices'.format(archive.count))
+
+    remaining = max(0, count - archive.count)
+    logging.info('Generating {} devices with {} processes into {}'.format(remaining, jobs, archive.archive_path))
+    start = time.monotonic()
+    try:
+        for device, files in generate_many(params, attestation, serializer, count, archive.count, jobs):
+            archive.add(device, files)
+            if archive.count % 1000 == 0:
+                logging.info('Generated {} of {} devices'.format(archive.count, count))
+    except KeyboardInterrupt:
+        logging.error('Interrupted after {} devices, resume to complete the batch'.format(archive.count))
+        raise
+    finally:
+        archive.close()
+
+    elapsed = time.monotonic() - start
+    logging.info('Generated {} devices in {:.1f}s ({:.1f} devices/s)'.format(
+        remaining, elapsed, remaining / elapsed if elapsed else 0))
+    logging.info('Factory data: {}'.format(archive.archive_path))
+    logging.info('Device index: {}'.format(archive.index_path))
+    return archive
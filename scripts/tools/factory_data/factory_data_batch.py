@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+"""
+Generates the factory data of a batch of devices for any platform of
+factory_data.SERIALIZERS, into a single archive and a CSV index.
+
+    ./factory_data_batch.py --platform nrfconnect --count 10000 -v 0xFFF1 -p 0x8001 \\
+        --pai-cert PAI-Cert.pem --pai-key PAI-Key.pem --cert-dclrn CD.der \\
+        --offset 0xf7000 --size 0x1000 -o out
+
+See README.md for the options of every platform.
+"""
+
+import argparse
+import logging
+import os
+import secrets
+import shutil
+import sys
+
+from factory_data import (DISCRIMINATOR_MAX, INVALID_PASSCODES, LIFETIME_NO_EXPIRY, PASSCODE_MAX, ROTATING_DEVICE_ID_UNIQUE_ID_LEN,
+                          SERIALIZERS, Attestation, FactoryDataParams, generate_pai, load_serializer, setup_batch, write_batch)
+
+SERIAL_NUMBER_LEN = 16
+
+
+def any_base_int(s):
+    return int(s, 0)
+
+
+def serializer_option(s):
+    """Parses a KEY=VALUE serializer option, 'true' and 'false' values are booleans."""
+    key, sep, value = s.partition('=')
+    if not sep or not key:
+        raise argparse.ArgumentTypeError('expected KEY=VALUE, got: {}'.format(s))
+    return key, {'true': True, 'false': False}.get(value.lower(), value)
+
+
+def get_args():
+    parser = argparse.ArgumentParser(description='Generates the factory data of a batch of Matter devices')
+
+    batch_args = parser.add_argument_group('Batch options')
+    batch_args.add_argument('--platform', required=True, choices=sorted(SERIALIZERS),
+                            help='Platform, i.e. format of the generated factory data')
+    batch_args.add_argument('-n', '--count', type=any_base_int, default=1, help='The number of devices in the batch')
+    batch_args.add_argument('-j', '--jobs', type=any_base_int, default=os.cpu_count(),
+                            help='The number of processes generating devices, default: number of CPUs')
+    batch_args.add_argument('-o', '--output', default='out', help='Output directory')
+    batch_args.add_argument('--resume', action='store_true',
+                            help='Generates the missing devices of the batch in the output directory')
+    batch_args.add_argument('--overwrite', action='store_true', help='Removes the existing output directory')
+
+    product_args = parser.add_argument_group('Product options')
+    product_args.add_argument('-v', '--vendor-id', type=any_base_int, required=True, help='Vendor id')
+    product_args.add_argument('-p', '--product-id', type=any_base_int, required=True, help='Product id')
+    product_args.add_argument('--vendor-name', help='Vendor name')
+    product_args.add_argument('--product-name', help='Product name')
+    product_args.add_argument('--hw-ver', type=any_base_int, help='Hardware version')
+    product_args.add_argument('--hw-ver-str', help='Hardware version string')
+    product_args.add_argument('--mfg-date', help='Manufacturing date in format YYYY-MM-DD')
+    product_args.add_argument('--product-label', help='Product label')
+    product_args.add_argument('--product-url', help='Product URL')
+    product_args.add_argument('--part-number', help='Part number')
+    product_args.add_argument('--enable-key', help='Enable key, in hex string')
+
+    device_args = parser.add_argument_group('Device options')
+    device_args.add_argument('-s', '--serial-num',
+                             help='Serial number of the first device, in hex string, incremented for every device. '
+                             'Randomly generated when not given')
+    device_args.add_argument('--passcode', type=any_base_int,
+                             help='The passcode of all devices, randomly generated for every device when not given')
+    device_args.add_argument('-d', '--discriminator', type=any_base_int,
+                             help='The discriminator of all devices, randomly generated for every device when not given')
+    device_args.add_argument('--spake2-it', type=any_base_int, default=1000, help='SPAKE2+ iteration count')
+    device_args.add_argument('--enable-rotating-device-id', action='store_true',
+                             help='Stores a rotating device ID unique ID, randomly generated for every device '
+                             'unless --rd-id-uid is given')
+    device_args.add_argument('--rd-id-uid', help='The rotating device ID unique ID of all devices, in hex string')
+    device_args.add_argument('-dm', '--discovery-mode', type=any_base_int, default=2,
+                             help='Discovery capabilities bitmask of the onboarding codes: 1 SoftAP, 2 BLE, 4 on network')
+    device_args.add_argument('-cf', '--commissioning-flow', type=any_base_int, default=0, choices=[0, 1, 2],
+                             help='Commissioning flow of the onboarding codes: 0 standard, 1 user action, 2 custom')
+
+    attestation_args = parser.add_argument_group('Attestation options')
+    attestation_args.add_argument('-cd', '--cert-dclrn', help='Certification declaration, in DER format')
+    attestation_args.add_argument('--pai-cert', help='PAI certificate signing the DACs, in PEM or DER format')
+    attestation_args.add_argument('--pai-key', help='PAI private key, in PEM or DER format')
+    attestation_args.add_argument('--paa-cert',
+                                  help='PAA certificate signing a PAI generated once for the batch, in PEM or DER format')
+    attestation_args.add_argument('--paa-key', help='PAA private key, in PEM or DER format')
+    attestation_args.add_argument('--dac-cert', help='DAC certificate of all devices, in PEM or DER format')
+    attestation_args.add_argument('--dac-key', help='DAC private key of all devices, in PEM or DER format')
+    attestation_args.add_argument('--dac-key-password', help='DAC private key password')
+    attestation_args.add_argument('-cn', '--cn-prefix', default='Matter',
+                                  help='Common name prefix of the generated certificates')
+    attestation_args.add_argument('-lt', '--lifetime', type=any_base_int, default=LIFETIME_NO_EXPIRY,
+                                  help='Lifetime of the generated certificates in days, default: no expiry')
+    attestation_args.add_argument('-vf', '--valid-from',
+                                  help='Start date of the generated certificates in format YYYY-MM-DD [HH:MM:SS]')
+
+    serializer_args = parser.add_argument_group('Platform options')
+    serializer_args.add_argument('--offset', type=any_base_int, help='Factory data partition offset')
+    serializer_args.add_argument('--size', type=any_base_int, help='Factory data partition size')
+    serializer_args.add_argument('-O', '--option', type=serializer_option, action='append', default=[],
+                                 metavar='KEY=VALUE', help='Option of the platform serializer, see README.md')
+
+    args = parser.parse_args()
+
+    if args.passcode is not None and (args.passcode in INVALID_PASSCODES or not 0 < args.passcode <= PASSCODE_MAX):
+        parser.error('Invalid passcode: {}'.format(args.passcode))
+    if args.discriminator is not None and not 0 <= args.discriminator <= DISCRIMINATOR_MAX:
+        parser.error('Invalid discriminator: {}'.format(args.discriminator))
+    if args.rd_id_uid and len(bytes.fromhex(args.rd_id_uid)) != ROTATING_DEVICE_ID_UNIQUE_ID_LEN:
+        parser.error('Rotating device ID unique ID must be {} bytes'.format(ROTATING_DEVICE_ID_UNIQUE_ID_LEN))
+    if bool(args.pai_cert) != bool(args.pai_key) or bool(args.paa_cert) != bool(args.paa_key):
+        parser.error('Certificates must be given with their private key')
+    if args.pai_cert and args.paa_cert:
+        parser.error('Only one of --pai-cert and --paa-cert can be given')
+    if bool(args.dac_cert) != bool(args.dac_key):
+        parser.error('--dac-cert and --dac-key must be given together')
+    if args.dac_cert and not args.pai_cert:
+        parser.error('--dac-cert requires --pai-cert')
+    if args.resume and args.overwrite:
+        parser.error('Only one of --resume and --overwrite can be given')
+    for path in [args.cert_dclrn, args.pai_cert, args.pai_key, args.paa_cert, args.paa_key, args.dac_cert, args.dac_key]:
+        if path and not os.path.isfile(path):
+            parser.error('No such file: {}'.format(path))
+
+    return args
+
+
+def load_attestation(args, out_dir):
+    options = dict(cn_prefix=args.cn_prefix, lifetime=args.lifetime, valid_from=args.valid_from)
+    if not args.paa_cert:
+        return Attestation.from_files(cert_dclrn=args.cert_dclrn, pai_cert=args.pai_cert, pai_key=args.pai_key,
+                                      dac_cert=args.dac_cert, dac_key=args.dac_key,
+                                      dac_key_password=args.dac_key_password, **options)
+
+    pai_cert_path = os.path.join(out_dir, 'internal', 'pai_cert.pem')
+    pai_key_path = os.path.join(out_dir, 'internal', 'pai_key.pem')
+    # A resumed batch keeps signing with the PAI generated when it started
+    if not os.path.exists(pai_cert_path):
+        with open(args.paa_cert, 'rb') as f:
+            paa_cert = f.read()
+        with open(args.paa_key, 'rb') as f:
+            paa_key = f.read()
+        pai_cert, pai_key = generate_pai(paa_cert, paa_key, args.vendor_id, args.product_id,
+                                         '{} PAI 00'.format(args.cn_prefix), args.lifetime, args.valid_from)
+        os.makedirs(os.path.dirname(pai_cert_path), exist_ok=True)
+        with open(pai_key_path, 'wb') as f:
+            f.write(pai_key)
+        with open(pai_cert_path, 'wb') as f:
+            f.write(pai_cert)
+        logging.info('Generated PAI certificate: {}'.format(pai_cert_path))
+
+    return Attestation.from_files(cert_dclrn=args.cert_dclrn, pai_cert=pai_cert_path, pai_key=pai_key_path, **options)
+
+
+def main():
+    logging.basicConfig(format='[%(asctime)s] [%(levelname)7s] - %(message)s', level=logging.INFO)
+    args = get_args()
+
+    out_dir = os.path.realpath(args.output)
+    if os.path.exists(out_dir) and not args.resume:
+        if not args.overwrite:
+            logging.error('Output directory exists! Please use different, remove existing, or use --overwrite or --resume.')
+            sys.exit(1)
+        shutil.rmtree(out_dir)
+
+    serializer_options = dict(args.option)
+    if args.offset is not None:
+        serializer_options['offset'] = args.offset
+    if args.size is not None:
+        serializer_options['size'] = args.size
+    try:
+        serializer = load_serializer(args.platform, **serializer_options)
+    except TypeError as e:
+        logging.error('Invalid options for platform {}: {}'.format(args.platform, e))
+        sys.exit(1)
+
+    batch = setup_batch(out_dir, args.resume, {
+        'platform': args.platform,
+        'serial_num': args.serial_num or secrets.token_hex(SERIAL_NUMBER_LEN),
+        'vendor_id': args.vendor_id,
+        'product_id': args.product_id,
+        'count': args.count,
+    })
+    if (batch['platform'], batch['vendor_id'], batch['product_id']) != (args.platform, args.vendor_id, args.product_id):
+        logging.error('Platform, vendor and product ids do not match the batch being resumed: {} {:04x}/{:04x}'.format(
+            batch['platform'], batch['vendor_id'], batch['product_id']))
+        sys.exit(1)
+
+    params = FactoryDataParams(vendor_id=args.vendor_id, product_id=args.product_id, vendor_name=args.vendor_name,
+                               product_name=args.product_name, hw_ver=args.hw_ver, hw_ver_str=args.hw_ver_str,
+                               mfg_date=args.mfg_date, product_label=args.product_label,
+                               product_url=args.product_url, part_number=args.part_number,
+                               enable_key=args.enable_key, serial_num=int(batch['serial_num'], 16),
+                               passcode=args.passcode, discriminator=args.discriminator, spake2_it=args.spake2_it,
+                               rd_uid=bytes.fromhex(args.rd_id_uid) if args.rd_id_uid else None,
+                               generate_rd_uid=args.enable_rotating_device_id,
+                               discovery=args.discovery_mode, commissioning_flow=args.commissioning_flow)
+
+    try:
+        write_batch(out_dir, params, load_attestation(args, out_dir), serializer, args.count, jobs=args.jobs,
+                    resume=args.resume)
+    except KeyboardInterrupt:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
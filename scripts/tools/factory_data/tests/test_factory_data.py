@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import base64
+import binascii
+import csv
+import hashlib
+import io
+import json
+import os
+import subprocess
+import sys
+import tarfile
+import tempfile
+import unittest
+
+import cbor2
+from crc import Calculator, Crc16
+from Crypto.Cipher import AES
+from cryptography import x509
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from intelhex import IntelHex
+
+FACTORY_DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+CHIP_TOPDIR = os.path.abspath(os.path.join(FACTORY_DATA_DIR, '..', '..', '..'))
+ATTESTATION_DIR = os.path.join(CHIP_TOPDIR, 'credentials', 'test', 'attestation')
+CD_PATH = os.path.join(CHIP_TOPDIR, 'credentials', 'test', 'certification-declaration', 'Chip-Test-CD-FFF2-8001.der')
+PAI_CERT_PATH = os.path.join(ATTESTATION_DIR, 'Chip-Test-PAI-FFF2-8001-Cert.pem')
+PAI_KEY_PATH = os.path.join(ATTESTATION_DIR, 'Chip-Test-PAI-FFF2-8001-Key.pem')
+
+sys.path.insert(0, FACTORY_DATA_DIR)
+from factory_data import (ARCHIVE_FILE, INDEX_FILE, Attestation, FactoryDataParams, generate_device,  # noqa: E402 isort:skip
+                          generate_verifier, load_serializer)
+
+
+def batch_command(outdir: str, count: int, *args) -> list:
+    return ['python3', os.path.join(FACTORY_DATA_DIR, 'factory_data_batch.py'),
+            '--platform', 'nrfconnect',
+            '--count', str(count),
+            '--jobs', '2',
+            '-v', '0xFFF2',
+            '-p', '0x8001',
+            '--vendor-name', 'Test Vendor',
+            '--product-name', 'Test Product',
+            '--hw-ver', '1',
+            '--hw-ver-str', 'v1',
+            '--mfg-date', '2026-01-01',
+            '--serial-num', 'aabbccddeeff0000',
+            '--enable-rotating-device-id',
+            '--pai-cert', PAI_CERT_PATH,
+            '--pai-key', PAI_KEY_PATH,
+            '-cd', CD_PATH,
+            '-o', outdir,
+            *args]
+
+
+def generate_batch(outdir: str, count: int, *args) -> None:
+    subprocess.check_call(batch_command(outdir, count, *args))
+
+
+def read_index(outdir: str) -> list:
+    with open(os.path.join(outdir, INDEX_FILE), newline='') as f:
+        return list(csv.DictReader(f))
+
+
+def json_bytes(value: str) -> bytes:
+    assert value.startswith('hex:')
+    return bytes.fromhex(value[len('hex:'):])
+
+
+class TestFactoryDataBatch(unittest.TestCase):
+
+    def check_batch(self, outdir: str, count: int) -> None:
+        with open(PAI_CERT_PATH, 'rb') as f:
+            pai_cert = x509.load_pem_x509_certificate(f.read())
+
+        rows = read_index(outdir)
+        self.assertEqual(len(rows), count)
+        with open(os.path.join(outdir, ARCHIVE_FILE), 'rb') as archive_file, \
+                tarfile.open(os.path.join(outdir, ARCHIVE_FILE)) as archive:
+            for index, row in enumerate(rows):
+                self.assertEqual(int(row['Index']), index)
+                self.assertEqual(row['Serial Number'], '{:x}'.format(0xaabbccddeeff0000 + index))
+                self.assertTrue(row['QR Code'].startswith('MT:'))
+
+                # The index locates the primary file of the device in the archive
+                content = archive.extractfile('{}/factory_data.json'.format(row['Serial Number'])).read()
+                archive_file.seek(int(row['Offset']))
+                self.assertEqual(archive_file.read(int(row['Size'])), content)
+                factory_data = json.loads(content)
+
+                self.assertEqual(factory_data['sn'], row['Serial Number'])
+                self.assertEqual(factory_data['vendor_id'], 0xFFF2)
+                self.assertEqual(factory_data['product_id'], 0x8001)
+                self.assertEqual(factory_data['discriminator'], int(row['Discriminator']))
+                self.assertEqual(len(json_bytes(factory_data['rd_uid'])), 16)
+
+                salt = json_bytes(factory_data['spake2_salt'])
+                self.assertEqual(base64.b64encode(salt).decode('utf-8'), row['Salt'])
+                self.assertEqual(json_bytes(factory_data['spake2_verifier']),
+                                 generate_verifier(int(row['PIN Code']), salt, int(row['Iteration Count'])))
+
+                # Every device has its own DAC, signed by the PAI and matching its private key
+                dac_cert = x509.load_der_x509_certificate(json_bytes(factory_data['dac_cert']))
+                dac_cert.verify_directly_issued_by(pai_cert)
+                dac_key = ec.derive_private_key(int.from_bytes(json_bytes(factory_data['dac_key']), 'big'), ec.SECP256R1())
+                self.assertEqual(dac_key.public_key(), dac_cert.public_key())
+                self.assertEqual(json_bytes(factory_data['pai_cert']), pai_cert.public_bytes(serialization.Encoding.DER))
+
+    def test_generate_batch(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            outdir = os.path.join(tmpdir, 'out')
+            generate_batch(outdir, 6)
+            self.check_batch(outdir, 6)
+
+    def test_resume_batch(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            outdir = os.path.join(tmpdir, 'out')
+            generate_batch(outdir, 4)
+            # Simulate an interruption while the last index row was being written
+            index_path = os.path.join(outdir, INDEX_FILE)
+            with open(index_path, 'rb+') as f:
+                f.truncate(os.path.getsize(index_path) - 10)
+
+            generate_batch(outdir, 8, '--resume')
+            self.check_batch(outdir, 8)
+
+    def test_dac_without_key(self):
+        dac_cert = os.path.join(ATTESTATION_DIR, 'Chip-Test-DAC-FFF2-8001-0008-Cert.pem')
+        dac_key = os.path.join(ATTESTATION_DIR, 'Chip-Test-DAC-FFF2-8001-0008-Key.pem')
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for args in [('--dac-cert', dac_cert), ('--dac-key', dac_key)]:
+                result = subprocess.run(batch_command(os.path.join(tmpdir, 'out'), 1, *args), capture_output=True, text=True)
+                self.assertEqual(result.returncode, 2)
+                self.assertIn('--dac-cert and --dac-key must be given together', result.stderr)
+                self.assertFalse(os.path.exists(os.path.join(tmpdir, 'out')))
+
+
+def legacy_nxp_to_bin(klv, aes_key, hw_params) -> bytes:
+    """The factory data binary written by Generator.to_bin() of nxp/factory_data_generator/generate.py before klv_to_bytes()."""
+    fullContent = bytearray()
+    for entry in klv:
+        fullContent += entry[0].to_bytes(1, "little")
+        fullContent += entry[1].to_bytes(2, "little")
+        fullContent += entry[2]
+    size = len(fullContent)
+
+    hashId = bytearray.fromhex("CE47BA5E")
+    hashId.reverse()
+    if (aes_key is None):
+        hashing = hashlib.sha256(fullContent).hexdigest()[0:8]
+        fullContent = bytearray.fromhex(hashing) + fullContent
+        fullContent = size.to_bytes(4, "little") + fullContent
+        fullContent = hashId + fullContent
+        size = len(fullContent)
+
+        if (hw_params):
+            crc_sum = Calculator(Crc16.XMODEM).checksum(fullContent)
+            fullContent = bytearray(b"APP_FACT_DATA:  ") + size.to_bytes(4, 'little') + \
+                fullContent + crc_sum.to_bytes(2, 'little')
+        return bytes(fullContent)
+
+    fullContent += bytearray(16 - size % 16)
+    size = len(fullContent)
+    fullContentCipher = AES.new(bytes.fromhex(aes_key), AES.MODE_ECB).encrypt(fullContent)
+    hashing = hashlib.sha256(fullContent).hexdigest()[0:8]
+    fullContentCipher = bytearray.fromhex(hashing) + fullContentCipher
+    fullContentCipher = size.to_bytes(4, "little") + fullContentCipher
+    return bytes(hashId + fullContentCipher)
+
+
+class TestSerializers(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.params = FactoryDataParams(vendor_id=0xFFF2, product_id=0x8001, vendor_name='Test Vendor',
+                                       product_name='Test Product', hw_ver=1, hw_ver_str='v1', mfg_date='2026-01-01',
+                                       serial_num=0xaabbccddeeff0000, generate_rd_uid=True)
+        attestation = Attestation.from_files(cert_dclrn=CD_PATH, pai_cert=PAI_CERT_PATH, pai_key=PAI_KEY_PATH)
+        cls.device = generate_device(cls.params, attestation, 3)
+
+    def serialize(self, platform: str, **options) -> dict:
+        serializer = load_serializer(platform, **options)
+        files = serializer.serialize(self.params, self.device)
+        self.assertIn(serializer.primary_file, files)
+        return files
+
+    def test_esp32(self):
+        files = self.serialize('esp32', size=0x6000)
+        self.assertEqual(len(files['factory_partition.bin']), 0x6000)
+
+        rows = list(csv.reader(io.StringIO(files['nvs_partition.csv'].decode('utf-8'))))
+        self.assertEqual(rows[:2], [['key', 'type', 'encoding', 'value'], ['chip-factory', 'namespace', '', '']])
+        values = {key: (encoding, value) for key, _, encoding, value in rows[2:]}
+        self.assertEqual(values['discriminator'], ('u32', str(self.device.discriminator)))
+        self.assertEqual(values['iteration-count'], ('u32', str(self.device.spake2_it)))
+        self.assertEqual(values['salt'], ('string', base64.b64encode(self.device.spake2_salt).decode('utf-8')))
+        self.assertEqual(values['verifier'], ('string', base64.b64encode(self.device.spake2_verifier).decode('utf-8')))
+        self.assertEqual(values['serial-num'], ('string', self.device.serial_num))
+        self.assertEqual(values['vendor-id'], ('u32', str(0xFFF2)))
+        self.assertEqual(values['rd-id-uid'], ('hex2bin', self.device.rd_uid.hex()))
+        self.assertEqual(values['dac-cert'], ('hex2bin', self.device.dac_cert.hex()))
+        self.assertEqual(values['dac-key'], ('hex2bin', self.device.dac_key.hex()))
+        self.assertEqual(values['cert-dclrn'], ('hex2bin', self.device.cert_dclrn.hex()))
+
+        self.assertNotIn('factory_partition.bin', self.serialize('esp32', size=0))
+
+    def test_nxp(self):
+        content = self.serialize('nxp')['factory_data.bin']
+        self.assertEqual(content[:4], bytes.fromhex('5EBA47CE'))
+        size = int.from_bytes(content[4:8], 'little')
+        klv = content[12:]
+        self.assertEqual(len(klv), size)
+        self.assertEqual(content[8:12], hashlib.sha256(klv).digest()[:4])
+
+        entries = {}
+        while klv:
+            length = int.from_bytes(klv[1:3], 'little')
+            entries[klv[0]] = klv[3:3 + length]
+            klv = klv[3 + length:]
+        self.assertIn(self.device.serial_num.encode('utf-8'), entries.values())
+        self.assertIn(self.device.dac_cert, entries.values())
+        self.assertIn(self.device.dac_key, entries.values())
+        self.assertIn(base64.b64encode(self.device.spake2_verifier), entries.values())
+
+    def test_nxp_legacy_parity(self):
+        sys.path.insert(0, os.path.join(CHIP_TOPDIR, 'scripts', 'tools', 'nxp', 'factory_data_generator'))
+        from generate import klv_to_bytes
+
+        small = [(1, 4, bytes(4)), (2, 3, b'abc')]
+        aligned = [(1, 13, bytes(range(13))), (5, 13, bytes(13))]
+        large = [(key, 100 + key, bytes([key]) * (100 + key)) for key in range(1, 20)]
+        for klv in [small, aligned, large]:
+            for aes_key in [None, '2b7e151628aed2a6abf7158809cf4f3c',
+                            '603deb1015ca71be2b73aef0857d77811f352c073b6108d72d9810a30914dff4']:
+                for hw_params in [False, True]:
+                    self.assertEqual(klv_to_bytes(klv, aes_key, hw_params), legacy_nxp_to_bin(klv, aes_key, hw_params),
+                                     (klv, aes_key, hw_params))
+
+    def test_silabs(self):
+        objects = self.serialize('silabs')['nvm3_objects.txt'].decode('utf-8').splitlines()
+        values = dict(nvm3_object.split(':', 1) for nvm3_object in objects)
+        self.assertEqual(values['0x87207'], self.device.discriminator.to_bytes(2, 'little').hex())
+        self.assertEqual(values['0x87208'], self.device.spake2_it.to_bytes(4, 'little').hex())
+        self.assertEqual(values['0x87209'], base64.b64encode(self.device.spake2_salt).hex())
+        self.assertEqual(values['0x8720A'], base64.b64encode(self.device.spake2_verifier).hex())
+        self.assertEqual(values['0x8720B'], (0x8001).to_bytes(2, 'little').hex())
+        self.assertEqual(values['0x8720C'], (0xFFF2).to_bytes(2, 'little').hex())
+        self.assertEqual(values['0x8720D'], b'Test Vendor'.hex())
+        self.assertEqual(values['0x87200'], self.device.serial_num.encode('utf-8').hex())
+        self.assertEqual(values['0x8721F'], self.device.rd_uid.hex())
+
+    def test_bouffalolab(self):
+        content = self.serialize('bouffalolab')['mfd.bin']
+
+        def section(offset):
+            size = int.from_bytes(content[offset:offset + 4], 'little')
+            data = content[offset + 4:offset + 4 + size]
+            self.assertEqual(int.from_bytes(content[offset + 4 + size:offset + 8 + size], 'little'), binascii.crc32(data))
+            return data, offset + 8 + size
+
+        sec_tlvs, offset = section(0)
+        raw_tlvs, offset = section(offset)
+        self.assertEqual(sec_tlvs, b'')
+        self.assertEqual(offset, len(content))
+
+        tlvs = {}
+        while raw_tlvs:
+            length = int.from_bytes(raw_tlvs[2:4], 'little')
+            tlvs[int.from_bytes(raw_tlvs[:2], 'little') - 0x8000] = raw_tlvs[4:4 + length]
+            raw_tlvs = raw_tlvs[4 + length:]
+        self.assertEqual(tlvs[2], self.device.dac_cert)
+        self.assertEqual(tlvs[3], self.device.dac_key)
+        self.assertEqual(int.from_bytes(tlvs[4], 'little'), self.device.passcode)
+        self.assertEqual(tlvs[5], self.device.pai_cert)
+        self.assertEqual(tlvs[6], self.device.cert_dclrn)
+        self.assertEqual(tlvs[7], self.device.serial_num.encode('utf-8'))
+        self.assertEqual(int.from_bytes(tlvs[8], 'little'), self.device.discriminator)
+        self.assertEqual(tlvs[9], self.device.rd_uid)
+        self.assertEqual(tlvs[11], self.device.spake2_salt)
+        self.assertEqual(tlvs[12], self.device.spake2_verifier)
+        self.assertEqual(int.from_bytes(tlvs[14], 'little'), 0xFFF2)
+
+    def test_telink(self):
+        files = self.serialize('telink', offset=0x1000, size=0x1000)
+        self.assertEqual(files['internal/DAC_cert.der'], self.device.dac_cert)
+        factory_data = cbor2.CBORDecoder(io.BytesIO(files['factory_data.bin'])).decode()
+        self.assertEqual(factory_data['sn'], self.device.serial_num.encode('utf-8'))
+        self.assertEqual(factory_data['vendor_id'], 0xFFF2)
+        self.assertEqual(factory_data['product_id'], 0x8001)
+        self.assertEqual(factory_data['discriminator'], self.device.discriminator)
+        self.assertEqual(factory_data['passcode'], self.device.passcode)
+        self.assertEqual(factory_data['spake2_salt'], self.device.spake2_salt)
+        self.assertEqual(factory_data['spake2_verifier'], self.device.spake2_verifier)
+        self.assertEqual(factory_data['rd_uid'], self.device.rd_uid)
+        self.assertEqual(factory_data['dac_key'], self.device.dac_key)
+
+        # The hex file places the same partition at the offset
+        ih = IntelHex(io.StringIO(files['factory_data.hex'].decode('utf-8')))
+        self.assertEqual(ih.minaddr(), 0x1000)
+        self.assertEqual(ih.tobinstr(), files['factory_data.bin'])
+
+        with self.assertRaises(ValueError):
+            self.serialize('telink', offset=0x1000, size=0x100)
+
+
+if __name__ == '__main__':
+    unittest.main()
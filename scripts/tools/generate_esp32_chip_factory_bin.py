@@ -18,14 +18,18 @@
 
 import argparse
 import base64
+import contextlib
+import io
 import logging
 import os
 import sys
+import tempfile
 from enum import Enum
 from types import SimpleNamespace
 
 import cryptography.x509
 import esp_idf_nvs_partition_gen.nvs_partition_gen as nvs_partition_gen
+from cryptography.hazmat.primitives.asymmetric import ec
 from esp_secure_cert.tlv_format import generate_partition_ds, generate_partition_no_ds, tlv_priv_key_t, tlv_priv_key_type_t
 
 CHIP_TOPDIR = os.path.dirname(os.path.realpath(__file__))[:-len(os.path.join('scripts', 'tools'))]
@@ -624,6 +628,80 @@ def generate_onboarding_data(args):
         f.write(csv_data)
 
 
+class Esp32Serializer:
+    """
+    Serializes a device generated by scripts/tools/factory_data into the
+    chip-factory NVS partition csv, and into the partition binary unless size
+    is 0. Attestation data is stored in the NVS partition, the esp_secure_cert
+    partition and the NVS encryption are not supported.
+    """
+
+    def __init__(self, size=0x6000, product_finish=None, product_color=None, device_type=None):
+        self.size = size
+        self.product_finish = product_finish
+        self.product_color = product_color
+        self.device_type = device_type
+        self.primary_file = FACTORY_PARTITION_BIN if size else FACTORY_PARTITION_CSV
+
+    def serialize(self, params, device):
+        dac_pub_key = None
+        if device.dac_key is not None:
+            public_numbers = ec.derive_private_key(int.from_bytes(device.dac_key, 'big'), ec.SECP256R1()).public_key().public_numbers()
+            dac_pub_key = b'\x04' + public_numbers.x.to_bytes(32, 'big') + public_numbers.y.to_bytes(32, 'big')
+
+        values = {
+            'discriminator': device.discriminator,
+            'iteration-count': device.spake2_it,
+            'salt': base64.b64encode(device.spake2_salt).decode('utf-8'),
+            'verifier': base64.b64encode(device.spake2_verifier).decode('utf-8'),
+            'dac-cert': device.dac_cert,
+            'dac-key': device.dac_key,
+            'dac-pub-key': dac_pub_key,
+            'pai-cert': device.pai_cert,
+            'cert-dclrn': device.cert_dclrn,
+            'vendor-id': params.vendor_id,
+            'vendor-name': params.vendor_name,
+            'product-id': params.product_id,
+            'product-name': params.product_name,
+            'serial-num': device.serial_num,
+            'hardware-ver': params.hw_ver,
+            'hw-ver-str': params.hw_ver_str,
+            'mfg-date': params.mfg_date,
+            'rd-id-uid': device.rd_uid.hex() if device.rd_uid is not None else None,
+            'product-finish': Product_Finish_Enum[self.product_finish].value if self.product_finish else None,
+            'product-color': Product_Color_Enum[self.product_color].value if self.product_color else None,
+            'part-number': params.part_number,
+            'product-label': params.product_label,
+            'product-url': params.product_url,
+            'device-type': self.device_type,
+        }
+
+        csv_content = 'key,type,encoding,value\n'
+        csv_content += 'chip-factory,namespace,,\n'
+        for k, v in FACTORY_DATA.items():
+            value = values.get(k)
+            if value is None:
+                continue
+            # Files are stored inline, as the same binary blobs
+            if isinstance(value, bytes):
+                csv_content += f"{k},data,hex2bin,{value.hex()}\n"
+            else:
+                csv_content += f"{k},{v['type']},{v['encoding']},{value}\n"
+
+        files = {FACTORY_PARTITION_CSV: csv_content.encode('utf-8')}
+        if self.size:
+            with tempfile.TemporaryDirectory() as output_dir:
+                csv_file = os.path.join(output_dir, FACTORY_PARTITION_CSV)
+                with open(csv_file, 'w') as f:
+                    f.write(csv_content)
+                # nvs_partition_gen prints every generated binary
+                with contextlib.redirect_stdout(io.StringIO()):
+                    generate_nvs_bin(False, self.size, csv_file, FACTORY_PARTITION_BIN, output_dir)
+                with open(os.path.join(output_dir, FACTORY_PARTITION_BIN), 'rb') as f:
+                    files[FACTORY_PARTITION_BIN] = f.read()
+        return files
+
+
 def main():
     args = get_args()
     set_up_out_dirs(args)
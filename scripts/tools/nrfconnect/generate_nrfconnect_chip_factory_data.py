@@ -28,7 +28,7 @@ from os.path import exists
 
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives.serialization import load_der_private_key
-from nrfconnect_generate_partition import PartitionCreator
+from nrfconnect_generate_partition import PartitionCreator, create_partition
 
 try:
     import qrcode
@@ -214,6 +214,15 @@ def gen_test_certs(chip_cert_exe: str,
     return attestation_certs(None, None, None)
 
 
+def add_entry(factory_data: list, name: str, value: any):
+    """ Add single entry to list of tuples ("key", "value"), skipping empty values """
+    if (isinstance(value, bytes) or isinstance(value, bytearray)):
+        value = HEX_PREFIX + value.hex()
+    if value or (isinstance(value, int) and value == 0):
+        log.debug("Adding entry '{}' with size {} and type {}".format(name, sys.getsizeof(value), type(value)))
+        factory_data.append((name, value))
+
+
 class FactoryDataGenerator:
     """
     Class to generate factory data from given arguments and generate a JSON file
@@ -371,11 +380,7 @@ class FactoryDataGenerator:
 
     def _add_entry(self, name: str, value: any):
         """ Add single entry to list of tuples ("key", "value") """
-        if (isinstance(value, bytes) or isinstance(value, bytearray)):
-            value = HEX_PREFIX + value.hex()
-        if value or (isinstance(value, int) and value == 0):
-            log.debug("Adding entry '{}' with size {} and type {}".format(name, sys.getsizeof(value), type(value)))
-            self._factory_data.append((name, value))
+        add_entry(self._factory_data, name, value)
 
     def _generate_spake2_verifier(self):
         """ If verifier has not been provided in arguments list it should be generated via external script """
@@ -432,6 +437,64 @@ class FactoryDataGenerator:
         qr.save(self._args.output + ".png")
 
 
+class NrfConnectSerializer:
+    """
+    Serializes a device generated by scripts/tools/factory_data into the same
+    factory data JSON as FactoryDataGenerator, and into the factory data
+    partition when offset and size are given.
+    """
+
+    def __init__(self, offset: int = None, size: int = None, include_passcode: bool = False,
+                 product_finish: str = None, product_color: str = None, user: str = None):
+        self.offset = offset
+        self.size = size
+        self.include_passcode = include_passcode
+        self.product_finish = product_finish
+        self.product_color = product_color
+        self.user = json.loads(user) if user else None
+        self.primary_file = "factory_data.bin" if offset and size else "factory_data.json"
+
+    def serialize(self, params, device) -> dict:
+        factory_data = list()
+        add_entry(factory_data, "version", FACTORY_DATA_VERSION)
+        add_entry(factory_data, "sn", device.serial_num)
+        add_entry(factory_data, "vendor_id", params.vendor_id)
+        add_entry(factory_data, "product_id", params.product_id)
+        add_entry(factory_data, "vendor_name", params.vendor_name)
+        add_entry(factory_data, "product_name", params.product_name)
+        add_entry(factory_data, "product_label", params.product_label)
+        add_entry(factory_data, "product_url", params.product_url)
+        add_entry(factory_data, "part_number", params.part_number)
+        add_entry(factory_data, "date", params.mfg_date)
+        add_entry(factory_data, "hw_ver", params.hw_ver)
+        add_entry(factory_data, "hw_ver_str", params.hw_ver_str)
+        add_entry(factory_data, "dac_cert", device.dac_cert)
+        add_entry(factory_data, "dac_key", device.dac_key)
+        add_entry(factory_data, "pai_cert", device.pai_cert)
+        if self.include_passcode:
+            add_entry(factory_data, "passcode", device.passcode)
+        add_entry(factory_data, "spake2_it", device.spake2_it)
+        add_entry(factory_data, "spake2_salt", device.spake2_salt)
+        add_entry(factory_data, "spake2_verifier", device.spake2_verifier)
+        add_entry(factory_data, "discriminator", device.discriminator)
+        add_entry(factory_data, "rd_uid", device.rd_uid)
+        if params.enable_key:
+            add_entry(factory_data, "enable_key", HEX_PREFIX + params.enable_key)
+        if self.product_finish:
+            add_entry(factory_data, "product_finish", PRODUCT_FINISH_ENUM[self.product_finish])
+        if self.product_color:
+            add_entry(factory_data, "primary_color", PRODUCT_COLOR_ENUM[self.product_color])
+        if self.user:
+            add_entry(factory_data, "user", self.user)
+
+        factory_data_dict = dict(factory_data)
+        files = {"factory_data.json": json.dumps(factory_data_dict).encode("utf-8")}
+        if self.offset and self.size:
+            files["factory_data.hex"], files["factory_data.bin"] = create_partition(
+                self.offset, self.size, PartitionCreator._convert_to_dict(factory_data_dict))
+        return files
+
+
 def main():
     parser = argparse.ArgumentParser(description="nRF Connect Factory Data generator tool")
 
@@ -17,6 +17,7 @@
 
 import argparse
 import codecs
+import io
 import json
 import logging as log
 import sys
@@ -123,6 +124,23 @@ class PartitionCreator:
             raise e
 
 
+def create_partition(offset: int, length: int, data: dict):
+    """
+    Creates the .hex and raw binary contents of a partition holding the CBOR
+    encoding of the given factory data, without writing files.
+    """
+    cbor_data = cbor.dumps(data)
+    if len(cbor_data) > length:
+        raise ValueError("generated CBOR file exceeds declared maximum partition size! {} > {}".format(len(cbor_data), length))
+    ih = IntelHex()
+    ih.putsz(offset, cbor_data)
+    hex_file = io.StringIO()
+    ih.write_hex_file(hex_file, True)
+    bin_file = io.BytesIO()
+    ih.tobinfile(bin_file)
+    return hex_file.getvalue().encode("utf-8"), bin_file.getvalue()
+
+
 def print_flashing_help():
     print("\nTo flash the generated hex containing factory data, run the following command:")
     print("For nrf52:")
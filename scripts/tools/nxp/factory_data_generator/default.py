@@ -124,6 +124,14 @@ class FileArgument(InputArgument):
         with open(arg, "rb") as _file:
             self.val = _file.read()
 
+    @classmethod
+    def from_bytes(cls, val):
+        '''Create the argument from the file content instead of its path.'''
+        obj = cls.__new__(cls)
+        InputArgument.__init__(obj)
+        obj.val = val
+        return obj
+
     def length(self):
         return len(self.val)
 
@@ -17,6 +17,7 @@
 #
 
 import argparse
+import base64
 import hashlib
 import logging
 import subprocess
@@ -118,81 +119,121 @@ class KlvGenerator:
         return data
 
     def to_bin(self, klv, out, aes_key):
-        fullContent = bytearray()
+        fullContent = klv_to_bytes(klv, aes_key, self.args.hw_params)
         with open(out, "wb") as file:
-            for entry in klv:
-                fullContent += entry[0].to_bytes(1, "little")
-                fullContent += entry[1].to_bytes(2, "little")
-                fullContent += entry[2]
-            size = len(fullContent)
-
-            if (aes_key is None):
-                # Calculate 4 bytes of hashing
-                hashing = hashlib.sha256(fullContent).hexdigest()
-                hashing = hashing[0:8]
-                logging.info("4 byte section hash (for integrity check): {}".format(hashing))
-
-                # Add 4 bytes of hashing to generated binary to check for integrity
-                fullContent = bytearray.fromhex(hashing) + fullContent
-
-                # Add length of data to binary to know how to calculate SHA on embedded
-                fullContent = size.to_bytes(4, "little") + fullContent
-
-                # Add hash id
-                hashId = bytearray.fromhex(hash_id)
-                hashId.reverse()
-                fullContent = hashId + fullContent
-
-                size = len(fullContent)
-
-                if (self.args.hw_params):
-                    calculator = Calculator(Crc16.XMODEM)
-                    crc_sum = calculator.checksum(fullContent)
-
-                    fullContent = bytearray(b"APP_FACT_DATA:  ") + size.to_bytes(4, 'little') + \
-                        fullContent + crc_sum.to_bytes(2, 'little')
-
-                    size = len(fullContent)
-
-                logging.info("Size of final generated binary is: {} bytes".format(size))
-                file.write(fullContent)
-            else:
-                # In case a aes_key is given the data will be encrypted
-                # Always add a padding to be 16 bytes aligned
-                padding_len = size % 16
-                padding_len = 16 - padding_len
-                padding_bytes = bytearray(padding_len)
-                logging.info("(Before padding) Size of generated binary is: {} bytes".format(size))
-                fullContent += padding_bytes
-                size = len(fullContent)
-                logging.info("(After padding) Size of generated binary is: {} bytes".format(size))
-                from Crypto.Cipher import AES
-                cipher = AES.new(bytes.fromhex(aes_key), AES.MODE_ECB)
-                fullContentCipher = cipher.encrypt(fullContent)
-
-                # Add 4 bytes of hashing to generated binary to check for integrity
-                hashing = hashlib.sha256(fullContent).hexdigest()
-                hashing = hashing[0:8]
-                logging.info("4 byte section hash (for integrity check): {}".format(hashing))
-                fullContentCipher = bytearray.fromhex(hashing) + fullContentCipher
-
-                # Add length of data to binary to know how to calculate SHA on embedded
-                fullContentCipher = size.to_bytes(4, "little") + fullContentCipher
-
-                # Add hash id
-                hashId = bytearray.fromhex(hash_id)
-                hashId.reverse()
-                fullContentCipher = hashId + fullContentCipher
-
-                size = len(fullContentCipher)
-
-                logging.info("Size of final generated binary is: {} bytes".format(size))
-                file.write(fullContentCipher)
+            file.write(fullContent)
 
+        logging.info("Size of final generated binary is: {} bytes".format(len(fullContent)))
         out_hash = hashlib.sha256(fullContent).hexdigest()
         logging.info("SHA256 of generated binary: {}".format(out_hash))
 
 
+def klv_to_bytes(klv, aes_key=None, hw_params=False):
+    '''Return the factory data binary of a list of (K, L, V) tuples.'''
+    fullContent = bytearray()
+    for entry in klv:
+        fullContent += entry[0].to_bytes(1, "little")
+        fullContent += entry[1].to_bytes(2, "little")
+        fullContent += entry[2]
+    size = len(fullContent)
+
+    if (aes_key is not None):
+        # In case a aes_key is given the data will be encrypted
+        # Always add a padding to be 16 bytes aligned
+        padding_len = size % 16
+        padding_len = 16 - padding_len
+        fullContent += bytearray(padding_len)
+        size = len(fullContent)
+        from Crypto.Cipher import AES
+        cipher = AES.new(bytes.fromhex(aes_key), AES.MODE_ECB)
+        content = bytearray(cipher.encrypt(bytes(fullContent)))
+    else:
+        content = fullContent
+
+    # Add 4 bytes of hashing to generated binary to check for integrity
+    hashing = hashlib.sha256(fullContent).digest()[0:4]
+
+    # Add length of data to binary to know how to calculate SHA on embedded
+    hashId = bytearray.fromhex(hash_id)
+    hashId.reverse()
+    content = hashId + size.to_bytes(4, "little") + hashing + content
+
+    if (aes_key is None and hw_params):
+        calculator = Calculator(Crc16.XMODEM)
+        crc_sum = calculator.checksum(content)
+
+        content = bytearray(b"APP_FACT_DATA:  ") + len(content).to_bytes(4, 'little') + \
+            content + crc_sum.to_bytes(2, 'little')
+
+    return bytes(content)
+
+
+class NxpSerializer:
+    '''Serializes a device generated by scripts/tools/factory_data into the KLV factory data binary.
+
+    The DAC private key is stored in plain text: SSS blobs and EdgeLock 2Go
+    provisioning are not supported.
+    '''
+
+    primary_file = 'factory_data.bin'
+
+    def __init__(self, aes_key=None, hw_params=False, product_finish=None, product_primary_color=None):
+        self.aes_key = aes_key
+        self.hw_params = hw_params
+        self.product_finish = product_finish
+        self.product_primary_color = product_primary_color
+
+    def serialize(self, params, device):
+        data = [
+            Verifier(base64.b64encode(device.spake2_verifier)),
+            Salt(base64.b64encode(device.spake2_salt)),
+            IterationCount(str(device.spake2_it)),
+            Discriminator(str(device.discriminator)),
+            SetupPasscode(str(device.passcode)),
+            VendorId(str(params.vendor_id)),
+            ProductId(str(params.product_id)),
+            SerialNum(device.serial_num),
+        ]
+        if params.vendor_name:
+            data.append(VendorName(params.vendor_name))
+        if params.product_name:
+            data.append(ProductName(params.product_name))
+        if params.hw_ver is not None:
+            data.append(HardwareVersion(str(params.hw_ver)))
+        if params.hw_ver_str:
+            data.append(HardwareVersionStr(params.hw_ver_str))
+        if device.cert_dclrn is not None:
+            data.append(CertDeclaration.from_bytes(device.cert_dclrn))
+        if device.dac_cert is not None:
+            data.append(PaiCert.from_bytes(device.pai_cert))
+            data.append(DacCert.from_bytes(device.dac_cert))
+            dac_key = DacPKey.from_bytes(device.dac_key)
+            dac_key.private_key = device.dac_key
+            data.append(dac_key)
+        if params.mfg_date:
+            data.append(ManufacturingDate(params.mfg_date))
+        if params.part_number:
+            data.append(PartNumber(params.part_number))
+        if params.product_url:
+            data.append(ProductURL(params.product_url))
+        if params.product_label:
+            data.append(ProductLabel(params.product_label))
+        if device.rd_uid is not None:
+            data.append(UniqueId(device.rd_uid.hex()))
+        if self.product_finish:
+            data.append(ProductFinish(self.product_finish))
+        if self.product_primary_color:
+            data.append(ProductPrimaryColor(self.product_primary_color))
+
+        for arg in data:
+            if isinstance(arg, StrArgument) and arg.length() > arg.max_length():
+                raise ValueError("{} is longer than {} bytes".format(type(arg).__name__, arg.max_length()))
+
+        # Sorted by key, as KlvGenerator.generate() does
+        klv = [(arg.key(), arg.length(), arg.encode()) for arg in sorted(data, key=lambda x: x.key())]
+        return {self.primary_file: klv_to_bytes(klv, self.aes_key, self.hw_params)}
+
+
 def main():
     set_logger()
     parser = argparse.ArgumentParser(description="NXP Factory Data Generator")
@@ -15,6 +15,7 @@
 #
 
 import argparse
+import base64
 import datetime
 import os
 import subprocess
@@ -181,6 +182,70 @@ class FactoryDataWriter:
         if self._args.jtag_serial:
             cmdList.extend(["--serialno", self._args.jtagSerial])
 
+    def nvm3_objects(self):
+        """ Return the factory commissioning data as the "key:value" nvm3 objects
+            given to commander
+        """
+        # Convert interger to little endian hex format and strings to hex byte array format for nvm3 storage
+        spake2pIterationCount = self._args.spake2_iteration.to_bytes(4, 'little').hex()
+        discriminator = self._args.discriminator.to_bytes(2, 'little').hex()
+        saltByteArray = bytes(self._args.spake2_salt, 'utf-8').hex()
+        verifierByteArray = bytes(self._args.spake2_verifier, 'utf-8').hex()
+
+        productId = self._args.product_id.to_bytes(2, "little").hex()
+        vendorId = self._args.vendor_id.to_bytes(2, "little").hex()
+
+        objects = [
+            self.DISCRIMINATOR_NVM3_KEY + str(discriminator),
+            self.SETUP_PAYLOAD_NVM3_KEY + self.generateQrCodeBitSet(),
+            self.ITERATIONCOUNT_NVM3_KEY + str(spake2pIterationCount),
+            self.SALT_NVM3_KEY + str(saltByteArray),
+            self.VERIFIER_NVM3_KEY + str(verifierByteArray),
+            self.PRODUCT_ID_NVM3_KEY + str(productId),
+            self.VENDOR_ID_NVM3_KEY + str(vendorId),
+        ]
+
+        if self._args.product_name:
+            productNameByteArray = bytes(self._args.product_name, 'utf-8').hex()
+            objects.append(self.PRODUCT_NAME_NVM3_KEY + str(productNameByteArray))
+
+        if self._args.vendor_name:
+            vendorNameByteArray = bytes(self._args.vendor_name, 'utf-8').hex()
+            objects.append(self.VENDOR_NAME_NVM3_KEY + str(vendorNameByteArray))
+
+        if self._args.hw_version:
+            hwVersionByteArray = self._args.hw_version.to_bytes(2, "little").hex()
+            objects.append(self.HW_VER_NVM3_KEY + str(hwVersionByteArray))
+
+        if self._args.hw_version_str:
+            hwVersionByteArray = bytes(self._args.hw_version_str, 'utf-8').hex()
+            objects.append(self.HW_VER_STR_NVM3_KEY + str(hwVersionByteArray))
+
+        if self._args.unique_id:
+            objects.append(self.UNIQUE_ID_NVM3_KEY + self._args.unique_id)
+
+        if self._args.manufacturing_date:
+            dateByteArray = bytes(self._args.manufacturing_date, 'utf-8').hex()
+            objects.append(self.MANUFACTURING_DATE_NVM3_KEY + str(dateByteArray))
+
+        if self._args.serial_number:
+            serialNumberByteArray = bytes(self._args.serial_number, 'utf-8').hex()
+            objects.append(self.SERIAL_NUMBER_NVM3_KEY + str(serialNumberByteArray))
+
+        if self._args.part_number:
+            partNumberByteArray = bytes(self._args.part_number, 'utf-8').hex()
+            objects.append(self.PART_NUMBER_NVM3_KEY + str(partNumberByteArray))
+
+        if self._args.product_label:
+            productLabelByteArray = bytes(self._args.product_label, 'utf-8').hex()
+            objects.append(self.PRODUCT_LABEL_NVM3_KEY + str(productLabelByteArray))
+
+        if self._args.product_url:
+            productUrlByteArray = bytes(self._args.product_url, 'utf-8').hex()
+            objects.append(self.PRODUCT_URL_NVM3_KEY + str(productUrlByteArray))
+
+        return objects
+
     def create_nvm3injected_image(self):
         """ Use commander command lines create a binary flashable to the EFR32
             containing the factory commissioning data in NVM3 section
@@ -222,65 +287,10 @@ class FactoryDataWriter:
                     print("Connect debug port or provide the mcu_family")
                     return
 
-        # Convert interger to little endian hex format and strings to hex byte array format for nvm3 storage
-        spake2pIterationCount = self._args.spake2_iteration.to_bytes(4, 'little').hex()
-        discriminator = self._args.discriminator.to_bytes(2, 'little').hex()
-        saltByteArray = bytes(self._args.spake2_salt, 'utf-8').hex()
-        verifierByteArray = bytes(self._args.spake2_verifier, 'utf-8').hex()
-
-        productId = self._args.product_id.to_bytes(2, "little").hex()
-        vendorId = self._args.vendor_id.to_bytes(2, "little").hex()
-
         # create the binary containing the new nvm3 data
-        cmd = [
-            "commander", "nvm3", "set", inputImage,
-            "--object", self.DISCRIMINATOR_NVM3_KEY + str(discriminator),
-            "--object", self.SETUP_PAYLOAD_NVM3_KEY + self.generateQrCodeBitSet(),
-            "--object", self.ITERATIONCOUNT_NVM3_KEY + str(spake2pIterationCount),
-            "--object", self.SALT_NVM3_KEY + str(saltByteArray),
-            "--object", self.VERIFIER_NVM3_KEY + str(verifierByteArray),
-            "--object", self.PRODUCT_ID_NVM3_KEY + str(productId),
-            "--object", self.VENDOR_ID_NVM3_KEY + str(vendorId),
-        ]
-
-        if self._args.product_name:
-            productNameByteArray = bytes(self._args.product_name, 'utf-8').hex()
-            cmd.extend(["--object", self.PRODUCT_NAME_NVM3_KEY + str(productNameByteArray)])
-
-        if self._args.vendor_name:
-            vendorNameByteArray = bytes(self._args.vendor_name, 'utf-8').hex()
-            cmd.extend(["--object", self.VENDOR_NAME_NVM3_KEY + str(vendorNameByteArray)])
-
-        if self._args.hw_version:
-            hwVersionByteArray = self._args.hw_version.to_bytes(2, "little").hex()
-            cmd.extend(["--object", self.HW_VER_NVM3_KEY + str(hwVersionByteArray)])
-
-        if self._args.hw_version_str:
-            hwVersionByteArray = bytes(self._args.hw_version_str, 'utf-8').hex()
-            cmd.extend(["--object", self.HW_VER_STR_NVM3_KEY + str(hwVersionByteArray)])
-
-        if self._args.unique_id:
-            cmd.extend(["--object", self.UNIQUE_ID_NVM3_KEY + self._args.unique_id])
-
-        if self._args.manufacturing_date:
-            dateByteArray = bytes(self._args.manufacturing_date, 'utf-8').hex()
-            cmd.extend(["--object", self.MANUFACTURING_DATE_NVM3_KEY + str(dateByteArray)])
-
-        if self._args.serial_number:
-            serialNumberByteArray = bytes(self._args.serial_number, 'utf-8').hex()
-            cmd.extend(["--object", self.SERIAL_NUMBER_NVM3_KEY + str(serialNumberByteArray)])
-
-        if self._args.part_number:
-            partNumberByteArray = bytes(self._args.part_number, 'utf-8').hex()
-            cmd.extend(["--object", self.PART_NUMBER_NVM3_KEY + str(partNumberByteArray)])
-
-        if self._args.product_label:
-            productLabelByteArray = bytes(self._args.product_label, 'utf-8').hex()
-            cmd.extend(["--object", self.PRODUCT_LABEL_NVM3_KEY + str(productLabelByteArray)])
-
-        if self._args.product_url:
-            productUrlByteArray = bytes(self._args.product_url, 'utf-8').hex()
-            cmd.extend(["--object", self.PRODUCT_URL_NVM3_KEY + str(productUrlByteArray)])
+        cmd = ["commander", "nvm3", "set", inputImage, ]
+        for nvm3_object in self.nvm3_objects():
+            cmd.extend(["--object", nvm3_object])
 
         cmd.extend(["--outfile", self.OUT_FILE])
         results = subprocess.run(cmd)
@@ -299,6 +309,40 @@ class FactoryDataWriter:
             results = subprocess.run(cmd)
 
 
+class SilabsSerializer:
+    """ Serialize a device generated by scripts/tools/factory_data into the nvm3
+        objects of FactoryDataWriter, one "key:value" object per line, to be
+        given to "commander nvm3 set --object" when programming the device.
+        The attestation credentials are not stored in nvm3 and are ignored.
+    """
+    primary_file = "nvm3_objects.txt"
+
+    def serialize(self, params, device):
+        arguments = argparse.Namespace(
+            gen_spake2p_path=None,
+            passcode=device.passcode,
+            discriminator=device.discriminator,
+            spake2_iteration=device.spake2_it,
+            spake2_salt=base64.b64encode(device.spake2_salt).decode('utf-8'),
+            spake2_verifier=base64.b64encode(device.spake2_verifier).decode('utf-8'),
+            product_id=params.product_id,
+            vendor_id=params.vendor_id,
+            product_name=params.product_name,
+            vendor_name=params.vendor_name,
+            hw_version=params.hw_ver,
+            hw_version_str=params.hw_ver_str,
+            product_label=params.product_label,
+            product_url=params.product_url,
+            unique_id=device.rd_uid.hex() if device.rd_uid is not None else None,
+            serial_number=device.serial_num,
+            manufacturing_date=params.mfg_date,
+            part_number=params.part_number,
+            commissioning_flow=params.commissioning_flow,
+            rendezvous_flag=params.discovery)
+        writer = FactoryDataWriter(arguments)
+        return {self.primary_file: "".join(nvm3_object + "\n" for nvm3_object in writer.nvm3_objects()).encode('utf-8')}
+
+
 def main():
     def all_int_format(i): return int(i, 0)
     parser = argparse.ArgumentParser(description='EFR32 NVM3 Factory data provider')
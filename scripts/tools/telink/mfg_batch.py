@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+"""
+Batch mode of mfg_tool.py, for manufacturing runs of many devices.
+
+Everything is generated in process by scripts/tools/factory_data, without the
+spake2p, chip-cert and chip-tool binaries, and serialized by TelinkSerializer.
+Devices are generated in a pool of processes and written, in order, into a
+single archive next to a CSV index:
+
+    <output>/<vid>_<pid>/
+        batch.json              - parameters of the batch, used to resume it
+        factory_data.tar        - <serial>/factory_data.bin, <serial>/factory_data.hex
+                                  and <serial>/internal/DAC_cert.der of every device
+        factory_data.csv        - one row per device: onboarding data, and offset
+                                  and size of factory_data.bin in the archive
+        internal/pai_cert.pem   - PAI generated from the PAA (--paa only)
+        internal/pai_key.pem
+
+The index is written after the archive entries of a device, so an interrupted
+batch can be resumed with --resume from the last device of the index.
+"""
+
+import argparse
+import binascii
+import io
+import logging as logger
+import os
+import shutil
+import sys
+
+import cbor2 as cbor
+import mfg_tool
+from intelhex import IntelHex
+
+CHIP_TOPDIR = os.path.dirname(os.path.realpath(__file__))[:-len(os.path.join('scripts', 'tools', 'telink'))]
+sys.path.insert(0, os.path.join(CHIP_TOPDIR, 'scripts', 'tools', 'factory_data'))
+from factory_data import Attestation, FactoryDataParams, generate_pai, setup_batch, write_batch  # noqa: E402 isort:skip
+
+
+class TelinkSerializer:
+    """Serializes a device into the CBOR factory data partition of Telink platforms."""
+
+    primary_file = 'factory_data.bin'
+
+    def __init__(self, offset: int, size: int):
+        self.offset = offset
+        self.size = size
+
+    def serialize(self, params: FactoryDataParams, device) -> dict:
+        # Same keys, in the same order, as the factory data generated by mfg_tool.py
+        kv_args = argparse.Namespace(vendor_id=params.vendor_id, vendor_name=params.vendor_name,
+                                     product_id=params.product_id, product_name=params.product_name,
+                                     hw_ver=params.hw_ver, hw_ver_str=params.hw_ver_str, mfg_date=params.mfg_date,
+                                     enable_rotating_device_id=device.rd_uid is not None, rd_id_uid=device.rd_uid,
+                                     enable_key=params.enable_key, product_label=params.product_label,
+                                     product_url=params.product_url, part_number=params.part_number)
+        mfg_tool.NVS_MEMORY.clear()
+        mfg_tool.add_additional_kv(kv_args, device.serial_num)
+        mfg_tool.nvs_memory_append('discriminator', device.discriminator)
+        mfg_tool.nvs_memory_append('spake2_it', device.spake2_it)
+        mfg_tool.nvs_memory_append('spake2_salt', device.spake2_salt)
+        mfg_tool.nvs_memory_append('spake2_verifier', device.spake2_verifier)
+        mfg_tool.nvs_memory_append('passcode', device.passcode)
+
+        files = {}
+        if device.dac_cert is not None:
+            mfg_tool.nvs_memory_append('dac_cert', device.dac_cert)
+            mfg_tool.nvs_memory_append('dac_key', device.dac_key)
+            mfg_tool.nvs_memory_append('pai_cert', device.pai_cert)
+            files['internal/DAC_cert.der'] = device.dac_cert
+        mfg_tool.nvs_memory_append('cert_dclrn', device.cert_dclrn)
+
+        cbor_data = cbor.dumps(mfg_tool.NVS_MEMORY)
+        if len(cbor_data) > self.size:
+            raise ValueError("generated CBOR file exceeds declared maximum partition size! {} > {}".format(
+                len(cbor_data), self.size))
+        ih = IntelHex()
+        ih.putsz(self.offset, cbor_data)
+        hex_file = io.StringIO()
+        ih.write_hex_file(hex_file, True)
+        bin_file = io.BytesIO()
+        ih.tobinfile(bin_file)
+        files['factory_data.bin'] = bin_file.getvalue()
+        files['factory_data.hex'] = hex_file.getvalue().encode('utf-8')
+        return files
+
+
+def load_attestation(args, out_dir: str) -> Attestation:
+    options = dict(cn_prefix=args.cn_prefix, lifetime=args.lifetime, valid_from=args.valid_from)
+    if not args.paa:
+        if not args.pai:
+            return Attestation.from_files(cert_dclrn=args.cert_dclrn, **options)
+        return Attestation.from_files(cert_dclrn=args.cert_dclrn, pai_cert=args.cert, pai_key=args.key,
+                                      dac_cert=args.dac_cert, dac_key=args.dac_key, **options)
+
+    internal_dir = os.sep.join([out_dir, 'internal'])
+    pai_cert_path = os.sep.join([internal_dir, 'pai_cert.pem'])
+    pai_key_path = os.sep.join([internal_dir, 'pai_key.pem'])
+    # A resumed batch keeps signing with the PAI generated when it started
+    if not os.path.exists(pai_cert_path):
+        with open(args.cert, 'rb') as f:
+            paa_cert = f.read()
+        with open(args.key, 'rb') as f:
+            paa_key = f.read()
+        pai_cert, pai_key = generate_pai(paa_cert, paa_key, args.vendor_id, args.product_id,
+                                         '{} PAI {}'.format(args.cn_prefix, '00'), args.lifetime, args.valid_from)
+        os.makedirs(internal_dir, exist_ok=True)
+        with open(pai_key_path, 'wb') as f:
+            f.write(pai_key)
+        with open(pai_cert_path, 'wb') as f:
+            f.write(pai_cert)
+        logger.info('Generated PAI certificate: {}'.format(pai_cert_path))
+        logger.info('Generated PAI private key: {}'.format(pai_key_path))
+
+    return Attestation.from_files(cert_dclrn=args.cert_dclrn, pai_cert=pai_cert_path, pai_key=pai_key_path, **options)
+
+
+def generate_batch(args):
+    out_dir_top = os.path.realpath(args.output)
+    out_dir = os.sep.join([out_dir_top, mfg_tool.vid_pid_str(args.vendor_id, args.product_id)])
+
+    if os.path.exists(out_dir_top) and not args.resume:
+        if args.overwrite:
+            logger.info("Output directory already exists. All data will be overwritten.")
+            shutil.rmtree(out_dir_top)
+        else:
+            logger.error("Output directory exists! Please use different, remove existing or use --resume.")
+            sys.exit(1)
+
+    # If serial number is not passed, then generate one
+    if args.serial_num is None:
+        serial_num_int = int(binascii.b2a_hex(os.urandom(mfg_tool.SERIAL_NUMBER_LEN)), 16)
+    else:
+        serial_num_int = int(args.serial_num, 16)
+
+    batch = setup_batch(out_dir, args.resume, {
+        'serial_num': format(serial_num_int, 'x'),
+        'vendor_id': args.vendor_id,
+        'product_id': args.product_id,
+        'count': args.count,
+    })
+    if (batch['vendor_id'], batch['product_id']) != (args.vendor_id, args.product_id):
+        logger.error('Vendor and product ids do not match the batch being resumed: {:04x}/{:04x}'.format(
+            batch['vendor_id'], batch['product_id']))
+        sys.exit(1)
+    if args.serial_num is None and not args.resume:
+        logger.info("Serial number not provided. Using generated one: {}".format(hex(serial_num_int)))
+
+    params = FactoryDataParams(vendor_id=args.vendor_id, product_id=args.product_id, vendor_name=args.vendor_name,
+                               product_name=args.product_name, hw_ver=args.hw_ver, hw_ver_str=args.hw_ver_str,
+                               mfg_date=args.mfg_date, product_label=args.product_label,
+                               product_url=args.product_url, part_number=args.part_number,
+                               enable_key=args.enable_key, serial_num=int(batch['serial_num'], 16),
+                               passcode=args.passcode if args.passcode else None,
+                               discriminator=args.discriminator if args.discriminator else None,
+                               spake2_it=args.spake2_it,
+                               # A given rotating device ID unique ID is stored as mfg_tool.py does
+                               rd_uid=args.rd_id_uid.encode('utf-8') if args.enable_rotating_device_id and args.rd_id_uid else None,
+                               generate_rd_uid=args.enable_rotating_device_id,
+                               discovery=1 << args.discovery_mode, commissioning_flow=args.commissioning_flow)
+
+    try:
+        write_batch(out_dir, params, load_attestation(args, out_dir), TelinkSerializer(args.offset, args.size),
+                    args.count, jobs=args.jobs, resume=args.resume)
+    except KeyboardInterrupt:
+        sys.exit(1)
@@ -30,6 +30,7 @@ import sys
 import cbor2 as cbor
 import cryptography.hazmat.backends
 import cryptography.x509
+import mfg_batch
 import pyqrcode
 from intelhex import IntelHex
 
@@ -646,8 +647,25 @@ def get_and_validate_args():
                                help='Partition offset - an address in devices NVM memory, where factory data will be stored')
     part_gen_args.add_argument('--size', type=allow_any_int, help='The maximum partition size')
 
+    batch_args = parser.add_argument_group('Batch options')
+    batch_args.add_argument('--batch', action='store_true', default=False,
+                            help='Generate the factory data of all devices in process, without the spake2p, chip-cert and '
+                            'chip-tool tools, into a single archive indexed by a CSV file.')
+    batch_args.add_argument('--jobs', type=allow_any_int, default=os.cpu_count(),
+                            help='Number of processes generating devices in batch mode. Default is the number of CPUs.')
+    batch_args.add_argument('--resume', action='store_true', default=False,
+                            help='Complete an interrupted batch in the output directory, up to --count devices.')
+
     args = parser.parse_args()
 
+    # Validate batch parameters
+    if args.batch and args.in_tree:
+        logger.error('Option --in-tree can not be used together with --batch')
+        sys.exit(1)
+    if args.resume and (not args.batch or args.overwrite):
+        logger.error('Option --resume requires --batch and can not be used together with --overwrite')
+        sys.exit(1)
+
     # Validate in-tree parameter
     if args.count > 1 and args.in_tree:
         logger.error('Option --in-tree can not be use together with --count > 1')
@@ -708,6 +726,10 @@ def get_and_validate_args():
 def main():
     logger.basicConfig(format='[%(asctime)s] [%(levelname)7s] - %(message)s', level=logger.INFO)
     args = get_and_validate_args()
+    if args.batch:
+        mfg_batch.generate_batch(args)
+        return
+
     check_tools_exists(args)
 
     if os.path.exists(args.output):
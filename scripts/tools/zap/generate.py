@@ -371,11 +371,18 @@ def main():
         # While that is going on, we need to post-process outputs
         renames = {
             '../../clusters/Pm2.5ConcentrationMeasurement': '../../clusters/Pm25ConcentrationMeasurement',
+            # Python module names cannot contain a dot.
+            'src/controller/python/matter/clusters/objects/Pm2.5ConcentrationMeasurement.py':
+                'src/controller/python/matter/clusters/objects/Pm25ConcentrationMeasurement.py',
         }
         for src, dest in renames.items():
             srcDir = f'{cmdLineArgs.outputDir}/{src}'
             if not os.path.exists(srcDir):
                 continue
+            if os.path.isfile(srcDir):
+                print(f"Moving {srcDir} TO {cmdLineArgs.outputDir}/{dest}")
+                os.replace(srcDir, f'{cmdLineArgs.outputDir}/{dest}')
+                continue
             print(f"Moving files from {srcDir} INTO {cmdLineArgs.outputDir}/{dest}")
             # move all files
             for name in glob.glob(f'{srcDir}/*'):
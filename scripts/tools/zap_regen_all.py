@@ -31,7 +31,7 @@ import urllib.request
 from dataclasses import dataclass
 from enum import Flag, auto
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from zap.clang_format import getClangFormatBinary
 
@@ -272,14 +272,15 @@ class GoldenTestImageTarget():
 
 
 class JinjaCodegenTarget():
-    def __init__(self, generator: str, output_directory: str, idl_path: str):
+    def __init__(self, generator: str, output_directory: str, idl_path: str, cache_dir: Optional[str] = None):
         # This runs a test, but the important bit is we pass `--regenerate`
         # to it and this will cause it to OVERWRITE golden images.
         self.idl_path = idl_path
         self.generator = generator
         self.output_directory = output_directory
+        self.cache_args = ["--cache-dir", cache_dir] if cache_dir else []
         self.command = ["./scripts/codegen.py", "--output-dir", output_directory,
-                        "--generator", generator, idl_path]
+                        "--generator", generator] + self.cache_args + [idl_path]
 
     def formatKotlinFiles(self, paths):
         try:
@@ -309,7 +310,8 @@ class JinjaCodegenTarget():
 
     def codeFormat(self):
         outputs = subprocess.check_output(["./scripts/codegen.py", "--name-only", "--generator",
-                                           self.generator, "--log-level", "fatal", self.idl_path]).decode("utf8").split("\n")
+                                           self.generator, "--log-level", "fatal"] + self.cache_args +
+                                          [self.idl_path]).decode("utf8").split("\n")
         outputs = [os.path.join(self.output_directory, name) for name in outputs if name]
 
         # Split output files by extension,
@@ -367,6 +369,9 @@ def setupArgumentsParser():
     parser.add_argument('--run-bootstrap', default=None, action='store_true',
                         help='Automatically run ZAP bootstrap. By default the bootstrap is not triggered')
 
+    parser.add_argument('--codegen-cache-dir', default=None,
+                        help='Directory to cache scripts/codegen.py outputs in, to skip parsing and rendering unchanged inputs')
+
     parser.add_argument('--parallel', action='store_true')
     parser.add_argument('--no-parallel', action='store_false', dest='parallel')
     parser.add_argument('--no-rerun-in-env', action='store_false', dest='rerun_in_env')
@@ -417,28 +422,32 @@ def getGlobalTemplatesTargets():
     return targets
 
 
-def getCodegenTemplates():
+def getCodegenTemplates(cache_dir: Optional[str] = None):
     targets = []
 
     targets.append(JinjaCodegenTarget(
         generator="java-class",
         idl_path="src/controller/data_model/controller-clusters.matter",
-        output_directory="src/controller/java/generated"))
+        output_directory="src/controller/java/generated",
+        cache_dir=cache_dir))
 
     targets.append(JinjaCodegenTarget(
         generator="kotlin-class",
         idl_path="src/controller/data_model/controller-clusters.matter",
-        output_directory="src/controller/java/generated"))
+        output_directory="src/controller/java/generated",
+        cache_dir=cache_dir))
 
     targets.append(JinjaCodegenTarget(
         generator="summary-markdown",
         idl_path="src/controller/data_model/controller-clusters.matter",
-        output_directory="docs/ids_and_codes"))
+        output_directory="docs/ids_and_codes",
+        cache_dir=cache_dir))
 
     targets.append(JinjaCodegenTarget(
         generator="cpp-sdk",
         idl_path="src/controller/data_model/controller-clusters.matter",
-        output_directory="zzz_generated/app-common/clusters"))
+        output_directory="zzz_generated/app-common/clusters",
+        cache_dir=cache_dir))
 
     return targets
 
@@ -469,7 +478,7 @@ def getSpecificTemplatesTargets():
     return targets
 
 
-def getTargets(type):
+def getTargets(type, codegen_cache_dir: Optional[str] = None):
     targets = []
 
     if type & TargetType.GLOBAL:
@@ -479,7 +488,7 @@ def getTargets(type):
         targets.extend(getSpecificTemplatesTargets())
 
     if type & TargetType.IDL_CODEGEN:
-        targets.extend(getCodegenTemplates())
+        targets.extend(getCodegenTemplates(codegen_cache_dir))
 
     if type & TargetType.GOLDEN_TEST_IMAGES:
         targets.extend(getGoldenTestImageTargets())
@@ -544,7 +553,7 @@ def main():
     os.chdir(CHIP_ROOT_DIR)
     args = setupArgumentsParser()
 
-    targets = getTargets(args.type)
+    targets = getTargets(args.type, args.codegen_cache_dir)
 
     if args.dry_run:
         sys.exit(0)
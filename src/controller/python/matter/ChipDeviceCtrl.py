@@ -57,6 +57,11 @@ from .crypto import p256keypair
 from .interaction_model import SessionParameters, SessionParametersStruct
 from .native import PyChipError
 
+if typing.TYPE_CHECKING:
+    from .clusters.AttributeCacheStore import AttributeCacheStore
+    from .CommandBatcher import CommandBatcher
+    from .SessionPool import SessionPool
+
 __all__ = ["ChipDeviceController", "CommissioningParameters",
            "AttributeReadRequest", "AttributeReadRequestList", "SubscriptionTargetList"]
 
@@ -153,6 +158,18 @@ class ICDRegistrationParameters:
         return ICDRegistrationParameters.CStruct(self.symmetricKey, len(self.symmetricKey), self.checkInNodeId, self.monitoredSubject, self.stayActiveMs, self.clientType.value)
 
 
+@dataclass
+class NodeReadResult:
+    '''
+    The outcome of reading from, or subscribing to, one node of a ReadMany or SubscribeMany call. Exactly one of
+    response and error is set.
+    '''
+    nodeId: int
+    response: typing.Union[None, ClusterAttribute.AsyncReadTransaction.ReadResponse,
+                           ClusterAttribute.SubscriptionTransaction] = None
+    error: typing.Optional[Exception] = None
+
+
 @_DeviceAvailableCallbackFunct
 def _DeviceAvailableCallback(closure, device, err):
     closure.deviceAvailable(device, err)
@@ -489,6 +506,10 @@ class ChipDeviceControllerBase():
         self._open_window_context: CallbackContext = CallbackContext(asyncio.Lock())
         self._unpair_device_context: CallbackContext = CallbackContext(asyncio.Lock())
         self._pase_establishment_context: CallbackContext = CallbackContext(self._commissioning_lock)
+        self._sessionPool: typing.Optional[SessionPool] = None
+        self._commandBatcher: typing.Optional[CommandBatcher] = None
+        self._attributeCacheStore: typing.Optional[AttributeCacheStore] = None
+        self._attributeCacheStoreFabricId = 0
 
     def _set_dev_ctrl(self, devCtrl, pairingDelegate):
         def HandleCommissioningComplete(nodeId: int, err: PyChipError):
@@ -647,6 +668,10 @@ class ChipDeviceControllerBase():
         if not self._isActive:
             return
 
+        if self._sessionPool is not None:
+            self._sessionPool.Clear()
+            self._sessionPool = None
+
         if self.devCtrl is not None:
             self._ChipStack.Call(
                 lambda: self._dmLib.pychip_DeviceController_DeleteDeviceController(
@@ -1429,6 +1454,8 @@ class ChipDeviceControllerBase():
             allowPASE (bool): Get a device proxy of a device being commissioned.
             timeoutMs (Optional[int]): Timeout for a timed invoke request. Omit or set to 'None' to indicate a non-timed request.
 
+        When a session pool is set with SetSessionPool, operational device proxies are served from it.
+
         Returns:
             DeviceProxyWrapper on success.
         '''
@@ -1442,6 +1469,14 @@ class ChipDeviceControllerBase():
                 LOGGER.info('Using PASE connection')
                 return DeviceProxyWrapper(returnDevice, DeviceProxyWrapper.DeviceProxyType.COMMISSIONEE, self._dmLib)
 
+        if self._sessionPool is not None:
+            return await self._sessionPool.GetConnectedDevice(nodeid, timeoutMs=timeoutMs, payloadCapability=payloadCapability)
+        return await self._GetOperationalDevice(nodeid, timeoutMs, payloadCapability)
+
+    async def _GetOperationalDevice(self, nodeid, timeoutMs: typing.Optional[int], payloadCapability: int):
+        '''
+        Gets an OperationalDeviceProxy for the specified Node, establishing a CASE session if there is none yet.
+        '''
         eventLoop = asyncio.get_running_loop()
         future = eventLoop.create_future()
 
@@ -1482,6 +1517,44 @@ class ChipDeviceControllerBase():
 
         return DeviceProxyWrapper(future.result(), DeviceProxyWrapper.DeviceProxyType.OPERATIONAL, self._dmLib)
 
+    def SetSessionPool(self, sessionPool: typing.Optional[SessionPool]):
+        '''
+        Sets the session pool that operational device proxies are served from, for all the reads, writes and commands of
+        this controller. See SessionPool.SessionPool.
+
+        Args:
+            sessionPool: The pool, created for this controller, or None to stop using a pool.
+        '''
+        if sessionPool is not None and sessionPool.deviceController is not self:
+            raise ValueError("The session pool was created for another controller")
+        self._sessionPool = sessionPool
+
+    def SetCommandBatcher(self, commandBatcher: typing.Optional[CommandBatcher]):
+        '''
+        Sets the command batcher that coalesces the commands sent to the same node at the same time with SendCommand.
+        See CommandBatcher.CommandBatcher.
+
+        Args:
+            commandBatcher: The batcher, created for this controller, or None to send every command on its own.
+        '''
+        if commandBatcher is not None and commandBatcher.deviceController is not self:
+            raise ValueError("The command batcher was created for another controller")
+        self._commandBatcher = commandBatcher
+
+    def SetAttributeCacheStore(self, attributeCacheStore: typing.Optional[AttributeCacheStore]):
+        '''
+        Sets the store that the attribute data read from nodes is persisted in. Fabric-filtered reads of whole clusters (e.g.
+        wildcard reads) then only ask for the clusters whose data version changed since the data was stored, and return the
+        stored data of the others. See clusters.AttributeCacheStore.AttributeCacheStore.
+
+        Args:
+            attributeCacheStore: The store, or None to stop using one.
+        '''
+        if attributeCacheStore is not None:
+            # Node IDs are only unique within a fabric.
+            self._attributeCacheStoreFabricId = self.GetCompressedFabricId()
+        self._attributeCacheStore = attributeCacheStore
+
     def ComputeRoundTripTimeout(self, nodeid, upperLayerProcessingTimeoutMs: int = 0):
         '''
         Returns a computed timeout value based on the round-trip time it takes for the peer at the other end of the session to
@@ -1596,6 +1669,9 @@ class ChipDeviceControllerBase():
         interactionTimeoutMs: Overall timeout for the interaction. Omit or set to 'None' to have the SDK automatically compute the
                               right timeout value based on transport characteristics as well as the responsiveness of the target.
 
+        When a command batcher is set with SetCommandBatcher, the command is sent in a batch with the other commands sent to the
+        node at the same time, unless busyWaitMs or suppressResponse are given.
+
         Returns:
             command response. The type of the response is defined by the command.
 
@@ -1605,6 +1681,12 @@ class ChipDeviceControllerBase():
         LOGGER.debug("Sending command %s to node ID 0x%016X", payload, nodeid)
         self.CheckIsActive()
 
+        if (self._commandBatcher is not None and busyWaitMs is None and not suppressResponse and
+                not (payload.must_use_timed_invoke and not timedRequestTimeoutMs)):
+            return await self._commandBatcher.SendCommand(
+                nodeid, endpoint, payload, responseType, timedRequestTimeoutMs=timedRequestTimeoutMs,
+                interactionTimeoutMs=interactionTimeoutMs, payloadCapability=payloadCapability)
+
         eventLoop = asyncio.get_running_loop()
         future = eventLoop.create_future()
 
@@ -1624,7 +1706,8 @@ class ChipDeviceControllerBase():
                                 timedRequestTimeoutMs: typing.Optional[int] = None,
                                 interactionTimeoutMs: typing.Optional[int] = None, busyWaitMs: typing.Optional[int] = None,
                                 suppressResponse: typing.Optional[bool] = None,
-                                payloadCapability: int = TransportPayloadCapability.MRP_PAYLOAD):
+                                payloadCapability: int = TransportPayloadCapability.MRP_PAYLOAD,
+                                returnDecodeErrors: bool = False):
         '''
         Send a batch of cluster-object encapsulated commands to a node and get returned a future that can be awaited upon to receive
         the responses. If a valid responseType is passed in, that will be used to de-serialize the object. If not,
@@ -1637,6 +1720,8 @@ class ChipDeviceControllerBase():
                               right timeout value based on transport characteristics as well as the responsiveness of the target.
         busyWaitMs: How long to wait in ms after sending command to device before performing any other operations.
         suppressResponse: Do not send a response to this action
+        returnDecodeErrors: Return the exception raised by the decoding of a response in its place, instead of raising it for the
+                            whole batch.
 
         Returns:
             - List of command responses in the same order as what was given in `commands`. The type of the response is defined by the command.
@@ -1657,7 +1742,8 @@ class ChipDeviceControllerBase():
         res = await ClusterCommand.SendBatchCommands(
             future, eventLoop, device.deviceProxy, commands,
             timedRequestTimeoutMs=timedRequestTimeoutMs,
-            interactionTimeoutMs=interactionTimeoutMs, busyWaitMs=busyWaitMs, suppressResponse=suppressResponse)
+            interactionTimeoutMs=interactionTimeoutMs, busyWaitMs=busyWaitMs, suppressResponse=suppressResponse,
+            returnDecodeErrors=returnDecodeErrors)
         res.raise_on_error()
         return await future
 
@@ -1998,7 +2084,7 @@ class ChipDeviceControllerBase():
         eventNumberFilter: typing.Optional[int] = None,
         returnClusterObject: bool = False, reportInterval: typing.Optional[typing.Tuple[int, int]] = None,
         fabricFiltered: bool = True, keepSubscriptions: bool = False, autoResubscribe: bool = True,
-        payloadCapability: int = TransportPayloadCapability.MRP_PAYLOAD
+        payloadCapability: int = TransportPayloadCapability.MRP_PAYLOAD, batchAttributeReports: bool = False
     ):
         '''
         Read a list of attributes and/or events from a target node
@@ -2021,7 +2107,9 @@ class ChipDeviceControllerBase():
 
             An AttributePath can also be specified directly by [matter.cluster.Attribute.AttributePath(...)]
 
-        dataVersionFilters: A list of tuples of (endpoint, cluster, data version).
+        dataVersionFilters: A list of tuples of (endpoint, cluster, data version). When omitted for a fabric-filtered read of whole
+            clusters and an attribute cache store is set (see SetAttributeCacheStore), the data versions of the stored clusters
+            are used.
 
         events: A list of tuples of varying types depending on the type of read being requested:
             (endpoint, Clusters.ClusterA.EventA, urgent):       Endpoint = specific,
@@ -2048,6 +2136,9 @@ class ChipDeviceControllerBase():
         autoResubscribe: Automatically resubscribe to the subscription if subscription is lost. The automatic re-subscription only
             applies if the subscription establishes on first try. If the first subscription establishment attempt fails the function
             returns right away.
+        batchAttributeReports: Hand the attribute data of every report over from the CHIP thread in a single batch at the end of
+            the report, and decode it on the event loop thread. This reduces the overhead of large reports and busy subscriptions.
+            The attribute update and report callbacks of subscriptions are then called from the event loop thread.
 
         Returns:
             - AsyncReadTransaction.ReadResponse. Please see ReadAttribute and ReadEvent for examples of how to access data.
@@ -2063,20 +2154,51 @@ class ChipDeviceControllerBase():
         # These mismatches are intentional and safe within the current logic.
         # TODO:  Explore proper typing for dynamic attributes in ChipDeviceCtrl.py #618
 
-        eventLoop = asyncio.get_running_loop()
-        future = eventLoop.create_future()
+        attributePaths, clusterDataVersionFilters, eventPaths = self._parseReadPaths(attributes, dataVersionFilters, events)
+        return await self._Read(nodeid, attributePaths, clusterDataVersionFilters, eventPaths,
+                                eventNumberFilter=eventNumberFilter, returnClusterObject=returnClusterObject,
+                                reportInterval=reportInterval, fabricFiltered=fabricFiltered,
+                                keepSubscriptions=keepSubscriptions, autoResubscribe=autoResubscribe,
+                                payloadCapability=payloadCapability, batchAttributeReports=batchAttributeReports)
 
-        device = await self.GetConnectedDevice(nodeid, payloadCapability=payloadCapability)
+    def _parseReadPaths(self, attributes, dataVersionFilters, events):
         attributePaths = [self._parseAttributePathTuple(
             v) for v in attributes] if attributes else None
         clusterDataVersionFilters = [self._parseDataVersionFilterTuple(
             v) for v in dataVersionFilters] if dataVersionFilters else None  # type: ignore[arg-type]
         eventPaths = [self._parseEventPathTuple(
             v) for v in events] if events else None
+        return attributePaths, clusterDataVersionFilters, eventPaths
+
+    async def _Read(self, nodeid: int,
+                    attributePaths: typing.Optional[typing.List[ClusterAttribute.AttributePath]],
+                    clusterDataVersionFilters: typing.Optional[typing.List[ClusterAttribute.DataVersionFilter]],
+                    eventPaths: typing.Optional[typing.List[ClusterAttribute.EventPath]],
+                    eventNumberFilter: typing.Optional[int] = None,
+                    returnClusterObject: bool = False, reportInterval: typing.Optional[typing.Tuple[int, int]] = None,
+                    fabricFiltered: bool = True, keepSubscriptions: bool = False, autoResubscribe: bool = True,
+                    payloadCapability: int = TransportPayloadCapability.MRP_PAYLOAD, batchAttributeReports: bool = False):
+        '''
+        Read or subscribe with paths that were already parsed by _parseReadPaths. See Read.
+        '''
+        eventLoop = asyncio.get_running_loop()
+        future = eventLoop.create_future()
+
+        # Reads that are not fabric-filtered see the fabric-scoped data of other fabrics, which is not stored.
+        attributeCacheStore = self._attributeCacheStore
+        if (attributeCacheStore is None or reportInterval is not None or clusterDataVersionFilters is not None or
+                not fabricFiltered or not attributeCacheStore.CanServe(attributePaths)):
+            attributeCacheStore = None
+        else:
+            clusterDataVersionFilters = attributeCacheStore.GetDataVersionFilters(
+                self._attributeCacheStoreFabricId, nodeid, attributePaths) or None  # type: ignore[arg-type]
+
+        device = await self.GetConnectedDevice(nodeid, payloadCapability=payloadCapability)
 
         allowLargePayload = payloadCapability in (TransportPayloadCapability.LARGE_PAYLOAD,
                                                   TransportPayloadCapability.MRP_OR_TCP_PAYLOAD)
-        transaction = ClusterAttribute.AsyncReadTransaction(future, eventLoop, self, returnClusterObject)
+        transaction = ClusterAttribute.AsyncReadTransaction(
+            future, eventLoop, self, returnClusterObject, batchAttributeReports=batchAttributeReports)
         ClusterAttribute.Read(transaction, device=device.deviceProxy,
                               attributes=attributePaths, dataVersionFilters=clusterDataVersionFilters, events=eventPaths,
                               eventNumberFilter=eventNumberFilter,
@@ -2084,10 +2206,17 @@ class ChipDeviceControllerBase():
                                   reportInterval[0], reportInterval[1]) if reportInterval else None,
                               fabricFiltered=fabricFiltered,
                               keepSubscriptions=keepSubscriptions, autoResubscribe=autoResubscribe, allowLargePayload=allowLargePayload).raise_on_error()
-        await future
+        try:
+            await future
+        except asyncio.CancelledError:
+            transaction.Cancel()
+            raise
 
         if result := transaction.GetSubscriptionHandler():
             return result
+        if attributeCacheStore is not None:
+            attributeCacheStore.MergeRead(self._attributeCacheStoreFabricId, nodeid,
+                                          attributePaths, transaction.GetAttributeCache())  # type: ignore[arg-type]
         return transaction.GetReadResponse()
 
     async def ReadAttribute(
@@ -2110,7 +2239,7 @@ class ChipDeviceControllerBase():
         returnClusterObject: bool = False,
         reportInterval: typing.Optional[typing.Tuple[int, int]] = None,
         fabricFiltered: bool = True, keepSubscriptions: bool = False, autoResubscribe: bool = True,
-        payloadCapability: int = TransportPayloadCapability.MRP_PAYLOAD
+        payloadCapability: int = TransportPayloadCapability.MRP_PAYLOAD, batchAttributeReports: bool = False
     ):
         '''
         Read a list of attributes from a target node, this is a wrapper of DeviceController.Read()
@@ -2145,6 +2274,9 @@ class ChipDeviceControllerBase():
         autoResubscribe: Automatically resubscribe to the subscription if subscription is lost. The automatic re-subscription only
             applies if the subscription establishes on first try. If the first subscription establishment attempt fails the function
             returns right away.
+        batchAttributeReports: Hand the attribute data of every report over from the CHIP thread in a single batch at the end of
+            the report, and decode it on the event loop thread. This reduces the overhead of large reports and busy subscriptions.
+            The attribute update and report callbacks of subscriptions are then called from the event loop thread.
 
         Returns:
             - subscription request: ClusterAttribute.SubscriptionTransaction
@@ -2174,7 +2306,8 @@ class ChipDeviceControllerBase():
                               fabricFiltered=fabricFiltered,
                               keepSubscriptions=keepSubscriptions,
                               autoResubscribe=autoResubscribe,
-                              payloadCapability=payloadCapability)
+                              payloadCapability=payloadCapability,
+                              batchAttributeReports=batchAttributeReports)
         if isinstance(res, ClusterAttribute.SubscriptionTransaction):
             return res
         else:
@@ -2254,6 +2387,176 @@ class ChipDeviceControllerBase():
         else:
             return res.events
 
+    def ReadMany(
+        self,
+        nodeids: typing.Iterable[int],
+        attributes: typing.Optional[typing.List[typing.Union[
+            None,  # Empty tuple, all wildcard
+            typing.Tuple[int],  # Endpoint
+            # Wildcard endpoint, Cluster id present
+            typing.Tuple[typing.Type[ClusterObjects.Cluster]],
+            # Wildcard endpoint, Cluster + Attribute present
+            typing.Tuple[typing.Type[ClusterObjects.ClusterAttributeDescriptor]],
+            # Wildcard attribute id
+            typing.Tuple[int, typing.Type[ClusterObjects.Cluster]],
+            # Concrete path
+            typing.Tuple[int, typing.Type[ClusterObjects.ClusterAttributeDescriptor]],
+            # Directly specified attribute path
+            ClusterAttribute.AttributePath
+        ]]] = None,
+        dataVersionFilters: typing.Optional[typing.List[typing.Tuple[int, typing.Type[ClusterObjects.Cluster], int]]] = None,
+        events: typing.Optional[typing.List[typing.Union[
+            None,  # Empty tuple, all wildcard
+            typing.Tuple[str, int],  # all wildcard with urgency set
+            typing.Tuple[int, int],  # Endpoint,
+            # Wildcard endpoint, Cluster id present
+            typing.Tuple[typing.Type[ClusterObjects.Cluster], int],
+            # Wildcard endpoint, Cluster + Event present
+            typing.Tuple[typing.Type[ClusterObjects.ClusterEvent], int],
+            # Wildcard event id
+            typing.Tuple[int, typing.Type[ClusterObjects.Cluster], int],
+            # Concrete path
+            typing.Tuple[int, typing.Type[ClusterObjects.ClusterEvent], int]
+        ]]] = None,
+        eventNumberFilter: typing.Optional[int] = None,
+        returnClusterObject: bool = False,
+        fabricFiltered: bool = True,
+        concurrency: int = 16,
+        timeoutSeconds: typing.Optional[float] = None,
+        payloadCapability: int = TransportPayloadCapability.MRP_PAYLOAD, batchAttributeReports: bool = False
+    ) -> typing.AsyncIterator[NodeReadResult]:
+        '''
+        Read the same list of attributes and/or events from many nodes, with a bounded number of nodes being read at a time.
+
+        The paths are parsed once for all nodes, in the formats accepted by Read, and invalid paths raise right away.
+        The results are streamed as the nodes answer, which is not necessarily in the order of nodeids:
+
+            async for result in devCtrl.ReadMany(nodeids, attributes=[(0, Clusters.BasicInformation)]):
+                if result.error is None:
+                    handle(result.nodeId, result.response.attributes)
+
+        nodeids: Node IDs of the targets. This may be a lazy iterable, which is only consumed as nodes get read.
+        concurrency: Maximum number of nodes being connected to or read from at the same time. This also bounds the number
+            of CASE sessions being established concurrently.
+        timeoutSeconds: Timeout for each node, covering both getting the session and the read. None for no timeout.
+
+        See Read for the other arguments.
+
+        Returns:
+            - An async iterator of NodeReadResult, one per node. The response is an AsyncReadTransaction.ReadResponse.
+              Failures of single nodes, including timeouts, are reported as the error of their NodeReadResult and do not
+              stop the reads of the other nodes.
+        '''
+        self.CheckIsActive()
+        return self._ReadMany(nodeids, concurrency, timeoutSeconds,
+                              *self._parseReadPaths(attributes, dataVersionFilters, events),
+                              eventNumberFilter=eventNumberFilter, returnClusterObject=returnClusterObject,
+                              fabricFiltered=fabricFiltered, payloadCapability=payloadCapability,
+                              batchAttributeReports=batchAttributeReports)
+
+    def SubscribeMany(
+        self,
+        nodeids: typing.Iterable[int],
+        reportInterval: typing.Tuple[int, int],
+        attributes: typing.Optional[typing.List[typing.Union[
+            None,  # Empty tuple, all wildcard
+            typing.Tuple[int],  # Endpoint
+            # Wildcard endpoint, Cluster id present
+            typing.Tuple[typing.Type[ClusterObjects.Cluster]],
+            # Wildcard endpoint, Cluster + Attribute present
+            typing.Tuple[typing.Type[ClusterObjects.ClusterAttributeDescriptor]],
+            # Wildcard attribute id
+            typing.Tuple[int, typing.Type[ClusterObjects.Cluster]],
+            # Concrete path
+            typing.Tuple[int, typing.Type[ClusterObjects.ClusterAttributeDescriptor]],
+            # Directly specified attribute path
+            ClusterAttribute.AttributePath
+        ]]] = None,
+        dataVersionFilters: typing.Optional[typing.List[typing.Tuple[int, typing.Type[ClusterObjects.Cluster], int]]] = None,
+        events: typing.Optional[typing.List[typing.Union[
+            None,  # Empty tuple, all wildcard
+            typing.Tuple[str, int],  # all wildcard with urgency set
+            typing.Tuple[int, int],  # Endpoint,
+            # Wildcard endpoint, Cluster id present
+            typing.Tuple[typing.Type[ClusterObjects.Cluster], int],
+            # Wildcard endpoint, Cluster + Event present
+            typing.Tuple[typing.Type[ClusterObjects.ClusterEvent], int],
+            # Wildcard event id
+            typing.Tuple[int, typing.Type[ClusterObjects.Cluster], int],
+            # Concrete path
+            typing.Tuple[int, typing.Type[ClusterObjects.ClusterEvent], int]
+        ]]] = None,
+        eventNumberFilter: typing.Optional[int] = None,
+        returnClusterObject: bool = False,
+        fabricFiltered: bool = True, keepSubscriptions: bool = False, autoResubscribe: bool = True,
+        concurrency: int = 16,
+        timeoutSeconds: typing.Optional[float] = None,
+        payloadCapability: int = TransportPayloadCapability.MRP_PAYLOAD, batchAttributeReports: bool = False
+    ) -> typing.AsyncIterator[NodeReadResult]:
+        '''
+        Subscribe to the same list of attributes and/or events on many nodes, with a bounded number of subscriptions being
+        established at a time. This works like ReadMany, with the response of every NodeReadResult being the
+        ClusterAttribute.SubscriptionTransaction of the node.
+
+        timeoutSeconds: Timeout for each node, covering both getting the session and establishing the subscription. A
+            subscription that times out, or that is still being established when the iteration stops, is shut down once
+            it gets established. Subscriptions which were established but not taken from the iterator yet when the
+            iteration stops are shut down as well.
+
+        See Read for the other arguments.
+        '''
+        self.CheckIsActive()
+        return self._ReadMany(nodeids, concurrency, timeoutSeconds,
+                              *self._parseReadPaths(attributes, dataVersionFilters, events),
+                              eventNumberFilter=eventNumberFilter, returnClusterObject=returnClusterObject,
+                              reportInterval=reportInterval, fabricFiltered=fabricFiltered,
+                              keepSubscriptions=keepSubscriptions, autoResubscribe=autoResubscribe,
+                              payloadCapability=payloadCapability, batchAttributeReports=batchAttributeReports)
+
+    async def _ReadMany(self, nodeids: typing.Iterable[int], concurrency: int, timeoutSeconds: typing.Optional[float],
+                        *parsedPaths, **readArgs) -> typing.AsyncIterator[NodeReadResult]:
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        # The workers share the iterator, so that nodes are only taken from it once a worker is free.
+        pendingNodeIds = iter(nodeids)
+        results: asyncio.Queue[typing.Optional[NodeReadResult]] = asyncio.Queue()
+
+        async def readNodes():
+            try:
+                for nodeid in pendingNodeIds:
+                    try:
+                        response = await asyncio.wait_for(self._Read(nodeid, *parsedPaths, **readArgs), timeoutSeconds)
+                        results.put_nowait(NodeReadResult(nodeid, response=response))
+                    except Exception as ex:
+                        results.put_nowait(NodeReadResult(nodeid, error=ex))
+            finally:
+                # Tells the consumer that this worker is done.
+                results.put_nowait(None)
+
+        workers = [asyncio.create_task(readNodes()) for _ in range(concurrency)]
+        try:
+            runningWorkers = len(workers)
+            while runningWorkers:
+                result = await results.get()
+                if result is None:
+                    runningWorkers -= 1
+                else:
+                    yield result
+        finally:
+            # The consumer may stop iterating early, in which case the reads still in flight are cancelled.
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            # Results the consumer did not take anymore, the subscriptions among them would otherwise be left running.
+            while True:
+                try:
+                    result = results.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if result is not None and isinstance(result.response, ClusterAttribute.SubscriptionTransaction):
+                    result.response.Shutdown()
+
     def SetIpk(self, ipk: bytes):
         '''
         Sets the Identity Protection Key (IPK) for the device controller.
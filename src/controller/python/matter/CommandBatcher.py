@@ -0,0 +1,197 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+# Needed to use types in type hints before they are fully defined.
+from __future__ import annotations
+
+import asyncio
+import logging
+import typing
+
+from . import clusters as Clusters
+from .ChipDeviceCtrl import ChipDeviceControllerBase, TransportPayloadCapability
+from .clusters import Attribute as ClusterAttribute
+from .clusters import ClusterObjects as ClusterObjects
+from .clusters import Command as ClusterCommand
+from .interaction_model import InteractionModelError
+from .interaction_model import Status as InteractionModelStatus
+
+LOGGER = logging.getLogger(__name__)
+
+# Commands to the same node can only be sent in the same InvokeRequests message when sharing these.
+_BatchKey = typing.Tuple[int, typing.Optional[int], typing.Optional[int], int]
+
+
+class CommandBatcher:
+    ''' Coalesces the commands sent to the same node within a short window into InvokeRequests messages carrying
+        several commands, and routes every response back to the caller of the command.
+
+        Batches hold at most MaxPathsPerInvoke commands, as read from the BasicInformation cluster of the node, and
+        never the same command path twice. Commands sent to a node while a batch is waiting to be sent join that
+        batch, and a batch is sent right away once full.
+
+        The batcher serves the SendCommand calls of the controller once set with
+        ChipDeviceControllerBase.SetCommandBatcher:
+
+            devCtrl.SetCommandBatcher(CommandBatcher(devCtrl, windowMs=5))
+            await asyncio.gather(*[devCtrl.SendCommand(nodeid, endpoint, Clusters.OnOff.Commands.On())
+                                   for endpoint in endpoints])
+    '''
+
+    def __init__(self, devCtrl: ChipDeviceControllerBase, windowMs: float = 5,
+                 maxPathsPerInvoke: typing.Optional[int] = None):
+        ''' Initializes the batcher.
+
+            devCtrl: The controller the batches are sent with.
+            windowMs: How long the first command of a batch waits for other commands to join it.
+            maxPathsPerInvoke: Maximum number of commands per batch for all nodes, instead of reading it from every node.
+        '''
+        if windowMs < 0:
+            raise ValueError("windowMs must not be negative")
+        if maxPathsPerInvoke is not None and maxPathsPerInvoke < 1:
+            raise ValueError("maxPathsPerInvoke must be at least 1")
+
+        self._devCtrl = devCtrl
+        self._window = windowMs / 1000
+        self._maxPathsPerInvokeOverride = maxPathsPerInvoke
+        self._maxPathsPerInvoke: typing.Dict[int, int] = {}
+        self._maxPathsPerInvokeReads: typing.Dict[int, asyncio.Task] = {}
+        self._pending: typing.Dict[_BatchKey, typing.List[typing.Tuple[ClusterCommand.InvokeRequestInfo, asyncio.Future]]] = {}
+        self._flushTimers: typing.Dict[_BatchKey, asyncio.TimerHandle] = {}
+        self._sendTasks: typing.Set[asyncio.Task] = set()
+
+    @property
+    def deviceController(self) -> ChipDeviceControllerBase:
+        return self._devCtrl
+
+    async def SendCommand(self, nodeid: int, endpoint: int, payload: ClusterObjects.ClusterCommand, responseType=None,
+                          timedRequestTimeoutMs: typing.Optional[int] = None,
+                          interactionTimeoutMs: typing.Optional[int] = None,
+                          payloadCapability: int = TransportPayloadCapability.MRP_PAYLOAD):
+        '''
+        Queues a command for the next batch to the node, and waits for its response. See
+        ChipDeviceControllerBase.SendCommand.
+
+        Returns:
+            command response. The type of the response is defined by the command.
+
+        Raises:
+            InteractionModelError on error
+        '''
+        key = (nodeid, timedRequestTimeoutMs, interactionTimeoutMs, payloadCapability)
+        future = asyncio.get_running_loop().create_future()
+        pending = self._pending.setdefault(key, [])
+        pending.append((ClusterCommand.InvokeRequestInfo(endpoint, payload, responseType), future))
+
+        maxPathsPerInvoke = self._GetKnownMaxPathsPerInvoke(nodeid)
+        if maxPathsPerInvoke is not None and len(pending) >= maxPathsPerInvoke:
+            self._Flush(key)
+        elif len(pending) == 1:
+            self._flushTimers[key] = asyncio.get_running_loop().call_later(self._window, self._Flush, key)
+        return await future
+
+    def _GetKnownMaxPathsPerInvoke(self, nodeid: int) -> typing.Optional[int]:
+        if self._maxPathsPerInvokeOverride is not None:
+            return self._maxPathsPerInvokeOverride
+        return self._maxPathsPerInvoke.get(nodeid)
+
+    async def _GetMaxPathsPerInvoke(self, nodeid: int, payloadCapability: int) -> int:
+        maxPathsPerInvoke = self._GetKnownMaxPathsPerInvoke(nodeid)
+        if maxPathsPerInvoke is not None:
+            return maxPathsPerInvoke
+
+        read = self._maxPathsPerInvokeReads.get(nodeid)
+        if read is None:
+            read = asyncio.create_task(self._ReadMaxPathsPerInvoke(nodeid, payloadCapability))
+            self._maxPathsPerInvokeReads[nodeid] = read
+        return await asyncio.shield(read)
+
+    async def _ReadMaxPathsPerInvoke(self, nodeid: int, payloadCapability: int) -> int:
+        attribute = Clusters.BasicInformation.Attributes.MaxPathsPerInvoke
+        try:
+            result = await self._devCtrl.ReadAttribute(nodeid, [(0, attribute)], payloadCapability=payloadCapability)
+            maxPathsPerInvoke = result[0][Clusters.BasicInformation][attribute]
+            if isinstance(maxPathsPerInvoke, ClusterAttribute.ValueDecodeFailure):
+                raise maxPathsPerInvoke.Reason
+        except InteractionModelError as ex:
+            if ex.status != InteractionModelStatus.UnsupportedAttribute:
+                return self._MaxPathsPerInvokeReadFailed(nodeid, ex)
+            # Nodes from before MaxPathsPerInvoke existed only accept a single command per InvokeRequests message.
+            maxPathsPerInvoke = 1
+        except Exception as ex:
+            return self._MaxPathsPerInvokeReadFailed(nodeid, ex)
+        finally:
+            del self._maxPathsPerInvokeReads[nodeid]
+
+        self._maxPathsPerInvoke[nodeid] = max(maxPathsPerInvoke, 1)
+        return self._maxPathsPerInvoke[nodeid]
+
+    def _MaxPathsPerInvokeReadFailed(self, nodeid: int, ex: Exception) -> int:
+        # Not remembered, so the read is retried with the next batch, the commands of this one are sent one by one.
+        LOGGER.info("Failed to read MaxPathsPerInvoke of node ID 0x%016X, not batching its commands for now: %s", nodeid, ex)
+        return 1
+
+    def _Flush(self, key: _BatchKey):
+        timer = self._flushTimers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        requests = self._pending.pop(key, None)
+        if not requests:
+            return
+        # Keeps a reference to the task, the event loop only keeps weak ones.
+        task = asyncio.get_running_loop().create_task(self._Send(key, requests))
+        self._sendTasks.add(task)
+        task.add_done_callback(self._sendTasks.discard)
+
+    async def _Send(self, key: _BatchKey, requests: typing.List[typing.Tuple[ClusterCommand.InvokeRequestInfo, asyncio.Future]]):
+        nodeid, _, _, payloadCapability = key
+        maxPathsPerInvoke = await self._GetMaxPathsPerInvoke(nodeid, payloadCapability)
+
+        batches: typing.List[typing.List[typing.Tuple[ClusterCommand.InvokeRequestInfo, asyncio.Future]]] = []
+        batchPaths: typing.Set[typing.Tuple[int, int, int]] = set()
+        for request in requests:
+            info = request[0]
+            path = (info.EndpointId, info.Command.cluster_id, info.Command.command_id)
+            if not batches or len(batches[-1]) >= maxPathsPerInvoke or path in batchPaths:
+                batches.append([])
+                batchPaths = set()
+            batches[-1].append(request)
+            batchPaths.add(path)
+
+        await asyncio.gather(*[self._SendBatch(key, batch) for batch in batches])
+
+    async def _SendBatch(self, key: _BatchKey, batch: typing.List[typing.Tuple[ClusterCommand.InvokeRequestInfo, asyncio.Future]]):
+        nodeid, timedRequestTimeoutMs, interactionTimeoutMs, payloadCapability = key
+        try:
+            responses = await self._devCtrl.SendBatchCommands(
+                nodeid, [info for info, _ in batch], timedRequestTimeoutMs=timedRequestTimeoutMs,
+                interactionTimeoutMs=interactionTimeoutMs, payloadCapability=payloadCapability, returnDecodeErrors=True)
+        except Exception as ex:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(ex)
+            return
+
+        for (_, future), response in zip(batch, responses):
+            if future.done():
+                # The caller stopped waiting.
+                continue
+            # Errors of the command, or of the decoding of its response.
+            if isinstance(response, Exception):
+                future.set_exception(response)
+            else:
+                future.set_result(response)
@@ -0,0 +1,209 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+# Needed to use types in type hints before they are fully defined.
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import typing
+from dataclasses import dataclass
+
+from .ChipDeviceCtrl import ChipDeviceControllerBase, DeviceProxyWrapper, TransportPayloadCapability
+from .exceptions import ChipStackError
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class SessionPoolMetrics:
+    ''' Counters of a SessionPool, updated as device proxies are requested from it. '''
+    # Requests served by a pooled session that was still active.
+    hits: int = 0
+    # Requests that had to wait for a session to be established, including by another request.
+    misses: int = 0
+    # Pooled sessions that were found inactive, and dropped.
+    staleSessions: int = 0
+    establishments: int = 0
+    failedEstablishments: int = 0
+    totalEstablishmentSeconds: float = 0.0
+    maxEstablishmentSeconds: float = 0.0
+
+    @property
+    def averageEstablishmentSeconds(self) -> float:
+        attempts = self.establishments + self.failedEstablishments
+        return self.totalEstablishmentSeconds / attempts if attempts else 0.0
+
+
+class SessionPool:
+    ''' Keeps the operational device proxies of a controller, so that the reads, writes and commands to a node reuse
+        its CASE session, and bounds how many CASE sessions are established at a time, and how fast.
+
+        Pooled sessions are checked with DeviceProxyWrapper.isActiveSession before being handed out, and inactive
+        ones are established again. Requests for a node whose session is being established wait for that
+        establishment instead of starting another one.
+
+        The pool serves the requests of the controller once set with ChipDeviceControllerBase.SetSessionPool:
+
+            pool = SessionPool(devCtrl, maxConcurrentEstablishments=16, establishmentsPerSecond=50)
+            devCtrl.SetSessionPool(pool)
+            failures = await pool.Prewarm(nodeIds)
+    '''
+
+    def __init__(self, devCtrl: ChipDeviceControllerBase, maxConcurrentEstablishments: int = 8,
+                 establishmentsPerSecond: typing.Optional[float] = None,
+                 establishmentTimeoutMs: typing.Optional[int] = None):
+        ''' Initializes the pool.
+
+            devCtrl: The controller the sessions are established by.
+            maxConcurrentEstablishments: Maximum number of CASE sessions being established at the same time.
+            establishmentsPerSecond: Maximum rate at which CASE session establishments are started, or None for no limit.
+            establishmentTimeoutMs: Timeout of every establishment, when the request does not provide one.
+        '''
+        if maxConcurrentEstablishments < 1:
+            raise ValueError("maxConcurrentEstablishments must be at least 1")
+        if establishmentsPerSecond is not None and establishmentsPerSecond <= 0:
+            raise ValueError("establishmentsPerSecond must be positive")
+
+        self._devCtrl = devCtrl
+        self._establishmentSemaphore = asyncio.Semaphore(maxConcurrentEstablishments)
+        self._establishmentInterval = 1 / establishmentsPerSecond if establishmentsPerSecond else 0.0
+        self._nextEstablishmentTime = 0.0
+        self._establishmentTimeoutMs = establishmentTimeoutMs
+        self._devices: typing.Dict[typing.Tuple[int, int], DeviceProxyWrapper] = {}
+        self._establishments: typing.Dict[typing.Tuple[int, int], asyncio.Task] = {}
+        self._metrics = SessionPoolMetrics()
+
+    @property
+    def deviceController(self) -> ChipDeviceControllerBase:
+        return self._devCtrl
+
+    @property
+    def metrics(self) -> SessionPoolMetrics:
+        ''' The counters of the pool, which keep being updated. '''
+        return self._metrics
+
+    def ResetMetrics(self):
+        self._metrics = SessionPoolMetrics()
+
+    def __len__(self) -> int:
+        return len(self._devices)
+
+    async def GetConnectedDevice(self, nodeid: int, timeoutMs: typing.Optional[int] = None,
+                                 payloadCapability: int = TransportPayloadCapability.MRP_PAYLOAD) -> DeviceProxyWrapper:
+        '''
+        Gets an OperationalDeviceProxy for the specified Node, from the pool if its session is still active.
+
+        Args:
+            nodeId (int): Target's Node ID.
+            timeoutMs (Optional[int]): Timeout for establishing the session, if needed. Defaults to the timeout of the pool.
+
+        Returns:
+            DeviceProxyWrapper on success.
+        '''
+        key = (nodeid, payloadCapability)
+        device = self._devices.get(key)
+        if device is not None:
+            if self._IsActive(device):
+                self._metrics.hits += 1
+                return device
+            self._metrics.staleSessions += 1
+            del self._devices[key]
+
+        self._metrics.misses += 1
+        establishment = self._establishments.get(key)
+        if establishment is None:
+            establishment = asyncio.create_task(self._Establish(
+                key, timeoutMs if timeoutMs is not None else self._establishmentTimeoutMs))
+            self._establishments[key] = establishment
+        # Shielded, so that a request giving up does not cancel the establishment for the other requests.
+        return await asyncio.shield(establishment)
+
+    async def Prewarm(self, nodeids: typing.Iterable[int],
+                      payloadCapability: int = TransportPayloadCapability.MRP_PAYLOAD) -> typing.Dict[int, BaseException]:
+        '''
+        Establishes sessions to all the given nodes that have no active session in the pool, within the concurrency and
+        rate limits of the pool.
+
+        Returns:
+            The error of every node whose session could not be established.
+        '''
+        nodeids = list(nodeids)
+        results = await asyncio.gather(*[self.GetConnectedDevice(nodeid, payloadCapability=payloadCapability)
+                                         for nodeid in nodeids], return_exceptions=True)
+        failures = {}
+        for nodeid, result in zip(nodeids, results):
+            # This includes the establishments cancelled by Clear.
+            if isinstance(result, BaseException):
+                failures[nodeid] = result
+        return failures
+
+    def Evict(self, nodeid: int):
+        ''' Drops the pooled sessions of a node, for instance after it was removed from the fabric. '''
+        for key in [key for key in self._devices if key[0] == nodeid]:
+            del self._devices[key]
+
+    def Clear(self):
+        ''' Drops all pooled sessions, and cancels the establishments in progress. '''
+        self._devices.clear()
+        for establishment in self._establishments.values():
+            establishment.cancel()
+        self._establishments.clear()
+
+    def _IsActive(self, device: DeviceProxyWrapper) -> bool:
+        try:
+            return device.isActiveSession
+        except ChipStackError as ex:
+            LOGGER.debug("Failed to check the pooled session: %s", ex)
+            return False
+
+    async def _WaitForEstablishmentSlot(self):
+        if not self._establishmentInterval:
+            return
+        # Slots are reserved in the order the establishments get here, so that they start at the configured rate.
+        now = asyncio.get_running_loop().time()
+        startTime = max(now, self._nextEstablishmentTime)
+        self._nextEstablishmentTime = startTime + self._establishmentInterval
+        if startTime > now:
+            await asyncio.sleep(startTime - now)
+
+    def _RecordEstablishment(self, elapsed: float, failed: bool):
+        if failed:
+            self._metrics.failedEstablishments += 1
+        else:
+            self._metrics.establishments += 1
+        self._metrics.totalEstablishmentSeconds += elapsed
+        self._metrics.maxEstablishmentSeconds = max(self._metrics.maxEstablishmentSeconds, elapsed)
+
+    async def _Establish(self, key: typing.Tuple[int, int], timeoutMs: typing.Optional[int]) -> DeviceProxyWrapper:
+        nodeid, payloadCapability = key
+        try:
+            async with self._establishmentSemaphore:
+                await self._WaitForEstablishmentSlot()
+                start = time.monotonic()
+                try:
+                    device = await self._devCtrl._GetOperationalDevice(nodeid, timeoutMs, payloadCapability)
+                except Exception:
+                    self._RecordEstablishment(time.monotonic() - start, failed=True)
+                    raise
+                self._RecordEstablishment(time.monotonic() - start, failed=False)
+            self._devices[key] = device
+            return device
+        finally:
+            if self._establishments.get(key) is asyncio.current_task():
+                del self._establishments[key]
@@ -19,15 +19,15 @@
 from __future__ import annotations
 
 import builtins
+import copy
 import ctypes
-import inspect
 import logging
-import sys
+import struct
 from asyncio.futures import Future
 from ctypes import CFUNCTYPE, POINTER, c_bool, c_size_t, c_uint8, c_uint16, c_uint32, c_uint64, c_void_p, cast, py_object
 from dataclasses import dataclass, field
 from enum import Enum, unique
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 import construct  # type: ignore
 from rich.pretty import pprint  # type: ignore
@@ -37,8 +37,8 @@ from ..interaction_model import (AttributePathIBstruct, DataVersionFilterIBstruc
 from ..interaction_model import Status as InteractionModelStatus
 from ..native import ErrorSDKPart, GetLibraryHandle, NativeLibraryHandleMethodArguments, PyChipError
 from ..tlv import TLVReader
-from . import Objects as GeneratedObjects  # noqa: F401
-from .ClusterObjects import Cluster, ClusterAttributeDescriptor, ClusterEvent
+from .ClusterObjects import ALL_ATTRIBUTES, ALL_CLUSTERS, ALL_EVENTS, Cluster, ClusterAttributeDescriptor, ClusterEvent
+from .ObjectsIndex import ATTRIBUTE_NAMES, CLUSTER_NAMES, EVENT_NAMES
 
 LOGGER = logging.getLogger(__name__)
 
@@ -116,29 +116,20 @@ class TypedAttributePath:
             raise ValueError(
                 "Either ClusterType and AttributeType OR Path must be provided.")
 
-        # if ClusterType and AttributeType were provided we can continue onwards to deriving the label.
-        # Otherwise, we'll need to walk the attribute index to find the right type information.
-
-        # If Path is provided, derive ClusterType and AttributeType from it
+        # If Path is provided, derive ClusterType, AttributeType and the label from the attribute index,
+        # which is keyed by (cluster id, attribute id) so this is a single dictionary lookup.
         if self.Path is not None:
-            for cluster, attribute in _AttributeIndex:
-                attributeType = _AttributeIndex[(cluster, attribute)][0]
-                clusterType = _AttributeIndex[(cluster, attribute)][1]
-
-                if clusterType.id == self.Path.ClusterId and attributeType.attribute_id == self.Path.AttributeId:
-                    self.ClusterType = clusterType
-                    self.AttributeType = attributeType
-                    break
-
-            if self.ClusterType is None or self.AttributeType is None:
+            entry = _GetTypedAttribute(self.Path.ClusterId, self.Path.AttributeId)
+            if entry is None:
                 raise KeyError(f"No Schema found for Attribute {self.Path}")
-
-        # Next, let's figure out the label.
-        for c_field in self.ClusterType.descriptor.Fields:
-            if c_field.Tag != self.AttributeType.attribute_id:
-                continue
-
-            self.AttributeName = c_field.Label
+            self.ClusterType, self.AttributeType, self.AttributeName = entry
+        else:
+            entry = _GetTypedAttribute(self.ClusterType.id, self.AttributeType.attribute_id)
+            if entry is not None and entry[0] is self.ClusterType:
+                self.AttributeName = entry[2]
+            else:
+                # The cluster is not one of the generated cluster objects, look the label up in its descriptor.
+                self.AttributeName = _GetAttributeLabel(self.ClusterType, self.AttributeType.attribute_id)
 
         if self.AttributeName is None:
             raise KeyError(f"Unable to resolve name for Attribute {self.Path}")
@@ -244,41 +235,58 @@ class EventReadResult(EventStatus):
     Data: Any = None
 
 
-_AttributeIndex = {}
-_EventIndex = {}
-_ClusterIndex = {}
+# Maps (cluster id, attribute id) to (ClusterType, AttributeType, AttributeName), where AttributeName is the label
+# of the attribute field on the cluster object. Entries are resolved from the generated objects index the first
+# time a path is seen, so paths are resolved in O(1) when handling reports.
+_TypedAttributeIndex: Dict[Tuple[int, int], Tuple[Any, Any, str]] = {}
+
 
+def _GetAttributeLabel(clusterType, attributeId: int) -> Optional[str]:
+    for c_field in clusterType.descriptor.Fields:
+        if c_field.Tag == attributeId:
+            return c_field.Label
+    return None
 
-def _BuildAttributeIndex():
-    ''' Build internal attribute index for locating the corresponding cluster object by path in the future.
-        We do this because this operation will take a long time when there are lots of attributes,
-        it takes about 300ms for a single query.
-        This is acceptable during init, but unacceptable when the server returns lots of attributes at the same time.
+
+def _GetClusterType(clusterId: int) -> Optional[Any]:
+    ''' Returns the generated cluster object for the given cluster id, or None if the cluster is unknown.
     '''
-    for clusterName, obj in inspect.getmembers(sys.modules['matter.clusters.Objects']):
-        if ('matter.clusters.Objects' in str(obj)) and inspect.isclass(obj):
-            for objName, subclass in inspect.getmembers(obj):
-                if inspect.isclass(subclass) and (('Attributes') in str(subclass)):
-                    for attributeName, attribute in inspect.getmembers(subclass):
-                        if inspect.isclass(attribute):
-                            base_classes = inspect.getmro(attribute)
-
-                            # Only match on classes that extend the ClusterAttributeDescriptor class
-                            matched = [
-                                value for value in base_classes if 'ClusterAttributeDescriptor' in str(value)]
-                            if (matched == []):
-                                continue
-
-                            _AttributeIndex[(attribute.cluster_id, attribute.attribute_id)] = (eval(
-                                'GeneratedObjects.' + clusterName + '.Attributes.' + attributeName), obj)
-
-
-def _BuildClusterIndex():
-    ''' Build internal cluster index for locating the corresponding cluster object by path in the future.
+    # Check the generated index first, so unknown clusters do not require loading the generated cluster objects.
+    if clusterId not in CLUSTER_NAMES:
+        return None
+    return ALL_CLUSTERS.get(clusterId)
+
+
+def _GetTypedAttribute(clusterId: int, attributeId: int) -> Optional[Tuple[Any, Any, str]]:
+    ''' Returns (ClusterType, AttributeType, AttributeName) for the given path, or None if the attribute is unknown.
     '''
-    for clusterName, obj in inspect.getmembers(sys.modules['matter.clusters.Objects']):
-        if ('matter.clusters.Objects' in str(obj)) and inspect.isclass(obj) and issubclass(obj, Cluster):
-            _ClusterIndex[obj.id] = obj
+    entry = _TypedAttributeIndex.get((clusterId, attributeId))
+    if entry is not None:
+        return entry
+
+    if attributeId not in ATTRIBUTE_NAMES.get(clusterId, {}):
+        return None
+
+    clusterType = ALL_CLUSTERS.get(clusterId)
+    attributeType = ALL_ATTRIBUTES.get(clusterId, {}).get(attributeId)
+    if clusterType is None or attributeType is None:
+        return None
+
+    label = _GetAttributeLabel(clusterType, attributeId)
+    if label is None:
+        return None
+
+    entry = (clusterType, attributeType, label)
+    _TypedAttributeIndex[(clusterId, attributeId)] = entry
+    return entry
+
+
+def _GetEventType(clusterId: int, eventId: int) -> Optional[Any]:
+    ''' Returns the generated event object for the given path, or None if the event is unknown.
+    '''
+    if eventId not in EVENT_NAMES.get(clusterId, {}):
+        return None
+    return ALL_EVENTS.get(clusterId, {}).get(eventId)
 
 
 @dataclass
@@ -369,17 +377,27 @@ class AttributeCache:
             regardless of the subset of attributes read. For attributes not returned in the report,
             defaults are used. If a cluster cannot be decoded,
             instead of a cluster object value, a ValueDecodeFailure shall be present.
+
+            Only the attributes which were updated since the last call are decoded. In the cluster-view, a cluster object
+            which was successfully decoded before is copied and only the fields of the changed attributes are decoded into
+            the copy, instead of decoding the whole cluster. Cluster objects returned by earlier calls are never modified.
         '''
 
-        def handle_cluster_view(endpointId, clusterId, clusterType):
+        def handle_cluster_view(endpointId, clusterId, clusterType, attributeIds):
+            clusterTLV = self.attributeTLVCache[endpointId][clusterId]
+            decodedData = self._attributeCache[endpointId].get(clusterType)
             try:
-                decodedData = clusterType.FromDict(
-                    data=clusterType.descriptor.TagDictToLabelDict([], self.attributeTLVCache[endpointId][clusterId]))
+                if isinstance(decodedData, clusterType):
+                    # The previous object may still be held by the caller, so the update goes into a copy of it.
+                    decodedData = copy.copy(decodedData)
+                    decodedData.UpdateFromTagDict({attributeId: clusterTLV[attributeId] for attributeId in attributeIds})
+                else:
+                    decodedData = clusterType.FromTagDict(clusterTLV)
                 decodedData.SetDataVersion(
                     self.versionList.get(endpointId, {}).get(clusterId))
                 return decodedData
             except Exception as ex:
-                return ValueDecodeFailure(self.attributeTLVCache[endpointId][clusterId], ex)
+                return ValueDecodeFailure(clusterTLV, ex)
 
         def handle_attribute_view(endpointId, clusterId, attributeId, attributeType):
             value = self.attributeTLVCache[endpointId][clusterId][attributeId]
@@ -390,45 +408,87 @@ class AttributeCache:
             except Exception as ex:
                 return ValueDecodeFailure(value, ex)
 
+        # Changed attribute ids, grouped by (endpoint id, cluster id) so every cluster object is only updated once.
+        changedClusters: Dict[Tuple[int, int], Set[int]] = {}
         for attributePath in self._attributeCacheUpdateNeeded:
-            endpointId, clusterId, attributeId = attributePath.EndpointId, attributePath.ClusterId, attributePath.AttributeId
+            key = (attributePath.EndpointId, attributePath.ClusterId)
+            if key not in changedClusters:
+                changedClusters[key] = set()
+            changedClusters[key].add(attributePath.AttributeId)
 
+        for (endpointId, clusterId), attributeIds in changedClusters.items():
             if endpointId not in self._attributeCache:
                 self._attributeCache[endpointId] = {}
             endpointCache = self._attributeCache[endpointId]
 
-            if clusterId not in _ClusterIndex:
+            clusterType = _GetClusterType(clusterId)
+            if clusterType is None:
                 #
                 # #22599 tracks dealing with unknown clusters more
                 # gracefully so that clients can still access this data.
                 #
                 continue
 
-            clusterType = _ClusterIndex[clusterId]
-
             if self.returnClusterObject:
                 endpointCache[clusterType] = handle_cluster_view(
-                    endpointId, clusterId, clusterType)
-            else:
-                if clusterType not in endpointCache:
-                    endpointCache[clusterType] = {}
-                clusterCache = endpointCache[clusterType]
-                clusterCache[DataVersion] = self.versionList.get(
-                    endpointId, {}).get(clusterId)
+                    endpointId, clusterId, clusterType, attributeIds)
+                continue
+
+            if clusterType not in endpointCache:
+                endpointCache[clusterType] = {}
+            clusterCache = endpointCache[clusterType]
+            clusterCache[DataVersion] = self.versionList.get(
+                endpointId, {}).get(clusterId)
 
-                if (clusterId, attributeId) not in _AttributeIndex:
+            for attributeId in attributeIds:
+                entry = _GetTypedAttribute(clusterId, attributeId)
+                if entry is None:
                     #
                     # #22599 tracks dealing with unknown clusters more
                     # gracefully so that clients can still access this data.
                     #
                     continue
 
-                attributeType = _AttributeIndex[(clusterId, attributeId)][0]
+                attributeType = entry[1]
                 clusterCache[attributeType] = handle_attribute_view(
                     endpointId, clusterId, attributeId, attributeType)
         self._attributeCacheUpdateNeeded.clear()
         return self._attributeCache
 
+    def GetAttributeDelta(self, paths: Iterable[AttributePath]) -> Dict[int, Dict[Any, Dict[Any, Any]]]:
+        ''' Returns the current values of the given attribute paths, in the attribute-view format
+            (Dict[EndpointId, Dict[ClusterObjectType, Dict[AttributeObjectType, AttributeValue]]]) regardless of
+            returnClusterObject.
+
+            Only pending updates are decoded (see GetUpdatedAttributeCache()), so this is cheap to call for the paths that
+            changed in a report. Paths of unknown clusters or attributes are left out. In the cluster-view, attributes of a
+            cluster which could not be decoded have the ValueDecodeFailure of the cluster as their value.
+        '''
+        cache = self.GetUpdatedAttributeCache()
+        delta: Dict[int, Dict[Any, Dict[Any, Any]]] = {}
+        for path in paths:
+            entry = _GetTypedAttribute(path.ClusterId, path.AttributeId)
+            if entry is None:
+                continue
+            clusterType, attributeType, attributeName = entry
+            clusterData = cache.get(path.EndpointId, {}).get(clusterType)
+            if clusterData is None:
+                continue
+
+            if not self.returnClusterObject:
+                value = clusterData.get(attributeType)
+            elif isinstance(clusterData, ValueDecodeFailure):
+                value = clusterData
+            else:
+                value = getattr(clusterData, attributeName)
+
+            if path.EndpointId not in delta:
+                delta[path.EndpointId] = {}
+            if clusterType not in delta[path.EndpointId]:
+                delta[path.EndpointId][clusterType] = {}
+            delta[path.EndpointId][clusterType][attributeType] = value
+        return delta
+
 
 class SubscriptionTransaction:
     def __init__(self, transaction: AsyncReadTransaction, subscriptionId, devCtrl):
@@ -442,6 +502,8 @@ class SubscriptionTransaction:
             int, SubscriptionTransaction], None] = DefaultErrorCallback
         self._onReportBeginCb: Callable[[SubscriptionTransaction], None] = DefaultReportBeginCallback
         self._onReportEndCb: Callable[[SubscriptionTransaction], None] = DefaultReportEndCallback
+        self._onReportDeltaCb: Optional[Callable[[Dict[int, Dict[Any, Dict[Any, Any]]], SubscriptionTransaction], None]] = None
+        self._lastReportChangedPaths: Set[AttributePath] = set()
         self._readTransaction = transaction
         self._subscriptionId = subscriptionId
         self._devCtrl = devCtrl
@@ -463,10 +525,19 @@ class SubscriptionTransaction:
         data = self._readTransaction._cache.GetUpdatedAttributeCache()
 
         if (self._readTransaction._cache.returnClusterObject):
-            return eval(f'data[path.Path.EndpointId][path.ClusterType].{path.AttributeName}')
+            return getattr(data[path.Path.EndpointId][path.ClusterType], path.AttributeName)
         else:
             return data[path.Path.EndpointId][path.ClusterType][path.AttributeType]
 
+    def GetReportDelta(self) -> Dict[int, Dict[Any, Dict[Any, Any]]]:
+        ''' Returns the attributes that changed in the last report, in the attribute-view format
+            (Dict[EndpointId, Dict[ClusterObjectType, Dict[AttributeObjectType, AttributeValue]]]).
+
+            Only the changed attributes are decoded, so long-running subscriptions do not need to materialize the whole
+            attribute cache with GetAttributes() after every report.
+        '''
+        return self._readTransaction._cache.GetAttributeDelta(self._lastReportChangedPaths)
+
     def GetEvents(self):
         return self._readTransaction.GetAllEventValues()
 
@@ -572,6 +643,15 @@ class SubscriptionTransaction:
         else:
             self._onReportEndCb = DefaultReportEndCallback
 
+    def SetReportDeltaCallback(self, callback: Optional[Callable[[Dict[int, Dict[Any, Dict[Any, Any]]],
+                                                                  SubscriptionTransaction], None]]):
+        '''
+        Sets the callback function for when a subscription report with at least one attribute path ends, accepts a
+        Callable that accepts the attributes that changed in the report (see GetReportDelta()) and the transaction.
+        If set to None, disable the callback.
+        '''
+        self._onReportDeltaCb = callback
+
     def SetEventUpdateCallback(self, callback: Callable[[EventReadResult, SubscriptionTransaction], None]):
         if callback is not None:
             self._onEventChangeCb = callback
@@ -596,6 +676,10 @@ class SubscriptionTransaction:
     def OnReportEndCb(self) -> Callable[[SubscriptionTransaction], None]:
         return self._onReportEndCb
 
+    @property
+    def OnReportDeltaCb(self) -> Optional[Callable[[Dict[int, Dict[Any, Dict[Any, Any]]], SubscriptionTransaction], None]]:
+        return self._onReportDeltaCb
+
     @property
     def OnEventChangeCb(self) -> Callable[[EventReadResult, SubscriptionTransaction], None]:
         return self._onEventChangeCb
@@ -660,29 +744,6 @@ def DefaultReportEndCallback(transaction: SubscriptionTransaction):
     pass
 
 
-def _BuildEventIndex():
-    ''' Build internal event index for locating the corresponding cluster object by path in the future.
-    We do this because this operation will take a long time when there are lots of events, it takes about 300ms for a single query.
-    This is acceptable during init, but unacceptable when the server returns lots of events at the same time.
-    '''
-    for clusterName, obj in inspect.getmembers(sys.modules['matter.clusters.Objects']):
-        if ('matter.clusters.Objects' in str(obj)) and inspect.isclass(obj):
-            for objName, subclass in inspect.getmembers(obj):
-                if inspect.isclass(subclass) and (('Events' == objName)):
-                    for eventName, event in inspect.getmembers(subclass):
-                        if inspect.isclass(event):
-                            base_classes = inspect.getmro(event)
-
-                            # Only match on classes that extend the ClusterEvent class
-                            matched = [
-                                value for value in base_classes if 'ClusterEvent' in str(value)]
-                            if (matched == []):
-                                continue
-
-                            _EventIndex[str(EventPath(ClusterId=event.cluster_id, EventId=event.event_id))] = eval(
-                                'GeneratedObjects.' + clusterName + '.Events.' + eventName)
-
-
 class AsyncReadTransaction:
     @dataclass
     class ReadResponse:
@@ -690,7 +751,7 @@ class AsyncReadTransaction:
         events: list[ClusterEvent]
         tlvAttributes: dict[int, Any]
 
-    def __init__(self, future: Future, eventLoop, devCtrl, returnClusterObject: bool):
+    def __init__(self, future: Future, eventLoop, devCtrl, returnClusterObject: bool, batchAttributeReports: bool = False):
         self._event_loop = eventLoop
         self._future = future
         self._subscription_handler = None
@@ -700,6 +761,9 @@ class AsyncReadTransaction:
         self._changedPathSet: Set[AttributePath] = set()
         self._pReadClient = None
         self._resultError: Optional[PyChipError] = None
+        # When set, the attribute data of a report is handed over in a single batch at the end of the report and is
+        # decoded on the event loop thread, instead of being decoded on the CHIP thread one attribute at a time.
+        self._batchAttributeReports = batchAttributeReports
 
     def SetClientObjPointers(self, pReadClient):
         self._pReadClient = pReadClient
@@ -719,6 +783,10 @@ class AsyncReadTransaction:
         """Returns subscription transaction."""
         return self._subscription_handler
 
+    def GetAttributeCache(self) -> AttributeCache:
+        """Returns the cache the attribute data of the reports is stored in."""
+        return self._cache
+
     def handleAttributeData(self, path: AttributePath, dataVersion: int, status: int, data: bytes):
         try:
             imStatus = InteractionModelStatus(status)
@@ -736,9 +804,24 @@ class AsyncReadTransaction:
         except Exception as ex:
             LOGGER.exception(ex)
 
+    def _handleAttributeDataBatch(self, data: bytes):
+        buffer = memoryview(data)
+        headerSize = _AttributeDataBatchRecordHeader.size
+        offset = 0
+        while offset < len(buffer):
+            dataVersion, endpoint, cluster, attribute, status, dataLen = _AttributeDataBatchRecordHeader.unpack_from(
+                buffer, offset)
+            offset += headerSize
+            self.handleAttributeData(AttributePath(EndpointId=endpoint, ClusterId=cluster, AttributeId=attribute),
+                                     dataVersion, status, buffer[offset:offset + dataLen])
+            offset += dataLen
+
+    def handleAttributeDataBatch(self, data: bytes):
+        self._event_loop.call_soon_threadsafe(self._handleAttributeDataBatch, data)
+
     def handleEventData(self, header: EventHeader, path: EventPath, data: bytes, status: int):
         try:
-            eventType = _EventIndex.get(str(path), None)
+            eventType = _GetEventType(path.ClusterId, path.EventId)
             eventValue = None
 
             if data:
@@ -776,16 +859,35 @@ class AsyncReadTransaction:
         except Exception as ex:
             LOGGER.exception(ex)
 
-    def handleError(self, chipError: PyChipError):
+    def _handleError(self, chipError: PyChipError):
         if self._subscription_handler:
             self._subscription_handler.OnErrorCb(
                 chipError.code, self._subscription_handler)
+
+    def handleError(self, chipError: PyChipError):
+        # Like the report callbacks, the error is reported after the attribute data still queued on the event loop.
+        if self._batchAttributeReports:
+            self._event_loop.call_soon_threadsafe(self._handleError, chipError)
+        else:
+            self._handleError(chipError)
         self._resultError = chipError
 
+    def Cancel(self):
+        '''
+        Called when the caller stopped waiting for the transaction, e.g. on a timeout or a cancelled task. A subscription
+        is shut down as soon as it is established, since nothing else holds it to shut it down. A read ends on its own.
+        '''
+        if self._subscription_handler is not None:
+            self._subscription_handler.Shutdown()
+
     def _handleSubscriptionEstablished(self, subscriptionId):
-        if not self._future.done():
+        if self._subscription_handler is None:
             self._subscription_handler = SubscriptionTransaction(
                 self, subscriptionId, self._devCtrl)
+            if self._future.done():
+                # The caller stopped waiting for the subscription before it was established, see Cancel.
+                self._subscription_handler.Shutdown()
+                return
             self._future.set_result(self)
         else:
             self._subscription_handler._subscriptionId = subscriptionId
@@ -828,6 +930,11 @@ class AsyncReadTransaction:
                 self._subscription_handler.OnAttributeChangeCb(
                     attribute_path, self._subscription_handler)
 
+            self._subscription_handler._lastReportChangedPaths = self._changedPathSet
+            if self._changedPathSet and self._subscription_handler.OnReportDeltaCb is not None:
+                self._subscription_handler.OnReportDeltaCb(
+                    self._subscription_handler.GetReportDelta(), self._subscription_handler)
+
             self._subscription_handler.OnReportEndCb(self._subscription_handler)
             # Clear it out once we've notified of all changes in this transaction.
         self._changedPathSet = set()
@@ -863,12 +970,18 @@ class AsyncReadTransaction:
         self._event_loop.call_soon_threadsafe(self._handleDone)
 
     def handleReportBegin(self):
-        # self._event_loop.call_soon_threadsafe(self._handleReportBegin)
-        self._handleReportBegin()
+        # When batching, the attribute data is handled on the event loop thread, so the report callbacks are as well to
+        # keep them in order with the attribute data.
+        if self._batchAttributeReports:
+            self._event_loop.call_soon_threadsafe(self._handleReportBegin)
+        else:
+            self._handleReportBegin()
 
     def handleReportEnd(self):
-        # self._event_loop.call_soon_threadsafe(self._handleReportEnd)
-        self._handleReportEnd()
+        if self._batchAttributeReports:
+            self._event_loop.call_soon_threadsafe(self._handleReportEnd)
+        else:
+            self._handleReportEnd()
 
 
 class AsyncWriteTransaction:
@@ -919,6 +1032,8 @@ class AsyncWriteTransaction:
 
 _OnReadAttributeDataCallbackFunct = CFUNCTYPE(
     None, py_object, c_uint32, c_uint16, c_uint32, c_uint32, c_uint8, c_void_p, c_size_t)
+_OnReadAttributeDataBatchCallbackFunct = CFUNCTYPE(
+    None, py_object, c_void_p, c_size_t, c_size_t)
 _OnSubscriptionEstablishedCallbackFunct = CFUNCTYPE(None, py_object, c_uint32)
 _OnResubscriptionAttemptedCallbackFunct = CFUNCTYPE(
     None, py_object, PyChipError, c_uint32)
@@ -941,6 +1056,16 @@ def _OnReadAttributeDataCallback(closure, dataVersion: int, endpoint: int, clust
         EndpointId=endpoint, ClusterId=cluster, AttributeId=attribute), dataVersion, status, dataBytes[:])
 
 
+# This struct matches the AttributeDataBatchRecordHeader in attribute.cpp, every header in a batch is directly followed by
+# dataLen bytes of TLV data.
+_AttributeDataBatchRecordHeader = struct.Struct("=IHIIBI")
+
+
+@_OnReadAttributeDataBatchCallbackFunct
+def _OnReadAttributeDataBatchCallback(closure, data, len: int, count: int):
+    closure.handleAttributeDataBatch(ctypes.string_at(data, len))
+
+
 @_OnReadEventDataCallbackFunct
 def _OnReadEventDataCallback(closure, endpoint: int, cluster: int, event: c_uint64,
                              number: int, priority: int, timestamp: int, timestampType: int, data, len, status):
@@ -1097,6 +1222,7 @@ _ReadParams = construct.Struct(
     "IsFabricFiltered" / construct.Flag,
     "KeepSubscriptions" / construct.Flag,
     "AutoResubscribe" / construct.Flag,
+    "BatchAttributeReports" / construct.Flag,
 )
 
 
@@ -1188,6 +1314,7 @@ def Read(transaction: AsyncReadTransaction, device,
         params.IsSubscription = True
         params.KeepSubscriptions = keepSubscriptions
     params.IsFabricFiltered = fabricFiltered
+    params.BatchAttributeReports = transaction._batchAttributeReports
     params = _ReadParams.build(params)
     eventNumberFilterPtr = ctypes.POINTER(ctypes.c_ulonglong)()
     if eventNumberFilter is not None:
@@ -1249,6 +1376,7 @@ def Init():
                    _OnSubscriptionEstablishedCallbackFunct, _OnResubscriptionAttemptedCallbackFunct,
                    _OnReadErrorCallbackFunct, _OnReadDoneCallbackFunct,
                    _OnReportBeginCallbackFunct, _OnReportEndCallbackFunct])
+        setter.Set('pychip_ReadClient_InitAttributeDataBatchCallback', None, [_OnReadAttributeDataBatchCallbackFunct])
 
     handle.pychip_WriteClient_InitCallbacks(
         _OnWriteResponseCallback, _OnWriteErrorCallback, _OnWriteDoneCallback)
@@ -1256,7 +1384,4 @@ def Init():
         _OnReadAttributeDataCallback, _OnReadEventDataCallback,
         _OnSubscriptionEstablishedCallback, _OnResubscriptionAttemptedCallback, _OnReadErrorCallback, _OnReadDoneCallback,
         _OnReportBeginCallback, _OnReportEndCallback)
-
-    _BuildAttributeIndex()
-    _BuildClusterIndex()
-    _BuildEventIndex()
+    handle.pychip_ReadClient_InitAttributeDataBatchCallback(_OnReadAttributeDataBatchCallback)
@@ -0,0 +1,163 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+# Needed to use types in type hints before they are fully defined.
+from __future__ import annotations
+
+import logging
+import sqlite3
+from typing import Dict, List, Optional, Set, Tuple
+
+from ..tlv import TLVReader, TLVWriter
+from .Attribute import AttributeCache, AttributePath, DataVersionFilter, ValueDecodeFailure
+
+LOGGER = logging.getLogger(__name__)
+
+# Descriptor cluster and attributes, which give the endpoints of a node and the clusters of every endpoint.
+_DESCRIPTOR_CLUSTER_ID = 0x001D
+_DESCRIPTOR_SERVER_LIST_ATTRIBUTE_ID = 0x0001
+_DESCRIPTOR_PARTS_LIST_ATTRIBUTE_ID = 0x0003
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS clusters (
+    fabric INTEGER NOT NULL, node INTEGER NOT NULL, endpoint INTEGER NOT NULL, cluster INTEGER NOT NULL,
+    dataVersion INTEGER NOT NULL,
+    PRIMARY KEY (fabric, node, endpoint, cluster)
+);
+CREATE TABLE IF NOT EXISTS attributes (
+    fabric INTEGER NOT NULL, node INTEGER NOT NULL, endpoint INTEGER NOT NULL, cluster INTEGER NOT NULL,
+    attribute INTEGER NOT NULL, tlv BLOB NOT NULL,
+    PRIMARY KEY (fabric, node, endpoint, cluster, attribute)
+);
+'''
+
+# Cluster data of a node: (endpoint id, cluster id) -> (data version, attribute id -> decoded TLV).
+_ClusterData = Dict[Tuple[int, int], Tuple[int, Dict[int, object]]]
+
+
+class AttributeCacheStore:
+    ''' Persists the attribute data read from nodes in an sqlite database, keyed by fabric, node, endpoint and cluster,
+        so that reading a node again only transfers the clusters whose data version changed since.
+
+        Only fabric-filtered reads of whole clusters are served from the store (paths without an attribute ID, e.g. wildcard
+        reads), since the fabric-scoped data seen by other reads depends on the fabric filtering.
+        Before such a read, GetDataVersionFilters gives the data version of every stored cluster covered by the read.
+        After it, MergeRead stores the reported clusters, and adds the stored clusters which were not reported, because
+        their data version did not change, to the attribute cache of the read. Stored endpoints and clusters which are no
+        longer in the Descriptor cluster of the node are dropped.
+
+        The store is used by the reads of a controller once set with ChipDeviceControllerBase.SetAttributeCacheStore.
+    '''
+
+    def __init__(self, path: str):
+        ''' Opens the store, creating the database at the given path if needed. ':memory:' gives a store which is not
+            persisted.
+        '''
+        self._db = sqlite3.connect(path)
+        self._db.executescript(_SCHEMA)
+
+    def Close(self):
+        self._db.close()
+
+    @staticmethod
+    def CanServe(attributePaths: Optional[List[AttributePath]]) -> bool:
+        ''' Returns whether a read of these paths can be served from the store, which requires whole clusters to be read. '''
+        return bool(attributePaths) and all(path.AttributeId is None for path in attributePaths)  # type: ignore[union-attr]
+
+    def GetDataVersionFilters(self, fabricId: int, nodeid: int, attributePaths: List[AttributePath]) -> List[DataVersionFilter]:
+        ''' Returns the data version filters of the stored clusters covered by the given paths. '''
+        return [DataVersionFilter(EndpointId=endpoint, ClusterId=cluster, DataVersion=dataVersion)
+                for (endpoint, cluster, dataVersion) in self._db.execute(
+                    'SELECT endpoint, cluster, dataVersion FROM clusters WHERE fabric = ? AND node = ?', (fabricId, nodeid))
+                if _IsCovered(attributePaths, endpoint, cluster)]
+
+    def MergeRead(self, fabricId: int, nodeid: int, attributePaths: List[AttributePath], cache: AttributeCache):
+        ''' Stores the clusters reported by a read with the data version filters of GetDataVersionFilters, and adds the
+            stored clusters which were not reported to its attribute cache.
+        '''
+        reported = {(endpoint, cluster) for endpoint, clusters in cache.attributeTLVCache.items() for cluster in clusters}
+        stored = {key: value for key, value in self._Load(fabricId, nodeid).items()
+                  if _IsCovered(attributePaths, *key)}
+
+        def descriptorAttribute(endpoint: int, attribute: int):
+            if (endpoint, _DESCRIPTOR_CLUSTER_ID) in reported:
+                value = cache.attributeTLVCache[endpoint][_DESCRIPTOR_CLUSTER_ID].get(attribute)
+            else:
+                value = stored.get((endpoint, _DESCRIPTOR_CLUSTER_ID), (None, {}))[1].get(attribute)
+            return value if isinstance(value, list) else None
+
+        # Stored clusters that were not reported either did not change, or no longer exist on the node.
+        endpoints: Optional[Set[int]] = None
+        partsList = descriptorAttribute(0, _DESCRIPTOR_PARTS_LIST_ATTRIBUTE_ID)
+        if partsList is not None and any(path.EndpointId is None for path in attributePaths):
+            endpoints = {0, *partsList}
+        removed = []
+        for (endpoint, cluster), (dataVersion, attributes) in stored.items():
+            if (endpoint, cluster) in reported:
+                continue
+            serverList = descriptorAttribute(endpoint, _DESCRIPTOR_SERVER_LIST_ATTRIBUTE_ID)
+            if (endpoints is not None and endpoint not in endpoints) or (serverList is not None and cluster not in serverList):
+                removed.append((endpoint, cluster))
+                continue
+            for attribute, value in attributes.items():
+                cache.UpdateTLV(AttributePath(EndpointId=endpoint, ClusterId=cluster, AttributeId=attribute), dataVersion, value)
+
+        with self._db:
+            for endpoint, cluster in removed:
+                self._DeleteCluster(fabricId, nodeid, endpoint, cluster)
+            for endpoint, cluster in reported:
+                self._DeleteCluster(fabricId, nodeid, endpoint, cluster)
+                attributes = cache.attributeTLVCache[endpoint][cluster]
+                dataVersion = cache.versionList.get(endpoint, {}).get(cluster)
+                # Clusters with errors are left out, so that they are read in full next time.
+                if dataVersion is None or any(isinstance(value, ValueDecodeFailure) for value in attributes.values()):
+                    continue
+                self._db.execute('INSERT INTO clusters VALUES (?, ?, ?, ?, ?)', (fabricId, nodeid, endpoint, cluster, dataVersion))
+                self._db.executemany('INSERT INTO attributes VALUES (?, ?, ?, ?, ?, ?)', [
+                    (fabricId, nodeid, endpoint, cluster, attribute, _Encode(value)) for attribute, value in attributes.items()])
+
+    def Remove(self, fabricId: int, nodeid: int):
+        ''' Drops all the data stored for a node. '''
+        with self._db:
+            self._db.execute('DELETE FROM clusters WHERE fabric = ? AND node = ?', (fabricId, nodeid))
+            self._db.execute('DELETE FROM attributes WHERE fabric = ? AND node = ?', (fabricId, nodeid))
+
+    def _Load(self, fabricId: int, nodeid: int) -> _ClusterData:
+        clusters: _ClusterData = {
+            (endpoint, cluster): (dataVersion, {}) for (endpoint, cluster, dataVersion) in self._db.execute(
+                'SELECT endpoint, cluster, dataVersion FROM clusters WHERE fabric = ? AND node = ?', (fabricId, nodeid))}
+        for (endpoint, cluster, attribute, tlv) in self._db.execute(
+                'SELECT endpoint, cluster, attribute, tlv FROM attributes WHERE fabric = ? AND node = ?', (fabricId, nodeid)):
+            if (endpoint, cluster) in clusters:
+                clusters[(endpoint, cluster)][1][attribute] = TLVReader(tlv).get()['Any']
+        return clusters
+
+    def _DeleteCluster(self, fabricId: int, nodeid: int, endpoint: int, cluster: int):
+        key = (fabricId, nodeid, endpoint, cluster)
+        self._db.execute('DELETE FROM clusters WHERE fabric = ? AND node = ? AND endpoint = ? AND cluster = ?', key)
+        self._db.execute('DELETE FROM attributes WHERE fabric = ? AND node = ? AND endpoint = ? AND cluster = ?', key)
+
+
+def _IsCovered(attributePaths: List[AttributePath], endpoint: int, cluster: int) -> bool:
+    return any((path.EndpointId is None or path.EndpointId == endpoint) and (path.ClusterId is None or path.ClusterId == cluster)
+               for path in attributePaths)
+
+
+def _Encode(value) -> bytes:
+    writer = TLVWriter()
+    writer.put(None, value)
+    return bytes(writer.encoding)
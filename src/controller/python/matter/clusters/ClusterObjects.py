@@ -16,14 +16,17 @@
 #
 
 import enum
+import importlib
+import sys
 import typing
-from dataclasses import asdict, dataclass, field, make_dataclass
+from dataclasses import dataclass, field, fields, is_dataclass, make_dataclass
 from typing import Any, ClassVar, Dict, List, Mapping, Union
 
 from dacite import from_dict  # type: ignore
 
 from .. import ChipUtility, tlv
 from ..clusters.Types import Nullable, NullValue
+from .ObjectsIndex import CLUSTER_NAMES
 
 
 def GetUnionUnderlyingType(typeToCheck, matchingType=None):
@@ -191,31 +194,289 @@ class ClusterObjectDescriptor:
         return bytes(tlvwriter.encoding)
 
 
+def _GetCompiledOnClass(cls, name: str, compile: typing.Callable):
+    ''' Returns the object compiled by compile(cls), which is cached on the class itself under the given name.
+
+        The generated descriptors are class properties which build a new descriptor every time they are accessed,
+        so anything derived from them is cached on the class instead. The lookup is done through the class
+        __dict__ so that subclasses never pick up the compiled object of their base class.
+    '''
+    compiled = cls.__dict__.get(name)
+    if compiled is None:
+        compiled = compile(cls)
+        setattr(cls, name, compiled)
+    return compiled
+
+
+def _IsClusterObjectType(elementType) -> bool:
+    return isinstance(elementType, type) and issubclass(elementType, ClusterObject)
+
+
+class _CompiledField:
+    ''' A ClusterObjectFieldDescriptor with its type information resolved ahead of time.
+
+        Decoding and encoding behave like ClusterObjectDescriptor.TagDictToLabelDict followed by dacite, and
+        ClusterObjectFieldDescriptor.PutFieldToTLV respectively, without inspecting the field type for every value.
+    '''
+    __slots__ = ('Label', 'Tag', 'InitLabel', 'IsNullable', 'IsOptional', 'ValueType', 'ListElementType',
+                 'IsStruct', 'IsEnum', 'EncodeType', 'EncodeListElementType', 'IsEncodeStruct')
+
+    def __init__(self, descriptor: ClusterObjectFieldDescriptor, initLabels: typing.Optional[typing.Set[str]] = None):
+        fieldType = descriptor.Type
+        self.Label = descriptor.Label
+        self.Tag = descriptor.Tag
+        # The label under which the decoded value is passed to the dataclass constructor, None if the dataclass
+        # has no such field (in which case dacite would have ignored the value as well).
+        self.InitLabel = descriptor.Label if (initLabels is None or descriptor.Label in initLabels) else None
+        self.IsNullable = GetUnionUnderlyingType(fieldType, Nullable) is not None
+        self.IsOptional = GetUnionUnderlyingType(fieldType, type(None)) is not None
+
+        if (typing.get_origin(fieldType) == typing.Union):
+            self.ValueType = GetUnionUnderlyingType(fieldType)
+        else:
+            self.ValueType = fieldType
+
+        elementType = self.ValueType
+        self.ListElementType = None
+        if (typing.get_origin(elementType) == list):
+            (self.ListElementType, ) = typing.get_args(elementType)
+            elementType = self.ListElementType
+        self.IsStruct = _IsClusterObjectType(elementType)
+        self.IsEnum = isinstance(elementType, type) and issubclass(elementType, enum.Enum)
+
+        # Encoding falls back to the field type itself if the union has no underlying type.
+        self.EncodeType = self.ValueType if self.ValueType is not None else fieldType
+        encodeArgs = typing.get_args(self.EncodeType)
+        self.EncodeListElementType = encodeArgs[0] if len(encodeArgs) == 1 else None
+        self.IsEncodeStruct = _IsClusterObjectType(self.EncodeType)
+
+    def _DecodeElement(self, debugPath: str, elementType, value: Any) -> Any:
+        if self.IsStruct:
+            if not isinstance(value, Mapping):
+                raise ValueError(
+                    f"Failed to decode field {debugPath}, struct expected.")
+            return _GetCodec(elementType).DecodeTagDict(debugPath, value)
+
+        if self.IsEnum:
+            value = elementType(value)
+        if not isinstance(value, elementType):
+            raise ValueError(
+                f"Failed to decode field {debugPath}, expected type {elementType}, got {type(value)}")
+        return value
+
+    def Decode(self, debugPath: str, value: Any) -> Any:
+        if (value is None):
+            if not self.IsNullable:
+                raise ValueError(
+                    f"Field {debugPath}.{self.Label} was not nullable, but got a null")
+            return NullValue
+
+        if (self.ValueType is None):
+            raise ValueError(
+                f"Field {debugPath}.{self.Label} has no valid underlying data model type")
+
+        if (self.ListElementType is not None):
+            elementType = self.ListElementType
+            return [self._DecodeElement(f'{debugPath}[{i}]', elementType, v) for i, v in enumerate(value)]
+        return self._DecodeElement(f'{debugPath}.{self.Label}', self.ValueType, value)
+
+    def _EncodeElement(self, tag, val, elementType, isStruct: bool, writer: tlv.TLVWriter, debugPath: str):
+        if isStruct:
+            if isinstance(val, ClusterObject):
+                _GetCodec(elementType).EncodeObjectWithWriter(f'{debugPath}.{self.Label}', tag, val, writer)
+                return
+            if not isinstance(val, dict):
+                raise ValueError(
+                    f"Field {debugPath}.{self.Label} expected a struct, but got {type(val)}")
+            _GetCodec(elementType).EncodeDictWithWriter(f'{debugPath}.{self.Label}', tag, val, writer)
+            return
+
+        try:
+            val = elementType(val)
+        except Exception:
+            raise ValueError(
+                f"Field {debugPath}.{self.Label} expected {elementType}, but got {type(val)}")
+        writer.put(tag, val)
+
+    def Encode(self, tag, val, writer: tlv.TLVWriter, debugPath: str = '?'):
+        if (val == NullValue):
+            if not self.IsNullable:
+                raise ValueError(
+                    f"Field {debugPath}.{self.Label} was not nullable, but got a null")
+            writer.put(tag, None)
+        elif (val is None):
+            if not self.IsOptional:
+                raise ValueError(
+                    f"Field {debugPath}.{self.Label} was not optional, but encountered None")
+        elif not isinstance(val, list):
+            self._EncodeElement(tag, val, self.EncodeType, self.IsEncodeStruct, writer, debugPath)
+        else:
+            elementType = self.EncodeListElementType
+            if elementType is None:
+                raise ValueError(
+                    f"Field {debugPath}.{self.Label} expected {self.EncodeType}, but got a list")
+            isStruct = _IsClusterObjectType(elementType)
+            writer.startArray(tag)
+            for i, v in enumerate(val):
+                self._EncodeElement(None, v, elementType, isStruct, writer, debugPath + f'[{i}]')
+            writer.endContainer()
+
+
+class _ClusterObjectCodec:
+    ''' The decode/encode plan of a ClusterObject type, compiled from its descriptor the first time it is needed.
+
+        Decoding constructs the dataclass directly instead of going through an intermediate label dictionary and
+        dacite, which is where most of the time decoding large reads used to go.
+    '''
+
+    def __init__(self, cls):
+        self._objectClass = cls
+        initLabels = {f.name for f in fields(cls) if f.init} if is_dataclass(cls) else None
+        self._fields = [_CompiledField(f, initLabels) for f in cls.descriptor.Fields]
+        self._fieldsByTag = {f.Tag: f for f in reversed(self._fields)}
+
+    def DecodeTagDict(self, debugPath: str, tlvData: Mapping) -> Any:
+        kwargs = {}
+        fieldsByTag = self._fieldsByTag
+        for tag, value in tlvData.items():
+            compiledField = fieldsByTag.get(tag)
+            if compiledField is None:
+                # We do not have enough information for this field.
+                continue
+            value = compiledField.Decode(debugPath, value)
+            if compiledField.InitLabel is not None:
+                kwargs[compiledField.InitLabel] = value
+        return self._objectClass(**kwargs)
+
+    def UpdateFromTagDict(self, debugPath: str, obj: Any, tlvData: Mapping):
+        # Decode all values before updating any field, so the object is left untouched if decoding fails.
+        decoded = []
+        fieldsByTag = self._fieldsByTag
+        for tag, value in tlvData.items():
+            compiledField = fieldsByTag.get(tag)
+            if compiledField is None:
+                continue
+            value = compiledField.Decode(debugPath, value)
+            if compiledField.InitLabel is not None:
+                decoded.append((compiledField.InitLabel, value))
+        for label, value in decoded:
+            setattr(obj, label, value)
+
+    def EncodeDictWithWriter(self, debugPath: str, tag, data: Mapping, writer: tlv.TLVWriter):
+        writer.startStructure(tag)
+        for compiledField in self._fields:
+            compiledField.Encode(compiledField.Tag, data.get(compiledField.Label, None), writer,
+                                 debugPath + f'.{compiledField.Label}')
+        writer.endContainer()
+
+    def EncodeObjectWithWriter(self, debugPath: str, tag, obj: Any, writer: tlv.TLVWriter):
+        writer.startStructure(tag)
+        for compiledField in self._fields:
+            compiledField.Encode(compiledField.Tag, getattr(obj, compiledField.Label, None), writer,
+                                 debugPath + f'.{compiledField.Label}')
+        writer.endContainer()
+
+
+def _GetCodec(cls) -> _ClusterObjectCodec:
+    return _GetCompiledOnClass(cls, '_compiledCodec', _ClusterObjectCodec)
+
+
 class ClusterObject:
     def ToTLV(self):
-        return self.descriptor.DictToTLV(asdict(self))
+        writer = tlv.TLVWriter(bytearray())
+        _GetCodec(type(self)).EncodeObjectWithWriter('', None, self, writer)
+        return bytes(writer.encoding)
 
     @classmethod
     def FromDict(cls, data: dict):
         return from_dict(data_class=cls, data=data)
 
+    @classmethod
+    def FromTagDict(cls, data: Mapping, debugPath: str = ''):
+        ''' Constructs the object from TLV data decoded into a tag dictionary (as returned by TLVReader). '''
+        return _GetCodec(cls).DecodeTagDict(debugPath, data)
+
     @classmethod
     def FromTLV(cls, data: bytes):
-        return cls.FromDict(data=cls.descriptor.TLVToDict(data))
+        return cls.FromTagDict(tlv.TLVReader(data).get().get('Any', {}))
+
+    def UpdateFromTagDict(self, data: Mapping, debugPath: str = ''):
+        ''' Updates the fields present in the given tag dictionary in place, all other fields are left untouched. '''
+        _GetCodec(type(self)).UpdateFromTagDict(debugPath, self, data)
 
     @ChipUtility.classproperty
     def descriptor(cls):
         raise NotImplementedError()
 
 
+def LoadGeneratedObjects():
+    ''' Imports all the generated cluster objects (one module per cluster, see Objects.py), which registers them in
+        the dictionaries below.
+
+        The generated cluster objects are loaded lazily since importing them is expensive, this is a no-op
+        once they have been loaded.
+    '''
+    for clusterId in CLUSTER_NAMES:
+        LoadGeneratedCluster(clusterId)
+
+
+def LoadGeneratedCluster(clusterId):
+    ''' Imports the generated cluster object of the given cluster id, which registers it in the dictionaries below.
+        This is a no-op for cluster ids without a generated cluster object, or once it has been loaded.
+    '''
+    name = CLUSTER_NAMES.get(clusterId)
+    if name is not None and f'{__package__}.objects.{name}' not in sys.modules:
+        importlib.import_module(f'.objects.{name}', __package__)
+
+
+class _GeneratedObjectsRegistry(dict):
+    ''' A dictionary of generated cluster objects keyed by cluster id, which makes sure the generated cluster objects
+        are loaded before it is read, so that lookups behave as if all of them had been imported eagerly. Looking a
+        cluster id up only loads the generated cluster object of that cluster, going through all the entries loads
+        all of them.
+    '''
+
+    def __getitem__(self, key):
+        LoadGeneratedCluster(key)
+        return super().__getitem__(key)
+
+    def __contains__(self, key):
+        LoadGeneratedCluster(key)
+        return super().__contains__(key)
+
+    def __iter__(self):
+        LoadGeneratedObjects()
+        return super().__iter__()
+
+    def __len__(self):
+        LoadGeneratedObjects()
+        return super().__len__()
+
+    def get(self, key, default=None):
+        LoadGeneratedCluster(key)
+        return super().get(key, default)
+
+    def keys(self):
+        LoadGeneratedObjects()
+        return super().keys()
+
+    def values(self):
+        LoadGeneratedObjects()
+        return super().values()
+
+    def items(self):
+        LoadGeneratedObjects()
+        return super().items()
+
+
 # The below dictionaries will be filled dynamically
 # and are used for quick lookup/mapping from cluster/attribute id to the correct class
-ALL_CLUSTERS: typing.Dict = {}
-ALL_ATTRIBUTES: typing.Dict = {}
+ALL_CLUSTERS: typing.Dict = _GeneratedObjectsRegistry()
+ALL_ATTRIBUTES: typing.Dict = _GeneratedObjectsRegistry()
 # These need to be separate because there can be overlap in command ids for commands and responses.
-ALL_ACCEPTED_COMMANDS: typing.Dict = {}
-ALL_GENERATED_COMMANDS: typing.Dict = {}
-ALL_EVENTS: typing.Dict = {}
+ALL_ACCEPTED_COMMANDS: typing.Dict = _GeneratedObjectsRegistry()
+ALL_GENERATED_COMMANDS: typing.Dict = _GeneratedObjectsRegistry()
+ALL_EVENTS: typing.Dict = _GeneratedObjectsRegistry()
 
 
 class ClusterCommand(ClusterObject):
@@ -307,21 +568,16 @@ class ClusterAttributeDescriptor:
     @classmethod
     def ToTLV(cls, tag: Union[int, None], value):
         writer = tlv.TLVWriter()
-        wrapped_value = cls._cluster_object(Value=value)
-        cls.attribute_type.PutFieldToTLV(tag,
-                                         asdict(wrapped_value)['Value'], writer, '')
+        _GetCompiledOnClass(cls, '_compiledAttributeType', _CompileAttributeType).Encode(tag, value, writer, '')
         return writer.encoding
 
     @classmethod
     def FromTLV(cls, tlvBuffer: bytes):
-        obj_class = cls._cluster_object
-        return obj_class.FromDict(
-            obj_class.descriptor.TagDictToLabelDict('', {0: tlv.TLVReader(tlvBuffer).get().get('Any', {})})).Value
+        return cls.FromTagDictOrRawValue(tlv.TLVReader(tlvBuffer).get().get('Any', {}))
 
     @classmethod
     def FromTagDictOrRawValue(cls, val: Any):
-        obj_class = cls._cluster_object
-        return obj_class.FromDict(obj_class.descriptor.TagDictToLabelDict('', {0: val})).Value
+        return _GetCompiledOnClass(cls, '_compiledAttributeType', _CompileAttributeType).Decode('', val)
 
     @ChipUtility.classproperty
     def cluster_id(self) -> int:
@@ -345,20 +601,28 @@ class ClusterAttributeDescriptor:
 
     @ChipUtility.classproperty
     def _cluster_object(cls) -> ClusterObject:
-        return make_dataclass('InternalClass',
-                              [
-                                  ('Value', cls.attribute_type.Type,
-                                   field(default=None)),
-                                  ('descriptor', ClassVar[ClusterObjectDescriptor],
-                                   field(
-                                      default=ClusterObjectDescriptor(
-                                          Fields=[ClusterObjectFieldDescriptor(
-                                              Label='Value', Tag=0, Type=cls.attribute_type.Type)]
-                                      )
-                                  )
+        return _GetCompiledOnClass(cls, '_compiledClusterObject', _MakeAttributeClusterObject)
+
+
+def _CompileAttributeType(cls) -> _CompiledField:
+    return _CompiledField(ClusterObjectFieldDescriptor(Label='Value', Tag=0, Type=cls.attribute_type.Type))
+
+
+def _MakeAttributeClusterObject(cls) -> ClusterObject:
+    return make_dataclass('InternalClass',
+                          [
+                              ('Value', cls.attribute_type.Type,
+                               field(default=None)),
+                              ('descriptor', ClassVar[ClusterObjectDescriptor],
+                               field(
+                                  default=ClusterObjectDescriptor(
+                                      Fields=[ClusterObjectFieldDescriptor(
+                                          Label='Value', Tag=0, Type=cls.attribute_type.Type)]
                                   )
-                              ],
-                              bases=(ClusterObject,))
+                              )
+                              )
+                          ],
+                          bases=(ClusterObject,))
 
 
 class ClusterEvent(ClusterObject):
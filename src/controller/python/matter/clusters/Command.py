@@ -17,9 +17,7 @@
 
 import builtins
 import ctypes
-import inspect
 import logging
-import sys
 from asyncio.futures import Future
 from ctypes import CFUNCTYPE, POINTER, c_bool, c_char_p, c_size_t, c_uint8, c_uint16, c_uint32, c_void_p, cast, py_object
 from dataclasses import dataclass
@@ -29,8 +27,8 @@ from ..interaction_model import InteractionModelError, PyInvokeRequestData
 from ..interaction_model import Status as InteractionModelStatus
 from ..interaction_model import TestOnlyPyBatchCommandsOverrides, TestOnlyPyOnDoneInfo
 from ..native import GetLibraryHandle, NativeLibraryHandleMethodArguments, PyChipError
-from . import Objects as GeneratedObjects  # noqa: F401
-from .ClusterObjects import ClusterCommand
+from .ClusterObjects import ALL_ACCEPTED_COMMANDS, ALL_GENERATED_COMMANDS, ClusterCommand
+from .ObjectsIndex import ACCEPTED_COMMAND_NAMES, GENERATED_COMMAND_NAMES
 
 logger = logging.getLogger('matter.cluster.Command')
 logger.setLevel(logging.ERROR)
@@ -70,18 +68,15 @@ def FindCommandClusterObject(isClientSideCommand: bool, path: CommandPath):
 
         Returns the type of the cluster object if one is found. Otherwise, returns None.
     '''
-    for clusterName, obj in inspect.getmembers(sys.modules['matter.clusters.Objects']):
-        if ('matter.clusters.Objects' in str(obj)) and inspect.isclass(obj):
-            for objName, subclass in inspect.getmembers(obj):
-                if inspect.isclass(subclass) and (('Commands') in str(subclass)):
-                    for commandName, command in inspect.getmembers(subclass):
-                        if inspect.isclass(command):
-                            for name, field in inspect.getmembers(command):
-                                if ('__dataclass_fields__' in name):
-                                    if (field['cluster_id'].default == path.ClusterId) and (field['command_id'].default ==
-                                                                                            path.CommandId) and (field['is_client'].default == isClientSideCommand):
-                                        return eval('GeneratedObjects.' + clusterName + '.Commands.' + commandName)
-    return None
+    if isClientSideCommand:
+        commandNames, commands = ACCEPTED_COMMAND_NAMES, ALL_ACCEPTED_COMMANDS
+    else:
+        commandNames, commands = GENERATED_COMMAND_NAMES, ALL_GENERATED_COMMANDS
+
+    # Check the generated index first, so unknown commands do not require loading the generated cluster objects.
+    if path.CommandId not in commandNames.get(path.ClusterId, {}):
+        return None
+    return commands.get(path.ClusterId, {}).get(path.CommandId)
 
 
 class AsyncCommandTransaction:
@@ -143,10 +138,11 @@ class AsyncCommandTransaction:
 
 
 class AsyncBatchCommandsTransaction:
-    def __init__(self, future: Future, eventLoop, expectTypes: List[Type]):
+    def __init__(self, future: Future, eventLoop, expectTypes: List[Type], returnDecodeErrors: bool = False):
         self._event_loop = eventLoop
         self._future = future
         self._expect_types = expectTypes
+        self._return_decode_errors = returnDecodeErrors
         default_im_failure = InteractionModelError(
             InteractionModelStatus.NoCommandResponse)
         self._responses = [default_im_failure] * len(expectTypes)
@@ -175,8 +171,14 @@ class AsyncBatchCommandsTransaction:
                     # add it to the except block below. We changed Exception->AttributeError as
                     # that is what we thought we are trying to catch here.
                     self._responses[index] = self._expect_types[index].FromTLV(response)
-                except AttributeError as ex:
-                    self._handleError(status, 0, ex)
+                except Exception as ex:
+                    if self._return_decode_errors:
+                        # Only the command whose response failed to decode fails.
+                        self._responses[index] = ex
+                    elif isinstance(ex, AttributeError):
+                        self._handleError(status, 0, ex)
+                    else:
+                        raise
             else:
                 self._responses[index] = None
 
@@ -356,7 +358,8 @@ def _BuildPyInvokeRequestData(commands: List[InvokeRequestInfo], timedRequestTim
 
 async def SendBatchCommands(future: Future, eventLoop, device, commands: List[InvokeRequestInfo],
                             timedRequestTimeoutMs: Optional[int] = None, interactionTimeoutMs: Optional[int] = None,
-                            busyWaitMs: Optional[int] = None, suppressResponse: Optional[bool] = None) -> PyChipError:
+                            busyWaitMs: Optional[int] = None, suppressResponse: Optional[bool] = None,
+                            returnDecodeErrors: bool = False) -> PyChipError:
     ''' Initiates an InvokeInteraction with the batch commands provided.
 
     Arguments:
@@ -365,6 +368,8 @@ async def SendBatchCommands(future: Future, eventLoop, device, commands: List[In
           CHIP_ERROR_TIMEOUT if a response is not received within the specified timeout. If not provided,
           a suitable value will be automatically computed based on transport characteristics and
           receiver responsiveness.
+        - returnDecodeErrors: If True, a response which fails to decode is returned as the exception raised
+          by its decoding, in place of the response, instead of failing the whole batch.
 
     Returns:
         - PyChipError: Indicates the outcome of initiating the InvokeRequest. Upon success the caller
@@ -379,6 +384,7 @@ async def SendBatchCommands(future: Future, eventLoop, device, commands: List[In
                 - interaction_model.Status.*: Command failure with IM Status.
                 - interaction_model.Status.NoCommandResponse: No response from the server for
                   a specific command.
+                - Exception: The response failed to decode, with returnDecodeErrors.
         - Non-path-specific error: An `InteractionModelError` exception is raised through the future.
     '''
     handle = GetLibraryHandle()
@@ -386,7 +392,7 @@ async def SendBatchCommands(future: Future, eventLoop, device, commands: List[In
     responseTypes: List[Type] = []
     pyBatchCommandsData = _BuildPyInvokeRequestData(commands, timedRequestTimeoutMs, responseTypes)
 
-    transaction = AsyncBatchCommandsTransaction(future, eventLoop, responseTypes)
+    transaction = AsyncBatchCommandsTransaction(future, eventLoop, responseTypes, returnDecodeErrors)
     ctypes.pythonapi.Py_IncRef(ctypes.py_object(transaction))
 
     return await builtins.chipStack.CallAsyncWithResult(
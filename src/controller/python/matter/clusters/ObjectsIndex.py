@@ -0,0 +1,3822 @@
+'''
+/*
+ *
+ *    Copyright (c) 2022 Project CHIP Authors
+ *
+ *    Licensed under the Apache License, Version 2.0 (the "License");
+ *    you may not use this file except in compliance with the License.
+ *    You may obtain a copy of the License at
+ *
+ *        http://www.apache.org/licenses/LICENSE-2.0
+ *
+ *    Unless required by applicable law or agreed to in writing, software
+ *    distributed under the License is distributed on an "AS IS" BASIS,
+ *    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *    See the License for the specific language governing permissions and
+ *    limitations under the License.
+ */
+
+// THIS FILE IS GENERATED BY ZAP
+'''
+
+# This file contains a generated index from cluster, attribute, event and command IDs to the names
+# of the generated cluster objects in Objects.py. It is used to resolve IDs without importing Objects.py,
+# which is only loaded once a cluster object is actually used.
+
+__all__ = [
+    "CLUSTER_NAMES",
+    "ATTRIBUTE_NAMES",
+    "EVENT_NAMES",
+    "ACCEPTED_COMMAND_NAMES",
+    "GENERATED_COMMAND_NAMES",
+]
+
+CLUSTER_NAMES = {
+    0x00000003: "Identify",
+    0x00000004: "Groups",
+    0x00000006: "OnOff",
+    0x00000008: "LevelControl",
+    0x0000001C: "PulseWidthModulation",
+    0x0000001D: "Descriptor",
+    0x0000001E: "Binding",
+    0x0000001F: "AccessControl",
+    0x00000025: "Actions",
+    0x00000028: "BasicInformation",
+    0x00000029: "OtaSoftwareUpdateProvider",
+    0x0000002A: "OtaSoftwareUpdateRequestor",
+    0x0000002B: "LocalizationConfiguration",
+    0x0000002C: "TimeFormatLocalization",
+    0x0000002D: "UnitLocalization",
+    0x0000002E: "PowerSourceConfiguration",
+    0x0000002F: "PowerSource",
+    0x00000030: "GeneralCommissioning",
+    0x00000031: "NetworkCommissioning",
+    0x00000032: "DiagnosticLogs",
+    0x00000033: "GeneralDiagnostics",
+    0x00000034: "SoftwareDiagnostics",
+    0x00000035: "ThreadNetworkDiagnostics",
+    0x00000036: "WiFiNetworkDiagnostics",
+    0x00000037: "EthernetNetworkDiagnostics",
+    0x00000038: "TimeSynchronization",
+    0x00000039: "BridgedDeviceBasicInformation",
+    0x0000003B: "Switch",
+    0x0000003C: "AdministratorCommissioning",
+    0x0000003E: "OperationalCredentials",
+    0x0000003F: "GroupKeyManagement",
+    0x00000040: "FixedLabel",
+    0x00000041: "UserLabel",
+    0x00000042: "ProxyConfiguration",
+    0x00000043: "ProxyDiscovery",
+    0x00000044: "ProxyValid",
+    0x00000045: "BooleanState",
+    0x00000046: "IcdManagement",
+    0x00000047: "Timer",
+    0x00000048: "OvenCavityOperationalState",
+    0x00000049: "OvenMode",
+    0x0000004A: "LaundryDryerControls",
+    0x00000050: "ModeSelect",
+    0x00000051: "LaundryWasherMode",
+    0x00000052: "RefrigeratorAndTemperatureControlledCabinetMode",
+    0x00000053: "LaundryWasherControls",
+    0x00000054: "RvcRunMode",
+    0x00000055: "RvcCleanMode",
+    0x00000056: "TemperatureControl",
+    0x00000057: "RefrigeratorAlarm",
+    0x00000059: "DishwasherMode",
+    0x0000005B: "AirQuality",
+    0x0000005C: "SmokeCoAlarm",
+    0x0000005D: "DishwasherAlarm",
+    0x0000005E: "MicrowaveOvenMode",
+    0x0000005F: "MicrowaveOvenControl",
+    0x00000060: "OperationalState",
+    0x00000061: "RvcOperationalState",
+    0x00000062: "ScenesManagement",
+    0x00000065: "Groupcast",
+    0x00000071: "HepaFilterMonitoring",
+    0x00000072: "ActivatedCarbonFilterMonitoring",
+    0x00000080: "BooleanStateConfiguration",
+    0x00000081: "ValveConfigurationAndControl",
+    0x00000090: "ElectricalPowerMeasurement",
+    0x00000091: "ElectricalEnergyMeasurement",
+    0x00000094: "WaterHeaterManagement",
+    0x00000095: "CommodityPrice",
+    0x00000097: "Messages",
+    0x00000098: "DeviceEnergyManagement",
+    0x00000099: "EnergyEvse",
+    0x0000009B: "EnergyPreference",
+    0x0000009C: "PowerTopology",
+    0x0000009D: "EnergyEvseMode",
+    0x0000009E: "WaterHeaterMode",
+    0x0000009F: "DeviceEnergyManagementMode",
+    0x000000A0: "ElectricalGridConditions",
+    0x00000101: "DoorLock",
+    0x00000102: "WindowCovering",
+    0x00000104: "ClosureControl",
+    0x00000105: "ClosureDimension",
+    0x00000150: "ServiceArea",
+    0x00000200: "PumpConfigurationAndControl",
+    0x00000201: "Thermostat",
+    0x00000202: "FanControl",
+    0x00000204: "ThermostatUserInterfaceConfiguration",
+    0x00000300: "ColorControl",
+    0x00000301: "BallastConfiguration",
+    0x00000400: "IlluminanceMeasurement",
+    0x00000402: "TemperatureMeasurement",
+    0x00000403: "PressureMeasurement",
+    0x00000404: "FlowMeasurement",
+    0x00000405: "RelativeHumidityMeasurement",
+    0x00000406: "OccupancySensing",
+    0x0000040C: "CarbonMonoxideConcentrationMeasurement",
+    0x0000040D: "CarbonDioxideConcentrationMeasurement",
+    0x00000413: "NitrogenDioxideConcentrationMeasurement",
+    0x00000415: "OzoneConcentrationMeasurement",
+    0x0000042A: "Pm25ConcentrationMeasurement",
+    0x0000042B: "FormaldehydeConcentrationMeasurement",
+    0x0000042C: "Pm1ConcentrationMeasurement",
+    0x0000042D: "Pm10ConcentrationMeasurement",
+    0x0000042E: "TotalVolatileOrganicCompoundsConcentrationMeasurement",
+    0x0000042F: "RadonConcentrationMeasurement",
+    0x00000430: "SoilMeasurement",
+    0x00000451: "WiFiNetworkManagement",
+    0x00000452: "ThreadBorderRouterManagement",
+    0x00000453: "ThreadNetworkDirectory",
+    0x00000503: "WakeOnLan",
+    0x00000504: "Channel",
+    0x00000505: "TargetNavigator",
+    0x00000506: "MediaPlayback",
+    0x00000507: "MediaInput",
+    0x00000508: "LowPower",
+    0x00000509: "KeypadInput",
+    0x0000050A: "ContentLauncher",
+    0x0000050B: "AudioOutput",
+    0x0000050C: "ApplicationLauncher",
+    0x0000050D: "ApplicationBasic",
+    0x0000050E: "AccountLogin",
+    0x0000050F: "ContentControl",
+    0x00000510: "ContentAppObserver",
+    0x00000550: "ZoneManagement",
+    0x00000551: "CameraAvStreamManagement",
+    0x00000552: "CameraAvSettingsUserLevelManagement",
+    0x00000553: "WebRTCTransportProvider",
+    0x00000554: "WebRTCTransportRequestor",
+    0x00000555: "PushAvStreamTransport",
+    0x00000556: "Chime",
+    0x00000700: "CommodityTariff",
+    0x00000750: "EcosystemInformation",
+    0x00000751: "CommissionerControl",
+    0x00000752: "JointFabricDatastore",
+    0x00000753: "JointFabricAdministrator",
+    0x00000801: "TlsCertificateManagement",
+    0x00000802: "TlsClientManagement",
+    0x00000B06: "MeterIdentification",
+    0x00000B07: "CommodityMetering",
+    0xFFF1FC05: "UnitTesting",
+    0xFFF1FC06: "FaultInjection",
+    0xFFF1FC20: "SampleMei",
+}
+
+ATTRIBUTE_NAMES = {
+    0x00000003: {
+        0x00000000: "IdentifyTime",
+        0x00000001: "IdentifyType",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000004: {
+        0x00000000: "NameSupport",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000006: {
+        0x00000000: "OnOff",
+        0x00004000: "GlobalSceneControl",
+        0x00004001: "OnTime",
+        0x00004002: "OffWaitTime",
+        0x00004003: "StartUpOnOff",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000008: {
+        0x00000000: "CurrentLevel",
+        0x00000001: "RemainingTime",
+        0x00000002: "MinLevel",
+        0x00000003: "MaxLevel",
+        0x00000004: "CurrentFrequency",
+        0x00000005: "MinFrequency",
+        0x00000006: "MaxFrequency",
+        0x0000000F: "Options",
+        0x00000010: "OnOffTransitionTime",
+        0x00000011: "OnLevel",
+        0x00000012: "OnTransitionTime",
+        0x00000013: "OffTransitionTime",
+        0x00000014: "DefaultMoveRate",
+        0x00004000: "StartUpCurrentLevel",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x0000001C: {
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x0000001D: {
+        0x00000000: "DeviceTypeList",
+        0x00000001: "ServerList",
+        0x00000002: "ClientList",
+        0x00000003: "PartsList",
+        0x00000004: "TagList",
+        0x00000005: "EndpointUniqueID",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x0000001E: {
+        0x00000000: "Binding",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x0000001F: {
+        0x00000000: "Acl",
+        0x00000001: "Extension",
+        0x00000002: "SubjectsPerAccessControlEntry",
+        0x00000003: "TargetsPerAccessControlEntry",
+        0x00000004: "AccessControlEntriesPerFabric",
+        0x00000005: "CommissioningARL",
+        0x00000006: "Arl",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000025: {
+        0x00000000: "ActionList",
+        0x00000001: "EndpointLists",
+        0x00000002: "SetupURL",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000028: {
+        0x00000000: "DataModelRevision",
+        0x00000001: "VendorName",
+        0x00000002: "VendorID",
+        0x00000003: "ProductName",
+        0x00000004: "ProductID",
+        0x00000005: "NodeLabel",
+        0x00000006: "Location",
+        0x00000007: "HardwareVersion",
+        0x00000008: "HardwareVersionString",
+        0x00000009: "SoftwareVersion",
+        0x0000000A: "SoftwareVersionString",
+        0x0000000B: "ManufacturingDate",
+        0x0000000C: "PartNumber",
+        0x0000000D: "ProductURL",
+        0x0000000E: "ProductLabel",
+        0x0000000F: "SerialNumber",
+        0x00000010: "LocalConfigDisabled",
+        0x00000011: "Reachable",
+        0x00000012: "UniqueID",
+        0x00000013: "CapabilityMinima",
+        0x00000014: "ProductAppearance",
+        0x00000015: "SpecificationVersion",
+        0x00000016: "MaxPathsPerInvoke",
+        0x00000018: "ConfigurationVersion",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000029: {
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x0000002A: {
+        0x00000000: "DefaultOTAProviders",
+        0x00000001: "UpdatePossible",
+        0x00000002: "UpdateState",
+        0x00000003: "UpdateStateProgress",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x0000002B: {
+        0x00000000: "ActiveLocale",
+        0x00000001: "SupportedLocales",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x0000002C: {
+        0x00000000: "HourFormat",
+        0x00000001: "ActiveCalendarType",
+        0x00000002: "SupportedCalendarTypes",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x0000002D: {
+        0x00000000: "TemperatureUnit",
+        0x00000001: "SupportedTemperatureUnits",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x0000002E: {
+        0x00000000: "Sources",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x0000002F: {
+        0x00000000: "Status",
+        0x00000001: "Order",
+        0x00000002: "Description",
+        0x00000003: "WiredAssessedInputVoltage",
+        0x00000004: "WiredAssessedInputFrequency",
+        0x00000005: "WiredCurrentType",
+        0x00000006: "WiredAssessedCurrent",
+        0x00000007: "WiredNominalVoltage",
+        0x00000008: "WiredMaximumCurrent",
+        0x00000009: "WiredPresent",
+        0x0000000A: "ActiveWiredFaults",
+        0x0000000B: "BatVoltage",
+        0x0000000C: "BatPercentRemaining",
+        0x0000000D: "BatTimeRemaining",
+        0x0000000E: "BatChargeLevel",
+        0x0000000F: "BatReplacementNeeded",
+        0x00000010: "BatReplaceability",
+        0x00000011: "BatPresent",
+        0x00000012: "ActiveBatFaults",
+        0x00000013: "BatReplacementDescription",
+        0x00000014: "BatCommonDesignation",
+        0x00000015: "BatANSIDesignation",
+        0x00000016: "BatIECDesignation",
+        0x00000017: "BatApprovedChemistry",
+        0x00000018: "BatCapacity",
+        0x00000019: "BatQuantity",
+        0x0000001A: "BatChargeState",
+        0x0000001B: "BatTimeToFullCharge",
+        0x0000001C: "BatFunctionalWhileCharging",
+        0x0000001D: "BatChargingCurrent",
+        0x0000001E: "ActiveBatChargeFaults",
+        0x0000001F: "EndpointList",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000030: {
+        0x00000000: "Breadcrumb",
+        0x00000001: "BasicCommissioningInfo",
+        0x00000002: "RegulatoryConfig",
+        0x00000003: "LocationCapability",
+        0x00000004: "SupportsConcurrentConnection",
+        0x00000005: "TCAcceptedVersion",
+        0x00000006: "TCMinRequiredVersion",
+        0x00000007: "TCAcknowledgements",
+        0x00000008: "TCAcknowledgementsRequired",
+        0x00000009: "TCUpdateDeadline",
+        0x0000000A: "RecoveryIdentifier",
+        0x0000000B: "NetworkRecoveryReason",
+        0x0000000C: "IsCommissioningWithoutPower",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000031: {
+        0x00000000: "MaxNetworks",
+        0x00000001: "Networks",
+        0x00000002: "ScanMaxTimeSeconds",
+        0x00000003: "ConnectMaxTimeSeconds",
+        0x00000004: "InterfaceEnabled",
+        0x00000005: "LastNetworkingStatus",
+        0x00000006: "LastNetworkID",
+        0x00000007: "LastConnectErrorValue",
+        0x00000008: "SupportedWiFiBands",
+        0x00000009: "SupportedThreadFeatures",
+        0x0000000A: "ThreadVersion",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000032: {
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000033: {
+        0x00000000: "NetworkInterfaces",
+        0x00000001: "RebootCount",
+        0x00000002: "UpTime",
+        0x00000003: "TotalOperationalHours",
+        0x00000004: "BootReason",
+        0x00000005: "ActiveHardwareFaults",
+        0x00000006: "ActiveRadioFaults",
+        0x00000007: "ActiveNetworkFaults",
+        0x00000008: "TestEventTriggersEnabled",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000034: {
+        0x00000000: "ThreadMetrics",
+        0x00000001: "CurrentHeapFree",
+        0x00000002: "CurrentHeapUsed",
+        0x00000003: "CurrentHeapHighWatermark",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000035: {
+        0x00000000: "Channel",
+        0x00000001: "RoutingRole",
+        0x00000002: "NetworkName",
+        0x00000003: "PanId",
+        0x00000004: "ExtendedPanId",
+        0x00000005: "MeshLocalPrefix",
+        0x00000006: "OverrunCount",
+        0x00000007: "NeighborTable",
+        0x00000008: "RouteTable",
+        0x00000009: "PartitionId",
+        0x0000000A: "Weighting",
+        0x0000000B: "DataVersion",
+        0x0000000C: "StableDataVersion",
+        0x0000000D: "LeaderRouterId",
+        0x0000000E: "DetachedRoleCount",
+        0x0000000F: "ChildRoleCount",
+        0x00000010: "RouterRoleCount",
+        0x00000011: "LeaderRoleCount",
+        0x00000012: "AttachAttemptCount",
+        0x00000013: "PartitionIdChangeCount",
+        0x00000014: "BetterPartitionAttachAttemptCount",
+        0x00000015: "ParentChangeCount",
+        0x00000016: "TxTotalCount",
+        0x00000017: "TxUnicastCount",
+        0x00000018: "TxBroadcastCount",
+        0x00000019: "TxAckRequestedCount",
+        0x0000001A: "TxAckedCount",
+        0x0000001B: "TxNoAckRequestedCount",
+        0x0000001C: "TxDataCount",
+        0x0000001D: "TxDataPollCount",
+        0x0000001E: "TxBeaconCount",
+        0x0000001F: "TxBeaconRequestCount",
+        0x00000020: "TxOtherCount",
+        0x00000021: "TxRetryCount",
+        0x00000022: "TxDirectMaxRetryExpiryCount",
+        0x00000023: "TxIndirectMaxRetryExpiryCount",
+        0x00000024: "TxErrCcaCount",
+        0x00000025: "TxErrAbortCount",
+        0x00000026: "TxErrBusyChannelCount",
+        0x00000027: "RxTotalCount",
+        0x00000028: "RxUnicastCount",
+        0x00000029: "RxBroadcastCount",
+        0x0000002A: "RxDataCount",
+        0x0000002B: "RxDataPollCount",
+        0x0000002C: "RxBeaconCount",
+        0x0000002D: "RxBeaconRequestCount",
+        0x0000002E: "RxOtherCount",
+        0x0000002F: "RxAddressFilteredCount",
+        0x00000030: "RxDestAddrFilteredCount",
+        0x00000031: "RxDuplicatedCount",
+        0x00000032: "RxErrNoFrameCount",
+        0x00000033: "RxErrUnknownNeighborCount",
+        0x00000034: "RxErrInvalidSrcAddrCount",
+        0x00000035: "RxErrSecCount",
+        0x00000036: "RxErrFcsCount",
+        0x00000037: "RxErrOtherCount",
+        0x00000038: "ActiveTimestamp",
+        0x00000039: "PendingTimestamp",
+        0x0000003A: "Delay",
+        0x0000003B: "SecurityPolicy",
+        0x0000003C: "ChannelPage0Mask",
+        0x0000003D: "OperationalDatasetComponents",
+        0x0000003E: "ActiveNetworkFaultsList",
+        0x0000003F: "ExtAddress",
+        0x00000040: "Rloc16",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000036: {
+        0x00000000: "Bssid",
+        0x00000001: "SecurityType",
+        0x00000002: "WiFiVersion",
+        0x00000003: "ChannelNumber",
+        0x00000004: "Rssi",
+        0x00000005: "BeaconLostCount",
+        0x00000006: "BeaconRxCount",
+        0x00000007: "PacketMulticastRxCount",
+        0x00000008: "PacketMulticastTxCount",
+        0x00000009: "PacketUnicastRxCount",
+        0x0000000A: "PacketUnicastTxCount",
+        0x0000000B: "CurrentMaxRate",
+        0x0000000C: "OverrunCount",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000037: {
+        0x00000000: "PHYRate",
+        0x00000001: "FullDuplex",
+        0x00000002: "PacketRxCount",
+        0x00000003: "PacketTxCount",
+        0x00000004: "TxErrCount",
+        0x00000005: "CollisionCount",
+        0x00000006: "OverrunCount",
+        0x00000007: "CarrierDetect",
+        0x00000008: "TimeSinceReset",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000038: {
+        0x00000000: "UTCTime",
+        0x00000001: "Granularity",
+        0x00000002: "TimeSource",
+        0x00000003: "TrustedTimeSource",
+        0x00000004: "DefaultNTP",
+        0x00000005: "TimeZone",
+        0x00000006: "DSTOffset",
+        0x00000007: "LocalTime",
+        0x00000008: "TimeZoneDatabase",
+        0x00000009: "NTPServerAvailable",
+        0x0000000A: "TimeZoneListMaxSize",
+        0x0000000B: "DSTOffsetListMaxSize",
+        0x0000000C: "SupportsDNSResolve",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000039: {
+        0x00000001: "VendorName",
+        0x00000002: "VendorID",
+        0x00000003: "ProductName",
+        0x00000004: "ProductID",
+        0x00000005: "NodeLabel",
+        0x00000007: "HardwareVersion",
+        0x00000008: "HardwareVersionString",
+        0x00000009: "SoftwareVersion",
+        0x0000000A: "SoftwareVersionString",
+        0x0000000B: "ManufacturingDate",
+        0x0000000C: "PartNumber",
+        0x0000000D: "ProductURL",
+        0x0000000E: "ProductLabel",
+        0x0000000F: "SerialNumber",
+        0x00000011: "Reachable",
+        0x00000012: "UniqueID",
+        0x00000014: "ProductAppearance",
+        0x00000018: "ConfigurationVersion",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x0000003B: {
+        0x00000000: "NumberOfPositions",
+        0x00000001: "CurrentPosition",
+        0x00000002: "MultiPressMax",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x0000003C: {
+        0x00000000: "WindowStatus",
+        0x00000001: "AdminFabricIndex",
+        0x00000002: "AdminVendorId",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x0000003E: {
+        0x00000000: "NOCs",
+        0x00000001: "Fabrics",
+        0x00000002: "SupportedFabrics",
+        0x00000003: "CommissionedFabrics",
+        0x00000004: "TrustedRootCertificates",
+        0x00000005: "CurrentFabricIndex",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x0000003F: {
+        0x00000000: "GroupKeyMap",
+        0x00000001: "GroupTable",
+        0x00000002: "MaxGroupsPerFabric",
+        0x00000003: "MaxGroupKeysPerFabric",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000040: {
+        0x00000000: "LabelList",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000041: {
+        0x00000000: "LabelList",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000042: {
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000043: {
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000044: {
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000045: {
+        0x00000000: "StateValue",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000046: {
+        0x00000000: "IdleModeDuration",
+        0x00000001: "ActiveModeDuration",
+        0x00000002: "ActiveModeThreshold",
+        0x00000003: "RegisteredClients",
+        0x00000004: "ICDCounter",
+        0x00000005: "ClientsSupportedPerFabric",
+        0x00000006: "UserActiveModeTriggerHint",
+        0x00000007: "UserActiveModeTriggerInstruction",
+        0x00000008: "OperatingMode",
+        0x00000009: "MaximumCheckInBackOff",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000047: {
+        0x00000000: "SetTime",
+        0x00000001: "TimeRemaining",
+        0x00000002: "TimerState",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000048: {
+        0x00000000: "PhaseList",
+        0x00000001: "CurrentPhase",
+        0x00000002: "CountdownTime",
+        0x00000003: "OperationalStateList",
+        0x00000004: "OperationalState",
+        0x00000005: "OperationalError",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000049: {
+        0x00000000: "SupportedModes",
+        0x00000001: "CurrentMode",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x0000004A: {
+        0x00000000: "SupportedDrynessLevels",
+        0x00000001: "SelectedDrynessLevel",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000050: {
+        0x00000000: "Description",
+        0x00000001: "StandardNamespace",
+        0x00000002: "SupportedModes",
+        0x00000003: "CurrentMode",
+        0x00000004: "StartUpMode",
+        0x00000005: "OnMode",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000051: {
+        0x00000000: "SupportedModes",
+        0x00000001: "CurrentMode",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000052: {
+        0x00000000: "SupportedModes",
+        0x00000001: "CurrentMode",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000053: {
+        0x00000000: "SpinSpeeds",
+        0x00000001: "SpinSpeedCurrent",
+        0x00000002: "NumberOfRinses",
+        0x00000003: "SupportedRinses",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000054: {
+        0x00000000: "SupportedModes",
+        0x00000001: "CurrentMode",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000055: {
+        0x00000000: "SupportedModes",
+        0x00000001: "CurrentMode",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000056: {
+        0x00000000: "TemperatureSetpoint",
+        0x00000001: "MinTemperature",
+        0x00000002: "MaxTemperature",
+        0x00000003: "Step",
+        0x00000004: "SelectedTemperatureLevel",
+        0x00000005: "SupportedTemperatureLevels",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000057: {
+        0x00000000: "Mask",
+        0x00000002: "State",
+        0x00000003: "Supported",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000059: {
+        0x00000000: "SupportedModes",
+        0x00000001: "CurrentMode",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x0000005B: {
+        0x00000000: "AirQuality",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x0000005C: {
+        0x00000000: "ExpressedState",
+        0x00000001: "SmokeState",
+        0x00000002: "COState",
+        0x00000003: "BatteryAlert",
+        0x00000004: "DeviceMuted",
+        0x00000005: "TestInProgress",
+        0x00000006: "HardwareFaultAlert",
+        0x00000007: "EndOfServiceAlert",
+        0x00000008: "InterconnectSmokeAlarm",
+        0x00000009: "InterconnectCOAlarm",
+        0x0000000A: "ContaminationState",
+        0x0000000B: "SmokeSensitivityLevel",
+        0x0000000C: "ExpiryDate",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x0000005D: {
+        0x00000000: "Mask",
+        0x00000001: "Latch",
+        0x00000002: "State",
+        0x00000003: "Supported",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x0000005E: {
+        0x00000000: "SupportedModes",
+        0x00000001: "CurrentMode",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x0000005F: {
+        0x00000000: "CookTime",
+        0x00000001: "MaxCookTime",
+        0x00000002: "PowerSetting",
+        0x00000003: "MinPower",
+        0x00000004: "MaxPower",
+        0x00000005: "PowerStep",
+        0x00000006: "SupportedWatts",
+        0x00000007: "SelectedWattIndex",
+        0x00000008: "WattRating",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000060: {
+        0x00000000: "PhaseList",
+        0x00000001: "CurrentPhase",
+        0x00000002: "CountdownTime",
+        0x00000003: "OperationalStateList",
+        0x00000004: "OperationalState",
+        0x00000005: "OperationalError",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000061: {
+        0x00000000: "PhaseList",
+        0x00000001: "CurrentPhase",
+        0x00000002: "CountdownTime",
+        0x00000003: "OperationalStateList",
+        0x00000004: "OperationalState",
+        0x00000005: "OperationalError",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000062: {
+        0x00000001: "SceneTableSize",
+        0x00000002: "FabricSceneInfo",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000065: {
+        0x00000000: "Membership",
+        0x00000001: "MaxMembershipCount",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000071: {
+        0x00000000: "Condition",
+        0x00000001: "DegradationDirection",
+        0x00000002: "ChangeIndication",
+        0x00000003: "InPlaceIndicator",
+        0x00000004: "LastChangedTime",
+        0x00000005: "ReplacementProductList",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000072: {
+        0x00000000: "Condition",
+        0x00000001: "DegradationDirection",
+        0x00000002: "ChangeIndication",
+        0x00000003: "InPlaceIndicator",
+        0x00000004: "LastChangedTime",
+        0x00000005: "ReplacementProductList",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000080: {
+        0x00000000: "CurrentSensitivityLevel",
+        0x00000001: "SupportedSensitivityLevels",
+        0x00000002: "DefaultSensitivityLevel",
+        0x00000003: "AlarmsActive",
+        0x00000004: "AlarmsSuppressed",
+        0x00000005: "AlarmsEnabled",
+        0x00000006: "AlarmsSupported",
+        0x00000007: "SensorFault",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000081: {
+        0x00000000: "OpenDuration",
+        0x00000001: "DefaultOpenDuration",
+        0x00000002: "AutoCloseTime",
+        0x00000003: "RemainingDuration",
+        0x00000004: "CurrentState",
+        0x00000005: "TargetState",
+        0x00000006: "CurrentLevel",
+        0x00000007: "TargetLevel",
+        0x00000008: "DefaultOpenLevel",
+        0x00000009: "ValveFault",
+        0x0000000A: "LevelStep",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000090: {
+        0x00000000: "PowerMode",
+        0x00000001: "NumberOfMeasurementTypes",
+        0x00000002: "Accuracy",
+        0x00000003: "Ranges",
+        0x00000004: "Voltage",
+        0x00000005: "ActiveCurrent",
+        0x00000006: "ReactiveCurrent",
+        0x00000007: "ApparentCurrent",
+        0x00000008: "ActivePower",
+        0x00000009: "ReactivePower",
+        0x0000000A: "ApparentPower",
+        0x0000000B: "RMSVoltage",
+        0x0000000C: "RMSCurrent",
+        0x0000000D: "RMSPower",
+        0x0000000E: "Frequency",
+        0x0000000F: "HarmonicCurrents",
+        0x00000010: "HarmonicPhases",
+        0x00000011: "PowerFactor",
+        0x00000012: "NeutralCurrent",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000091: {
+        0x00000000: "Accuracy",
+        0x00000001: "CumulativeEnergyImported",
+        0x00000002: "CumulativeEnergyExported",
+        0x00000003: "PeriodicEnergyImported",
+        0x00000004: "PeriodicEnergyExported",
+        0x00000005: "CumulativeEnergyReset",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000094: {
+        0x00000000: "HeaterTypes",
+        0x00000001: "HeatDemand",
+        0x00000002: "TankVolume",
+        0x00000003: "EstimatedHeatRequired",
+        0x00000004: "TankPercentage",
+        0x00000005: "BoostState",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000095: {
+        0x00000000: "TariffUnit",
+        0x00000001: "Currency",
+        0x00000002: "CurrentPrice",
+        0x00000003: "PriceForecast",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000097: {
+        0x00000000: "Messages",
+        0x00000001: "ActiveMessageIDs",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000098: {
+        0x00000000: "ESAType",
+        0x00000001: "ESACanGenerate",
+        0x00000002: "ESAState",
+        0x00000003: "AbsMinPower",
+        0x00000004: "AbsMaxPower",
+        0x00000005: "PowerAdjustmentCapability",
+        0x00000006: "Forecast",
+        0x00000007: "OptOutState",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000099: {
+        0x00000000: "State",
+        0x00000001: "SupplyState",
+        0x00000002: "FaultState",
+        0x00000003: "ChargingEnabledUntil",
+        0x00000004: "DischargingEnabledUntil",
+        0x00000005: "CircuitCapacity",
+        0x00000006: "MinimumChargeCurrent",
+        0x00000007: "MaximumChargeCurrent",
+        0x00000008: "MaximumDischargeCurrent",
+        0x00000009: "UserMaximumChargeCurrent",
+        0x0000000A: "RandomizationDelayWindow",
+        0x00000023: "NextChargeStartTime",
+        0x00000024: "NextChargeTargetTime",
+        0x00000025: "NextChargeRequiredEnergy",
+        0x00000026: "NextChargeTargetSoC",
+        0x00000027: "ApproximateEVEfficiency",
+        0x00000030: "StateOfCharge",
+        0x00000031: "BatteryCapacity",
+        0x00000032: "VehicleID",
+        0x00000040: "SessionID",
+        0x00000041: "SessionDuration",
+        0x00000042: "SessionEnergyCharged",
+        0x00000043: "SessionEnergyDischarged",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x0000009B: {
+        0x00000000: "EnergyBalances",
+        0x00000001: "CurrentEnergyBalance",
+        0x00000002: "EnergyPriorities",
+        0x00000003: "LowPowerModeSensitivities",
+        0x00000004: "CurrentLowPowerModeSensitivity",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x0000009C: {
+        0x00000000: "AvailableEndpoints",
+        0x00000001: "ActiveEndpoints",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x0000009D: {
+        0x00000000: "SupportedModes",
+        0x00000001: "CurrentMode",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x0000009E: {
+        0x00000000: "SupportedModes",
+        0x00000001: "CurrentMode",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x0000009F: {
+        0x00000000: "SupportedModes",
+        0x00000001: "CurrentMode",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x000000A0: {
+        0x00000000: "LocalGenerationAvailable",
+        0x00000001: "CurrentConditions",
+        0x00000002: "ForecastConditions",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000101: {
+        0x00000000: "LockState",
+        0x00000001: "LockType",
+        0x00000002: "ActuatorEnabled",
+        0x00000003: "DoorState",
+        0x00000004: "DoorOpenEvents",
+        0x00000005: "DoorClosedEvents",
+        0x00000006: "OpenPeriod",
+        0x00000011: "NumberOfTotalUsersSupported",
+        0x00000012: "NumberOfPINUsersSupported",
+        0x00000013: "NumberOfRFIDUsersSupported",
+        0x00000014: "NumberOfWeekDaySchedulesSupportedPerUser",
+        0x00000015: "NumberOfYearDaySchedulesSupportedPerUser",
+        0x00000016: "NumberOfHolidaySchedulesSupported",
+        0x00000017: "MaxPINCodeLength",
+        0x00000018: "MinPINCodeLength",
+        0x00000019: "MaxRFIDCodeLength",
+        0x0000001A: "MinRFIDCodeLength",
+        0x0000001B: "CredentialRulesSupport",
+        0x0000001C: "NumberOfCredentialsSupportedPerUser",
+        0x00000021: "Language",
+        0x00000022: "LEDSettings",
+        0x00000023: "AutoRelockTime",
+        0x00000024: "SoundVolume",
+        0x00000025: "OperatingMode",
+        0x00000026: "SupportedOperatingModes",
+        0x00000027: "DefaultConfigurationRegister",
+        0x00000028: "EnableLocalProgramming",
+        0x00000029: "EnableOneTouchLocking",
+        0x0000002A: "EnableInsideStatusLED",
+        0x0000002B: "EnablePrivacyModeButton",
+        0x0000002C: "LocalProgrammingFeatures",
+        0x00000030: "WrongCodeEntryLimit",
+        0x00000031: "UserCodeTemporaryDisableTime",
+        0x00000032: "SendPINOverTheAir",
+        0x00000033: "RequirePINforRemoteOperation",
+        0x00000035: "ExpiringUserTimeout",
+        0x00000080: "AliroReaderVerificationKey",
+        0x00000081: "AliroReaderGroupIdentifier",
+        0x00000082: "AliroReaderGroupSubIdentifier",
+        0x00000083: "AliroExpeditedTransactionSupportedProtocolVersions",
+        0x00000084: "AliroGroupResolvingKey",
+        0x00000085: "AliroSupportedBLEUWBProtocolVersions",
+        0x00000086: "AliroBLEAdvertisingVersion",
+        0x00000087: "NumberOfAliroCredentialIssuerKeysSupported",
+        0x00000088: "NumberOfAliroEndpointKeysSupported",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000102: {
+        0x00000000: "Type",
+        0x00000001: "PhysicalClosedLimitLift",
+        0x00000002: "PhysicalClosedLimitTilt",
+        0x00000003: "CurrentPositionLift",
+        0x00000004: "CurrentPositionTilt",
+        0x00000005: "NumberOfActuationsLift",
+        0x00000006: "NumberOfActuationsTilt",
+        0x00000007: "ConfigStatus",
+        0x00000008: "CurrentPositionLiftPercentage",
+        0x00000009: "CurrentPositionTiltPercentage",
+        0x0000000A: "OperationalStatus",
+        0x0000000B: "TargetPositionLiftPercent100ths",
+        0x0000000C: "TargetPositionTiltPercent100ths",
+        0x0000000D: "EndProductType",
+        0x0000000E: "CurrentPositionLiftPercent100ths",
+        0x0000000F: "CurrentPositionTiltPercent100ths",
+        0x00000010: "InstalledOpenLimitLift",
+        0x00000011: "InstalledClosedLimitLift",
+        0x00000012: "InstalledOpenLimitTilt",
+        0x00000013: "InstalledClosedLimitTilt",
+        0x00000017: "Mode",
+        0x0000001A: "SafetyStatus",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000104: {
+        0x00000000: "CountdownTime",
+        0x00000001: "MainState",
+        0x00000002: "CurrentErrorList",
+        0x00000003: "OverallCurrentState",
+        0x00000004: "OverallTargetState",
+        0x00000005: "LatchControlModes",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000105: {
+        0x00000000: "CurrentState",
+        0x00000001: "TargetState",
+        0x00000002: "Resolution",
+        0x00000003: "StepValue",
+        0x00000004: "Unit",
+        0x00000005: "UnitRange",
+        0x00000006: "LimitRange",
+        0x00000007: "TranslationDirection",
+        0x00000008: "RotationAxis",
+        0x00000009: "Overflow",
+        0x0000000A: "ModulationType",
+        0x0000000B: "LatchControlModes",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000150: {
+        0x00000000: "SupportedAreas",
+        0x00000001: "SupportedMaps",
+        0x00000002: "SelectedAreas",
+        0x00000003: "CurrentArea",
+        0x00000004: "EstimatedEndTime",
+        0x00000005: "Progress",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000200: {
+        0x00000000: "MaxPressure",
+        0x00000001: "MaxSpeed",
+        0x00000002: "MaxFlow",
+        0x00000003: "MinConstPressure",
+        0x00000004: "MaxConstPressure",
+        0x00000005: "MinCompPressure",
+        0x00000006: "MaxCompPressure",
+        0x00000007: "MinConstSpeed",
+        0x00000008: "MaxConstSpeed",
+        0x00000009: "MinConstFlow",
+        0x0000000A: "MaxConstFlow",
+        0x0000000B: "MinConstTemp",
+        0x0000000C: "MaxConstTemp",
+        0x00000010: "PumpStatus",
+        0x00000011: "EffectiveOperationMode",
+        0x00000012: "EffectiveControlMode",
+        0x00000013: "Capacity",
+        0x00000014: "Speed",
+        0x00000015: "LifetimeRunningHours",
+        0x00000016: "Power",
+        0x00000017: "LifetimeEnergyConsumed",
+        0x00000020: "OperationMode",
+        0x00000021: "ControlMode",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000201: {
+        0x00000000: "LocalTemperature",
+        0x00000001: "OutdoorTemperature",
+        0x00000002: "Occupancy",
+        0x00000003: "AbsMinHeatSetpointLimit",
+        0x00000004: "AbsMaxHeatSetpointLimit",
+        0x00000005: "AbsMinCoolSetpointLimit",
+        0x00000006: "AbsMaxCoolSetpointLimit",
+        0x00000007: "PICoolingDemand",
+        0x00000008: "PIHeatingDemand",
+        0x00000009: "HVACSystemTypeConfiguration",
+        0x00000010: "LocalTemperatureCalibration",
+        0x00000011: "OccupiedCoolingSetpoint",
+        0x00000012: "OccupiedHeatingSetpoint",
+        0x00000013: "UnoccupiedCoolingSetpoint",
+        0x00000014: "UnoccupiedHeatingSetpoint",
+        0x00000015: "MinHeatSetpointLimit",
+        0x00000016: "MaxHeatSetpointLimit",
+        0x00000017: "MinCoolSetpointLimit",
+        0x00000018: "MaxCoolSetpointLimit",
+        0x00000019: "MinSetpointDeadBand",
+        0x0000001A: "RemoteSensing",
+        0x0000001B: "ControlSequenceOfOperation",
+        0x0000001C: "SystemMode",
+        0x0000001E: "ThermostatRunningMode",
+        0x00000020: "StartOfWeek",
+        0x00000021: "NumberOfWeeklyTransitions",
+        0x00000022: "NumberOfDailyTransitions",
+        0x00000023: "TemperatureSetpointHold",
+        0x00000024: "TemperatureSetpointHoldDuration",
+        0x00000025: "ThermostatProgrammingOperationMode",
+        0x00000029: "ThermostatRunningState",
+        0x00000030: "SetpointChangeSource",
+        0x00000031: "SetpointChangeAmount",
+        0x00000032: "SetpointChangeSourceTimestamp",
+        0x00000034: "OccupiedSetback",
+        0x00000035: "OccupiedSetbackMin",
+        0x00000036: "OccupiedSetbackMax",
+        0x00000037: "UnoccupiedSetback",
+        0x00000038: "UnoccupiedSetbackMin",
+        0x00000039: "UnoccupiedSetbackMax",
+        0x0000003A: "EmergencyHeatDelta",
+        0x00000040: "ACType",
+        0x00000041: "ACCapacity",
+        0x00000042: "ACRefrigerantType",
+        0x00000043: "ACCompressorType",
+        0x00000044: "ACErrorCode",
+        0x00000045: "ACLouverPosition",
+        0x00000046: "ACCoilTemperature",
+        0x00000047: "ACCapacityformat",
+        0x00000048: "PresetTypes",
+        0x00000049: "ScheduleTypes",
+        0x0000004A: "NumberOfPresets",
+        0x0000004B: "NumberOfSchedules",
+        0x0000004C: "NumberOfScheduleTransitions",
+        0x0000004D: "NumberOfScheduleTransitionPerDay",
+        0x0000004E: "ActivePresetHandle",
+        0x0000004F: "ActiveScheduleHandle",
+        0x00000050: "Presets",
+        0x00000051: "Schedules",
+        0x00000052: "SetpointHoldExpiryTimestamp",
+        0x00000053: "MaxThermostatSuggestions",
+        0x00000054: "ThermostatSuggestions",
+        0x00000055: "CurrentThermostatSuggestion",
+        0x00000056: "ThermostatSuggestionNotFollowingReason",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000202: {
+        0x00000000: "FanMode",
+        0x00000001: "FanModeSequence",
+        0x00000002: "PercentSetting",
+        0x00000003: "PercentCurrent",
+        0x00000004: "SpeedMax",
+        0x00000005: "SpeedSetting",
+        0x00000006: "SpeedCurrent",
+        0x00000007: "RockSupport",
+        0x00000008: "RockSetting",
+        0x00000009: "WindSupport",
+        0x0000000A: "WindSetting",
+        0x0000000B: "AirflowDirection",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000204: {
+        0x00000000: "TemperatureDisplayMode",
+        0x00000001: "KeypadLockout",
+        0x00000002: "ScheduleProgrammingVisibility",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000300: {
+        0x00000000: "CurrentHue",
+        0x00000001: "CurrentSaturation",
+        0x00000002: "RemainingTime",
+        0x00000003: "CurrentX",
+        0x00000004: "CurrentY",
+        0x00000005: "DriftCompensation",
+        0x00000006: "CompensationText",
+        0x00000007: "ColorTemperatureMireds",
+        0x00000008: "ColorMode",
+        0x0000000F: "Options",
+        0x00000010: "NumberOfPrimaries",
+        0x00000011: "Primary1X",
+        0x00000012: "Primary1Y",
+        0x00000013: "Primary1Intensity",
+        0x00000015: "Primary2X",
+        0x00000016: "Primary2Y",
+        0x00000017: "Primary2Intensity",
+        0x00000019: "Primary3X",
+        0x0000001A: "Primary3Y",
+        0x0000001B: "Primary3Intensity",
+        0x00000020: "Primary4X",
+        0x00000021: "Primary4Y",
+        0x00000022: "Primary4Intensity",
+        0x00000024: "Primary5X",
+        0x00000025: "Primary5Y",
+        0x00000026: "Primary5Intensity",
+        0x00000028: "Primary6X",
+        0x00000029: "Primary6Y",
+        0x0000002A: "Primary6Intensity",
+        0x00000030: "WhitePointX",
+        0x00000031: "WhitePointY",
+        0x00000032: "ColorPointRX",
+        0x00000033: "ColorPointRY",
+        0x00000034: "ColorPointRIntensity",
+        0x00000036: "ColorPointGX",
+        0x00000037: "ColorPointGY",
+        0x00000038: "ColorPointGIntensity",
+        0x0000003A: "ColorPointBX",
+        0x0000003B: "ColorPointBY",
+        0x0000003C: "ColorPointBIntensity",
+        0x00004000: "EnhancedCurrentHue",
+        0x00004001: "EnhancedColorMode",
+        0x00004002: "ColorLoopActive",
+        0x00004003: "ColorLoopDirection",
+        0x00004004: "ColorLoopTime",
+        0x00004005: "ColorLoopStartEnhancedHue",
+        0x00004006: "ColorLoopStoredEnhancedHue",
+        0x0000400A: "ColorCapabilities",
+        0x0000400B: "ColorTempPhysicalMinMireds",
+        0x0000400C: "ColorTempPhysicalMaxMireds",
+        0x0000400D: "CoupleColorTempToLevelMinMireds",
+        0x00004010: "StartUpColorTemperatureMireds",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000301: {
+        0x00000000: "PhysicalMinLevel",
+        0x00000001: "PhysicalMaxLevel",
+        0x00000002: "BallastStatus",
+        0x00000010: "MinLevel",
+        0x00000011: "MaxLevel",
+        0x00000014: "IntrinsicBallastFactor",
+        0x00000015: "BallastFactorAdjustment",
+        0x00000020: "LampQuantity",
+        0x00000030: "LampType",
+        0x00000031: "LampManufacturer",
+        0x00000032: "LampRatedHours",
+        0x00000033: "LampBurnHours",
+        0x00000034: "LampAlarmMode",
+        0x00000035: "LampBurnHoursTripPoint",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000400: {
+        0x00000000: "MeasuredValue",
+        0x00000001: "MinMeasuredValue",
+        0x00000002: "MaxMeasuredValue",
+        0x00000003: "Tolerance",
+        0x00000004: "LightSensorType",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000402: {
+        0x00000000: "MeasuredValue",
+        0x00000001: "MinMeasuredValue",
+        0x00000002: "MaxMeasuredValue",
+        0x00000003: "Tolerance",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000403: {
+        0x00000000: "MeasuredValue",
+        0x00000001: "MinMeasuredValue",
+        0x00000002: "MaxMeasuredValue",
+        0x00000003: "Tolerance",
+        0x00000010: "ScaledValue",
+        0x00000011: "MinScaledValue",
+        0x00000012: "MaxScaledValue",
+        0x00000013: "ScaledTolerance",
+        0x00000014: "Scale",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000404: {
+        0x00000000: "MeasuredValue",
+        0x00000001: "MinMeasuredValue",
+        0x00000002: "MaxMeasuredValue",
+        0x00000003: "Tolerance",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000405: {
+        0x00000000: "MeasuredValue",
+        0x00000001: "MinMeasuredValue",
+        0x00000002: "MaxMeasuredValue",
+        0x00000003: "Tolerance",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000406: {
+        0x00000000: "Occupancy",
+        0x00000001: "OccupancySensorType",
+        0x00000002: "OccupancySensorTypeBitmap",
+        0x00000003: "HoldTime",
+        0x00000004: "HoldTimeLimits",
+        0x00000010: "PIROccupiedToUnoccupiedDelay",
+        0x00000011: "PIRUnoccupiedToOccupiedDelay",
+        0x00000012: "PIRUnoccupiedToOccupiedThreshold",
+        0x00000020: "UltrasonicOccupiedToUnoccupiedDelay",
+        0x00000021: "UltrasonicUnoccupiedToOccupiedDelay",
+        0x00000022: "UltrasonicUnoccupiedToOccupiedThreshold",
+        0x00000030: "PhysicalContactOccupiedToUnoccupiedDelay",
+        0x00000031: "PhysicalContactUnoccupiedToOccupiedDelay",
+        0x00000032: "PhysicalContactUnoccupiedToOccupiedThreshold",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x0000040C: {
+        0x00000000: "MeasuredValue",
+        0x00000001: "MinMeasuredValue",
+        0x00000002: "MaxMeasuredValue",
+        0x00000003: "PeakMeasuredValue",
+        0x00000004: "PeakMeasuredValueWindow",
+        0x00000005: "AverageMeasuredValue",
+        0x00000006: "AverageMeasuredValueWindow",
+        0x00000007: "Uncertainty",
+        0x00000008: "MeasurementUnit",
+        0x00000009: "MeasurementMedium",
+        0x0000000A: "LevelValue",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x0000040D: {
+        0x00000000: "MeasuredValue",
+        0x00000001: "MinMeasuredValue",
+        0x00000002: "MaxMeasuredValue",
+        0x00000003: "PeakMeasuredValue",
+        0x00000004: "PeakMeasuredValueWindow",
+        0x00000005: "AverageMeasuredValue",
+        0x00000006: "AverageMeasuredValueWindow",
+        0x00000007: "Uncertainty",
+        0x00000008: "MeasurementUnit",
+        0x00000009: "MeasurementMedium",
+        0x0000000A: "LevelValue",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000413: {
+        0x00000000: "MeasuredValue",
+        0x00000001: "MinMeasuredValue",
+        0x00000002: "MaxMeasuredValue",
+        0x00000003: "PeakMeasuredValue",
+        0x00000004: "PeakMeasuredValueWindow",
+        0x00000005: "AverageMeasuredValue",
+        0x00000006: "AverageMeasuredValueWindow",
+        0x00000007: "Uncertainty",
+        0x00000008: "MeasurementUnit",
+        0x00000009: "MeasurementMedium",
+        0x0000000A: "LevelValue",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000415: {
+        0x00000000: "MeasuredValue",
+        0x00000001: "MinMeasuredValue",
+        0x00000002: "MaxMeasuredValue",
+        0x00000003: "PeakMeasuredValue",
+        0x00000004: "PeakMeasuredValueWindow",
+        0x00000005: "AverageMeasuredValue",
+        0x00000006: "AverageMeasuredValueWindow",
+        0x00000007: "Uncertainty",
+        0x00000008: "MeasurementUnit",
+        0x00000009: "MeasurementMedium",
+        0x0000000A: "LevelValue",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x0000042A: {
+        0x00000000: "MeasuredValue",
+        0x00000001: "MinMeasuredValue",
+        0x00000002: "MaxMeasuredValue",
+        0x00000003: "PeakMeasuredValue",
+        0x00000004: "PeakMeasuredValueWindow",
+        0x00000005: "AverageMeasuredValue",
+        0x00000006: "AverageMeasuredValueWindow",
+        0x00000007: "Uncertainty",
+        0x00000008: "MeasurementUnit",
+        0x00000009: "MeasurementMedium",
+        0x0000000A: "LevelValue",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x0000042B: {
+        0x00000000: "MeasuredValue",
+        0x00000001: "MinMeasuredValue",
+        0x00000002: "MaxMeasuredValue",
+        0x00000003: "PeakMeasuredValue",
+        0x00000004: "PeakMeasuredValueWindow",
+        0x00000005: "AverageMeasuredValue",
+        0x00000006: "AverageMeasuredValueWindow",
+        0x00000007: "Uncertainty",
+        0x00000008: "MeasurementUnit",
+        0x00000009: "MeasurementMedium",
+        0x0000000A: "LevelValue",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x0000042C: {
+        0x00000000: "MeasuredValue",
+        0x00000001: "MinMeasuredValue",
+        0x00000002: "MaxMeasuredValue",
+        0x00000003: "PeakMeasuredValue",
+        0x00000004: "PeakMeasuredValueWindow",
+        0x00000005: "AverageMeasuredValue",
+        0x00000006: "AverageMeasuredValueWindow",
+        0x00000007: "Uncertainty",
+        0x00000008: "MeasurementUnit",
+        0x00000009: "MeasurementMedium",
+        0x0000000A: "LevelValue",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x0000042D: {
+        0x00000000: "MeasuredValue",
+        0x00000001: "MinMeasuredValue",
+        0x00000002: "MaxMeasuredValue",
+        0x00000003: "PeakMeasuredValue",
+        0x00000004: "PeakMeasuredValueWindow",
+        0x00000005: "AverageMeasuredValue",
+        0x00000006: "AverageMeasuredValueWindow",
+        0x00000007: "Uncertainty",
+        0x00000008: "MeasurementUnit",
+        0x00000009: "MeasurementMedium",
+        0x0000000A: "LevelValue",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x0000042E: {
+        0x00000000: "MeasuredValue",
+        0x00000001: "MinMeasuredValue",
+        0x00000002: "MaxMeasuredValue",
+        0x00000003: "PeakMeasuredValue",
+        0x00000004: "PeakMeasuredValueWindow",
+        0x00000005: "AverageMeasuredValue",
+        0x00000006: "AverageMeasuredValueWindow",
+        0x00000007: "Uncertainty",
+        0x00000008: "MeasurementUnit",
+        0x00000009: "MeasurementMedium",
+        0x0000000A: "LevelValue",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x0000042F: {
+        0x00000000: "MeasuredValue",
+        0x00000001: "MinMeasuredValue",
+        0x00000002: "MaxMeasuredValue",
+        0x00000003: "PeakMeasuredValue",
+        0x00000004: "PeakMeasuredValueWindow",
+        0x00000005: "AverageMeasuredValue",
+        0x00000006: "AverageMeasuredValueWindow",
+        0x00000007: "Uncertainty",
+        0x00000008: "MeasurementUnit",
+        0x00000009: "MeasurementMedium",
+        0x0000000A: "LevelValue",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000430: {
+        0x00000000: "SoilMoistureMeasurementLimits",
+        0x00000001: "SoilMoistureMeasuredValue",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000451: {
+        0x00000000: "Ssid",
+        0x00000001: "PassphraseSurrogate",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000452: {
+        0x00000000: "BorderRouterName",
+        0x00000001: "BorderAgentID",
+        0x00000002: "ThreadVersion",
+        0x00000003: "InterfaceEnabled",
+        0x00000004: "ActiveDatasetTimestamp",
+        0x00000005: "PendingDatasetTimestamp",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000453: {
+        0x00000000: "PreferredExtendedPanID",
+        0x00000001: "ThreadNetworks",
+        0x00000002: "ThreadNetworkTableSize",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000503: {
+        0x00000000: "MACAddress",
+        0x00000001: "LinkLocalAddress",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000504: {
+        0x00000000: "ChannelList",
+        0x00000001: "Lineup",
+        0x00000002: "CurrentChannel",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000505: {
+        0x00000000: "TargetList",
+        0x00000001: "CurrentTarget",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000506: {
+        0x00000000: "CurrentState",
+        0x00000001: "StartTime",
+        0x00000002: "Duration",
+        0x00000003: "SampledPosition",
+        0x00000004: "PlaybackSpeed",
+        0x00000005: "SeekRangeEnd",
+        0x00000006: "SeekRangeStart",
+        0x00000007: "ActiveAudioTrack",
+        0x00000008: "AvailableAudioTracks",
+        0x00000009: "ActiveTextTrack",
+        0x0000000A: "AvailableTextTracks",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000507: {
+        0x00000000: "InputList",
+        0x00000001: "CurrentInput",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000508: {
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000509: {
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x0000050A: {
+        0x00000000: "AcceptHeader",
+        0x00000001: "SupportedStreamingProtocols",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x0000050B: {
+        0x00000000: "OutputList",
+        0x00000001: "CurrentOutput",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x0000050C: {
+        0x00000000: "CatalogList",
+        0x00000001: "CurrentApp",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x0000050D: {
+        0x00000000: "VendorName",
+        0x00000001: "VendorID",
+        0x00000002: "ApplicationName",
+        0x00000003: "ProductID",
+        0x00000004: "Application",
+        0x00000005: "Status",
+        0x00000006: "ApplicationVersion",
+        0x00000007: "AllowedVendorList",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x0000050E: {
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x0000050F: {
+        0x00000000: "Enabled",
+        0x00000001: "OnDemandRatings",
+        0x00000002: "OnDemandRatingThreshold",
+        0x00000003: "ScheduledContentRatings",
+        0x00000004: "ScheduledContentRatingThreshold",
+        0x00000005: "ScreenDailyTime",
+        0x00000006: "RemainingScreenTime",
+        0x00000007: "BlockUnrated",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000510: {
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000550: {
+        0x00000000: "MaxUserDefinedZones",
+        0x00000001: "MaxZones",
+        0x00000002: "Zones",
+        0x00000003: "Triggers",
+        0x00000004: "SensitivityMax",
+        0x00000005: "Sensitivity",
+        0x00000006: "TwoDCartesianMax",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000551: {
+        0x00000000: "MaxConcurrentEncoders",
+        0x00000001: "MaxEncodedPixelRate",
+        0x00000002: "VideoSensorParams",
+        0x00000003: "NightVisionUsesInfrared",
+        0x00000004: "MinViewportResolution",
+        0x00000005: "RateDistortionTradeOffPoints",
+        0x00000006: "MaxContentBufferSize",
+        0x00000007: "MicrophoneCapabilities",
+        0x00000008: "SpeakerCapabilities",
+        0x00000009: "TwoWayTalkSupport",
+        0x0000000A: "SnapshotCapabilities",
+        0x0000000B: "MaxNetworkBandwidth",
+        0x0000000C: "CurrentFrameRate",
+        0x0000000D: "HDRModeEnabled",
+        0x0000000E: "SupportedStreamUsages",
+        0x0000000F: "AllocatedVideoStreams",
+        0x00000010: "AllocatedAudioStreams",
+        0x00000011: "AllocatedSnapshotStreams",
+        0x00000012: "StreamUsagePriorities",
+        0x00000013: "SoftRecordingPrivacyModeEnabled",
+        0x00000014: "SoftLivestreamPrivacyModeEnabled",
+        0x00000015: "HardPrivacyModeOn",
+        0x00000016: "NightVision",
+        0x00000017: "NightVisionIllum",
+        0x00000018: "Viewport",
+        0x00000019: "SpeakerMuted",
+        0x0000001A: "SpeakerVolumeLevel",
+        0x0000001B: "SpeakerMaxLevel",
+        0x0000001C: "SpeakerMinLevel",
+        0x0000001D: "MicrophoneMuted",
+        0x0000001E: "MicrophoneVolumeLevel",
+        0x0000001F: "MicrophoneMaxLevel",
+        0x00000020: "MicrophoneMinLevel",
+        0x00000021: "MicrophoneAGCEnabled",
+        0x00000022: "ImageRotation",
+        0x00000023: "ImageFlipHorizontal",
+        0x00000024: "ImageFlipVertical",
+        0x00000025: "LocalVideoRecordingEnabled",
+        0x00000026: "LocalSnapshotRecordingEnabled",
+        0x00000027: "StatusLightEnabled",
+        0x00000028: "StatusLightBrightness",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000552: {
+        0x00000000: "MPTZPosition",
+        0x00000001: "MaxPresets",
+        0x00000002: "MPTZPresets",
+        0x00000003: "DPTZStreams",
+        0x00000004: "ZoomMax",
+        0x00000005: "TiltMin",
+        0x00000006: "TiltMax",
+        0x00000007: "PanMin",
+        0x00000008: "PanMax",
+        0x00000009: "MovementState",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000553: {
+        0x00000000: "CurrentSessions",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000554: {
+        0x00000000: "CurrentSessions",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000555: {
+        0x00000000: "SupportedFormats",
+        0x00000001: "CurrentConnections",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000556: {
+        0x00000000: "InstalledChimeSounds",
+        0x00000001: "SelectedChime",
+        0x00000002: "Enabled",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000700: {
+        0x00000000: "TariffInfo",
+        0x00000001: "TariffUnit",
+        0x00000002: "StartDate",
+        0x00000003: "DayEntries",
+        0x00000004: "DayPatterns",
+        0x00000005: "CalendarPeriods",
+        0x00000006: "IndividualDays",
+        0x00000007: "CurrentDay",
+        0x00000008: "NextDay",
+        0x00000009: "CurrentDayEntry",
+        0x0000000A: "CurrentDayEntryDate",
+        0x0000000B: "NextDayEntry",
+        0x0000000C: "NextDayEntryDate",
+        0x0000000D: "TariffComponents",
+        0x0000000E: "TariffPeriods",
+        0x0000000F: "CurrentTariffComponents",
+        0x00000010: "NextTariffComponents",
+        0x00000011: "DefaultRandomizationOffset",
+        0x00000012: "DefaultRandomizationType",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000750: {
+        0x00000000: "DeviceDirectory",
+        0x00000001: "LocationDirectory",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000751: {
+        0x00000000: "SupportedDeviceCategories",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000752: {
+        0x00000000: "AnchorRootCA",
+        0x00000001: "AnchorNodeID",
+        0x00000002: "AnchorVendorID",
+        0x00000003: "FriendlyName",
+        0x00000004: "GroupKeySetList",
+        0x00000005: "GroupList",
+        0x00000006: "NodeList",
+        0x00000007: "AdminList",
+        0x00000008: "Status",
+        0x00000009: "EndpointGroupIDList",
+        0x0000000A: "EndpointBindingList",
+        0x0000000B: "NodeKeySetList",
+        0x0000000C: "NodeACLList",
+        0x0000000D: "NodeEndpointList",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000753: {
+        0x00000000: "AdministratorFabricIndex",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000801: {
+        0x00000000: "MaxRootCertificates",
+        0x00000001: "ProvisionedRootCertificates",
+        0x00000002: "MaxClientCertificates",
+        0x00000003: "ProvisionedClientCertificates",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000802: {
+        0x00000000: "MaxProvisioned",
+        0x00000001: "ProvisionedEndpoints",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000B06: {
+        0x00000000: "MeterType",
+        0x00000001: "PointOfDelivery",
+        0x00000002: "MeterSerialNumber",
+        0x00000003: "ProtocolVersion",
+        0x00000004: "PowerThreshold",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0x00000B07: {
+        0x00000000: "MeteredQuantity",
+        0x00000001: "MeteredQuantityTimestamp",
+        0x00000002: "TariffUnit",
+        0x00000003: "MaximumMeteredQuantities",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0xFFF1FC05: {
+        0x00000000: "Boolean",
+        0x00000001: "Bitmap8",
+        0x00000002: "Bitmap16",
+        0x00000003: "Bitmap32",
+        0x00000004: "Bitmap64",
+        0x00000005: "Int8u",
+        0x00000006: "Int16u",
+        0x00000007: "Int24u",
+        0x00000008: "Int32u",
+        0x00000009: "Int40u",
+        0x0000000A: "Int48u",
+        0x0000000B: "Int56u",
+        0x0000000C: "Int64u",
+        0x0000000D: "Int8s",
+        0x0000000E: "Int16s",
+        0x0000000F: "Int24s",
+        0x00000010: "Int32s",
+        0x00000011: "Int40s",
+        0x00000012: "Int48s",
+        0x00000013: "Int56s",
+        0x00000014: "Int64s",
+        0x00000015: "Enum8",
+        0x00000016: "Enum16",
+        0x00000017: "FloatSingle",
+        0x00000018: "FloatDouble",
+        0x00000019: "OctetString",
+        0x0000001A: "ListInt8u",
+        0x0000001B: "ListOctetString",
+        0x0000001C: "ListStructOctetString",
+        0x0000001D: "LongOctetString",
+        0x0000001E: "CharString",
+        0x0000001F: "LongCharString",
+        0x00000020: "EpochUs",
+        0x00000021: "EpochS",
+        0x00000022: "VendorId",
+        0x00000023: "ListNullablesAndOptionalsStruct",
+        0x00000024: "EnumAttr",
+        0x00000025: "StructAttr",
+        0x00000026: "RangeRestrictedInt8u",
+        0x00000027: "RangeRestrictedInt8s",
+        0x00000028: "RangeRestrictedInt16u",
+        0x00000029: "RangeRestrictedInt16s",
+        0x0000002A: "ListLongOctetString",
+        0x0000002B: "ListFabricScoped",
+        0x00000030: "TimedWriteBoolean",
+        0x00000031: "GeneralErrorBoolean",
+        0x00000032: "ClusterErrorBoolean",
+        0x00000033: "GlobalEnum",
+        0x00000034: "GlobalStruct",
+        0x000000FE: "UnsupportedAttributeRequiringAdminPrivilege",
+        0x000000FF: "Unsupported",
+        0x00003000: "ReadFailureCode",
+        0x00003001: "FailureInt32U",
+        0x00004000: "NullableBoolean",
+        0x00004001: "NullableBitmap8",
+        0x00004002: "NullableBitmap16",
+        0x00004003: "NullableBitmap32",
+        0x00004004: "NullableBitmap64",
+        0x00004005: "NullableInt8u",
+        0x00004006: "NullableInt16u",
+        0x00004007: "NullableInt24u",
+        0x00004008: "NullableInt32u",
+        0x00004009: "NullableInt40u",
+        0x0000400A: "NullableInt48u",
+        0x0000400B: "NullableInt56u",
+        0x0000400C: "NullableInt64u",
+        0x0000400D: "NullableInt8s",
+        0x0000400E: "NullableInt16s",
+        0x0000400F: "NullableInt24s",
+        0x00004010: "NullableInt32s",
+        0x00004011: "NullableInt40s",
+        0x00004012: "NullableInt48s",
+        0x00004013: "NullableInt56s",
+        0x00004014: "NullableInt64s",
+        0x00004015: "NullableEnum8",
+        0x00004016: "NullableEnum16",
+        0x00004017: "NullableFloatSingle",
+        0x00004018: "NullableFloatDouble",
+        0x00004019: "NullableOctetString",
+        0x0000401E: "NullableCharString",
+        0x00004024: "NullableEnumAttr",
+        0x00004025: "NullableStruct",
+        0x00004026: "NullableRangeRestrictedInt8u",
+        0x00004027: "NullableRangeRestrictedInt8s",
+        0x00004028: "NullableRangeRestrictedInt16u",
+        0x00004029: "NullableRangeRestrictedInt16s",
+        0x0000402A: "WriteOnlyInt8u",
+        0x00004033: "NullableGlobalEnum",
+        0x00004034: "NullableGlobalStruct",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+        0xFFF24F01: "MeiInt8u",
+    },
+    0xFFF1FC06: {
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+    0xFFF1FC20: {
+        0x00000000: "FlipFlop",
+        0x0000FFF8: "GeneratedCommandList",
+        0x0000FFF9: "AcceptedCommandList",
+        0x0000FFFB: "AttributeList",
+        0x0000FFFC: "FeatureMap",
+        0x0000FFFD: "ClusterRevision",
+    },
+}
+
+EVENT_NAMES = {
+    0x00000003: {
+    },
+    0x00000004: {
+    },
+    0x00000006: {
+    },
+    0x00000008: {
+    },
+    0x0000001C: {
+    },
+    0x0000001D: {
+    },
+    0x0000001E: {
+    },
+    0x0000001F: {
+        0x00000000: "AccessControlEntryChanged",
+        0x00000001: "AccessControlExtensionChanged",
+        0x00000002: "FabricRestrictionReviewUpdate",
+    },
+    0x00000025: {
+        0x00000000: "StateChanged",
+        0x00000001: "ActionFailed",
+    },
+    0x00000028: {
+        0x00000000: "StartUp",
+        0x00000001: "ShutDown",
+        0x00000002: "Leave",
+        0x00000003: "ReachableChanged",
+    },
+    0x00000029: {
+    },
+    0x0000002A: {
+        0x00000000: "StateTransition",
+        0x00000001: "VersionApplied",
+        0x00000002: "DownloadError",
+    },
+    0x0000002B: {
+    },
+    0x0000002C: {
+    },
+    0x0000002D: {
+    },
+    0x0000002E: {
+    },
+    0x0000002F: {
+        0x00000000: "WiredFaultChange",
+        0x00000001: "BatFaultChange",
+        0x00000002: "BatChargeFaultChange",
+    },
+    0x00000030: {
+    },
+    0x00000031: {
+    },
+    0x00000032: {
+    },
+    0x00000033: {
+        0x00000000: "HardwareFaultChange",
+        0x00000001: "RadioFaultChange",
+        0x00000002: "NetworkFaultChange",
+        0x00000003: "BootReason",
+    },
+    0x00000034: {
+        0x00000000: "SoftwareFault",
+    },
+    0x00000035: {
+        0x00000000: "ConnectionStatus",
+        0x00000001: "NetworkFaultChange",
+    },
+    0x00000036: {
+        0x00000000: "Disconnection",
+        0x00000001: "AssociationFailure",
+        0x00000002: "ConnectionStatus",
+    },
+    0x00000037: {
+    },
+    0x00000038: {
+        0x00000000: "DSTTableEmpty",
+        0x00000001: "DSTStatus",
+        0x00000002: "TimeZoneStatus",
+        0x00000003: "TimeFailure",
+        0x00000004: "MissingTrustedTimeSource",
+    },
+    0x00000039: {
+        0x00000000: "StartUp",
+        0x00000001: "ShutDown",
+        0x00000002: "Leave",
+        0x00000003: "ReachableChanged",
+        0x00000080: "ActiveChanged",
+    },
+    0x0000003B: {
+        0x00000000: "SwitchLatched",
+        0x00000001: "InitialPress",
+        0x00000002: "LongPress",
+        0x00000003: "ShortRelease",
+        0x00000004: "LongRelease",
+        0x00000005: "MultiPressOngoing",
+        0x00000006: "MultiPressComplete",
+    },
+    0x0000003C: {
+    },
+    0x0000003E: {
+    },
+    0x0000003F: {
+    },
+    0x00000040: {
+    },
+    0x00000041: {
+    },
+    0x00000042: {
+    },
+    0x00000043: {
+    },
+    0x00000044: {
+    },
+    0x00000045: {
+        0x00000000: "StateChange",
+    },
+    0x00000046: {
+    },
+    0x00000047: {
+    },
+    0x00000048: {
+        0x00000000: "OperationalError",
+        0x00000001: "OperationCompletion",
+    },
+    0x00000049: {
+    },
+    0x0000004A: {
+    },
+    0x00000050: {
+    },
+    0x00000051: {
+    },
+    0x00000052: {
+    },
+    0x00000053: {
+    },
+    0x00000054: {
+    },
+    0x00000055: {
+    },
+    0x00000056: {
+    },
+    0x00000057: {
+        0x00000000: "Notify",
+    },
+    0x00000059: {
+    },
+    0x0000005B: {
+    },
+    0x0000005C: {
+        0x00000000: "SmokeAlarm",
+        0x00000001: "COAlarm",
+        0x00000002: "LowBattery",
+        0x00000003: "HardwareFault",
+        0x00000004: "EndOfService",
+        0x00000005: "SelfTestComplete",
+        0x00000006: "AlarmMuted",
+        0x00000007: "MuteEnded",
+        0x00000008: "InterconnectSmokeAlarm",
+        0x00000009: "InterconnectCOAlarm",
+        0x0000000A: "AllClear",
+    },
+    0x0000005D: {
+        0x00000000: "Notify",
+    },
+    0x0000005E: {
+    },
+    0x0000005F: {
+    },
+    0x00000060: {
+        0x00000000: "OperationalError",
+        0x00000001: "OperationCompletion",
+    },
+    0x00000061: {
+        0x00000000: "OperationalError",
+        0x00000001: "OperationCompletion",
+    },
+    0x00000062: {
+    },
+    0x00000065: {
+    },
+    0x00000071: {
+    },
+    0x00000072: {
+    },
+    0x00000080: {
+        0x00000000: "AlarmsStateChanged",
+        0x00000001: "SensorFault",
+    },
+    0x00000081: {
+        0x00000000: "ValveStateChanged",
+        0x00000001: "ValveFault",
+    },
+    0x00000090: {
+        0x00000000: "MeasurementPeriodRanges",
+    },
+    0x00000091: {
+        0x00000000: "CumulativeEnergyMeasured",
+        0x00000001: "PeriodicEnergyMeasured",
+    },
+    0x00000094: {
+        0x00000000: "BoostStarted",
+        0x00000001: "BoostEnded",
+    },
+    0x00000095: {
+        0x00000000: "PriceChange",
+    },
+    0x00000097: {
+        0x00000000: "MessageQueued",
+        0x00000001: "MessagePresented",
+        0x00000002: "MessageComplete",
+    },
+    0x00000098: {
+        0x00000000: "PowerAdjustStart",
+        0x00000001: "PowerAdjustEnd",
+        0x00000002: "Paused",
+        0x00000003: "Resumed",
+    },
+    0x00000099: {
+        0x00000000: "EVConnected",
+        0x00000001: "EVNotDetected",
+        0x00000002: "EnergyTransferStarted",
+        0x00000003: "EnergyTransferStopped",
+        0x00000004: "Fault",
+        0x00000005: "Rfid",
+    },
+    0x0000009B: {
+    },
+    0x0000009C: {
+    },
+    0x0000009D: {
+    },
+    0x0000009E: {
+    },
+    0x0000009F: {
+    },
+    0x000000A0: {
+        0x00000000: "CurrentConditionsChanged",
+    },
+    0x00000101: {
+        0x00000000: "DoorLockAlarm",
+        0x00000001: "DoorStateChange",
+        0x00000002: "LockOperation",
+        0x00000003: "LockOperationError",
+        0x00000004: "LockUserChange",
+    },
+    0x00000102: {
+    },
+    0x00000104: {
+        0x00000000: "OperationalError",
+        0x00000001: "MovementCompleted",
+        0x00000002: "EngageStateChanged",
+        0x00000003: "SecureStateChanged",
+    },
+    0x00000105: {
+    },
+    0x00000150: {
+    },
+    0x00000200: {
+        0x00000000: "SupplyVoltageLow",
+        0x00000001: "SupplyVoltageHigh",
+        0x00000002: "PowerMissingPhase",
+        0x00000003: "SystemPressureLow",
+        0x00000004: "SystemPressureHigh",
+        0x00000005: "DryRunning",
+        0x00000006: "MotorTemperatureHigh",
+        0x00000007: "PumpMotorFatalFailure",
+        0x00000008: "ElectronicTemperatureHigh",
+        0x00000009: "PumpBlocked",
+        0x0000000A: "SensorFailure",
+        0x0000000B: "ElectronicNonFatalFailure",
+        0x0000000C: "ElectronicFatalFailure",
+        0x0000000D: "GeneralFault",
+        0x0000000E: "Leakage",
+        0x0000000F: "AirDetection",
+        0x00000010: "TurbineOperation",
+    },
+    0x00000201: {
+        0x00000000: "SystemModeChange",
+        0x00000001: "LocalTemperatureChange",
+        0x00000002: "OccupancyChange",
+        0x00000003: "SetpointChange",
+        0x00000004: "RunningStateChange",
+        0x00000005: "RunningModeChange",
+        0x00000006: "ActiveScheduleChange",
+        0x00000007: "ActivePresetChange",
+    },
+    0x00000202: {
+    },
+    0x00000204: {
+    },
+    0x00000300: {
+    },
+    0x00000301: {
+    },
+    0x00000400: {
+    },
+    0x00000402: {
+    },
+    0x00000403: {
+    },
+    0x00000404: {
+    },
+    0x00000405: {
+    },
+    0x00000406: {
+        0x00000000: "OccupancyChanged",
+    },
+    0x0000040C: {
+    },
+    0x0000040D: {
+    },
+    0x00000413: {
+    },
+    0x00000415: {
+    },
+    0x0000042A: {
+    },
+    0x0000042B: {
+    },
+    0x0000042C: {
+    },
+    0x0000042D: {
+    },
+    0x0000042E: {
+    },
+    0x0000042F: {
+    },
+    0x00000430: {
+    },
+    0x00000451: {
+    },
+    0x00000452: {
+    },
+    0x00000453: {
+    },
+    0x00000503: {
+    },
+    0x00000504: {
+    },
+    0x00000505: {
+        0x00000000: "TargetUpdated",
+    },
+    0x00000506: {
+        0x00000000: "StateChanged",
+    },
+    0x00000507: {
+    },
+    0x00000508: {
+    },
+    0x00000509: {
+    },
+    0x0000050A: {
+    },
+    0x0000050B: {
+    },
+    0x0000050C: {
+    },
+    0x0000050D: {
+    },
+    0x0000050E: {
+        0x00000000: "LoggedOut",
+    },
+    0x0000050F: {
+        0x00000000: "RemainingScreenTimeExpired",
+    },
+    0x00000510: {
+    },
+    0x00000550: {
+        0x00000000: "ZoneTriggered",
+        0x00000001: "ZoneStopped",
+    },
+    0x00000551: {
+    },
+    0x00000552: {
+    },
+    0x00000553: {
+    },
+    0x00000554: {
+    },
+    0x00000555: {
+        0x00000000: "PushTransportBegin",
+        0x00000001: "PushTransportEnd",
+    },
+    0x00000556: {
+    },
+    0x00000700: {
+    },
+    0x00000750: {
+    },
+    0x00000751: {
+        0x00000000: "CommissioningRequestResult",
+    },
+    0x00000752: {
+    },
+    0x00000753: {
+    },
+    0x00000801: {
+    },
+    0x00000802: {
+    },
+    0x00000B06: {
+    },
+    0x00000B07: {
+    },
+    0xFFF1FC05: {
+        0x00000001: "TestEvent",
+        0x00000002: "TestFabricScopedEvent",
+        0xFFF200EE: "TestDifferentVendorMeiEvent",
+    },
+    0xFFF1FC06: {
+    },
+    0xFFF1FC20: {
+        0x00000000: "PingCountEvent",
+    },
+}
+
+ACCEPTED_COMMAND_NAMES = {
+    0x00000003: {
+        0x00000000: "Identify",
+        0x00000040: "TriggerEffect",
+    },
+    0x00000004: {
+        0x00000000: "AddGroup",
+        0x00000001: "ViewGroup",
+        0x00000002: "GetGroupMembership",
+        0x00000003: "RemoveGroup",
+        0x00000004: "RemoveAllGroups",
+        0x00000005: "AddGroupIfIdentifying",
+    },
+    0x00000006: {
+        0x00000000: "Off",
+        0x00000001: "On",
+        0x00000002: "Toggle",
+        0x00000040: "OffWithEffect",
+        0x00000041: "OnWithRecallGlobalScene",
+        0x00000042: "OnWithTimedOff",
+    },
+    0x00000008: {
+        0x00000000: "MoveToLevel",
+        0x00000001: "Move",
+        0x00000002: "Step",
+        0x00000003: "Stop",
+        0x00000004: "MoveToLevelWithOnOff",
+        0x00000005: "MoveWithOnOff",
+        0x00000006: "StepWithOnOff",
+        0x00000007: "StopWithOnOff",
+        0x00000008: "MoveToClosestFrequency",
+    },
+    0x0000001C: {
+    },
+    0x0000001D: {
+    },
+    0x0000001E: {
+    },
+    0x0000001F: {
+        0x00000000: "ReviewFabricRestrictions",
+    },
+    0x00000025: {
+        0x00000000: "InstantAction",
+        0x00000001: "InstantActionWithTransition",
+        0x00000002: "StartAction",
+        0x00000003: "StartActionWithDuration",
+        0x00000004: "StopAction",
+        0x00000005: "PauseAction",
+        0x00000006: "PauseActionWithDuration",
+        0x00000007: "ResumeAction",
+        0x00000008: "EnableAction",
+        0x00000009: "EnableActionWithDuration",
+        0x0000000A: "DisableAction",
+        0x0000000B: "DisableActionWithDuration",
+    },
+    0x00000028: {
+        0x10020000: "MfgSpecificPing",
+    },
+    0x00000029: {
+        0x00000000: "QueryImage",
+        0x00000002: "ApplyUpdateRequest",
+        0x00000004: "NotifyUpdateApplied",
+    },
+    0x0000002A: {
+        0x00000000: "AnnounceOTAProvider",
+    },
+    0x0000002B: {
+    },
+    0x0000002C: {
+    },
+    0x0000002D: {
+    },
+    0x0000002E: {
+    },
+    0x0000002F: {
+    },
+    0x00000030: {
+        0x00000000: "ArmFailSafe",
+        0x00000002: "SetRegulatoryConfig",
+        0x00000004: "CommissioningComplete",
+        0x00000006: "SetTCAcknowledgements",
+    },
+    0x00000031: {
+        0x00000000: "ScanNetworks",
+        0x00000002: "AddOrUpdateWiFiNetwork",
+        0x00000003: "AddOrUpdateThreadNetwork",
+        0x00000004: "RemoveNetwork",
+        0x00000006: "ConnectNetwork",
+        0x00000008: "ReorderNetwork",
+        0x00000009: "QueryIdentity",
+    },
+    0x00000032: {
+        0x00000000: "RetrieveLogsRequest",
+    },
+    0x00000033: {
+        0x00000000: "TestEventTrigger",
+        0x00000001: "TimeSnapshot",
+        0x00000003: "PayloadTestRequest",
+    },
+    0x00000034: {
+        0x00000000: "ResetWatermarks",
+    },
+    0x00000035: {
+        0x00000000: "ResetCounts",
+    },
+    0x00000036: {
+        0x00000000: "ResetCounts",
+    },
+    0x00000037: {
+        0x00000000: "ResetCounts",
+    },
+    0x00000038: {
+        0x00000000: "SetUTCTime",
+        0x00000001: "SetTrustedTimeSource",
+        0x00000002: "SetTimeZone",
+        0x00000004: "SetDSTOffset",
+        0x00000005: "SetDefaultNTP",
+    },
+    0x00000039: {
+        0x00000080: "KeepActive",
+    },
+    0x0000003B: {
+    },
+    0x0000003C: {
+        0x00000000: "OpenCommissioningWindow",
+        0x00000001: "OpenBasicCommissioningWindow",
+        0x00000002: "RevokeCommissioning",
+    },
+    0x0000003E: {
+        0x00000000: "AttestationRequest",
+        0x00000002: "CertificateChainRequest",
+        0x00000004: "CSRRequest",
+        0x00000006: "AddNOC",
+        0x00000007: "UpdateNOC",
+        0x00000009: "UpdateFabricLabel",
+        0x0000000A: "RemoveFabric",
+        0x0000000B: "AddTrustedRootCertificate",
+        0x0000000C: "SetVIDVerificationStatement",
+        0x0000000D: "SignVIDVerificationRequest",
+    },
+    0x0000003F: {
+        0x00000000: "KeySetWrite",
+        0x00000001: "KeySetRead",
+        0x00000003: "KeySetRemove",
+        0x00000004: "KeySetReadAllIndices",
+    },
+    0x00000040: {
+    },
+    0x00000041: {
+    },
+    0x00000042: {
+    },
+    0x00000043: {
+    },
+    0x00000044: {
+    },
+    0x00000045: {
+    },
+    0x00000046: {
+        0x00000000: "RegisterClient",
+        0x00000002: "UnregisterClient",
+        0x00000003: "StayActiveRequest",
+    },
+    0x00000047: {
+        0x00000000: "SetTimer",
+        0x00000001: "ResetTimer",
+        0x00000002: "AddTime",
+        0x00000003: "ReduceTime",
+    },
+    0x00000048: {
+        0x00000001: "Stop",
+        0x00000002: "Start",
+    },
+    0x00000049: {
+        0x00000000: "ChangeToMode",
+    },
+    0x0000004A: {
+    },
+    0x00000050: {
+        0x00000000: "ChangeToMode",
+    },
+    0x00000051: {
+        0x00000000: "ChangeToMode",
+    },
+    0x00000052: {
+        0x00000000: "ChangeToMode",
+    },
+    0x00000053: {
+    },
+    0x00000054: {
+        0x00000000: "ChangeToMode",
+    },
+    0x00000055: {
+        0x00000000: "ChangeToMode",
+    },
+    0x00000056: {
+        0x00000000: "SetTemperature",
+    },
+    0x00000057: {
+    },
+    0x00000059: {
+        0x00000000: "ChangeToMode",
+    },
+    0x0000005B: {
+    },
+    0x0000005C: {
+        0x00000000: "SelfTestRequest",
+    },
+    0x0000005D: {
+        0x00000000: "Reset",
+        0x00000001: "ModifyEnabledAlarms",
+    },
+    0x0000005E: {
+    },
+    0x0000005F: {
+        0x00000000: "SetCookingParameters",
+        0x00000001: "AddMoreTime",
+    },
+    0x00000060: {
+        0x00000000: "Pause",
+        0x00000001: "Stop",
+        0x00000002: "Start",
+        0x00000003: "Resume",
+    },
+    0x00000061: {
+        0x00000000: "Pause",
+        0x00000003: "Resume",
+        0x00000080: "GoHome",
+    },
+    0x00000062: {
+        0x00000000: "AddScene",
+        0x00000001: "ViewScene",
+        0x00000002: "RemoveScene",
+        0x00000003: "RemoveAllScenes",
+        0x00000004: "StoreScene",
+        0x00000005: "RecallScene",
+        0x00000006: "GetSceneMembership",
+        0x00000040: "CopyScene",
+    },
+    0x00000065: {
+        0x00000000: "JoinGroup",
+        0x00000001: "LeaveGroup",
+        0x00000003: "UpdateGroupKey",
+        0x00000004: "ExpireGracePeriod",
+        0x00000005: "ConfigureAuxiliaryACL",
+    },
+    0x00000071: {
+        0x00000000: "ResetCondition",
+    },
+    0x00000072: {
+        0x00000000: "ResetCondition",
+    },
+    0x00000080: {
+        0x00000000: "SuppressAlarm",
+        0x00000001: "EnableDisableAlarm",
+    },
+    0x00000081: {
+        0x00000000: "Open",
+        0x00000001: "Close",
+    },
+    0x00000090: {
+    },
+    0x00000091: {
+    },
+    0x00000094: {
+        0x00000000: "Boost",
+        0x00000001: "CancelBoost",
+    },
+    0x00000095: {
+        0x00000000: "GetDetailedPriceRequest",
+        0x00000002: "GetDetailedForecastRequest",
+    },
+    0x00000097: {
+        0x00000000: "PresentMessagesRequest",
+        0x00000001: "CancelMessagesRequest",
+    },
+    0x00000098: {
+        0x00000000: "PowerAdjustRequest",
+        0x00000001: "CancelPowerAdjustRequest",
+        0x00000002: "StartTimeAdjustRequest",
+        0x00000003: "PauseRequest",
+        0x00000004: "ResumeRequest",
+        0x00000005: "ModifyForecastRequest",
+        0x00000006: "RequestConstraintBasedForecast",
+        0x00000007: "CancelRequest",
+    },
+    0x00000099: {
+        0x00000001: "Disable",
+        0x00000002: "EnableCharging",
+        0x00000003: "EnableDischarging",
+        0x00000004: "StartDiagnostics",
+        0x00000005: "SetTargets",
+        0x00000006: "GetTargets",
+        0x00000007: "ClearTargets",
+    },
+    0x0000009B: {
+    },
+    0x0000009C: {
+    },
+    0x0000009D: {
+        0x00000000: "ChangeToMode",
+    },
+    0x0000009E: {
+        0x00000000: "ChangeToMode",
+    },
+    0x0000009F: {
+        0x00000000: "ChangeToMode",
+    },
+    0x000000A0: {
+    },
+    0x00000101: {
+        0x00000000: "LockDoor",
+        0x00000001: "UnlockDoor",
+        0x00000003: "UnlockWithTimeout",
+        0x0000000B: "SetWeekDaySchedule",
+        0x0000000C: "GetWeekDaySchedule",
+        0x0000000D: "ClearWeekDaySchedule",
+        0x0000000E: "SetYearDaySchedule",
+        0x0000000F: "GetYearDaySchedule",
+        0x00000010: "ClearYearDaySchedule",
+        0x00000011: "SetHolidaySchedule",
+        0x00000012: "GetHolidaySchedule",
+        0x00000013: "ClearHolidaySchedule",
+        0x0000001A: "SetUser",
+        0x0000001B: "GetUser",
+        0x0000001D: "ClearUser",
+        0x00000022: "SetCredential",
+        0x00000024: "GetCredentialStatus",
+        0x00000026: "ClearCredential",
+        0x00000027: "UnboltDoor",
+        0x00000028: "SetAliroReaderConfig",
+        0x00000029: "ClearAliroReaderConfig",
+    },
+    0x00000102: {
+        0x00000000: "UpOrOpen",
+        0x00000001: "DownOrClose",
+        0x00000002: "StopMotion",
+        0x00000004: "GoToLiftValue",
+        0x00000005: "GoToLiftPercentage",
+        0x00000007: "GoToTiltValue",
+        0x00000008: "GoToTiltPercentage",
+    },
+    0x00000104: {
+        0x00000000: "Stop",
+        0x00000001: "MoveTo",
+        0x00000002: "Calibrate",
+    },
+    0x00000105: {
+        0x00000000: "SetTarget",
+        0x00000001: "Step",
+    },
+    0x00000150: {
+        0x00000000: "SelectAreas",
+        0x00000002: "SkipArea",
+    },
+    0x00000200: {
+    },
+    0x00000201: {
+        0x00000000: "SetpointRaiseLower",
+        0x00000001: "SetWeeklySchedule",
+        0x00000002: "GetWeeklySchedule",
+        0x00000003: "ClearWeeklySchedule",
+        0x00000005: "SetActiveScheduleRequest",
+        0x00000006: "SetActivePresetRequest",
+        0x00000007: "AddThermostatSuggestion",
+        0x00000008: "RemoveThermostatSuggestion",
+        0x000000FE: "AtomicRequest",
+    },
+    0x00000202: {
+        0x00000000: "Step",
+    },
+    0x00000204: {
+    },
+    0x00000300: {
+        0x00000000: "MoveToHue",
+        0x00000001: "MoveHue",
+        0x00000002: "StepHue",
+        0x00000003: "MoveToSaturation",
+        0x00000004: "MoveSaturation",
+        0x00000005: "StepSaturation",
+        0x00000006: "MoveToHueAndSaturation",
+        0x00000007: "MoveToColor",
+        0x00000008: "MoveColor",
+        0x00000009: "StepColor",
+        0x0000000A: "MoveToColorTemperature",
+        0x00000040: "EnhancedMoveToHue",
+        0x00000041: "EnhancedMoveHue",
+        0x00000042: "EnhancedStepHue",
+        0x00000043: "EnhancedMoveToHueAndSaturation",
+        0x00000044: "ColorLoopSet",
+        0x00000047: "StopMoveStep",
+        0x0000004B: "MoveColorTemperature",
+        0x0000004C: "StepColorTemperature",
+    },
+    0x00000301: {
+    },
+    0x00000400: {
+    },
+    0x00000402: {
+    },
+    0x00000403: {
+    },
+    0x00000404: {
+    },
+    0x00000405: {
+    },
+    0x00000406: {
+    },
+    0x0000040C: {
+    },
+    0x0000040D: {
+    },
+    0x00000413: {
+    },
+    0x00000415: {
+    },
+    0x0000042A: {
+    },
+    0x0000042B: {
+    },
+    0x0000042C: {
+    },
+    0x0000042D: {
+    },
+    0x0000042E: {
+    },
+    0x0000042F: {
+    },
+    0x00000430: {
+    },
+    0x00000451: {
+        0x00000000: "NetworkPassphraseRequest",
+    },
+    0x00000452: {
+        0x00000000: "GetActiveDatasetRequest",
+        0x00000001: "GetPendingDatasetRequest",
+        0x00000003: "SetActiveDatasetRequest",
+        0x00000004: "SetPendingDatasetRequest",
+    },
+    0x00000453: {
+        0x00000000: "AddNetwork",
+        0x00000001: "RemoveNetwork",
+        0x00000002: "GetOperationalDataset",
+    },
+    0x00000503: {
+    },
+    0x00000504: {
+        0x00000000: "ChangeChannel",
+        0x00000002: "ChangeChannelByNumber",
+        0x00000003: "SkipChannel",
+        0x00000004: "GetProgramGuide",
+        0x00000006: "RecordProgram",
+        0x00000007: "CancelRecordProgram",
+    },
+    0x00000505: {
+        0x00000000: "NavigateTarget",
+    },
+    0x00000506: {
+        0x00000000: "Play",
+        0x00000001: "Pause",
+        0x00000002: "Stop",
+        0x00000003: "StartOver",
+        0x00000004: "Previous",
+        0x00000005: "Next",
+        0x00000006: "Rewind",
+        0x00000007: "FastForward",
+        0x00000008: "SkipForward",
+        0x00000009: "SkipBackward",
+        0x0000000B: "Seek",
+        0x0000000C: "ActivateAudioTrack",
+        0x0000000D: "ActivateTextTrack",
+        0x0000000E: "DeactivateTextTrack",
+    },
+    0x00000507: {
+        0x00000000: "SelectInput",
+        0x00000001: "ShowInputStatus",
+        0x00000002: "HideInputStatus",
+        0x00000003: "RenameInput",
+    },
+    0x00000508: {
+        0x00000000: "Sleep",
+    },
+    0x00000509: {
+        0x00000000: "SendKey",
+    },
+    0x0000050A: {
+        0x00000000: "LaunchContent",
+        0x00000001: "LaunchURL",
+    },
+    0x0000050B: {
+        0x00000000: "SelectOutput",
+        0x00000001: "RenameOutput",
+    },
+    0x0000050C: {
+        0x00000000: "LaunchApp",
+        0x00000001: "StopApp",
+        0x00000002: "HideApp",
+    },
+    0x0000050D: {
+    },
+    0x0000050E: {
+        0x00000000: "GetSetupPIN",
+        0x00000002: "Login",
+        0x00000003: "Logout",
+    },
+    0x0000050F: {
+        0x00000000: "UpdatePIN",
+        0x00000001: "ResetPIN",
+        0x00000003: "Enable",
+        0x00000004: "Disable",
+        0x00000005: "AddBonusTime",
+        0x00000006: "SetScreenDailyTime",
+        0x00000007: "BlockUnratedContent",
+        0x00000008: "UnblockUnratedContent",
+        0x00000009: "SetOnDemandRatingThreshold",
+        0x0000000A: "SetScheduledContentRatingThreshold",
+    },
+    0x00000510: {
+        0x00000000: "ContentAppMessage",
+    },
+    0x00000550: {
+        0x00000000: "CreateTwoDCartesianZone",
+        0x00000002: "UpdateTwoDCartesianZone",
+        0x00000003: "RemoveZone",
+        0x00000004: "CreateOrUpdateTrigger",
+        0x00000005: "RemoveTrigger",
+    },
+    0x00000551: {
+        0x00000000: "AudioStreamAllocate",
+        0x00000002: "AudioStreamDeallocate",
+        0x00000003: "VideoStreamAllocate",
+        0x00000005: "VideoStreamModify",
+        0x00000006: "VideoStreamDeallocate",
+        0x00000007: "SnapshotStreamAllocate",
+        0x00000009: "SnapshotStreamModify",
+        0x0000000A: "SnapshotStreamDeallocate",
+        0x0000000B: "SetStreamPriorities",
+        0x0000000C: "CaptureSnapshot",
+    },
+    0x00000552: {
+        0x00000000: "MPTZSetPosition",
+        0x00000001: "MPTZRelativeMove",
+        0x00000002: "MPTZMoveToPreset",
+        0x00000003: "MPTZSavePreset",
+        0x00000004: "MPTZRemovePreset",
+        0x00000005: "DPTZSetViewport",
+        0x00000006: "DPTZRelativeMove",
+    },
+    0x00000553: {
+        0x00000000: "SolicitOffer",
+        0x00000002: "ProvideOffer",
+        0x00000004: "ProvideAnswer",
+        0x00000005: "ProvideICECandidates",
+        0x00000006: "EndSession",
+    },
+    0x00000554: {
+        0x00000000: "Offer",
+        0x00000001: "Answer",
+        0x00000002: "ICECandidates",
+        0x00000003: "End",
+    },
+    0x00000555: {
+        0x00000000: "AllocatePushTransport",
+        0x00000002: "DeallocatePushTransport",
+        0x00000003: "ModifyPushTransport",
+        0x00000004: "SetTransportStatus",
+        0x00000005: "ManuallyTriggerTransport",
+        0x00000006: "FindTransport",
+    },
+    0x00000556: {
+        0x00000000: "PlayChimeSound",
+    },
+    0x00000700: {
+        0x00000000: "GetTariffComponent",
+        0x00000001: "GetDayEntry",
+    },
+    0x00000750: {
+    },
+    0x00000751: {
+        0x00000000: "RequestCommissioningApproval",
+        0x00000001: "CommissionNode",
+    },
+    0x00000752: {
+        0x00000000: "AddKeySet",
+        0x00000001: "UpdateKeySet",
+        0x00000002: "RemoveKeySet",
+        0x00000003: "AddGroup",
+        0x00000004: "UpdateGroup",
+        0x00000005: "RemoveGroup",
+        0x00000006: "AddAdmin",
+        0x00000007: "UpdateAdmin",
+        0x00000008: "RemoveAdmin",
+        0x00000009: "AddPendingNode",
+        0x0000000A: "RefreshNode",
+        0x0000000B: "UpdateNode",
+        0x0000000C: "RemoveNode",
+        0x0000000D: "UpdateEndpointForNode",
+        0x0000000E: "AddGroupIDToEndpointForNode",
+        0x0000000F: "RemoveGroupIDFromEndpointForNode",
+        0x00000010: "AddBindingToEndpointForNode",
+        0x00000011: "RemoveBindingFromEndpointForNode",
+        0x00000012: "AddACLToNode",
+        0x00000013: "RemoveACLFromNode",
+    },
+    0x00000753: {
+        0x00000000: "ICACCSRRequest",
+        0x00000002: "AddICAC",
+        0x00000004: "OpenJointCommissioningWindow",
+        0x00000005: "TransferAnchorRequest",
+        0x00000007: "TransferAnchorComplete",
+        0x00000008: "AnnounceJointFabricAdministrator",
+    },
+    0x00000801: {
+        0x00000000: "ProvisionRootCertificate",
+        0x00000002: "FindRootCertificate",
+        0x00000004: "LookupRootCertificate",
+        0x00000006: "RemoveRootCertificate",
+        0x00000007: "ClientCSR",
+        0x00000009: "ProvisionClientCertificate",
+        0x0000000A: "FindClientCertificate",
+        0x0000000C: "LookupClientCertificate",
+        0x0000000E: "RemoveClientCertificate",
+    },
+    0x00000802: {
+        0x00000000: "ProvisionEndpoint",
+        0x00000002: "FindEndpoint",
+        0x00000004: "RemoveEndpoint",
+    },
+    0x00000B06: {
+    },
+    0x00000B07: {
+    },
+    0xFFF1FC05: {
+        0x00000000: "Test",
+        0x00000001: "TestNotHandled",
+        0x00000002: "TestSpecific",
+        0x00000003: "TestUnknownCommand",
+        0x00000004: "TestAddArguments",
+        0x00000005: "TestSimpleArgumentRequest",
+        0x00000006: "TestStructArrayArgumentRequest",
+        0x00000007: "TestStructArgumentRequest",
+        0x00000008: "TestNestedStructArgumentRequest",
+        0x00000009: "TestListStructArgumentRequest",
+        0x0000000A: "TestListInt8UArgumentRequest",
+        0x0000000B: "TestNestedStructListArgumentRequest",
+        0x0000000C: "TestListNestedStructListArgumentRequest",
+        0x0000000D: "TestListInt8UReverseRequest",
+        0x0000000E: "TestEnumsRequest",
+        0x0000000F: "TestNullableOptionalRequest",
+        0x00000010: "TestComplexNullableOptionalRequest",
+        0x00000011: "SimpleStructEchoRequest",
+        0x00000012: "TimedInvokeRequest",
+        0x00000013: "TestSimpleOptionalArgumentRequest",
+        0x00000014: "TestEmitTestEventRequest",
+        0x00000015: "TestEmitTestFabricScopedEventRequest",
+        0x00000016: "TestBatchHelperRequest",
+        0x00000017: "TestSecondBatchHelperRequest",
+        0x00000018: "StringEchoRequest",
+        0x00000019: "GlobalEchoRequest",
+        0x0000001A: "TestCheckCommandFlags",
+        0xFFF200AA: "TestDifferentVendorMeiRequest",
+    },
+    0xFFF1FC06: {
+        0x00000000: "FailAtFault",
+        0x00000001: "FailRandomlyAtFault",
+    },
+    0xFFF1FC20: {
+        0x00000000: "Ping",
+        0x00000002: "AddArguments",
+    },
+}
+
+GENERATED_COMMAND_NAMES = {
+    0x00000003: {
+    },
+    0x00000004: {
+        0x00000000: "AddGroupResponse",
+        0x00000001: "ViewGroupResponse",
+        0x00000002: "GetGroupMembershipResponse",
+        0x00000003: "RemoveGroupResponse",
+    },
+    0x00000006: {
+    },
+    0x00000008: {
+    },
+    0x0000001C: {
+    },
+    0x0000001D: {
+    },
+    0x0000001E: {
+    },
+    0x0000001F: {
+        0x00000001: "ReviewFabricRestrictionsResponse",
+    },
+    0x00000025: {
+    },
+    0x00000028: {
+    },
+    0x00000029: {
+        0x00000001: "QueryImageResponse",
+        0x00000003: "ApplyUpdateResponse",
+    },
+    0x0000002A: {
+    },
+    0x0000002B: {
+    },
+    0x0000002C: {
+    },
+    0x0000002D: {
+    },
+    0x0000002E: {
+    },
+    0x0000002F: {
+    },
+    0x00000030: {
+        0x00000001: "ArmFailSafeResponse",
+        0x00000003: "SetRegulatoryConfigResponse",
+        0x00000005: "CommissioningCompleteResponse",
+        0x00000007: "SetTCAcknowledgementsResponse",
+    },
+    0x00000031: {
+        0x00000001: "ScanNetworksResponse",
+        0x00000005: "NetworkConfigResponse",
+        0x00000007: "ConnectNetworkResponse",
+        0x0000000A: "QueryIdentityResponse",
+    },
+    0x00000032: {
+        0x00000001: "RetrieveLogsResponse",
+    },
+    0x00000033: {
+        0x00000002: "TimeSnapshotResponse",
+        0x00000004: "PayloadTestResponse",
+    },
+    0x00000034: {
+    },
+    0x00000035: {
+    },
+    0x00000036: {
+    },
+    0x00000037: {
+    },
+    0x00000038: {
+        0x00000003: "SetTimeZoneResponse",
+    },
+    0x00000039: {
+    },
+    0x0000003B: {
+    },
+    0x0000003C: {
+    },
+    0x0000003E: {
+        0x00000001: "AttestationResponse",
+        0x00000003: "CertificateChainResponse",
+        0x00000005: "CSRResponse",
+        0x00000008: "NOCResponse",
+        0x0000000E: "SignVIDVerificationResponse",
+    },
+    0x0000003F: {
+        0x00000002: "KeySetReadResponse",
+        0x00000005: "KeySetReadAllIndicesResponse",
+    },
+    0x00000040: {
+    },
+    0x00000041: {
+    },
+    0x00000042: {
+    },
+    0x00000043: {
+    },
+    0x00000044: {
+    },
+    0x00000045: {
+    },
+    0x00000046: {
+        0x00000001: "RegisterClientResponse",
+        0x00000004: "StayActiveResponse",
+    },
+    0x00000047: {
+    },
+    0x00000048: {
+        0x00000004: "OperationalCommandResponse",
+    },
+    0x00000049: {
+        0x00000001: "ChangeToModeResponse",
+    },
+    0x0000004A: {
+    },
+    0x00000050: {
+    },
+    0x00000051: {
+        0x00000001: "ChangeToModeResponse",
+    },
+    0x00000052: {
+        0x00000001: "ChangeToModeResponse",
+    },
+    0x00000053: {
+    },
+    0x00000054: {
+        0x00000001: "ChangeToModeResponse",
+    },
+    0x00000055: {
+        0x00000001: "ChangeToModeResponse",
+    },
+    0x00000056: {
+    },
+    0x00000057: {
+    },
+    0x00000059: {
+        0x00000001: "ChangeToModeResponse",
+    },
+    0x0000005B: {
+    },
+    0x0000005C: {
+    },
+    0x0000005D: {
+    },
+    0x0000005E: {
+    },
+    0x0000005F: {
+    },
+    0x00000060: {
+        0x00000004: "OperationalCommandResponse",
+    },
+    0x00000061: {
+        0x00000004: "OperationalCommandResponse",
+    },
+    0x00000062: {
+        0x00000000: "AddSceneResponse",
+        0x00000001: "ViewSceneResponse",
+        0x00000002: "RemoveSceneResponse",
+        0x00000003: "RemoveAllScenesResponse",
+        0x00000004: "StoreSceneResponse",
+        0x00000006: "GetSceneMembershipResponse",
+        0x00000040: "CopySceneResponse",
+    },
+    0x00000065: {
+        0x00000002: "LeaveGroupResponse",
+    },
+    0x00000071: {
+    },
+    0x00000072: {
+    },
+    0x00000080: {
+    },
+    0x00000081: {
+    },
+    0x00000090: {
+    },
+    0x00000091: {
+    },
+    0x00000094: {
+    },
+    0x00000095: {
+        0x00000001: "GetDetailedPriceResponse",
+        0x00000003: "GetDetailedForecastResponse",
+    },
+    0x00000097: {
+    },
+    0x00000098: {
+    },
+    0x00000099: {
+        0x00000000: "GetTargetsResponse",
+    },
+    0x0000009B: {
+    },
+    0x0000009C: {
+    },
+    0x0000009D: {
+        0x00000001: "ChangeToModeResponse",
+    },
+    0x0000009E: {
+        0x00000001: "ChangeToModeResponse",
+    },
+    0x0000009F: {
+        0x00000001: "ChangeToModeResponse",
+    },
+    0x000000A0: {
+    },
+    0x00000101: {
+        0x0000000C: "GetWeekDayScheduleResponse",
+        0x0000000F: "GetYearDayScheduleResponse",
+        0x00000012: "GetHolidayScheduleResponse",
+        0x0000001C: "GetUserResponse",
+        0x00000023: "SetCredentialResponse",
+        0x00000025: "GetCredentialStatusResponse",
+    },
+    0x00000102: {
+    },
+    0x00000104: {
+    },
+    0x00000105: {
+    },
+    0x00000150: {
+        0x00000001: "SelectAreasResponse",
+        0x00000003: "SkipAreaResponse",
+    },
+    0x00000200: {
+    },
+    0x00000201: {
+        0x00000000: "GetWeeklyScheduleResponse",
+        0x00000002: "AddThermostatSuggestionResponse",
+        0x000000FD: "AtomicResponse",
+    },
+    0x00000202: {
+    },
+    0x00000204: {
+    },
+    0x00000300: {
+    },
+    0x00000301: {
+    },
+    0x00000400: {
+    },
+    0x00000402: {
+    },
+    0x00000403: {
+    },
+    0x00000404: {
+    },
+    0x00000405: {
+    },
+    0x00000406: {
+    },
+    0x0000040C: {
+    },
+    0x0000040D: {
+    },
+    0x00000413: {
+    },
+    0x00000415: {
+    },
+    0x0000042A: {
+    },
+    0x0000042B: {
+    },
+    0x0000042C: {
+    },
+    0x0000042D: {
+    },
+    0x0000042E: {
+    },
+    0x0000042F: {
+    },
+    0x00000430: {
+    },
+    0x00000451: {
+        0x00000001: "NetworkPassphraseResponse",
+    },
+    0x00000452: {
+        0x00000002: "DatasetResponse",
+    },
+    0x00000453: {
+        0x00000003: "OperationalDatasetResponse",
+    },
+    0x00000503: {
+    },
+    0x00000504: {
+        0x00000001: "ChangeChannelResponse",
+        0x00000005: "ProgramGuideResponse",
+    },
+    0x00000505: {
+        0x00000001: "NavigateTargetResponse",
+    },
+    0x00000506: {
+        0x0000000A: "PlaybackResponse",
+    },
+    0x00000507: {
+    },
+    0x00000508: {
+    },
+    0x00000509: {
+        0x00000001: "SendKeyResponse",
+    },
+    0x0000050A: {
+        0x00000002: "LauncherResponse",
+    },
+    0x0000050B: {
+    },
+    0x0000050C: {
+        0x00000003: "LauncherResponse",
+    },
+    0x0000050D: {
+    },
+    0x0000050E: {
+        0x00000001: "GetSetupPINResponse",
+    },
+    0x0000050F: {
+        0x00000002: "ResetPINResponse",
+    },
+    0x00000510: {
+        0x00000001: "ContentAppMessageResponse",
+    },
+    0x00000550: {
+        0x00000001: "CreateTwoDCartesianZoneResponse",
+    },
+    0x00000551: {
+        0x00000001: "AudioStreamAllocateResponse",
+        0x00000004: "VideoStreamAllocateResponse",
+        0x00000008: "SnapshotStreamAllocateResponse",
+        0x0000000D: "CaptureSnapshotResponse",
+    },
+    0x00000552: {
+    },
+    0x00000553: {
+        0x00000001: "SolicitOfferResponse",
+        0x00000003: "ProvideOfferResponse",
+    },
+    0x00000554: {
+    },
+    0x00000555: {
+        0x00000001: "AllocatePushTransportResponse",
+        0x00000007: "FindTransportResponse",
+    },
+    0x00000556: {
+    },
+    0x00000700: {
+        0x00000000: "GetTariffComponentResponse",
+        0x00000001: "GetDayEntryResponse",
+    },
+    0x00000750: {
+    },
+    0x00000751: {
+        0x00000002: "ReverseOpenCommissioningWindow",
+    },
+    0x00000752: {
+    },
+    0x00000753: {
+        0x00000001: "ICACCSRResponse",
+        0x00000003: "ICACResponse",
+        0x00000006: "TransferAnchorResponse",
+    },
+    0x00000801: {
+        0x00000001: "ProvisionRootCertificateResponse",
+        0x00000003: "FindRootCertificateResponse",
+        0x00000005: "LookupRootCertificateResponse",
+        0x00000008: "ClientCSRResponse",
+        0x0000000B: "FindClientCertificateResponse",
+        0x0000000D: "LookupClientCertificateResponse",
+    },
+    0x00000802: {
+        0x00000001: "ProvisionEndpointResponse",
+        0x00000003: "FindEndpointResponse",
+    },
+    0x00000B06: {
+    },
+    0x00000B07: {
+    },
+    0xFFF1FC05: {
+        0x00000000: "TestSpecificResponse",
+        0x00000001: "TestAddArgumentsResponse",
+        0x00000002: "TestSimpleArgumentResponse",
+        0x00000003: "TestStructArrayArgumentResponse",
+        0x00000004: "TestListInt8UReverseResponse",
+        0x00000005: "TestEnumsResponse",
+        0x00000006: "TestNullableOptionalResponse",
+        0x00000007: "TestComplexNullableOptionalResponse",
+        0x00000008: "BooleanResponse",
+        0x00000009: "SimpleStructResponse",
+        0x0000000A: "TestEmitTestEventResponse",
+        0x0000000B: "TestEmitTestFabricScopedEventResponse",
+        0x0000000C: "TestBatchHelperResponse",
+        0x0000000D: "StringEchoResponse",
+        0x0000000E: "GlobalEchoResponse",
+        0xFFF200BB: "TestDifferentVendorMeiResponse",
+    },
+    0xFFF1FC06: {
+    },
+    0xFFF1FC20: {
+        0x00000001: "AddArgumentsResponse",
+    },
+}
@@ -15,5 +15,27 @@
 #    limitations under the License.
 #
 
-from . import Attribute, CHIPClusters, Command, Objects  # noqa: F401
-from .Objects import *  # noqa: F401, F403
+import importlib
+
+from . import Attribute, CHIPClusters, Command  # noqa: F401
+from .ObjectsIndex import CLUSTER_NAMES
+
+# The generated cluster objects are expensive to import, so they are only loaded the first time one of them is
+# accessed through this package, and then only the module of that cluster (see Objects.py).
+_GENERATED_OBJECT_NAMES = ["Globals"] + list(CLUSTER_NAMES.values())
+
+__all__ = ["Attribute", "CHIPClusters", "Command", "Objects"] + _GENERATED_OBJECT_NAMES
+
+
+def __getattr__(name):
+    if name != "Objects" and name not in _GENERATED_OBJECT_NAMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    objects = importlib.import_module(".Objects", __name__)
+    if name != "Objects":
+        globals()[name] = getattr(objects, name)
+    return globals()[name]
+
+
+def __dir__():
+    return sorted(set(globals().keys()) | set(__all__))
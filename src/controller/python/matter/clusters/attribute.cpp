@@ -16,9 +16,11 @@
  */
 
 #include <cstdarg>
+#include <cstddef>
 #include <cstdio>
 #include <memory>
 #include <type_traits>
+#include <vector>
 
 #include <app/BufferedReadCallback.h>
 #include <app/ChunkedWriteCallback.h>
@@ -66,10 +68,33 @@ struct __attribute__((packed)) DataVersionFilter
     chip::DataVersion dataVersion;
 };
 
+// Header of every attribute in a batch of attribute data, it is directly followed by dataLen bytes of TLV data.
+// This struct matches _AttributeDataBatchRecordHeader in Attribute.py.
+struct __attribute__((packed)) AttributeDataBatchRecordHeader
+{
+    chip::DataVersion dataVersion;
+    chip::EndpointId endpointId;
+    chip::ClusterId clusterId;
+    chip::AttributeId attributeId;
+    std::underlying_type_t<Protocols::InteractionModel::Status> imStatus;
+    uint32_t dataLen;
+};
+
+// Python unpacks the header with struct.Struct("=IHIIBI"), keep the layout in sync with it.
+static_assert(sizeof(AttributeDataBatchRecordHeader) == 19, "AttributeDataBatchRecordHeader layout mismatch");
+static_assert(offsetof(AttributeDataBatchRecordHeader, dataVersion) == 0 &&
+                  offsetof(AttributeDataBatchRecordHeader, endpointId) == 4 &&
+                  offsetof(AttributeDataBatchRecordHeader, clusterId) == 6 &&
+                  offsetof(AttributeDataBatchRecordHeader, attributeId) == 10 &&
+                  offsetof(AttributeDataBatchRecordHeader, imStatus) == 14 &&
+                  offsetof(AttributeDataBatchRecordHeader, dataLen) == 15,
+              "AttributeDataBatchRecordHeader layout mismatch");
+
 using OnReadAttributeDataCallback       = void (*)(PyObject * appContext, chip::DataVersion version, chip::EndpointId endpointId,
                                              chip::ClusterId clusterId, chip::AttributeId attributeId,
                                              std::underlying_type_t<Protocols::InteractionModel::Status> imstatus, uint8_t * data,
                                              size_t dataLen);
+using OnReadAttributeDataBatchCallback  = void (*)(PyObject * appContext, const uint8_t * data, size_t dataLen, size_t count);
 using OnReadEventDataCallback           = void (*)(PyObject * appContext, chip::EndpointId endpointId, chip::ClusterId clusterId,
                                          chip::EventId eventId, chip::EventNumber eventNumber, uint8_t priority, uint64_t timestamp,
                                          uint8_t timestampType, uint8_t * data, size_t dataLen,
@@ -83,6 +108,7 @@ using OnReportBeginCallback             = void (*)(PyObject * appContext);
 using OnReportEndCallback               = void (*)(PyObject * appContext);
 
 OnReadAttributeDataCallback gOnReadAttributeDataCallback             = nullptr;
+OnReadAttributeDataBatchCallback gOnReadAttributeDataBatchCallback   = nullptr;
 OnReadEventDataCallback gOnReadEventDataCallback                     = nullptr;
 OnSubscriptionEstablishedCallback gOnSubscriptionEstablishedCallback = nullptr;
 OnResubscriptionAttemptedCallback gOnResubscriptionAttemptedCallback = nullptr;
@@ -113,6 +139,12 @@ public:
         //
         VerifyOrDie(!aPath.IsListItemOperation());
 
+        if (mBatchAttributeReports)
+        {
+            AppendToAttributeDataBatch(aPath, apData, aStatus);
+            return;
+        }
+
         std::unique_ptr<uint8_t[]> buffer;
         size_t size = 0;
 
@@ -207,7 +239,11 @@ public:
             to_underlying(apStatus == nullptr ? Protocols::InteractionModel::Status::Success : apStatus->mStatus));
     }
 
-    void OnError(CHIP_ERROR aError) override { gOnReadErrorCallback(mAppContext, ToPyChipError(aError)); }
+    void OnError(CHIP_ERROR aError) override
+    {
+        FlushAttributeDataBatch();
+        gOnReadErrorCallback(mAppContext, ToPyChipError(aError));
+    }
 
     void OnReportBegin() override { gOnReportBeginCallback(mAppContext); }
     void OnDeallocatePaths(chip::app::ReadPrepareParams && aReadPrepareParams) override
@@ -228,10 +264,15 @@ public:
         }
     }
 
-    void OnReportEnd() override { gOnReportEndCallback(mAppContext); }
+    void OnReportEnd() override
+    {
+        FlushAttributeDataBatch();
+        gOnReportEndCallback(mAppContext);
+    }
 
     void OnDone(ReadClient *) override
     {
+        FlushAttributeDataBatch();
         gOnReadDoneCallback(mAppContext);
 
         delete this;
@@ -241,7 +282,55 @@ public:
 
     void SetAutoResubscribe(bool autoResubscribe) { mAutoResubscribe = autoResubscribe; }
 
+    void SetBatchAttributeReports(bool batchAttributeReports) { mBatchAttributeReports = batchAttributeReports; }
+
 private:
+    void AppendToAttributeDataBatch(const ConcreteDataAttributePath & aPath, TLV::TLVReader * apData, const StatusIB & aStatus)
+    {
+        AttributeDataBatchRecordHeader header = {};
+        header.dataVersion                    = aPath.mDataVersion.ValueOr(0);
+        header.endpointId                     = aPath.mEndpointId;
+        header.clusterId                      = aPath.mClusterId;
+        header.attributeId                    = aPath.mAttributeId;
+        header.imStatus                       = to_underlying(aStatus.mStatus);
+
+        size_t recordOffset = mAttributeDataBatch.size();
+        size_t bufferLen    = (apData != nullptr) ? apData->GetRemainingLength() + apData->GetLengthRead() : 0;
+        mAttributeDataBatch.resize(recordOffset + sizeof(header) + bufferLen);
+
+        // When the apData is nullptr, means we did not receive a valid attribute data from server, status will be some error
+        // status.
+        if (apData != nullptr)
+        {
+            // Normalize the TLV the same way as in OnAttributeData, but directly into the batch buffer.
+            TLV::TLVWriter writer;
+            writer.Init(mAttributeDataBatch.data() + recordOffset + sizeof(header), bufferLen);
+            CHIP_ERROR err = writer.CopyElement(TLV::AnonymousTag(), *apData);
+            if (err != CHIP_NO_ERROR)
+            {
+                mAttributeDataBatch.resize(recordOffset);
+                this->OnError(err);
+                return;
+            }
+            header.dataLen = static_cast<uint32_t>(writer.GetLengthWritten());
+        }
+
+        memcpy(mAttributeDataBatch.data() + recordOffset, &header, sizeof(header));
+        mAttributeDataBatch.resize(recordOffset + sizeof(header) + header.dataLen);
+        mAttributeDataBatchCount++;
+    }
+
+    // Hands all attribute data accumulated since the last flush to Python in a single call.
+    void FlushAttributeDataBatch()
+    {
+        VerifyOrReturn(mAttributeDataBatchCount != 0);
+        gOnReadAttributeDataBatchCallback(mAppContext, mAttributeDataBatch.data(), mAttributeDataBatch.size(),
+                                          mAttributeDataBatchCount);
+        // Keeps the capacity, so following reports of a subscription do not need to grow the buffer again.
+        mAttributeDataBatch.clear();
+        mAttributeDataBatchCount = 0;
+    }
+
     BufferedReadCallback mBufferedReadCallback;
 
     PyObject * mAppContext;
@@ -249,6 +338,10 @@ private:
     std::unique_ptr<ReadClient> mReadClient;
     bool mAutoResubscribe       = true;
     bool mAutoResubscribeNeeded = false;
+
+    bool mBatchAttributeReports = false;
+    std::vector<uint8_t> mAttributeDataBatch;
+    size_t mAttributeDataBatchCount = 0;
 };
 
 extern "C" {
@@ -261,8 +354,13 @@ struct __attribute__((packed)) PyReadAttributeParams
     bool isFabricFiltered;
     bool keepSubscriptions;
     bool autoResubscribe;
+    bool batchAttributeReports;
 };
 
+// Python builds the params with _ReadParams in Attribute.py, keep the layout in sync with it.
+static_assert(sizeof(PyReadAttributeParams) == 9 && offsetof(PyReadAttributeParams, batchAttributeReports) == 8,
+              "PyReadAttributeParams layout mismatch");
+
 PyChipError pychip_WriteClient_WriteAttributes(void * appContext, DeviceProxy * device, size_t timedWriteTimeoutMsSizeT,
                                                size_t interactionTimeoutMsSizeT, size_t busyWaitMsSizeT,
                                                chip::python::PyWriteAttributeData * writeAttributesData, size_t attributeDataLength,
@@ -344,6 +442,11 @@ void pychip_ReadClient_InitCallbacks(OnReadAttributeDataCallback onReadAttribute
     gOnReportEndCallback               = onReportEndCallback;
 }
 
+void pychip_ReadClient_InitAttributeDataBatchCallback(OnReadAttributeDataBatchCallback onReadAttributeDataBatchCallback)
+{
+    gOnReadAttributeDataBatchCallback = onReadAttributeDataBatchCallback;
+}
+
 PyChipError pychip_WriteClient_WriteAttributes(void * appContext, DeviceProxy * device, size_t timedWriteTimeoutMsSizeT,
                                                size_t interactionTimeoutMsSizeT, size_t busyWaitMsSizeT,
                                                python::PyWriteAttributeData * writeAttributesData, size_t attributeDataLength,
@@ -529,6 +632,8 @@ PyChipError pychip_ReadClient_Read(void * appContext, ReadClient ** pReadClient,
     auto eventPaths         = std::make_unique<EventPathParams[]>(numEventPaths);
     std::unique_ptr<ReadClient> readClient;
 
+    callback->SetBatchAttributeReports(pyParams.batchAttributeReports);
+
     for (size_t i = 0; i < numAttributePaths; i++)
     {
         void * path = attributePathsFromPython[i];
@@ -16,15 +16,19 @@
 #
 
 import base64
+import contextlib
 import copy
 import ctypes
 import json
 import logging
+import os
 import re
+import threading
+import zlib
 from abc import ABC, abstractmethod
 from configparser import ConfigParser
 from ctypes import CFUNCTYPE, POINTER, c_bool, c_char, c_char_p, c_uint16, c_void_p, py_object
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from ..native import GetLibraryHandle
 
@@ -56,10 +60,7 @@ class PersistentStorage(ABC):
         retrievedValue = self.GetSdkKey(key.decode("utf-8"))
         if retrievedValue is not None:
             sizeToCopy = min(size[0], len(retrievedValue))
-            for count, val in enumerate(retrievedValue):
-                if sizeToCopy == count:
-                    break
-                value[count] = val
+            ctypes.memmove(value, retrievedValue, sizeToCopy)
             # As mentioned above, we are intentionally not returning
             # sizeToCopy as one might expect because the caller
             # will use the value in size[0] to determine if it should
@@ -189,6 +190,10 @@ class PersistentStorageBase(PersistentStorage):
     This class keeps the configuration in the dictionary _data attribute with
     two top-level keys 'repl-config' and 'sdk-config' respectively for the REPL
     and SDK configurations.
+
+    SDK values are kept base64 encoded in _sdkData, as they are persisted, and
+    decoded on first read into _sdkDecodedData, since the SDK reads keys like
+    the fabric table many times.
     """
 
     def __init__(self, data: Dict = {}, sdkData: Dict = {}):
@@ -196,6 +201,7 @@ class PersistentStorageBase(PersistentStorage):
         super().__init__()
         self._data = copy.deepcopy(data)
         self._sdkData = copy.deepcopy(sdkData)
+        self._sdkDecodedData: Dict[str, bytes] = {}
 
     def GetKey(self, key: str) -> Any | None:
         return copy.deepcopy(self._data.get(key, None))
@@ -213,8 +219,11 @@ class PersistentStorageBase(PersistentStorage):
         self.Commit()
 
     def GetSdkKey(self, key: str) -> bytes | None:
+        if (decodedValue := self._sdkDecodedData.get(key, None)) is not None:
+            return decodedValue
         if value := self._sdkData.get(key, None):
-            return base64.b64decode(value)
+            decodedValue = self._sdkDecodedData[key] = base64.b64decode(value)
+            return decodedValue
         return None
 
     def SetSdkKey(self, key: str, value: bytes):
@@ -224,11 +233,17 @@ class PersistentStorageBase(PersistentStorage):
             raise ValueError("SDK key value is not expected to be None")
         LOGGER.debug("Set SDK key: %s = hex:%s", key, value.hex())
         self._sdkData[key] = base64.b64encode(value).decode("utf-8")
+        if value:
+            self._sdkDecodedData[key] = bytes(value)
+        else:
+            # Empty values read back as missing, as they always did.
+            self._sdkDecodedData.pop(key, None)
         self.Commit()
 
     def DeleteSdkKey(self, key: str):
         LOGGER.debug("Delete SDK key: %s", key)
         self._sdkData.pop(key, None)
+        self._sdkDecodedData.pop(key, None)
         self.Commit()
 
 
@@ -387,3 +402,196 @@ class PersistentStorageINI(PersistentStorageBase):
                 config.write(f)
         except Exception as ex:
             LOGGER.critical("Could not save configuration to INI file: %s", ex)
+
+
+class PersistentStorageLog(PersistentStorageBase):
+    """Persistent storage back-end which appends every change to a log file.
+
+    Every write appends a single record, instead of rewriting the whole file
+    as PersistentStorageJSON and PersistentStorageINI do, so the cost of a
+    write does not grow with the amount of stored data. Records are protected
+    by a CRC-32, so a record torn by a crash is detected and dropped, together
+    with anything after it, when the log is loaded again.
+
+    The log is compacted into a snapshot of the live keys once it grows past
+    compactionRatio times the size of that snapshot. The snapshot is written
+    to a temporary file which atomically replaces the log.
+
+    By default, changes are flushed to the operating system on every commit,
+    which survives a crash of the process. With fsync=True, they are also
+    synced to the disk, which survives a power loss. Use Batch() to commit
+    many changes at once.
+    """
+
+    # Compaction is not worth it for small logs.
+    _MIN_COMPACTION_SIZE = 64 * 1024
+
+    def __init__(self, path: str, fsync: bool = False, compactionRatio: float = 4.0):
+        if compactionRatio <= 1:
+            raise ValueError("compactionRatio must be greater than 1")
+        LOGGER.info("Loading configuration from log file: %s", path)
+        self._path = path
+        self._fsync = fsync
+        self._compactionRatio = compactionRatio
+        self._lock = threading.RLock()
+        self._pending: List[bytes] = []
+        self._batchDepth = 0
+        data, sdkData, validSize = self._Load()
+        super().__init__(data, sdkData)
+
+        self._file = open(self._path, 'ab')
+        if self._file.tell() != validSize:
+            LOGGER.warning("Dropping %d bytes of incomplete records from the end of %s",
+                           self._file.tell() - validSize, self._path)
+            self._file.truncate(validSize)
+        self._logSize = validSize
+        self._snapshotSize = len(self._Snapshot())
+
+    def _Load(self):
+        data: Dict[str, Any] = {}
+        sdkData: Dict[str, str] = {}
+        validSize = 0
+        try:
+            with open(self._path, 'rb') as f:
+                for line in f:
+                    record = self._DecodeRecord(line)
+                    if record is None:
+                        break
+                    operation, section, key, *value = record
+                    target = sdkData if section == 'sdk' else data
+                    if operation == 'set':
+                        target[key] = value[0]
+                    else:
+                        target.pop(key, None)
+                    validSize += len(line)
+        except FileNotFoundError:
+            LOGGER.info("Configuration file not found, using empty configuration")
+        return data, sdkData, validSize
+
+    @staticmethod
+    def _EncodeRecord(record: List[Any]) -> bytes:
+        payload = json.dumps(record, ensure_ascii=True, separators=(',', ':')).encode()
+        return b'%08x %s\n' % (zlib.crc32(payload), payload)
+
+    @staticmethod
+    def _DecodeRecord(line: bytes) -> Optional[List[Any]]:
+        if not line.endswith(b'\n') or line[8:9] != b' ':
+            return None
+        payload = line[9:-1]
+        try:
+            if int(line[:8], 16) != zlib.crc32(payload):
+                return None
+            return json.loads(payload)
+        except ValueError:
+            return None
+
+    def _Snapshot(self) -> bytes:
+        return b''.join([self._EncodeRecord(['set', 'repl', key, value]) for key, value in self._data.items()] +
+                        [self._EncodeRecord(['set', 'sdk', key, value]) for key, value in self._sdkData.items()])
+
+    def SetKey(self, key: str, value: Any):
+        with self._lock:
+            if key:
+                self._pending.append(self._EncodeRecord(['set', 'repl', key, value]))
+            super().SetKey(key, value)
+
+    def DeleteKey(self, key: str):
+        with self._lock:
+            if key in self._data:
+                self._pending.append(self._EncodeRecord(['delete', 'repl', key]))
+            super().DeleteKey(key)
+
+    def SetSdkKey(self, key: str, value: bytes):
+        with self._lock:
+            if key and value is not None:
+                self._pending.append(self._EncodeRecord(['set', 'sdk', key, base64.b64encode(value).decode("utf-8")]))
+            super().SetSdkKey(key, value)
+
+    def DeleteSdkKey(self, key: str):
+        with self._lock:
+            if key in self._sdkData:
+                self._pending.append(self._EncodeRecord(['delete', 'sdk', key]))
+            super().DeleteSdkKey(key)
+
+    @contextlib.contextmanager
+    def Batch(self):
+        """Commits all the changes made within the context at once, when leaving it."""
+        with self._lock:
+            self._batchDepth += 1
+            try:
+                yield self
+            finally:
+                self._batchDepth -= 1
+                self.Commit()
+
+    def Commit(self):
+        with self._lock:
+            if self._batchDepth or not self._pending:
+                return
+            records = b''.join(self._pending)
+            try:
+                self._file.write(records)
+                self._file.flush()
+                if self._fsync:
+                    os.fsync(self._file.fileno())
+            except Exception as ex:
+                # The changes stay pending, to be written again with the next commit.
+                LOGGER.critical("Could not save configuration to log file: %s", ex)
+                self._DropUnsavedRecords()
+                return
+            self._pending.clear()
+            self._logSize += len(records)
+            try:
+                if self._logSize > max(self._MIN_COMPACTION_SIZE, self._compactionRatio * self._snapshotSize):
+                    self._Compact()
+            except Exception as ex:
+                LOGGER.critical("Could not compact configuration log file: %s", ex)
+
+    def _DropUnsavedRecords(self):
+        # A record partly written by the failed commit would hide the records appended after it when loading the log,
+        # so the log is cut back to the last successful commit.
+        try:
+            self._file.close()
+        except Exception:
+            # Closing flushes the buffered records again, which fails too, the file is closed nonetheless.
+            pass
+        try:
+            os.truncate(self._path, self._logSize)
+            self._file = open(self._path, 'ab')
+        except Exception as ex:
+            # The file stays closed, so the next commit fails its write and comes here again.
+            LOGGER.critical("Could not drop unsaved records from log file: %s", ex)
+
+    def _Compact(self):
+        snapshot = self._Snapshot()
+        if self._logSize <= self._compactionRatio * len(snapshot):
+            # The log mostly holds live keys, so compacting would not shrink it much.
+            self._snapshotSize = len(snapshot)
+            return
+        LOGGER.debug("Compacting %s from %d to %d bytes", self._path, self._logSize, len(snapshot))
+        temporaryPath = self._path + '.tmp'
+        with open(temporaryPath, 'wb') as f:
+            f.write(snapshot)
+            f.flush()
+            os.fsync(f.fileno())
+        # Some platforms cannot replace a file which is still open.
+        self._file.close()
+        try:
+            os.replace(temporaryPath, self._path)
+            self._logSize = self._snapshotSize = len(snapshot)
+            if hasattr(os, 'O_DIRECTORY'):
+                # Makes the rename itself durable.
+                directory = os.open(os.path.dirname(os.path.abspath(self._path)), os.O_DIRECTORY)
+                try:
+                    os.fsync(directory)
+                finally:
+                    os.close(directory)
+        finally:
+            # Whether or not the log was replaced, the following changes are appended to whichever log is in place.
+            self._file = open(self._path, 'ab')
+
+    def Shutdown(self):
+        with self._lock:
+            if hasattr(self, '_file') and not self._file.closed:
+                self._file.close()
+        super().Shutdown()
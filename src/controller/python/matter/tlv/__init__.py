@@ -28,7 +28,6 @@
 from __future__ import absolute_import, print_function
 
 import struct
-from collections import OrderedDict
 from collections.abc import Mapping, Sequence
 from enum import Enum
 
@@ -137,6 +136,21 @@ class float32(float):
     pass
 
 
+# Encoding tables for TLVWriter.
+_PACK_I8 = struct.Struct("<b").pack
+_PACK_I16 = struct.Struct("<h").pack
+_PACK_I32 = struct.Struct("<l").pack
+_PACK_I64 = struct.Struct("<q").pack
+_PACK_U8 = struct.Struct("<B").pack
+_PACK_U16 = struct.Struct("<H").pack
+_PACK_U32 = struct.Struct("<L").pack
+_PACK_U64 = struct.Struct("<Q").pack
+_PACK_FLOAT = struct.Struct("f").pack
+_PACK_DOUBLE = struct.Struct("d").pack
+_LEN_OF_LEN_OR_VAL_TO_CONTROL_BITS = {2: 1, 4: 2, 8: 3}
+_CONTROL_BYTES = [bytes((controlByte,)) for controlByte in range(256)]
+
+
 class TLVWriter(object):
     def __init__(self, encoding=None, implicitProfile=None):
         self._encoding = encoding if encoding is not None else bytearray()
@@ -198,7 +212,26 @@ class TLVWriter(object):
           the first integer encoded as the profile id and the second as the tag number.
         If tag is None, it is encoded as a TLV anonymous tag.
         """
-        if val is None:
+        # Check the most common exact types first, which avoids the slower isinstance checks against the
+        # abstract Mapping and Sequence types below.
+        valType = type(val)
+        if valType is uint:
+            self.putUnsignedInt(tag, val)
+        elif valType is int:
+            self.putSignedInt(tag, val)
+        elif valType is dict:
+            self.startStructure(tag)
+            for containedTag, containedVal in sorted(val.items(), key=_itemTagToSortKey):
+                self.put(containedTag, containedVal)
+            self.endContainer()
+        elif valType is list:
+            self.startArray(tag)
+            for containedVal in val:
+                self.put(None, containedVal)
+            self.endContainer()
+        elif valType is str:
+            self.putString(tag, val)
+        elif val is None:
             self.putNull(tag)
         elif isinstance(val, Enum):
             self.putUnsignedInt(tag, val)
@@ -218,12 +251,10 @@ class TLVWriter(object):
             self.putBytes(tag, val)
         elif isinstance(val, Mapping):
             self.startStructure(tag)
+            items = val.items()
             if type(val) is dict:
-                val = OrderedDict(
-                    sorted(val.items(),
-                           key=lambda item: tlvTagToSortKey(item[0]))
-                )
-            for containedTag, containedVal in val.items():
+                items = sorted(items, key=_itemTagToSortKey)
+            for containedTag, containedVal in items:
                 self.put(containedTag, containedVal)
             self.endContainer()
         elif isinstance(val, TLVList):
@@ -242,16 +273,15 @@ class TLVWriter(object):
     def putSignedInt(self, tag, val):
         """Write a value as a TLV signed integer with the specified TLV tag."""
         if val >= INT8_MIN and val <= INT8_MAX:
-            format = "<b"
+            val = _PACK_I8(val)
         elif val >= INT16_MIN and val <= INT16_MAX:
-            format = "<h"
+            val = _PACK_I16(val)
         elif val >= INT32_MIN and val <= INT32_MAX:
-            format = "<l"
+            val = _PACK_I32(val)
         elif val >= INT64_MIN and val <= INT64_MAX:
-            format = "<q"
+            val = _PACK_I64(val)
         else:
             raise ValueError("Integer value out of range")
-        val = struct.pack(format, val)
         controlAndTag = self._encodeControlAndTag(
             TLV_TYPE_SIGNED_INTEGER, tag, lenOfLenOrVal=len(val)
         )
@@ -269,7 +299,7 @@ class TLVWriter(object):
 
     def putFloat(self, tag, val):
         """Write a value as a TLV float with the specified TLV tag."""
-        val = struct.pack("f", val)
+        val = _PACK_FLOAT(val)
         controlAndTag = self._encodeControlAndTag(
             TLV_TYPE_FLOATING_POINT_NUMBER, tag, lenOfLenOrVal=len(val)
         )
@@ -278,7 +308,7 @@ class TLVWriter(object):
 
     def putDouble(self, tag, val):
         """Write a value as a TLV double with the specified TLV tag."""
-        val = struct.pack("d", val)
+        val = _PACK_DOUBLE(val)
         controlAndTag = self._encodeControlAndTag(
             TLV_TYPE_FLOATING_POINT_NUMBER, tag, lenOfLenOrVal=len(val)
         )
@@ -329,7 +359,7 @@ class TLVWriter(object):
         self._verifyValidContainerType(containerType)
         controlAndTag = self._encodeControlAndTag(containerType, tag)
         self._encoding.extend(controlAndTag)
-        self._containerStack.insert(0, containerType)
+        self._containerStack.append(containerType)
 
     def startStructure(self, tag):
         """Start writing a TLV structure with the specified TLV tag."""
@@ -345,42 +375,33 @@ class TLVWriter(object):
 
     def endContainer(self):
         """End writing the current TLV container."""
-        self._containerStack.pop(0)
-        controlAndTag = self._encodeControlAndTag(TLVEndOfContainer, None)
-        self._encoding.extend(controlAndTag)
+        self._containerStack.pop()
+        self._encoding.extend(_CONTROL_BYTES[TLVEndOfContainer])
 
     def _encodeControlAndTag(self, type, tag, lenOfLenOrVal=0):
-        controlByte = type
-        if lenOfLenOrVal == 2:
-            controlByte |= 1
-        elif lenOfLenOrVal == 4:
-            controlByte |= 2
-        elif lenOfLenOrVal == 8:
-            controlByte |= 3
+        controlByte = type | _LEN_OF_LEN_OR_VAL_TO_CONTROL_BITS.get(lenOfLenOrVal, 0)
         if tag is None:
             if (
                 type != TLVEndOfContainer
-                and len(self._containerStack) != 0
-                and self._containerStack[0] == TLV_TYPE_STRUCTURE
+                and self._containerStack
+                and self._containerStack[-1] == TLV_TYPE_STRUCTURE
             ):
                 raise ValueError(
                     "Attempt to encode anonymous tag within TLV structure")
-            controlByte |= TLV_TAG_CONTROL_ANONYMOUS
-            return struct.pack("<B", controlByte)
+            return _CONTROL_BYTES[controlByte | TLV_TAG_CONTROL_ANONYMOUS]
         if isinstance(tag, int):
             if tag < 0 or tag > UINT8_MAX:
                 raise ValueError(
                     "Context-specific TLV tag number out of range")
-            if len(self._containerStack) == 0:
+            if not self._containerStack:
                 raise ValueError(
                     "Attempt to encode context-specific TLV tag at top level"
                 )
-            if self._containerStack[0] == TLV_TYPE_ARRAY:
+            if self._containerStack[-1] == TLV_TYPE_ARRAY:
                 raise ValueError(
                     "Attempt to encode context-specific tag within TLV array"
                 )
-            controlByte |= TLV_TAG_CONTROL_CONTEXT_SPECIFIC
-            return struct.pack("<BB", controlByte, tag)
+            return bytes((controlByte | TLV_TAG_CONTROL_CONTEXT_SPECIFIC, tag))
         if isinstance(tag, tuple):
             (profile, tagNum) = tag
             if not isinstance(tagNum, int):
@@ -393,8 +414,8 @@ class TLVWriter(object):
                 if profile < 0 or profile > UINT32_MAX:
                     raise ValueError("TLV profile id value out of range")
             if (
-                len(self._containerStack) != 0
-                and self._containerStack[0] == TLV_TYPE_ARRAY
+                self._containerStack
+                and self._containerStack[-1] == TLV_TYPE_ARRAY
             ):
                 raise ValueError(
                     "Attempt to encode profile-specific tag within TLV array"
@@ -421,7 +442,7 @@ class TLVWriter(object):
                     return struct.pack("<BHHH", controlByte, vendorId, profileNum, tagNum)
                 else:
                     controlByte |= TLV_TAG_CONTROL_FULLY_QUALIFIED_8Bytes
-                    return struct.pack("<BHHL", controlByte, vendorId, profileNum, profile, tagNum)
+                    return struct.pack("<BHHL", controlByte, vendorId, profileNum, tagNum)
         raise ValueError("Invalid object given for TLV tag")
 
     @staticmethod
@@ -429,16 +450,14 @@ class TLVWriter(object):
         if val < 0:
             raise ValueError("Integer value out of range")
         if val <= UINT8_MAX:
-            format = "<B"
+            return _PACK_U8(val)
         elif val <= UINT16_MAX:
-            format = "<H"
+            return _PACK_U16(val)
         elif val <= UINT32_MAX:
-            format = "<L"
+            return _PACK_U32(val)
         elif val <= UINT64_MAX:
-            format = "<Q"
-        else:
-            raise ValueError("Integer value out of range")
-        return struct.pack(format, val)
+            return _PACK_U64(val)
+        raise ValueError("Integer value out of range")
 
     @staticmethod
     def _verifyValidContainerType(containerType):
@@ -450,20 +469,176 @@ class TLVWriter(object):
             raise ValueError("Invalid TLV container type")
 
 
+# Decoding tables for TLVReader.get(), indexed by the element type (lower 5 bits of the control byte).
+# Each entry is (kind, size, unpack) where size is the width of the value for scalars, or the width of the
+# length field for strings.
+_ELEMENT_SCALAR = 0
+_ELEMENT_UNSIGNED = 1
+_ELEMENT_FLOAT32 = 2
+_ELEMENT_UTF8_STRING = 3
+_ELEMENT_BYTE_STRING = 4
+_ELEMENT_CONSTANT = 5
+_ELEMENT_STRUCTURE = 6
+_ELEMENT_ARRAY = 7
+_ELEMENT_PATH = 8
+_ELEMENT_END_OF_CONTAINER = 9
+
+_UNPACK_U8 = struct.Struct("<B").unpack_from
+_UNPACK_U16 = struct.Struct("<H").unpack_from
+_UNPACK_U32 = struct.Struct("<L").unpack_from
+_UNPACK_U64 = struct.Struct("<Q").unpack_from
+_UNPACK_UNSIGNED = {1: _UNPACK_U8, 2: _UNPACK_U16, 4: _UNPACK_U32, 8: _UNPACK_U64}
+
+_ELEMENT_DECODERS = {
+    0x00: (_ELEMENT_SCALAR, 1, struct.Struct("<b").unpack_from),
+    0x01: (_ELEMENT_SCALAR, 2, struct.Struct("<h").unpack_from),
+    0x02: (_ELEMENT_SCALAR, 4, struct.Struct("<l").unpack_from),
+    0x03: (_ELEMENT_SCALAR, 8, struct.Struct("<q").unpack_from),
+    0x04: (_ELEMENT_UNSIGNED, 1, _UNPACK_U8),
+    0x05: (_ELEMENT_UNSIGNED, 2, _UNPACK_U16),
+    0x06: (_ELEMENT_UNSIGNED, 4, _UNPACK_U32),
+    0x07: (_ELEMENT_UNSIGNED, 8, _UNPACK_U64),
+    0x08: (_ELEMENT_CONSTANT, 0, False),
+    0x09: (_ELEMENT_CONSTANT, 0, True),
+    0x0A: (_ELEMENT_FLOAT32, 4, struct.Struct("<f").unpack_from),
+    0x0B: (_ELEMENT_SCALAR, 8, struct.Struct("<d").unpack_from),
+    0x0C: (_ELEMENT_UTF8_STRING, 1, _UNPACK_U8),
+    0x0D: (_ELEMENT_UTF8_STRING, 2, _UNPACK_U16),
+    0x0E: (_ELEMENT_UTF8_STRING, 4, _UNPACK_U32),
+    0x0F: (_ELEMENT_UTF8_STRING, 8, _UNPACK_U64),
+    0x10: (_ELEMENT_BYTE_STRING, 1, _UNPACK_U8),
+    0x11: (_ELEMENT_BYTE_STRING, 2, _UNPACK_U16),
+    0x12: (_ELEMENT_BYTE_STRING, 4, _UNPACK_U32),
+    0x13: (_ELEMENT_BYTE_STRING, 8, _UNPACK_U64),
+    0x14: (_ELEMENT_CONSTANT, 0, None),
+    0x15: (_ELEMENT_STRUCTURE, 0, None),
+    0x16: (_ELEMENT_ARRAY, 0, None),
+    0x17: (_ELEMENT_PATH, 0, None),
+    0x18: (_ELEMENT_END_OF_CONTAINER, 0, None),
+}
+
+
 class TLVReader(object):
     def __init__(self, tlv):
         self._tlv = tlv
         self._bytesRead = 0
         self._decodings = []
+        self._decoded = False
 
     @property
     def decoding(self):
+        """Detailed, per-element decoding of the tlv data (control byte, tag, length and value of each element)."""
+        if not self._decoded:
+            self._decoded = True
+            self._bytesRead = 0
+            self._get(self._tlv, self._decodings, {})
         return self._decodings
 
     def get(self):
         """Get the dictionary representation of tlv data"""
+        return self._fastGet(self._tlv)
+
+    @staticmethod
+    def _fastGet(tlv):
+        """Decodes tlv data into its dictionary representation.
+
+        This produces the same output as decoding through _get, but uses precompiled decoding tables and an
+        explicit container stack instead of building a detailed decoding for every element.
+        """
+        buf = memoryview(tlv).cast("B") if not isinstance(tlv, bytes) else tlv
+        end = len(buf)
+        pos = 0
         out = {}
-        self._get(self._tlv, self._decodings, out)
+        # Stack of the containers being decoded, the top level output is treated as a structure.
+        stack = [out]
+        container = out
+
+        while pos < end:
+            controlByte = buf[pos]
+            pos += 1
+
+            elementType = controlByte & 0x1F
+            decoder = _ELEMENT_DECODERS.get(elementType)
+            if decoder is None:
+                raise ValueError("Attempt to decode unsupported TLV type")
+            kind, size, unpack = decoder
+
+            tagControl = controlByte & 0xE0
+            profileTag = None
+            if tagControl == TLV_TAG_CONTROL_ANONYMOUS:
+                tag = None
+            elif tagControl == TLV_TAG_CONTROL_CONTEXT_SPECIFIC:
+                tag = buf[pos]
+                pos += 1
+            elif tagControl == TLV_TAG_CONTROL_COMMON_PROFILE_2Bytes:
+                profileTag = (0, _UNPACK_U16(buf, pos)[0])
+                pos += 2
+            elif tagControl == TLV_TAG_CONTROL_COMMON_PROFILE_4Bytes:
+                profileTag = (0, _UNPACK_U32(buf, pos)[0])
+                pos += 4
+            elif tagControl == TLV_TAG_CONTROL_IMPLICIT_PROFILE_2Bytes:
+                profileTag = (None, _UNPACK_U16(buf, pos)[0])
+                pos += 2
+            elif tagControl == TLV_TAG_CONTROL_IMPLICIT_PROFILE_4Bytes:
+                profileTag = (None, _UNPACK_U32(buf, pos)[0])
+                pos += 4
+            elif tagControl == TLV_TAG_CONTROL_FULLY_QUALIFIED_6Bytes:
+                profileTag = ((_UNPACK_U16(buf, pos)[0] << 16) | _UNPACK_U16(buf, pos + 2)[0], _UNPACK_U16(buf, pos + 4)[0])
+                pos += 6
+            else:
+                profileTag = ((_UNPACK_U16(buf, pos)[0] << 16) | _UNPACK_U16(buf, pos + 2)[0], _UNPACK_U32(buf, pos + 4)[0])
+                pos += 8
+
+            if kind == _ELEMENT_SCALAR:
+                (value,) = unpack(buf, pos)
+                pos += size
+            elif kind == _ELEMENT_UNSIGNED:
+                value = uint(unpack(buf, pos)[0])
+                pos += size
+            elif kind == _ELEMENT_CONSTANT:
+                value = unpack
+            elif kind == _ELEMENT_FLOAT32:
+                value = float32(unpack(buf, pos)[0])
+                pos += size
+            elif kind == _ELEMENT_UTF8_STRING or kind == _ELEMENT_BYTE_STRING:
+                (length,) = unpack(buf, pos)
+                pos += size
+                if pos + length > end:
+                    raise ValueError("Attempt to decode truncated TLV string")
+                value = bytes(buf[pos:pos + length])
+                pos += length
+                if kind == _ELEMENT_UTF8_STRING:
+                    try:
+                        value = str(value, "utf-8")
+                    except Exception:
+                        pass
+            elif kind == _ELEMENT_END_OF_CONTAINER:
+                if len(stack) == 1:
+                    # End of container at the top level ends the decoding.
+                    break
+                stack.pop()
+                container = stack[-1]
+                continue
+            elif kind == _ELEMENT_STRUCTURE:
+                value = {}
+            elif kind == _ELEMENT_ARRAY:
+                value = []
+            else:
+                value = TLVList()
+
+            if profileTag is not None:
+                container[profileTag] = value
+            elif isinstance(container, dict):
+                container[tag if tag is not None else "Any"] = value
+            elif isinstance(container, TLVList):
+                container.append(tag, value)
+            else:
+                container.append(value)
+
+            if kind >= _ELEMENT_STRUCTURE:
+                stack.append(value)
+                container = value
+
         return out
 
     def _decodeControlByte(self, tlv, decoding):
@@ -699,6 +874,10 @@ class TLVReader(object):
                     raise ValueError("Attempt to decode unsupported TLV tag")
 
 
+def _itemTagToSortKey(item):
+    return tlvTagToSortKey(item[0])
+
+
 def tlvTagToSortKey(tag):
     if tag is None:
         return -1
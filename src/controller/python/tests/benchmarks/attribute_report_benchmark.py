@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+'''
+Replays a large synthetic wildcard subscription report through AsyncReadTransaction, the same way reports
+coming from the CHIP stack are handled, and times how long it takes to resolve the changed paths.
+
+This does not require the native library, only the python cluster objects. Example:
+
+    python3 attribute_report_benchmark.py --endpoints 500 --compare-linear --compare-batched
+'''
+
+import argparse
+import ctypes
+import time
+
+import matter.clusters as Clusters
+from matter.clusters import Attribute, ClusterObjects
+from matter.tlv import TLVWriter
+
+# Clusters typically exposed by every endpoint of a bridge.
+BRIDGED_ENDPOINT_CLUSTERS = [
+    Clusters.Descriptor,
+    Clusters.Identify,
+    Clusters.Groups,
+    Clusters.OnOff,
+    Clusters.LevelControl,
+    Clusters.ColorControl,
+    Clusters.BridgedDeviceBasicInformation,
+]
+
+
+class _StandInSubscription:
+    ''' Minimal stand-in for a SubscriptionTransaction, which requires a running CHIP stack. '''
+
+    OnReportDeltaCb = None
+
+    def __init__(self):
+        self.changes = 0
+
+    def OnAttributeChangeCb(self, path, transaction):
+        self.changes += 1
+
+    def OnReportEndCb(self, transaction):
+        pass
+
+
+class _StandInEventLoop:
+    ''' Runs callbacks scheduled from the CHIP thread right away, there is only a single thread here. '''
+
+    def call_soon_threadsafe(self, callback, *args):
+        callback(*args)
+
+
+def _LinearResolve(attributes, path: Attribute.AttributePath):
+    ''' Path resolution as done before the (cluster id, attribute id) index existed, kept for comparison. '''
+    for (attributeType, clusterType) in attributes:
+        if clusterType.id == path.ClusterId and attributeType.attribute_id == path.AttributeId:
+            return clusterType, attributeType
+    raise KeyError(path)
+
+
+def BuildReport(endpoints: int):
+    payload = TLVWriter()
+    payload.put(None, 0)
+    data = bytes(payload.encoding)
+
+    report = []
+    for endpoint in range(1, endpoints + 1):
+        for cluster in BRIDGED_ENDPOINT_CLUSTERS:
+            for c_field in cluster.descriptor.Fields:
+                report.append((Attribute.AttributePath(EndpointId=endpoint, ClusterId=cluster.id, AttributeId=c_field.Tag), data))
+    return report
+
+
+def ReplayReport(report, iterations: int) -> float:
+    elapsed = 0.0
+    for _ in range(iterations):
+        transaction = Attribute.AsyncReadTransaction(None, None, None, returnClusterObject=False)
+        transaction._subscription_handler = _StandInSubscription()
+
+        start = time.perf_counter()
+        for path, data in report:
+            transaction.handleAttributeData(path, 1, 0, data)
+        transaction._handleReportEnd()
+        elapsed += time.perf_counter() - start
+
+        assert transaction._subscription_handler.changes == len(report)
+    return elapsed / iterations
+
+
+def DeliverReport(report, batched: bool) -> float:
+    ''' Times delivering the report through the ctypes callbacks which are called from the CHIP thread, either one
+        callback per attribute or a single callback with the whole report.
+    '''
+    transaction = Attribute.AsyncReadTransaction(None, _StandInEventLoop(), None, returnClusterObject=False,
+                                                 batchAttributeReports=batched)
+    transaction._subscription_handler = _StandInSubscription()
+
+    if batched:
+        batch = b''.join(
+            Attribute._AttributeDataBatchRecordHeader.pack(1, path.EndpointId, path.ClusterId, path.AttributeId, 0, len(data)) + data
+            for path, data in report)
+        buffer = ctypes.create_string_buffer(batch, len(batch))
+        start = time.perf_counter()
+        Attribute._OnReadAttributeDataBatchCallback(transaction, ctypes.addressof(buffer), len(batch), len(report))
+        Attribute._OnReportEndCallback(transaction)
+    else:
+        buffers = [(path, ctypes.create_string_buffer(data, len(data))) for path, data in report]
+        start = time.perf_counter()
+        for path, buffer in buffers:
+            Attribute._OnReadAttributeDataCallback(transaction, 1, path.EndpointId, path.ClusterId, path.AttributeId, 0,
+                                                   ctypes.addressof(buffer), len(buffer))
+        Attribute._OnReportEndCallback(transaction)
+    elapsed = time.perf_counter() - start
+
+    assert transaction._subscription_handler.changes == len(report)
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--endpoints', type=int, default=200, help='Number of bridged endpoints in the report')
+    parser.add_argument('--iterations', type=int, default=3, help='Number of times the report is replayed')
+    parser.add_argument('--compare-linear', action='store_true',
+                        help='Also time resolving every path by walking the whole attribute index')
+    parser.add_argument('--compare-batched', action='store_true',
+                        help='Also time delivering the report through the per-attribute and the batched ctypes callbacks')
+    args = parser.parse_args()
+
+    report = BuildReport(args.endpoints)
+    print(f"Report size:         {len(report):10d} attribute paths")
+
+    perReport = ReplayReport(report, args.iterations)
+    print(f"Report handling:     {perReport * 1000:10.1f} ms ({perReport / len(report) * 1e6:.2f} us/path)")
+
+    if args.compare_linear:
+        attributes = [(attributeType, ClusterObjects.ALL_CLUSTERS[clusterId])
+                      for clusterId, clusterAttributes in ClusterObjects.ALL_ATTRIBUTES.items()
+                      for attributeType in clusterAttributes.values()]
+        start = time.perf_counter()
+        for path, _ in report:
+            _LinearResolve(attributes, path)
+        linear = time.perf_counter() - start
+        print(f"Linear resolution:   {linear * 1000:10.1f} ms ({linear / len(report) * 1e6:.2f} us/path)")
+
+    if args.compare_batched:
+        for name, batched in [('Per-attribute:', False), ('Batched:', True)]:
+            delivery = DeliverReport(report, batched)
+            print(f"{name:20s} {delivery * 1000:10.1f} ms ({delivery / len(report) * 1e6:.2f} us/path)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+'''
+Times decoding the attribute data of a full wildcard read of a large device into cluster objects, for both the
+cluster-view and the attribute-view, as done by AttributeCache.GetUpdatedAttributeCache.
+
+This does not require the native library, only the python cluster objects. Example:
+
+    python3 cluster_objects_benchmark.py --endpoints 100 --compare-legacy
+'''
+
+import argparse
+import enum
+import time
+import typing
+
+import matter.clusters as Clusters
+from matter.clusters import ClusterObjects
+from matter.clusters.Types import Nullable
+from matter.tlv import TLVReader
+
+# Clusters typically exposed by every endpoint of a device, plus a few with large struct lists.
+DEVICE_ENDPOINT_CLUSTERS = [
+    Clusters.Descriptor,
+    Clusters.Identify,
+    Clusters.Groups,
+    Clusters.OnOff,
+    Clusters.LevelControl,
+    Clusters.ColorControl,
+    Clusters.BridgedDeviceBasicInformation,
+    Clusters.AccessControl,
+    Clusters.UnitTesting,
+]
+
+
+# Number of entries in every list attribute, and in lists nested in structs.
+LIST_LENGTH = 4
+
+
+def _SampleValue(fieldType):
+    if typing.get_origin(fieldType) == typing.Union:
+        fieldType = next(t for t in typing.get_args(fieldType) if t not in (Nullable, type(None)))
+    if typing.get_origin(fieldType) == list:
+        (elementType, ) = typing.get_args(fieldType)
+        return [_SampleValue(elementType) for _ in range(LIST_LENGTH)]
+    if issubclass(fieldType, ClusterObjects.ClusterObject):
+        return fieldType(**{c_field.Label: _SampleValue(c_field.Type) for c_field in fieldType.descriptor.Fields})
+    if issubclass(fieldType, enum.Enum):
+        return next(iter(fieldType))
+    return fieldType(0) if issubclass(fieldType, (int, float)) else fieldType()
+
+
+def BuildWildcardRead(endpoints: int):
+    ''' Returns the TLV cache (endpoint -> cluster id -> attribute id -> decoded TLV) of a wildcard read. '''
+    clusterData = {}
+    for cluster in DEVICE_ENDPOINT_CLUSTERS:
+        attributes = ClusterObjects.ALL_ATTRIBUTES[cluster.id]
+        clusterData[cluster.id] = {
+            c_field.Tag: TLVReader(bytes(attributes[c_field.Tag].ToTLV(None, _SampleValue(c_field.Type)))).get()['Any']
+            for c_field in cluster.descriptor.Fields}
+
+    return {endpoint: {clusterId: dict(attributes) for clusterId, attributes in clusterData.items()}
+            for endpoint in range(endpoints)}
+
+
+def DecodeClusterView(tlvCache, legacy: bool) -> float:
+    start = time.perf_counter()
+    for endpointData in tlvCache.values():
+        for clusterId, clusterData in endpointData.items():
+            clusterType = ClusterObjects.ALL_CLUSTERS[clusterId]
+            if legacy:
+                clusterType.FromDict(data=clusterType.descriptor.TagDictToLabelDict([], clusterData))
+            else:
+                clusterType.FromTagDict(clusterData)
+    return time.perf_counter() - start
+
+
+def DecodeAttributeView(tlvCache, legacy: bool) -> float:
+    start = time.perf_counter()
+    for endpointData in tlvCache.values():
+        for clusterId, clusterData in endpointData.items():
+            attributes = ClusterObjects.ALL_ATTRIBUTES[clusterId]
+            for attributeId, value in clusterData.items():
+                attributeType = attributes[attributeId]
+                if legacy:
+                    obj_class = ClusterObjects._MakeAttributeClusterObject(attributeType)
+                    obj_class.FromDict(obj_class.descriptor.TagDictToLabelDict('', {0: value}))
+                else:
+                    attributeType.FromTagDictOrRawValue(value)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--endpoints', type=int, default=50, help='Number of endpoints in the wildcard read')
+    parser.add_argument('--compare-legacy', action='store_true',
+                        help='Also time decoding through the label dictionary and dacite, as done before')
+    args = parser.parse_args()
+
+    tlvCache = BuildWildcardRead(args.endpoints)
+    attributeCount = sum(len(clusterData) for endpointData in tlvCache.values() for clusterData in endpointData.values())
+    print(f"Wildcard read:           {attributeCount:10d} attributes")
+
+    for name, decode in [('Cluster-view', DecodeClusterView), ('Attribute-view', DecodeAttributeView)]:
+        compiled = decode(tlvCache, legacy=False)
+        print(f"{name + ':':24s} {compiled * 1000:10.1f} ms")
+        if args.compare_legacy:
+            legacy = decode(tlvCache, legacy=True)
+            print(f"{name + ' (legacy):':24s} {legacy * 1000:10.1f} ms ({legacy / compiled:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
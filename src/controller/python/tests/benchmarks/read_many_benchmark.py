@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+'''
+Times reading the same attributes from a fleet of stand-in nodes, either one node after the other through Read,
+or through ReadMany with a bounded number of nodes being read at a time.
+
+Every stand-in node takes a fixed time to establish a session and answer the read. This does not require the
+native library, only the python cluster objects. Example:
+
+    python3 read_many_benchmark.py --nodes 2000 --latency-ms 20 --concurrency 64 --compare-serial
+'''
+
+import argparse
+import asyncio
+import time
+
+import matter.clusters as Clusters
+from matter.ChipDeviceCtrl import ChipDeviceControllerBase
+
+# Paths polled from every node of the fleet.
+POLLED_ATTRIBUTES = [
+    (0, Clusters.BasicInformation),
+    (1, Clusters.OnOff.Attributes.OnOff),
+    (1, Clusters.LevelControl.Attributes.CurrentLevel),
+    (1, Clusters.ColorControl),
+    Clusters.Descriptor.Attributes.PartsList,
+]
+
+
+class _StandInController(ChipDeviceControllerBase):
+    ''' Controller whose reads are answered by stand-in nodes, as the real one requires a running CHIP stack. '''
+
+    def __init__(self, latency: float):
+        self._latency = latency
+        self.maxInFlight = 0
+        self._inFlight = 0
+
+    def __del__(self):
+        pass
+
+    def CheckIsActive(self):
+        pass
+
+    async def _Read(self, nodeid, attributePaths, clusterDataVersionFilters, eventPaths, **readArgs):
+        self._inFlight += 1
+        self.maxInFlight = max(self.maxInFlight, self._inFlight)
+        try:
+            await asyncio.sleep(self._latency)
+            return nodeid
+        finally:
+            self._inFlight -= 1
+
+
+async def ReadSerially(controller: _StandInController, nodes: int) -> float:
+    start = time.perf_counter()
+    for nodeid in range(nodes):
+        await controller.Read(nodeid, attributes=POLLED_ATTRIBUTES)
+    return time.perf_counter() - start
+
+
+async def ReadMany(controller: _StandInController, nodes: int, concurrency: int) -> float:
+    start = time.perf_counter()
+    async for result in controller.ReadMany(range(nodes), attributes=POLLED_ATTRIBUTES, concurrency=concurrency):
+        if result.error is not None:
+            raise result.error
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--nodes', type=int, default=1000, help='Number of nodes in the fleet')
+    parser.add_argument('--latency-ms', type=float, default=10, help='Time each node takes to answer a read')
+    parser.add_argument('--concurrency', type=int, default=32, help='Maximum number of nodes read at a time')
+    parser.add_argument('--compare-serial', action='store_true', help='Also time reading the nodes one after the other')
+    args = parser.parse_args()
+
+    controller = _StandInController(args.latency_ms / 1000)
+    elapsed = asyncio.run(ReadMany(controller, args.nodes, args.concurrency))
+    print(f"ReadMany:                {elapsed * 1000:10.1f} ms ({args.nodes / elapsed:.0f} nodes/s, "
+          f"{controller.maxInFlight} in flight)")
+    if args.compare_serial:
+        serial = asyncio.run(ReadSerially(controller, args.nodes))
+        print(f"Read, one by one:        {serial * 1000:10.1f} ms ({serial / elapsed:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
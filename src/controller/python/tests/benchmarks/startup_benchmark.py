@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+'''
+Measures the start-up cost of the python cluster objects in fresh interpreters: importing matter.clusters,
+resolving a report path for an unknown cluster, and touching the first generated cluster object.
+
+This does not require the native library. Example:
+
+    python3 startup_benchmark.py --runs 5
+'''
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+_MEASURE_SCRIPT = '''
+import json
+import time
+
+start = time.perf_counter()
+import matter.clusters as Clusters
+from matter.clusters import Attribute
+imported = time.perf_counter()
+Attribute._GetTypedAttribute(0xFFF1FC99, 0)
+unknown = time.perf_counter()
+Attribute.TypedAttributePath(Path=Attribute.AttributePath(EndpointId=1, ClusterId=Clusters.OnOff.id, AttributeId=0))
+touched = time.perf_counter()
+
+print(json.dumps({
+    "import matter.clusters": imported - start,
+    "resolve unknown path": unknown - imported,
+    "first cluster object": touched - unknown,
+    "total": touched - start,
+}))
+'''
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5, help='Number of fresh interpreters to measure')
+    args = parser.parse_args()
+
+    samples = {}
+    for _ in range(args.runs):
+        output = subprocess.run([sys.executable, '-c', _MEASURE_SCRIPT], check=True, capture_output=True, text=True).stdout
+        for phase, duration in json.loads(output).items():
+            samples.setdefault(phase, []).append(duration)
+
+    for phase, durations in samples.items():
+        print(f"{phase:<24} median {statistics.median(durations) * 1000:8.1f} ms, "
+              f"min {min(durations) * 1000:8.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
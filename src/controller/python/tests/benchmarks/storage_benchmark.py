@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+'''
+Times the SDK key writes of the persistent storage back-ends, on a storage already holding the fabric tables,
+certificates and session resumption data of many fabrics, as counters and session resumption data keep being written.
+
+Also times the SDK key reads done at controller start-up, where the fabric table of every fabric is read several
+times, through the callback called by the storage adapter of the SDK. --compare-legacy adds the timing of the reads as
+done before, decoding the value at every read and copying it byte by byte.
+
+The storage adapter of the SDK is not registered, so this does not require the native library. Example:
+
+    python3 storage_benchmark.py --fabrics 64 --writes 2000 --compare-legacy
+'''
+
+import argparse
+import base64
+import ctypes
+import os
+import statistics
+import tempfile
+import time
+from unittest import mock
+
+from matter import storage
+
+# Size of the data stored per fabric: NOC, ICAC, RCAC, fabric metadata and session resumption entries.
+FABRIC_KEYS = {'n': 400, 'i': 400, 'r': 400, 'm': 64, 's': 128, 'k': 256}
+
+
+def Populate(store: storage.PersistentStorageBase, fabrics: int):
+    for fabric in range(1, fabrics + 1):
+        for key, size in FABRIC_KEYS.items():
+            store.SetSdkKey(f'f/{fabric:x}/{key}', os.urandom(size))
+
+
+def TimeWrites(store: storage.PersistentStorageBase, writes: int):
+    latencies = []
+    for counter in range(writes):
+        start = time.perf_counter()
+        store.SetSdkKey('g/gdc', counter.to_bytes(4, 'little'))
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def TimeStartupReads(store: storage.PersistentStorageBase, fabrics: int, passes: int, legacy: bool = False):
+    keys = [f'f/{fabric:x}/{key}'.encode() for fabric in range(1, fabrics + 1) for key in FABRIC_KEYS]
+    buffer = ctypes.create_string_buffer(1024)
+    size = ctypes.c_uint16()
+    found = ctypes.c_bool()
+    start = time.perf_counter()
+    for _ in range(passes):
+        for key in keys:
+            size.value = len(buffer)
+            if legacy:
+                value = base64.b64decode(store._sdkData[key.decode('utf-8')])
+                for count, val in enumerate(value):
+                    buffer[count] = val
+            else:
+                storage.PersistentStorage._OnGetKeyValueCb(store, key, buffer, ctypes.pointer(size), ctypes.pointer(found))
+    return (time.perf_counter() - start) / (passes * len(keys))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--fabrics', type=int, default=32, help='Number of fabrics held by the storage')
+    parser.add_argument('--writes', type=int, default=1000, help='Number of timed key writes')
+    parser.add_argument('--reads', type=int, default=10, help='Number of times every fabric key is read at start-up')
+    parser.add_argument('--compare-legacy', action='store_true', help='Also time the reads as done before')
+    args = parser.parse_args()
+
+    backends = [
+        ('JSON', lambda path: storage.PersistentStorageJSON(path + '.json')),
+        ('INI', lambda path: storage.PersistentStorageINI(path + '.ini')),
+        ('Log', lambda path: storage.PersistentStorageLog(path + '.log')),
+        ('Log, fsync', lambda path: storage.PersistentStorageLog(path + '.fsync.log', fsync=True)),
+    ]
+
+    with mock.patch.object(storage, 'GetLibraryHandle'), tempfile.TemporaryDirectory() as directory:
+        for name, create in backends:
+            store = create(os.path.join(directory, 'storage'))
+            if isinstance(store, storage.PersistentStorageLog):
+                with store.Batch():
+                    Populate(store, args.fabrics)
+            else:
+                Populate(store, args.fabrics)
+            latencies = TimeWrites(store, args.writes)
+            print(f"{name + ':':12s} mean {statistics.mean(latencies) * 1e6:9.1f} us, "
+                  f"p99 {statistics.quantiles(latencies, n=100)[98] * 1e6:9.1f} us")
+            store.Shutdown()
+
+        store = storage.VolatileTemporaryPersistentStorage()
+        Populate(store, args.fabrics)
+        print(f"Start-up reads: {TimeStartupReads(store, args.fabrics, args.reads) * 1e6:9.2f} us per key")
+        if args.compare_legacy:
+            print(f"Legacy reads:   {TimeStartupReads(store, args.fabrics, args.reads, legacy=True) * 1e6:9.2f} us per key")
+        store.Shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+'''
+Micro-benchmarks for TLVWriter/TLVReader over payloads shaped like common cluster data: a full ACL,
+a Descriptor PartsList of a large bridge, a burst of events and a BasicInformation read.
+
+The fast TLVReader.get() decoding is compared with the detailed per-element decoding it replaced.
+This does not require the native library. Example:
+
+    python3 tlv_benchmark.py --number 200
+'''
+
+import argparse
+import timeit
+
+from matter.tlv import TLVReader, TLVWriter, uint
+
+
+def AclPayload():
+    # AccessControlEntryStruct: privilege, authMode, subjects, targets, fabricIndex.
+    return [{
+        1: uint(5),
+        2: uint(2),
+        3: [uint(0x1122334455660000 + i) for i in range(4)],
+        4: [{0: uint(0x0006), 1: uint(i), 2: None} for i in range(3)],
+        254: uint(1),
+    } for i in range(16)]
+
+
+def PartsListPayload():
+    return [uint(endpoint) for endpoint in range(1, 255)]
+
+
+def EventBurstPayload():
+    # Switch MultiPressComplete-like events wrapped in an EventDataIB-like structure.
+    return [{
+        0: {0: uint(1), 1: uint(0x003B), 2: uint(0x06)},
+        1: uint(1000 + i),
+        2: uint(1),
+        3: uint(1700000000000 + i),
+        7: {0: uint(1), 1: uint(2)},
+    } for i in range(200)]
+
+
+def BasicInformationPayload():
+    return {
+        0: uint(17),
+        1: "Project CHIP Authors",
+        2: uint(0xFFF1),
+        3: "Bridge with a fairly long product name",
+        4: uint(0x8001),
+        5: "Living room bridge",
+        6: "XX",
+        7: uint(1),
+        8: "v1.0",
+        9: uint(1),
+        10: "1.0.0-release+build.123456",
+        11: "20260101",
+        15: "0123456789ABCDEF",
+        18: "00112233445566778899aabbccddeeff",
+        19: {0: uint(3), 1: uint(3)},
+    }
+
+
+PAYLOADS = {
+    "AccessControl ACL": AclPayload,
+    "Descriptor PartsList": PartsListPayload,
+    "Event burst": EventBurstPayload,
+    "BasicInformation": BasicInformationPayload,
+}
+
+
+def Encode(value) -> bytes:
+    writer = TLVWriter()
+    writer.put(None, value)
+    return bytes(writer.encoding)
+
+
+def LegacyDecode(tlv: bytes):
+    reader = TLVReader(tlv)
+    out = {}
+    reader._get(tlv, [], out)
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--number', type=int, default=100, help='Number of iterations per measurement')
+    args = parser.parse_args()
+
+    print(f"{'Payload':<24}{'Size':>8}{'Encode':>12}{'Decode':>12}{'Legacy decode':>16}{'Speedup':>10}")
+    for name, build in PAYLOADS.items():
+        value = build()
+        tlv = Encode(value)
+        assert TLVReader(tlv).get() == LegacyDecode(tlv)
+
+        encode = timeit.timeit(lambda: Encode(value), number=args.number) / args.number
+        decode = timeit.timeit(lambda: TLVReader(tlv).get(), number=args.number) / args.number
+        legacy = timeit.timeit(lambda: LegacyDecode(tlv), number=args.number) / args.number
+        print(f"{name:<24}{len(tlv):>8}{encode * 1e6:>10.0f}us{decode * 1e6:>10.0f}us{legacy * 1e6:>14.0f}us"
+              f"{legacy / decode:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,154 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import ctypes
+import struct
+import unittest
+
+import matter.clusters as Clusters
+from matter.clusters import Attribute
+from matter.interaction_model import Status
+from matter.native import PyChipError
+from matter.tlv import TLVWriter, uint
+
+'''
+This file contains tests for the batched delivery of attribute data from the CHIP thread, where all attribute data
+of a report is handed over in a single buffer and decoded on the event loop thread.
+'''
+
+
+class _QueuedEventLoop:
+    ''' Stand-in for the asyncio event loop, which only runs the scheduled callbacks when asked to. '''
+
+    def __init__(self):
+        self.scheduled = []
+
+    def call_soon_threadsafe(self, callback, *args):
+        self.scheduled.append((callback, args))
+
+    def run(self):
+        while self.scheduled:
+            callback, args = self.scheduled.pop(0)
+            callback(*args)
+
+
+def _record(endpoint, cluster, attribute, value, dataVersion=1, status=Status.Success):
+    data = b''
+    if value is not None:
+        writer = TLVWriter()
+        writer.put(None, value)
+        data = bytes(writer.encoding)
+    return Attribute._AttributeDataBatchRecordHeader.pack(
+        dataVersion, endpoint, cluster.id, attribute.attribute_id, status, len(data)) + data
+
+
+class TestAttributeDataBatch(unittest.TestCase):
+    def test_batch_decoded_on_event_loop(self):
+        eventLoop = _QueuedEventLoop()
+        transaction = Attribute.AsyncReadTransaction(None, eventLoop, None, returnClusterObject=False,
+                                                     batchAttributeReports=True)
+        batch = (_record(1, Clusters.OnOff, Clusters.OnOff.Attributes.OnOff, True, dataVersion=7) +
+                 _record(2, Clusters.LevelControl, Clusters.LevelControl.Attributes.CurrentLevel, uint(42)) +
+                 _record(2, Clusters.LevelControl, Clusters.LevelControl.Attributes.OnLevel, None,
+                         status=Status.UnsupportedAttribute))
+
+        # Goes through the ctypes callback, as the native side would call it.
+        buffer = ctypes.create_string_buffer(batch, len(batch))
+        Attribute._OnReadAttributeDataBatchCallback(transaction, ctypes.addressof(buffer), len(batch), 3)
+        transaction.handleReportEnd()
+        self.assertEqual(transaction._cache.attributeTLVCache, {})
+
+        eventLoop.run()
+        data = transaction._cache.GetUpdatedAttributeCache()
+        self.assertEqual(data[1][Clusters.OnOff][Clusters.OnOff.Attributes.OnOff], True)
+        self.assertEqual(data[1][Clusters.OnOff][Attribute.DataVersion], 7)
+        self.assertEqual(data[2][Clusters.LevelControl][Clusters.LevelControl.Attributes.CurrentLevel], 42)
+        failure = data[2][Clusters.LevelControl][Clusters.LevelControl.Attributes.OnLevel]
+        self.assertIsInstance(failure, Attribute.ValueDecodeFailure)
+        self.assertEqual(failure.Reason.status, Status.UnsupportedAttribute)
+
+    def test_report_callbacks_stay_in_order(self):
+        eventLoop = _QueuedEventLoop()
+        transaction = Attribute.AsyncReadTransaction(None, eventLoop, None, returnClusterObject=True,
+                                                     batchAttributeReports=True)
+        calls = []
+
+        class _Subscription:
+            OnReportDeltaCb = None
+
+            def OnReportBeginCb(self, subscription):
+                calls.append('begin')
+
+            def OnAttributeChangeCb(self, path, subscription):
+                calls.append((path.AttributeType, transaction._cache.GetUpdatedAttributeCache()[1][path.ClusterType].onOff))
+
+            def OnReportEndCb(self, subscription):
+                calls.append('end')
+
+        transaction._subscription_handler = _Subscription()
+        transaction.handleReportBegin()
+        transaction.handleAttributeDataBatch(_record(1, Clusters.OnOff, Clusters.OnOff.Attributes.OnOff, True))
+        transaction.handleReportEnd()
+        self.assertEqual(calls, [])
+
+        eventLoop.run()
+        self.assertEqual(calls, ['begin', (Clusters.OnOff.Attributes.OnOff, True), 'end'])
+
+    def test_error_after_queued_data(self):
+        eventLoop = _QueuedEventLoop()
+        transaction = Attribute.AsyncReadTransaction(None, eventLoop, None, returnClusterObject=True,
+                                                     batchAttributeReports=True)
+        calls = []
+
+        class _Subscription:
+            def OnReportBeginCb(self, subscription):
+                calls.append('begin')
+
+            def OnErrorCb(self, chipError, subscription):
+                calls.append((chipError, transaction._cache.GetUpdatedAttributeCache()[1][Clusters.OnOff].onOff))
+
+        transaction._subscription_handler = _Subscription()
+        transaction.handleReportBegin()
+        transaction.handleAttributeDataBatch(_record(1, Clusters.OnOff, Clusters.OnOff.Attributes.OnOff, True))
+        transaction.handleError(PyChipError.from_code(0x32))
+        self.assertEqual(calls, [])
+
+        eventLoop.run()
+        self.assertEqual(calls, ['begin', (0x32, True)])
+
+
+class TestNativeLayout(unittest.TestCase):
+    ''' The layouts below are asserted with static_assert in attribute.cpp as well, both sides have to change together. '''
+
+    def test_batch_record_header(self):
+        header = Attribute._AttributeDataBatchRecordHeader
+        self.assertEqual(header.size, 19)
+        offsets = [struct.calcsize('=' + header.format[1:i]) for i in range(1, len(header.format))]
+        # dataVersion, endpointId, clusterId, attributeId, imStatus, dataLen
+        self.assertEqual(offsets, [0, 4, 6, 10, 14, 15])
+        self.assertEqual(header.pack(1, 2, 3, 4, 5, 6),
+                         bytes.fromhex('01000000' '0200' '03000000' '04000000' '05' '06000000'))
+
+    def test_read_params(self):
+        self.assertEqual(Attribute._ReadParams.sizeof(), 9)
+        params = Attribute._ReadParams.parse(b'\x00' * Attribute._ReadParams.sizeof())
+        params.BatchAttributeReports = True
+        self.assertEqual(Attribute._ReadParams.build(params), b'\x00' * 8 + b'\x01')
+
+
+if __name__ == '__main__':
+    unittest.main()
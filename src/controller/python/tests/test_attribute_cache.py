@@ -0,0 +1,145 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import builtins
+import unittest
+from unittest import mock
+
+import matter.clusters as Clusters
+from matter.clusters import Attribute
+from matter.interaction_model import Status
+from matter.tlv import TLVWriter, uint
+
+'''
+This file contains tests for the incremental materialization of the attribute cache, and for the per-report
+attribute delta of subscriptions.
+'''
+
+OnOff = Clusters.OnOff
+LevelControl = Clusters.LevelControl
+
+
+def _encode(value):
+    writer = TLVWriter()
+    writer.put(None, value)
+    return bytes(writer.encoding)
+
+
+def _path(cluster, attribute, endpoint=1):
+    return Attribute.AttributePath(EndpointId=endpoint, ClusterId=cluster.id, AttributeId=attribute.attribute_id)
+
+
+class TestIncrementalAttributeCache(unittest.TestCase):
+    def _report(self, transaction, *attributes, dataVersion=1):
+        for path, value in attributes:
+            transaction.handleAttributeData(path, dataVersion, Status.Success, _encode(value))
+        transaction._handleReportEnd()
+
+    def test_cluster_view_updates_a_copy(self):
+        transaction = Attribute.AsyncReadTransaction(None, None, None, returnClusterObject=True)
+        self._report(transaction,
+                     (_path(OnOff, OnOff.Attributes.OnOff), True),
+                     (_path(OnOff, OnOff.Attributes.OnTime), uint(10)))
+        onOff = transaction._cache.GetUpdatedAttributeCache()[1][OnOff]
+        self.assertEqual((onOff.onOff, onOff.onTime, onOff.data_version), (True, 10, 1))
+
+        with mock.patch.object(OnOff, 'FromTagDict', side_effect=AssertionError("cluster decoded again")):
+            self._report(transaction, (_path(OnOff, OnOff.Attributes.OnTime), uint(20)), dataVersion=2)
+            updated = transaction._cache.GetUpdatedAttributeCache()[1][OnOff]
+
+        self.assertIsNot(updated, onOff)
+        self.assertEqual((updated.onOff, updated.onTime, updated.data_version), (True, 20, 2))
+        # The object returned for the previous report is left as it was.
+        self.assertEqual((onOff.onOff, onOff.onTime, onOff.data_version), (True, 10, 1))
+        self.assertIs(transaction._cache.GetUpdatedAttributeCache()[1][OnOff], updated)
+
+    def test_cluster_view_failure_and_recovery(self):
+        transaction = Attribute.AsyncReadTransaction(None, None, None, returnClusterObject=True)
+        self._report(transaction, (_path(OnOff, OnOff.Attributes.OnOff), True))
+        transaction._cache.GetUpdatedAttributeCache()
+
+        # A value of the wrong type fails the whole cluster, as when the cluster is decoded from scratch.
+        self._report(transaction, (_path(OnOff, OnOff.Attributes.OnTime), 'not a number'))
+        self.assertIsInstance(transaction._cache.GetUpdatedAttributeCache()[1][OnOff], Attribute.ValueDecodeFailure)
+
+        self._report(transaction, (_path(OnOff, OnOff.Attributes.OnTime), uint(5)))
+        onOff = transaction._cache.GetUpdatedAttributeCache()[1][OnOff]
+        self.assertEqual((onOff.onOff, onOff.onTime), (True, 5))
+
+    def test_attribute_view_only_decodes_changes(self):
+        transaction = Attribute.AsyncReadTransaction(None, None, None, returnClusterObject=False)
+        self._report(transaction,
+                     (_path(OnOff, OnOff.Attributes.OnOff), True),
+                     (_path(LevelControl, LevelControl.Attributes.CurrentLevel), uint(3)))
+        transaction._cache.GetUpdatedAttributeCache()
+
+        self._report(transaction, (_path(OnOff, OnOff.Attributes.OnOff), False))
+        with mock.patch.object(LevelControl.Attributes.CurrentLevel, 'FromTagDictOrRawValue',
+                               side_effect=AssertionError("attribute decoded again")):
+            data = transaction._cache.GetUpdatedAttributeCache()
+        self.assertEqual(data[1][OnOff][OnOff.Attributes.OnOff], False)
+        self.assertEqual(data[1][LevelControl][LevelControl.Attributes.CurrentLevel], 3)
+
+
+class TestReportDelta(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(builtins, 'chipStack', create=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _subscribe(self, returnClusterObject):
+        transaction = Attribute.AsyncReadTransaction(None, None, None, returnClusterObject=returnClusterObject)
+        transaction._subscription_handler = Attribute.SubscriptionTransaction(transaction, 1, None)
+        transaction._subscription_handler.SetAttributeUpdateCallback(lambda path, transaction: None)
+        return transaction
+
+    def _check_delta(self, returnClusterObject):
+        transaction = self._subscribe(returnClusterObject)
+        subscription = transaction.GetSubscriptionHandler()
+        deltas = []
+        subscription.SetReportDeltaCallback(lambda delta, subscription: deltas.append(delta))
+
+        transaction.handleAttributeData(_path(OnOff, OnOff.Attributes.OnOff), 1, Status.Success, _encode(True))
+        transaction.handleAttributeData(_path(OnOff, OnOff.Attributes.OnTime, endpoint=2), 1, Status.Success,
+                                        _encode(uint(7)))
+        transaction._handleReportEnd()
+        transaction.handleAttributeData(_path(OnOff, OnOff.Attributes.OnOff), 2, Status.Failure, b'')
+        transaction._handleReportEnd()
+
+        self.assertEqual(deltas[0], {1: {OnOff: {OnOff.Attributes.OnOff: True}},
+                                     2: {OnOff: {OnOff.Attributes.OnTime: 7}}})
+        self.assertEqual(list(deltas[1]), [1])
+        self.assertIsInstance(deltas[1][1][OnOff][OnOff.Attributes.OnOff], Attribute.ValueDecodeFailure)
+        self.assertEqual(subscription.GetReportDelta().keys(), deltas[1].keys())
+
+    def test_attribute_view_delta(self):
+        self._check_delta(returnClusterObject=False)
+
+    def test_cluster_view_delta(self):
+        self._check_delta(returnClusterObject=True)
+
+    def test_no_delta_without_callback(self):
+        transaction = self._subscribe(returnClusterObject=True)
+        transaction.handleAttributeData(_path(OnOff, OnOff.Attributes.OnOff), 1, Status.Success, _encode(True))
+        transaction._handleReportEnd()
+        # Nothing is materialized until the cache or the delta is accessed.
+        self.assertEqual(transaction._cache._attributeCache, {})
+        self.assertEqual(transaction.GetSubscriptionHandler().GetReportDelta(), {1: {OnOff: {OnOff.Attributes.OnOff: True}}})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,213 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import asyncio
+import builtins
+import ctypes
+import os
+import tempfile
+import types
+import unittest
+from unittest import mock
+
+import matter.clusters as Clusters
+from matter.ChipDeviceCtrl import ChipDeviceControllerBase
+from matter.clusters import Attribute
+from matter.clusters.AttributeCacheStore import AttributeCacheStore
+from matter.interaction_model import Status
+from matter.native import PyChipError
+from matter.tlv import TLVWriter, uint
+
+'''
+This file contains tests for the persistent attribute cache store, which supplies data version filters to reads and
+merges the clusters that did not change back into their results.
+'''
+
+FABRIC = 0x1234
+NODE = 1
+WILDCARD = [Attribute.AttributePath()]
+
+AccessControl = Clusters.AccessControl
+Descriptor = Clusters.Descriptor
+OnOff = Clusters.OnOff
+LevelControl = Clusters.LevelControl
+
+
+def _encode(value):
+    writer = TLVWriter()
+    writer.put(None, value)
+    return bytes(writer.encoding)
+
+
+def _read(store, reports, attributePaths=WILDCARD):
+    ''' Replays the reports of a read through a read transaction, and merges it with the store. '''
+    transaction = Attribute.AsyncReadTransaction(None, None, None, returnClusterObject=False)
+    for endpoint, attribute, dataVersion, value in reports:
+        path = Attribute.AttributePath(EndpointId=endpoint, ClusterId=attribute.cluster_id, AttributeId=attribute.attribute_id)
+        if value is None:
+            transaction.handleAttributeData(path, dataVersion, Status.UnsupportedAccess, b'')
+        else:
+            transaction.handleAttributeData(path, dataVersion, Status.Success, _encode(value))
+    store.MergeRead(FABRIC, NODE, attributePaths, transaction.GetAttributeCache())
+    return transaction.GetReadResponse().attributes
+
+
+FIRST_READ = [
+    (0, Descriptor.Attributes.PartsList, 1, [uint(1), uint(2)]),
+    (1, Descriptor.Attributes.ServerList, 1, [uint(Descriptor.id), uint(OnOff.id)]),
+    (1, OnOff.Attributes.OnOff, 5, True),
+    (1, OnOff.Attributes.OnTime, 5, uint(10)),
+    (2, LevelControl.Attributes.CurrentLevel, 7, uint(100)),
+]
+
+
+class TestAttributeCacheStore(unittest.TestCase):
+    def setUp(self):
+        self.store = AttributeCacheStore(':memory:')
+        self.addCleanup(self.store.Close)
+
+    def _filters(self, attributePaths=WILDCARD):
+        return sorted((f.EndpointId, f.ClusterId, f.DataVersion)
+                      for f in self.store.GetDataVersionFilters(FABRIC, NODE, attributePaths))
+
+    def test_only_whole_clusters_are_served(self):
+        self.assertTrue(AttributeCacheStore.CanServe(WILDCARD))
+        self.assertTrue(AttributeCacheStore.CanServe([Attribute.AttributePath(EndpointId=1, ClusterId=OnOff.id)]))
+        self.assertFalse(AttributeCacheStore.CanServe(None))
+        self.assertFalse(AttributeCacheStore.CanServe(
+            [Attribute.AttributePath(EndpointId=1, ClusterId=OnOff.id, AttributeId=0)]))
+
+    def test_filters_from_stored_clusters(self):
+        self.assertEqual(self._filters(), [])
+        _read(self.store, FIRST_READ)
+        self.assertEqual(self._filters(), [(0, Descriptor.id, 1), (1, OnOff.id, 5), (1, Descriptor.id, 1), (2, LevelControl.id, 7)])
+        self.assertEqual(self._filters([Attribute.AttributePath(EndpointId=1)]), [(1, OnOff.id, 5), (1, Descriptor.id, 1)])
+
+    def test_unchanged_clusters_are_merged(self):
+        _read(self.store, FIRST_READ)
+        data = _read(self.store, [(1, OnOff.Attributes.OnOff, 6, False), (1, OnOff.Attributes.OnTime, 6, uint(10))])
+
+        self.assertEqual(data[1][OnOff][OnOff.Attributes.OnOff], False)
+        self.assertEqual(data[1][OnOff][Attribute.DataVersion], 6)
+        self.assertEqual(data[2][LevelControl][LevelControl.Attributes.CurrentLevel], 100)
+        self.assertEqual(data[2][LevelControl][Attribute.DataVersion], 7)
+        self.assertEqual(data[0][Descriptor][Descriptor.Attributes.PartsList], [1, 2])
+        self.assertIn((1, OnOff.id, 6), self._filters())
+
+    def test_removed_endpoints_and_clusters_are_dropped(self):
+        _read(self.store, FIRST_READ)
+        data = _read(self.store, [(0, Descriptor.Attributes.PartsList, 2, [uint(1)]),
+                                  (1, Descriptor.Attributes.ServerList, 2, [uint(Descriptor.id)])])
+        self.assertEqual(sorted(data), [0, 1])
+        self.assertNotIn(OnOff, data[1])
+        self.assertEqual(self._filters(), [(0, Descriptor.id, 2), (1, Descriptor.id, 2)])
+
+    def test_clusters_with_errors_are_not_stored(self):
+        _read(self.store, [(1, OnOff.Attributes.OnOff, 5, True), (1, OnOff.Attributes.OnTime, 5, None)])
+        self.assertEqual(self._filters(), [])
+
+    def test_persisted_across_runs(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'attributes.sqlite')
+            store = AttributeCacheStore(path)
+            _read(store, FIRST_READ)
+            store.Close()
+
+            store = AttributeCacheStore(path)
+            data = _read(store, [])
+            store.Remove(FABRIC, NODE)
+            self.assertEqual(store.GetDataVersionFilters(FABRIC, NODE, WILDCARD), [])
+            store.Close()
+
+        self.assertEqual(data[1][OnOff][OnOff.Attributes.OnTime], 10)
+
+
+class _StandInController(ChipDeviceControllerBase):
+    '''
+    Controller going through the real _Read, with the native read client replaced by a node whose ACL has an entry for
+    the fabric of the controller and one for another fabric.
+    '''
+    ACL_DATA_VERSION = 3
+    # Fabric-scoped structs carry their fabric index in the FabricIndex tag.
+    OWN_ENTRY = {254: uint(1)}
+    OTHER_ENTRY = {254: uint(2)}
+
+    def __init__(self, store):
+        self._attributeCacheStore = store
+        self._attributeCacheStoreFabricId = FABRIC
+        self.sentFilters = []
+
+    def __del__(self):
+        pass
+
+    def CheckIsActive(self):
+        pass
+
+    async def GetConnectedDevice(self, nodeid, **kwargs):
+        return types.SimpleNamespace(deviceProxy=None)
+
+    def Read(self, transaction, dataVersionFilters, fabricFiltered, **kwargs):
+        ctypes.pythonapi.Py_IncRef(ctypes.py_object(transaction))
+        filters = [(f.EndpointId, f.ClusterId, f.DataVersion) for f in dataVersionFilters or []]
+        self.sentFilters.append(filters)
+        if (0, AccessControl.id, self.ACL_DATA_VERSION) not in filters:
+            entries = [self.OWN_ENTRY] if fabricFiltered else [self.OWN_ENTRY, self.OTHER_ENTRY]
+            transaction.handleAttributeData(
+                Attribute.AttributePath(EndpointId=0, ClusterId=AccessControl.id,
+                                        AttributeId=AccessControl.Attributes.Acl.attribute_id),
+                self.ACL_DATA_VERSION, Status.Success, _encode(entries))
+        transaction.handleDone()
+        return PyChipError.from_code(0)
+
+
+class TestControllerReads(unittest.TestCase):
+    def setUp(self):
+        self.store = AttributeCacheStore(':memory:')
+        self.addCleanup(self.store.Close)
+        self.controller = _StandInController(self.store)
+        for patcher in [mock.patch.object(builtins, 'chipStack', create=True),
+                        mock.patch.object(Attribute, 'Read', side_effect=self.controller.Read)]:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _acl(self, fabricFiltered):
+        response = asyncio.run(self.controller._Read(NODE, [Attribute.AttributePath(EndpointId=0, ClusterId=AccessControl.id)],
+                                                     None, None, fabricFiltered=fabricFiltered))
+        return response.attributes[0][AccessControl][AccessControl.Attributes.Acl]
+
+    def test_reads_not_fabric_filtered_bypass_the_store(self):
+        self.assertEqual(len(self._acl(fabricFiltered=False)), 2)
+        self.assertEqual(self._filters(), [])
+
+        self.assertEqual(len(self._acl(fabricFiltered=True)), 1)
+        self.assertEqual(self._filters(), [(0, AccessControl.id, self.controller.ACL_DATA_VERSION)])
+
+        # The other fabric's entry is still reported to reads which are not fabric-filtered, and is not stored by them.
+        self.assertEqual(len(self._acl(fabricFiltered=False)), 2)
+        acl = self._acl(fabricFiltered=True)
+        self.assertEqual(len(acl), 1)
+        self.assertEqual(acl[0].fabricIndex, 1)
+        self.assertEqual(self.controller.sentFilters,
+                         [[], [], [], [(0, AccessControl.id, self.controller.ACL_DATA_VERSION)]])
+
+    def _filters(self):
+        return [(f.EndpointId, f.ClusterId, f.DataVersion)
+                for f in self.store.GetDataVersionFilters(FABRIC, NODE, WILDCARD)]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import unittest
+
+import matter.clusters as Clusters
+from matter.clusters import Attribute
+from matter.clusters.ObjectsIndex import ATTRIBUTE_NAMES, CLUSTER_NAMES
+from matter.tlv import TLVReader, TLVWriter
+
+'''
+This file contains tests for the attribute index used to resolve report paths into typed attribute paths,
+and for the attribute cache built on top of it.
+'''
+
+
+def _encode(value):
+    writer = TLVWriter()
+    writer.put(None, value)
+    return TLVReader(bytes(writer.encoding)).get()['Any']
+
+
+class TestAttributeIndex(unittest.TestCase):
+    def test_typed_path_from_path(self):
+        path = Attribute.AttributePath(EndpointId=1, ClusterId=Clusters.OnOff.id,
+                                       AttributeId=Clusters.OnOff.Attributes.OnOff.attribute_id)
+        typedPath = Attribute.TypedAttributePath(Path=path)
+        self.assertIs(typedPath.ClusterType, Clusters.OnOff)
+        self.assertIs(typedPath.AttributeType, Clusters.OnOff.Attributes.OnOff)
+        self.assertEqual(typedPath.AttributeName, 'onOff')
+        self.assertEqual(typedPath.ClusterId, Clusters.OnOff.id)
+        self.assertEqual(typedPath.AttributeId, Clusters.OnOff.Attributes.OnOff.attribute_id)
+
+    def test_typed_path_from_types(self):
+        typedPath = Attribute.TypedAttributePath(ClusterType=Clusters.LevelControl,
+                                                 AttributeType=Clusters.LevelControl.Attributes.CurrentLevel)
+        self.assertEqual(typedPath.AttributeName, 'currentLevel')
+        self.assertEqual(typedPath.ClusterId, Clusters.LevelControl.id)
+
+    def test_typed_path_unknown(self):
+        with self.assertRaises(KeyError):
+            Attribute.TypedAttributePath(Path=Attribute.AttributePath(EndpointId=1, ClusterId=0xFFF1FC99, AttributeId=0))
+
+    def test_index_matches_cluster_descriptors(self):
+        for clusterId, attributes in ATTRIBUTE_NAMES.items():
+            clusterType = getattr(Clusters, CLUSTER_NAMES[clusterId])
+            for attributeId, attributeName in attributes.items():
+                clusterEntry, attributeEntry, label = Attribute._GetTypedAttribute(clusterId, attributeId)
+                self.assertIs(clusterEntry, clusterType)
+                self.assertIs(attributeEntry, getattr(clusterType.Attributes, attributeName))
+                self.assertEqual(label, Attribute._GetAttributeLabel(clusterType, attributeId))
+
+    def test_unknown_event(self):
+        self.assertIsNone(Attribute._GetEventType(0xFFF1FC99, 0))
+        self.assertIs(Attribute._GetEventType(Clusters.Switch.id, Clusters.Switch.Events.InitialPress.event_id),
+                      Clusters.Switch.Events.InitialPress)
+
+    def test_attribute_cache_attribute_view(self):
+        cache = Attribute.AttributeCache()
+        path = Attribute.AttributePath(EndpointId=1, ClusterId=Clusters.OnOff.id,
+                                       AttributeId=Clusters.OnOff.Attributes.OnOff.attribute_id)
+        cache.UpdateTLV(path, 5, _encode(True))
+        # Unknown attributes are skipped rather than failing the whole update.
+        cache.UpdateTLV(Attribute.AttributePath(EndpointId=1, ClusterId=Clusters.OnOff.id, AttributeId=0xFFF10000), 5,
+                        _encode(1))
+
+        data = cache.GetUpdatedAttributeCache()
+        self.assertEqual(data[1][Clusters.OnOff][Clusters.OnOff.Attributes.OnOff], True)
+        self.assertEqual(data[1][Clusters.OnOff][Attribute.DataVersion], 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,6 +4,7 @@ from dataclasses import dataclass
 
 import matter.ChipUtility
 from matter.clusters import ClusterObjects
+from matter.clusters.Types import Nullable, NullValue
 from matter.tlv import TLVReader, TLVWriter, uint
 
 '''
@@ -258,5 +259,52 @@ class TestAttributeDescriptor(unittest.TestCase):
         self.assertEqual(res, [1, 2, 3, 4, 5])
 
 
+class TestCompiledCodec(unittest.TestCase):
+    @dataclass
+    class NullableStruct(ClusterObjects.ClusterObject):
+        @matter.ChipUtility.classproperty
+        def descriptor(cls) -> ClusterObjects.ClusterObjectDescriptor:
+            return ClusterObjects.ClusterObjectDescriptor(
+                Fields=[
+                    ClusterObjects.ClusterObjectFieldDescriptor(
+                        Label="X", Tag=0, Type=typing.Union[Nullable, uint]),
+                    ClusterObjects.ClusterObjectFieldDescriptor(
+                        Label="Y", Tag=1, Type=typing.Optional[TestClusterObjects.C]),
+                ])
+
+        X: 'typing.Union[Nullable, uint]' = 0
+        Y: 'typing.Optional[TestClusterObjects.C]' = None
+
+    def _legacy_decode(self, cls, data):
+        return cls.FromDict(cls.descriptor.TagDictToLabelDict('', data))
+
+    def test_codec_cached_per_class(self):
+        TestClusterObjects.C.FromTagDict({0: uint(1)})
+        TestCompiledCodec.NullableStruct.FromTagDict({0: uint(1)})
+        codec = TestClusterObjects.C.__dict__['_compiledCodec']
+        TestClusterObjects.C.FromTagDict({0: uint(2)})
+        self.assertIs(TestClusterObjects.C.__dict__['_compiledCodec'], codec)
+        self.assertIsNot(TestCompiledCodec.NullableStruct.__dict__['_compiledCodec'], codec)
+
+    def test_matches_legacy_decode(self):
+        for data in [{}, {0: None}, {0: uint(3), 1: {0: uint(4), 1: 5}}, {0: uint(3), 0xFE: 'unknown'}]:
+            self.assertEqual(TestCompiledCodec.NullableStruct.FromTagDict(data),
+                             self._legacy_decode(TestCompiledCodec.NullableStruct, data))
+        self.assertEqual(TestCompiledCodec.NullableStruct.FromTagDict({0: None}).X, NullValue)
+
+    def test_decode_rejects_invalid_values(self):
+        for data in [{1: None}, {0: 'wrong'}, {1: [1, 2]}, {1: {0: -1}}]:
+            with self.assertRaises(Exception):
+                self._legacy_decode(TestCompiledCodec.NullableStruct, data)
+            with self.assertRaises(ValueError):
+                TestCompiledCodec.NullableStruct.FromTagDict(data)
+
+    def test_encode_nested_object_and_dict(self):
+        fromObject = TestCompiledCodec.NullableStruct(X=NullValue, Y=TestClusterObjects.C(X=1, Y=2))
+        fromDict = TestCompiledCodec.NullableStruct(X=NullValue, Y={'X': 1, 'Y': 2})
+        self.assertEqual(fromObject.ToTLV(), fromDict.ToTLV())
+        self.assertEqual(TLVReader(fromObject.ToTLV()).get()['Any'], {0: None, 1: {0: 1, 1: 2}})
+
+
 if __name__ == '__main__':
     unittest.main()
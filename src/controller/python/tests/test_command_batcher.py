@@ -0,0 +1,192 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import asyncio
+import ctypes
+import unittest
+
+import matter.clusters as Clusters
+from matter.ChipDeviceCtrl import ChipDeviceControllerBase
+from matter.clusters import Attribute, Command
+from matter.CommandBatcher import CommandBatcher
+from matter.interaction_model import InteractionModelError
+from matter.interaction_model import Status as InteractionModelStatus
+from matter.tlv import TLVWriter, uint
+
+'''
+This file contains tests for the command batcher, which coalesces the commands sent to the same node at the same
+time into InvokeRequests messages carrying several commands.
+'''
+
+OnOff = Clusters.OnOff
+MaxPathsPerInvoke = Clusters.BasicInformation.Attributes.MaxPathsPerInvoke
+
+
+class _StandInController(ChipDeviceControllerBase):
+    ''' Controller whose commands are answered by stand-in nodes, as the real one requires a running CHIP stack. '''
+
+    def __init__(self, maxPathsPerInvoke=None, failedReads=0):
+        self._commandBatcher = None
+        self._maxPathsPerInvoke = maxPathsPerInvoke
+        self._failedReads = failedReads
+        self.batches = []
+        self.reads = 0
+
+    def __del__(self):
+        pass
+
+    def CheckIsActive(self):
+        pass
+
+    async def ReadAttribute(self, nodeid, attributes, **kwargs):
+        self.reads += 1
+        await asyncio.sleep(0)
+        if self.reads <= self._failedReads:
+            raise InteractionModelError(InteractionModelStatus.Timeout)
+        if self._maxPathsPerInvoke is None:
+            value = Attribute.ValueDecodeFailure(Reason=InteractionModelError(InteractionModelStatus.UnsupportedAttribute))
+        else:
+            value = self._maxPathsPerInvoke
+        return {0: {Clusters.BasicInformation: {MaxPathsPerInvoke: value}}}
+
+    async def SendBatchCommands(self, nodeid, commands, timedRequestTimeoutMs=None, returnDecodeErrors=False, **kwargs):
+        self.batches.append((nodeid, timedRequestTimeoutMs, [(info.EndpointId, type(info.Command)) for info in commands]))
+        await asyncio.sleep(0)
+        if nodeid < 0:
+            raise InteractionModelError(InteractionModelStatus.Busy)
+        responses = []
+        for info in commands:
+            if info.EndpointId == 9:
+                responses.append(InteractionModelError(InteractionModelStatus.UnsupportedEndpoint))
+            elif info.EndpointId == 8:
+                # The response of endpoint 8 fails to decode.
+                error = ValueError("Failed to decode field .status")
+                if not returnDecodeErrors:
+                    raise error
+                responses.append(error)
+            else:
+                responses.append(None)
+        return responses
+
+
+class TestCommandBatcher(unittest.TestCase):
+    def _send(self, controller, commands, **batcherArgs):
+        return self._sendRounds(controller, [commands], **batcherArgs)[0]
+
+    def _sendRounds(self, controller, rounds, **batcherArgs):
+        ''' Sends every round of commands concurrently, one round after the other through the same batcher. '''
+        async def run():
+            controller.SetCommandBatcher(CommandBatcher(controller, **batcherArgs))
+            return [await asyncio.gather(*[controller.SendCommand(*command) for command in commands], return_exceptions=True)
+                    for commands in rounds]
+        return asyncio.run(run())
+
+    def test_concurrent_commands_are_batched(self):
+        controller = _StandInController(maxPathsPerInvoke=10)
+        results = self._send(controller, [(1, endpoint, OnOff.Commands.On()) for endpoint in (1, 2, 9)] +
+                             [(2, 1, OnOff.Commands.Off())])
+        self.assertEqual(results[:2], [None, None])
+        self.assertIsInstance(results[2], InteractionModelError)
+        self.assertEqual(results[2].status, InteractionModelStatus.UnsupportedEndpoint)
+        self.assertEqual(sorted(controller.batches), [
+            (1, None, [(1, OnOff.Commands.On), (2, OnOff.Commands.On), (9, OnOff.Commands.On)]),
+            (2, None, [(1, OnOff.Commands.Off)]),
+        ])
+        self.assertEqual(controller.reads, 2)
+
+    def test_batches_respect_max_paths_per_invoke(self):
+        controller = _StandInController(maxPathsPerInvoke=2)
+        self._send(controller, [(1, endpoint, OnOff.Commands.On()) for endpoint in range(5)])
+        self.assertEqual([len(commands) for _, _, commands in controller.batches], [2, 2, 1])
+
+    def test_same_path_is_not_batched_twice(self):
+        controller = _StandInController(maxPathsPerInvoke=10)
+        self._send(controller, [(1, 1, OnOff.Commands.On()), (1, 1, OnOff.Commands.On()), (1, 2, OnOff.Commands.On())])
+        self.assertEqual([commands for _, _, commands in controller.batches],
+                         [[(1, OnOff.Commands.On)], [(1, OnOff.Commands.On), (2, OnOff.Commands.On)]])
+
+    def test_nodes_without_max_paths_per_invoke(self):
+        controller = _StandInController(maxPathsPerInvoke=None)
+        commands = [(1, endpoint, OnOff.Commands.On()) for endpoint in range(3)]
+        self._sendRounds(controller, [commands, commands])
+        self.assertEqual([len(commands) for _, _, commands in controller.batches], [1, 1, 1, 1, 1, 1])
+        self.assertEqual(controller.reads, 1)
+
+    def test_failed_read_is_retried(self):
+        controller = _StandInController(maxPathsPerInvoke=10, failedReads=1)
+        commands = [(1, endpoint, OnOff.Commands.On()) for endpoint in range(3)]
+        self._sendRounds(controller, [commands, commands, commands])
+        # The first read fails, so those commands are sent one by one, the second read succeeds and is kept.
+        self.assertEqual([len(commands) for _, _, commands in controller.batches], [1, 1, 1, 3, 3])
+        self.assertEqual(controller.reads, 2)
+
+    def test_timed_commands_are_batched_separately(self):
+        controller = _StandInController()
+        self._send(controller, [(1, 1, OnOff.Commands.On()), (1, 2, OnOff.Commands.On(), None, 100)], maxPathsPerInvoke=5)
+        self.assertEqual(sorted(timed or 0 for _, timed, _ in controller.batches), [0, 100])
+        self.assertEqual(controller.reads, 0)
+
+    def test_batch_failure_is_raised_to_all_callers(self):
+        controller = _StandInController()
+        results = self._send(controller, [(-1, 1, OnOff.Commands.On()), (-1, 2, OnOff.Commands.On())], maxPathsPerInvoke=5)
+        self.assertEqual(len(controller.batches), 1)
+        for result in results:
+            self.assertIsInstance(result, InteractionModelError)
+            self.assertEqual(result.status, InteractionModelStatus.Busy)
+
+    def test_decode_failure_is_raised_to_its_caller(self):
+        controller = _StandInController(maxPathsPerInvoke=10)
+        results = self._send(controller, [(1, endpoint, OnOff.Commands.On()) for endpoint in (1, 8, 2)])
+        self.assertEqual(len(controller.batches), 1)
+        self.assertIsNone(results[0])
+        self.assertIsInstance(results[1], ValueError)
+        self.assertIsNone(results[2])
+
+
+class TestBatchCommandsTransaction(unittest.TestCase):
+    def _run(self, badResponse, returnDecodeErrors):
+        ''' Runs a batch of two commands whose first response, badResponse, fails to decode. '''
+        async def run():
+            eventLoop = asyncio.get_running_loop()
+            future = eventLoop.create_future()
+            transaction = Command.AsyncBatchCommandsTransaction(
+                future, eventLoop, [Clusters.Groups.Commands.AddGroupResponse] * 2, returnDecodeErrors=returnDecodeErrors)
+            # Released by _handleDone, as for a transaction given to the native side.
+            ctypes.pythonapi.Py_IncRef(ctypes.py_object(transaction))
+            success = Command.Status(IMStatus=InteractionModelStatus.Success, ClusterStatus=0)
+            for index, response in enumerate([badResponse, {0: uint(0), 1: uint(7)}]):
+                writer = TLVWriter()
+                writer.put(None, response)
+                transaction._handleResponse(Command.CommandPath(1, Clusters.Groups.id, 0), index, success,
+                                            bytes(writer.encoding))
+            transaction._handleDone()
+            return await future
+        return asyncio.run(run())
+
+    def test_decode_error_in_place_of_response(self):
+        for badResponse, error in [({0: b'x', 1: uint(7)}, ValueError), ([uint(0)], AttributeError)]:
+            responses = self._run(badResponse, returnDecodeErrors=True)
+            self.assertIsInstance(responses[0], error)
+            self.assertEqual(responses[1], Clusters.Groups.Commands.AddGroupResponse(status=0, groupID=7))
+
+    def test_decode_error_fails_batch_by_default(self):
+        with self.assertRaises(AttributeError):
+            self._run([uint(0)], returnDecodeErrors=False)
+
+
+if __name__ == '__main__':
+    unittest.main()
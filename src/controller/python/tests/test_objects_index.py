@@ -0,0 +1,94 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import subprocess
+import sys
+import unittest
+
+import matter.clusters as Clusters
+from matter.clusters import ClusterObjects, ObjectsIndex
+from matter.clusters.Command import CommandPath, FindCommandClusterObject
+
+'''
+This file contains tests checking that the generated objects index matches the generated cluster objects,
+and that the generated cluster objects are only loaded once they are used.
+'''
+
+
+class TestObjectsIndex(unittest.TestCase):
+    def CheckNames(self, names, registry):
+        # Other tests may register their own cluster objects, only consider the generated clusters.
+        generated = {clusterId for clusterId in registry.keys() if clusterId in ObjectsIndex.CLUSTER_NAMES}
+        self.assertEqual(set(names.keys()), generated)
+        for clusterId, objects in names.items():
+            self.assertEqual({i: name for i, name in objects.items()},
+                             {i: obj.__name__ for i, obj in registry[clusterId].items()})
+
+    def test_clusters(self):
+        for clusterId, name in ObjectsIndex.CLUSTER_NAMES.items():
+            self.assertEqual(ClusterObjects.ALL_CLUSTERS[clusterId].__name__, name)
+        for name in ObjectsIndex.CLUSTER_NAMES.values():
+            self.assertIs(getattr(Clusters, name), getattr(Clusters.Objects, name))
+
+    def test_attributes(self):
+        self.CheckNames({c: a for c, a in ObjectsIndex.ATTRIBUTE_NAMES.items() if a}, ClusterObjects.ALL_ATTRIBUTES)
+
+    def test_events(self):
+        self.CheckNames({c: e for c, e in ObjectsIndex.EVENT_NAMES.items() if e}, ClusterObjects.ALL_EVENTS)
+
+    def test_commands(self):
+        self.CheckNames({c: e for c, e in ObjectsIndex.ACCEPTED_COMMAND_NAMES.items() if e},
+                        ClusterObjects.ALL_ACCEPTED_COMMANDS)
+        self.CheckNames({c: e for c, e in ObjectsIndex.GENERATED_COMMAND_NAMES.items() if e},
+                        ClusterObjects.ALL_GENERATED_COMMANDS)
+
+    def test_find_command(self):
+        path = CommandPath(EndpointId=1, ClusterId=Clusters.Groups.id, CommandId=Clusters.Groups.Commands.AddGroup.command_id)
+        self.assertIs(FindCommandClusterObject(True, path), Clusters.Groups.Commands.AddGroup)
+        self.assertIs(FindCommandClusterObject(False, path), Clusters.Groups.Commands.AddGroupResponse)
+        self.assertIsNone(FindCommandClusterObject(True, CommandPath(EndpointId=1, ClusterId=0xFFF1FC99, CommandId=0)))
+
+    def test_lazy_loading(self):
+        script = '\n'.join([
+            'import sys',
+            'import matter.clusters as Clusters',
+            'from matter.clusters import Attribute',
+            'assert "matter.clusters.Objects" not in sys.modules',
+            'assert Attribute._GetClusterType(0xFFF1FC99) is None',
+            'assert "matter.clusters.Objects" not in sys.modules',
+            'assert Clusters.OnOff.id == 6',
+            'assert "matter.clusters.Objects" in sys.modules',
+            'assert "matter.clusters.objects.OnOff" in sys.modules',
+            'assert "matter.clusters.objects.LevelControl" not in sys.modules',
+        ])
+        subprocess.run([sys.executable, '-c', script], check=True)
+
+    def test_registry_loads_objects(self):
+        script = '\n'.join([
+            'import sys',
+            'from matter.clusters import ClusterObjects',
+            'assert ClusterObjects.ALL_CLUSTERS[6].__name__ == "OnOff"',
+            'assert "matter.clusters.objects.OnOff" in sys.modules',
+            'assert "matter.clusters.objects.LevelControl" not in sys.modules',
+            'assert len(ClusterObjects.ALL_CLUSTERS) > 100',
+            'assert "matter.clusters.objects.LevelControl" in sys.modules',
+        ])
+        subprocess.run([sys.executable, '-c', script], check=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,238 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import asyncio
+import builtins
+import ctypes
+import types
+import unittest
+from unittest import mock
+
+import matter.clusters as Clusters
+from matter.ChipDeviceCtrl import ChipDeviceControllerBase
+from matter.clusters import Attribute
+from matter.native import PyChipError
+
+'''
+This file contains tests for reading from, and subscribing to, many nodes at once through ReadMany and SubscribeMany.
+'''
+
+
+class _StandInController(ChipDeviceControllerBase):
+    ''' Controller whose reads are answered by stand-in nodes, as the real one requires a running CHIP stack. '''
+
+    def __init__(self, delays):
+        self._delays = delays
+        self.reads = []
+        self.inFlight = 0
+        self.maxInFlight = 0
+
+    def __del__(self):
+        pass
+
+    def CheckIsActive(self):
+        pass
+
+    async def _Read(self, nodeid, attributePaths, clusterDataVersionFilters, eventPaths, **readArgs):
+        self.reads.append((nodeid, attributePaths, eventPaths, readArgs))
+        self.inFlight += 1
+        self.maxInFlight = max(self.maxInFlight, self.inFlight)
+        try:
+            await asyncio.sleep(self._delays.get(nodeid, 0))
+            if nodeid < 0:
+                raise ValueError(f"node {nodeid} failed")
+            return nodeid * 10
+        finally:
+            self.inFlight -= 1
+
+
+async def _collect(results):
+    return [result async for result in results]
+
+
+class _NativeStandInController(ChipDeviceControllerBase):
+    '''
+    Controller going through the real _Read and AsyncReadTransaction, with the native read client replaced by a stand-in
+    that only records the transactions. The tests then call the transaction callbacks as the CHIP thread would.
+    '''
+
+    def __init__(self):
+        self._attributeCacheStore = None
+        self.transactions = []
+
+    def __del__(self):
+        pass
+
+    def CheckIsActive(self):
+        pass
+
+    async def GetConnectedDevice(self, nodeid, **kwargs):
+        return types.SimpleNamespace(deviceProxy=None)
+
+    def Read(self, transaction, **kwargs):
+        # Matches the reference the native read client holds on the transaction until handleDone.
+        ctypes.pythonapi.Py_IncRef(ctypes.py_object(transaction))
+        transaction.SetClientObjPointers(len(self.transactions) + 1)
+        self.transactions.append(transaction)
+        return PyChipError.from_code(0)
+
+
+class TestReadMany(unittest.TestCase):
+    def test_results_are_streamed_in_completion_order(self):
+        controller = _StandInController({1: 0.03, 2: 0.0, 3: 0.01})
+        results = asyncio.run(_collect(controller.ReadMany([1, 2, 3], attributes=[(1, Clusters.OnOff)])))
+        self.assertEqual([(result.nodeId, result.response, result.error) for result in results],
+                         [(2, 20, None), (3, 30, None), (1, 10, None)])
+
+    def test_paths_are_parsed_once(self):
+        controller = _StandInController({})
+        asyncio.run(_collect(controller.ReadMany(range(5), attributes=[Clusters.OnOff.Attributes.OnOff], events=[('*', 1)])))
+        self.assertEqual(len(controller.reads), 5)
+        (_, attributePaths, eventPaths, readArgs) = controller.reads[0]
+        self.assertEqual(attributePaths, [Attribute.AttributePath(ClusterId=Clusters.OnOff.id, AttributeId=0)])
+        self.assertEqual(eventPaths, [Attribute.EventPath(Urgent=1)])
+        self.assertIsNone(readArgs.get('reportInterval'))
+        for read in controller.reads:
+            self.assertIs(read[1], attributePaths)
+            self.assertIs(read[2], eventPaths)
+
+    def test_invalid_paths_raise_right_away(self):
+        with self.assertRaises(ValueError):
+            _StandInController({}).ReadMany([1], attributes=[Clusters.OnOff.Commands.On])
+
+    def test_concurrency_is_bounded(self):
+        controller = _StandInController({nodeid: 0.01 for nodeid in range(20)})
+        results = asyncio.run(_collect(controller.ReadMany(range(20), concurrency=4)))
+        self.assertEqual(sorted(result.nodeId for result in results), list(range(20)))
+        self.assertEqual(controller.maxInFlight, 4)
+
+    def test_failures_and_timeouts_are_per_node(self):
+        controller = _StandInController({1: 10, 3: 0.0})
+        results = asyncio.run(_collect(controller.ReadMany([1, -2, 3], timeoutSeconds=0.05)))
+        errors = {result.nodeId: result.error for result in results}
+        self.assertIsInstance(errors[1], asyncio.TimeoutError)
+        self.assertIsInstance(errors[-2], ValueError)
+        self.assertIsNone(errors[3])
+
+    def test_stopping_early_cancels_pending_reads(self):
+        controller = _StandInController({1: 0.0, 2: 10, 3: 10})
+
+        async def firstResult():
+            results = controller.ReadMany([1, 2, 3])
+            result = await results.__anext__()
+            await results.aclose()
+            return result
+
+        self.assertEqual(asyncio.run(firstResult()).nodeId, 1)
+        self.assertEqual(controller.inFlight, 0)
+
+    def test_subscribe_many(self):
+        controller = _StandInController({})
+        results = asyncio.run(_collect(controller.SubscribeMany([1, 2], (1, 10), attributes=[(1, Clusters.OnOff)],
+                                                                autoResubscribe=False)))
+        self.assertEqual(sorted(result.response for result in results), [10, 20])
+        (_, _, _, readArgs) = controller.reads[0]
+        self.assertEqual(readArgs['reportInterval'], (1, 10))
+        self.assertFalse(readArgs['autoResubscribe'])
+
+
+class TestReadManyTimeouts(unittest.TestCase):
+    ''' A timed out read or subscription keeps going in the CHIP stack, which must not break once it completes. '''
+
+    def setUp(self):
+        self.controller = _NativeStandInController()
+        self.shutdownReadClients = []
+        self.loopErrors = []
+
+        chipStack = mock.Mock()
+        chipStack.Call.side_effect = lambda callable: callable()
+        library = mock.Mock()
+        library.pychip_ReadClient_ShutdownSubscription.side_effect = self.shutdownReadClients.append
+        for patcher in [mock.patch.object(builtins, 'chipStack', chipStack, create=True),
+                        mock.patch.object(Attribute, 'GetLibraryHandle', return_value=library),
+                        mock.patch.object(Attribute, 'Read', side_effect=self.controller.Read)]:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def _run(self, results, afterTimeout):
+        asyncio.get_running_loop().set_exception_handler(lambda loop, context: self.loopErrors.append(context))
+        results = await _collect(results)
+        afterTimeout(self.controller.transactions[0])
+        # Lets the callbacks scheduled from the CHIP thread run.
+        await asyncio.sleep(0.01)
+        return results
+
+    def test_subscription_established_after_timeout_is_shut_down(self):
+        def establish(transaction):
+            transaction.handleSubscriptionEstablished(0x1234)
+
+        results = asyncio.run(self._run(self.controller.SubscribeMany([1], (1, 10), timeoutSeconds=0.01), establish))
+        self.assertIsInstance(results[0].error, asyncio.TimeoutError)
+        self.assertEqual(self.loopErrors, [])
+        self.assertEqual(self.shutdownReadClients, [1])
+        self.assertTrue(self.controller.transactions[0].GetSubscriptionHandler()._isDone)
+
+    def test_subscription_established_before_cancellation_is_shut_down(self):
+        async def subscribe():
+            task = asyncio.create_task(self.controller._Read(1, None, None, None, reportInterval=(1, 10)))
+            await asyncio.sleep(0)
+            transaction = self.controller.transactions[0]
+            # The subscription gets established, but the task is cancelled before it gets to return it.
+            transaction._handleSubscriptionEstablished(0x1234)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(subscribe())
+        self.assertEqual(self.shutdownReadClients, [1])
+
+    def test_subscriptions_not_taken_are_shut_down(self):
+        def subscribe(transaction, **kwargs):
+            result = self.controller.Read(transaction, **kwargs)
+            transaction.handleSubscriptionEstablished(0x1000 + len(self.controller.transactions))
+            return result
+
+        async def firstResult():
+            results = self.controller.SubscribeMany([1, 2, 3], (1, 10))
+            result = await results.__anext__()
+            # Lets the other subscriptions get established, so that they are waiting to be taken from the iterator.
+            await asyncio.sleep(0.01)
+            await results.aclose()
+            return result
+
+        with mock.patch.object(Attribute, 'Read', side_effect=subscribe):
+            result = asyncio.run(firstResult())
+        self.assertIsInstance(result.response, Attribute.SubscriptionTransaction)
+        self.assertEqual(len(self.controller.transactions), 3)
+        # Only the subscription handed to the caller is left running, the read clients are numbered in node order.
+        self.assertEqual(sorted(self.shutdownReadClients), sorted({1, 2, 3} - {result.nodeId}))
+        self.assertFalse(result.response._isDone)
+
+    def test_read_done_after_timeout(self):
+        def done(transaction):
+            transaction.handleAttributeData(Attribute.AttributePath(EndpointId=1, ClusterId=Clusters.OnOff.id, AttributeId=0),
+                                            1, 0, b'\x09')
+            transaction.handleDone()
+
+        results = asyncio.run(self._run(self.controller.ReadMany([1], timeoutSeconds=0.01), done))
+        self.assertIsInstance(results[0].error, asyncio.TimeoutError)
+        self.assertEqual(self.loopErrors, [])
+        self.assertEqual(self.shutdownReadClients, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import asyncio
+import unittest
+
+from matter.ChipDeviceCtrl import ChipDeviceControllerBase
+from matter.SessionPool import SessionPool
+
+'''
+This file contains tests for the session pool, which serves the operational device proxies of a controller and
+paces the CASE session establishments.
+'''
+
+
+class _StandInDevice:
+    def __init__(self, nodeid):
+        self.nodeid = nodeid
+        self.isActiveSession = True
+
+
+class _StandInController(ChipDeviceControllerBase):
+    ''' Controller whose sessions are established with stand-in nodes, as the real one requires a running CHIP stack. '''
+
+    def __init__(self, delay=0.0):
+        self._sessionPool = None
+        self._delay = delay
+        self.establishments = []
+        self.inFlight = 0
+        self.maxInFlight = 0
+
+    def __del__(self):
+        pass
+
+    def CheckIsActive(self):
+        pass
+
+    async def _GetOperationalDevice(self, nodeid, timeoutMs, payloadCapability):
+        self.establishments.append((nodeid, asyncio.get_running_loop().time()))
+        self.inFlight += 1
+        self.maxInFlight = max(self.maxInFlight, self.inFlight)
+        try:
+            await asyncio.sleep(self._delay)
+            if nodeid < 0:
+                raise TimeoutError(f"node {nodeid} did not answer")
+            return _StandInDevice(nodeid)
+        finally:
+            self.inFlight -= 1
+
+
+class TestSessionPool(unittest.TestCase):
+    def test_sessions_are_reused(self):
+        async def run():
+            controller = _StandInController()
+            pool = SessionPool(controller)
+            controller.SetSessionPool(pool)
+            first = await controller.GetConnectedDevice(1, allowPASE=False)
+            second = await controller.GetConnectedDevice(1, allowPASE=False)
+            return controller, pool, first, second
+
+        controller, pool, first, second = asyncio.run(run())
+        self.assertIs(first, second)
+        self.assertEqual(len(controller.establishments), 1)
+        self.assertEqual((pool.metrics.hits, pool.metrics.misses, pool.metrics.establishments), (1, 1, 1))
+
+    def test_inactive_sessions_are_established_again(self):
+        async def run():
+            controller = _StandInController()
+            pool = SessionPool(controller)
+            first = await pool.GetConnectedDevice(1)
+            first.isActiveSession = False
+            return pool, first, await pool.GetConnectedDevice(1)
+
+        pool, first, second = asyncio.run(run())
+        self.assertIsNot(first, second)
+        self.assertEqual((pool.metrics.staleSessions, pool.metrics.establishments), (1, 2))
+
+    def test_concurrent_requests_share_an_establishment(self):
+        async def run():
+            controller = _StandInController(delay=0.01)
+            pool = SessionPool(controller)
+            devices = await asyncio.gather(*[pool.GetConnectedDevice(1) for _ in range(5)])
+            return controller, devices
+
+        controller, devices = asyncio.run(run())
+        self.assertEqual(len(controller.establishments), 1)
+        self.assertTrue(all(device is devices[0] for device in devices))
+
+    def test_prewarm_is_bounded_and_paced(self):
+        async def run():
+            controller = _StandInController(delay=0.01)
+            pool = SessionPool(controller, maxConcurrentEstablishments=3, establishmentsPerSecond=200)
+            beginTime = asyncio.get_running_loop().time()
+            failures = await pool.Prewarm([1, 2, -3, 4, 5, 6])
+            return controller, pool, failures, beginTime
+
+        controller, pool, failures, beginTime = asyncio.run(run())
+        self.assertEqual(list(failures), [-3])
+        self.assertIsInstance(failures[-3], TimeoutError)
+        self.assertEqual(len(pool), 5)
+        self.assertLessEqual(controller.maxInFlight, 3)
+        # The n-th establishment starts no earlier than its slot. The gap between two establishments can be shorter, when
+        # the first one starts late, so the start times are compared with the slots instead. Timers may fire up to the
+        # clock resolution early.
+        startTimes = sorted(startTime for _, startTime in controller.establishments)
+        for index, startTime in enumerate(startTimes):
+            self.assertGreaterEqual(startTime - beginTime, index / 200 - 0.001)
+        self.assertEqual((pool.metrics.establishments, pool.metrics.failedEstablishments), (5, 1))
+        self.assertGreater(pool.metrics.averageEstablishmentSeconds, 0)
+
+    def test_failures_are_not_pooled(self):
+        async def run():
+            controller = _StandInController()
+            pool = SessionPool(controller)
+            for _ in range(2):
+                with self.assertRaises(TimeoutError):
+                    await pool.GetConnectedDevice(-1)
+            return controller
+
+        self.assertEqual(len(asyncio.run(run()).establishments), 2)
+
+    def test_pool_of_another_controller(self):
+        with self.assertRaises(ValueError):
+            _StandInController().SetSessionPool(SessionPool(_StandInController()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,205 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import ctypes
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from matter import storage
+
+'''
+This file contains tests for the SDK key callbacks of the persistent storage, and for the append-only log persistent
+storage back-end.
+'''
+
+
+class TestSdkKeyCallbacks(unittest.TestCase):
+    def setUp(self):
+        # The storage adapter of the SDK is not needed to test the python side of the storage.
+        patcher = mock.patch.object(storage, 'GetLibraryHandle')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.store = storage.VolatileTemporaryPersistentStorage(sdkData={'g/fidx': 'AAECAwQ='})
+        self.addCleanup(self.store.Shutdown)
+
+    def _get(self, key: bytes, bufferSize: int):
+        buffer = ctypes.create_string_buffer(bufferSize)
+        size = ctypes.c_uint16(bufferSize)
+        found = ctypes.c_bool(False)
+        # Goes through the ctypes callback, as the native side would call it.
+        storage.PersistentStorage._OnGetKeyValueCb(self.store, key, buffer, ctypes.pointer(size), ctypes.pointer(found))
+        return buffer.raw, size.value, found.value
+
+    def test_get_copies_value(self):
+        self.assertEqual(self._get(b'g/fidx', 8), (b'\x00\x01\x02\x03\x04\x00\x00\x00', 5, True))
+
+    def test_get_into_small_buffer(self):
+        # The full size is returned, so that the SDK can report that the buffer is too small.
+        self.assertEqual(self._get(b'g/fidx', 2), (b'\x00\x01', 5, True))
+
+    def test_get_missing_key(self):
+        self.assertEqual(self._get(b'g/missing', 4), (b'\x00' * 4, 0, False))
+
+    def test_values_are_decoded_once(self):
+        with mock.patch.object(storage.base64, 'b64decode', wraps=storage.base64.b64decode) as b64decode:
+            for _ in range(3):
+                self.assertEqual(self.store.GetSdkKey('g/fidx'), b'\x00\x01\x02\x03\x04')
+            self.assertEqual(b64decode.call_count, 1)
+
+            self.store.SetSdkKey('g/fidx', b'\x05')
+            self.assertEqual(self.store.GetSdkKey('g/fidx'), b'\x05')
+            self.store.DeleteSdkKey('g/fidx')
+            self.assertIsNone(self.store.GetSdkKey('g/fidx'))
+            self.assertEqual(b64decode.call_count, 1)
+
+
+class TestPersistentStorageLog(unittest.TestCase):
+    def setUp(self):
+        # The storage adapter of the SDK is not needed to test the python side of the storage.
+        patcher = mock.patch.object(storage, 'GetLibraryHandle')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'storage.log')
+
+    def _open(self, **kwargs):
+        store = storage.PersistentStorageLog(self.path, **kwargs)
+        self.addCleanup(store.Shutdown)
+        return store
+
+    def test_changes_are_persisted(self):
+        store = self._open()
+        store.SetKey('fabricAdmins', {'1': {'fabricId': 1}})
+        store.SetKey('removed', 1)
+        store.DeleteKey('removed')
+        store.SetSdkKey('f/1/n', b'\x00\x01')
+        store.SetSdkKey('g/lkgt', b'\x02')
+        store.DeleteSdkKey('g/lkgt')
+        store.Shutdown()
+
+        store = self._open()
+        self.assertEqual(store.GetKey('fabricAdmins'), {'1': {'fabricId': 1}})
+        self.assertIsNone(store.GetKey('removed'))
+        self.assertEqual(store.GetSdkKey('f/1/n'), b'\x00\x01')
+        self.assertIsNone(store.GetSdkKey('g/lkgt'))
+
+    def test_writes_are_appended(self):
+        store = self._open()
+        store.SetSdkKey('g/a', b'\x00' * 100)
+        size = os.path.getsize(self.path)
+        store.SetSdkKey('g/b', b'\x01')
+        record = os.path.getsize(self.path) - size
+        store.SetSdkKey('g/b', b'\x02')
+        self.assertEqual(os.path.getsize(self.path), size + 2 * record)
+
+    def test_batch_commits_once(self):
+        store = self._open()
+        with mock.patch.object(store._file, 'write', wraps=store._file.write) as write:
+            with store.Batch():
+                for i in range(10):
+                    store.SetSdkKey(f'g/{i}', bytes([i]))
+                self.assertEqual(write.call_count, 0)
+        self.assertEqual(write.call_count, 1)
+        store.Shutdown()
+        self.assertEqual(self._open().GetSdkKey('g/9'), b'\x09')
+
+    def test_failed_write_is_retried(self):
+        store = self._open()
+        store.SetSdkKey('g/a', b'\x01')
+        write = store._file.write
+
+        def tornWrite(data):
+            write(data[:len(data) // 2])
+            raise OSError("No space left on device")
+
+        with mock.patch.object(store._file, 'write', side_effect=tornWrite):
+            with self.assertLogs(storage.LOGGER, 'CRITICAL'):
+                store.SetSdkKey('g/b', b'\x02')
+        # The change which failed to be written is saved with the next one, and the torn record is gone.
+        store.SetSdkKey('g/c', b'\x03')
+        store.Shutdown()
+
+        store = self._open()
+        self.assertEqual(store.GetSdkKey('g/a'), b'\x01')
+        self.assertEqual(store.GetSdkKey('g/b'), b'\x02')
+        self.assertEqual(store.GetSdkKey('g/c'), b'\x03')
+
+    def test_torn_record_is_dropped(self):
+        store = self._open()
+        store.SetSdkKey('g/a', b'\x01')
+        store.SetSdkKey('g/b', b'\x02')
+        store.Shutdown()
+        with open(self.path, 'r+b') as f:
+            f.truncate(os.path.getsize(self.path) - 3)
+
+        store = self._open()
+        self.assertEqual(store.GetSdkKey('g/a'), b'\x01')
+        self.assertIsNone(store.GetSdkKey('g/b'))
+        store.SetSdkKey('g/c', b'\x03')
+        store.Shutdown()
+        self.assertEqual(self._open().GetSdkKey('g/c'), b'\x03')
+
+    def test_corrupted_record_is_dropped(self):
+        store = self._open()
+        store.SetSdkKey('g/a', b'\x01')
+        store.SetSdkKey('g/a', b'\x02')
+        store.Shutdown()
+        with open(self.path, 'rb') as f:
+            lines = f.readlines()
+        with open(self.path, 'wb') as f:
+            f.write(lines[0] + lines[1].replace(b'Ag==', b'Aw=='))
+        self.assertEqual(self._open().GetSdkKey('g/a'), b'\x01')
+
+    def test_compaction(self):
+        store = self._open(compactionRatio=2)
+        for counter in range(5000):
+            store.SetSdkKey('g/counter', counter.to_bytes(4, 'little'))
+        store.SetKey('config', 'value')
+        self.assertLess(os.path.getsize(self.path), 2 * storage.PersistentStorageLog._MIN_COMPACTION_SIZE)
+        self.assertFalse(os.path.exists(self.path + '.tmp'))
+        store.Shutdown()
+
+        store = self._open()
+        self.assertEqual(store.GetSdkKey('g/counter'), (4999).to_bytes(4, 'little'))
+        self.assertEqual(store.GetKey('config'), 'value')
+
+    def test_failed_compaction_keeps_log(self):
+        store = self._open(compactionRatio=2)
+        with mock.patch.object(storage.os, 'replace', side_effect=OSError("replace failed")) as replace:
+            with self.assertLogs(storage.LOGGER, 'CRITICAL'):
+                for counter in range(5000):
+                    store.SetSdkKey('g/counter', counter.to_bytes(4, 'little'))
+            self.assertTrue(replace.called)
+        self.assertFalse(store._file.closed)
+
+        # Later changes are still saved, and compaction works again once the replace does.
+        store.SetKey('config', 'value')
+        for counter in range(5000, 10000):
+            store.SetSdkKey('g/counter', counter.to_bytes(4, 'little'))
+        self.assertLess(os.path.getsize(self.path), 2 * storage.PersistentStorageLog._MIN_COMPACTION_SIZE)
+        store.Shutdown()
+
+        store = self._open()
+        self.assertEqual(store.GetSdkKey('g/counter'), (9999).to_bytes(4, 'little'))
+        self.assertEqual(store.GetKey('config'), 'value')
+
+
+if __name__ == '__main__':
+    unittest.main()
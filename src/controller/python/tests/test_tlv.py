@@ -17,7 +17,7 @@
 
 import unittest
 
-from matter.tlv import TLVList, TLVReader, TLVWriter
+from matter.tlv import TLVList, TLVReader, TLVWriter, float32
 from matter.tlv import uint as tlvUint
 
 
@@ -130,6 +130,16 @@ class TestTLVWriter(unittest.TestCase):
                                                0x18   # End of container
                                                ]))
 
+    def test_fully_qualified_tag(self):
+        encodeVal = self._getEncoded({(0x12345678, 0x10000): 1})
+        self.assertEqual(encodeVal, bytearray([0b00010101,  # Structure, anonymous tag
+                                               0b11100000,  # Fully qualified 8-byte tag, 1 octet signed int
+                                               0x34, 0x12, 0x78, 0x56,  # Vendor id, profile number
+                                               0x00, 0x00, 0x01, 0x00,  # Tag number
+                                               0x01,
+                                               0x18  # End of container
+                                               ]))
+
 
 class TestTLVReader(unittest.TestCase):
     def _read_case(self, input, answer):
@@ -195,6 +205,88 @@ class TestTLVReader(unittest.TestCase):
                          0x18   # End of container
                          ], TLVList([(None, 1), (None, TLVList([(None, 2), (3, 4)]))]))
 
+    def test_fully_qualified_tag_round_trip(self):
+        for tag, tagControl in [((0x12345678, 0x1234), 'Fully Qualified 6-byte'),
+                                ((0x12345678, 0x10000), 'Fully Qualified 8-byte'),
+                                ((0xFFF1FC01, 0xFFFFFFFF), 'Fully Qualified 8-byte')]:
+            writer = TLVWriter()
+            writer.put(None, {tag: tlvUint(7), 1: 'x'})
+            reader = TLVReader(writer.encoding)
+            self.assertEqual(reader.get()["Any"], {tag: tlvUint(7), 1: 'x'})
+            element = reader.decoding[0]['Structure'][1]
+            self.assertEqual((element['tagControl'], element['profileTag']), (tagControl, tag))
+
+
+class TestTLVReaderFastPath(unittest.TestCase):
+    ''' TLVReader.get() decodes through a table driven fast path, check it matches the detailed per-element decoding. '''
+
+    def _legacy_get(self, tlv):
+        reader = TLVReader(tlv)
+        out = {}
+        reader._get(tlv, [], out)
+        return out
+
+    def _check(self, tlv):
+        fast = TLVReader(tlv).get()
+        legacy = self._legacy_get(tlv)
+        self.assertEqual(fast, legacy)
+        self.assertEqual(repr(fast), repr(legacy))
+        return fast
+
+    def _encode(self, tag, val):
+        writer = TLVWriter()
+        writer.put(tag, val)
+        return writer.encoding
+
+    def test_scalars(self):
+        for val in [0, 1, -1, 0x7f, -0x80, 0x7fff, -0x8000, 0x7fffffff, -0x80000000, 0x7fffffffffffffff,
+                    -0x8000000000000000, tlvUint(0), tlvUint(0xff), tlvUint(0xffff), tlvUint(0xffffffff),
+                    tlvUint(0xffffffffffffffff), True, False, None, 1.5, float32(0.25), "", "hello", "\u00e9t\u00e9",
+                    "x" * 300, "y" * 70000, b"", b"\x00\x01", bytes(range(256)) * 2]:
+            decoded = self._check(self._encode(None, val))["Any"]
+            self.assertEqual(decoded, val)
+            self.assertEqual(type(decoded), type(val) if not isinstance(val, bytes) else bytes)
+
+    def test_containers(self):
+        val = {
+            0: [tlvUint(i) for i in range(300)],
+            1: {0: "nested", 1: [{1: b"\xde\xad", 2: None}, {1: b"", 2: [1, -2, 3]}]},
+            2: TLVList([(None, 1), (1, "a"), (None, TLVList([(2, 3)]))]),
+            3: [],
+            4: {},
+            (0, 1): "common profile",
+            (0, 0x12345): "common profile 4 bytes",
+            (None, 2): "implicit profile",
+            (None, 0x12345): "implicit profile 4 bytes",
+            (0x235A0000, 42): "fully qualified",
+        }
+        self.assertEqual(self._check(self._encode(None, val))["Any"], val)
+
+    def test_top_level_elements(self):
+        tlv = self._encode((None, 1), 1) + self._encode((0, 2), "two") + self._encode(None, 3)
+        self.assertEqual(self._check(tlv), {(None, 1): 1, (0, 2): "two", "Any": 3})
+        # An end of container at the top level ends decoding.
+        self.assertEqual(self._check(self._encode(None, 1) + bytearray([0x18]) + self._encode(None, 2)), {"Any": 1})
+
+    def test_invalid_utf8(self):
+        self.assertEqual(self._check(bytearray([0x0c, 0x02, 0xff, 0xfe]))["Any"], b"\xff\xfe")
+
+    def test_input_types(self):
+        tlv = self._encode(None, {1: [1, 2, 3], 2: "abc"})
+        for data in [bytes(tlv), bytearray(tlv), memoryview(bytes(tlv))]:
+            self.assertEqual(TLVReader(data).get(), {"Any": {1: [1, 2, 3], 2: "abc"}})
+
+    def test_detailed_decoding(self):
+        decodings = TLVReader(self._encode(None, {1: True})).decoding
+        self.assertEqual([d["type"] for d in decodings], ["Structure"])
+        self.assertEqual([d["type"] for d in decodings[0]["Structure"]], ["Boolean True", "End of Collection"])
+
+    def test_truncated(self):
+        with self.assertRaises(Exception):
+            TLVReader(bytearray([0x0c, 0x05, 0x61])).get()
+        with self.assertRaises(Exception):
+            TLVReader(bytearray([0x06, 0x01])).get()
+
 
 class TestTLVTypes(unittest.TestCase):
     def test_list(self):
@@ -37,3 +37,12 @@ def stash_globally(o: object) -> str:
 
 def unstash_globally(id: str) -> Any:
     return _GLOBAL_DATA.get(id)
+
+
+def stashed_ids() -> set[str]:
+    return set(_GLOBAL_DATA)
+
+
+def unstash_all_but(ids: set[str]) -> None:
+    for id in stashed_ids() - ids:
+        del _GLOBAL_DATA[id]
@@ -295,10 +295,12 @@ def generate_mobly_test_config(matter_test_config):
     return test_run_config
 
 
-def _find_test_class():
+def _find_test_class(module=None):
     """Finds the test class in a test script.
     Walk through module members and find the subclass of MatterBaseTest. Only
     one subclass is allowed in a test script.
+    Args:
+      module: The module of the test script, the main module by default.
     Returns:
       The test class in the test module.
     Raises:
@@ -307,7 +309,7 @@ def _find_test_class():
     from matter.testing.matter_testing import MatterBaseTest
 
     def get_subclasses(cls: Any):
-        subclasses = utils.find_subclasses_in_module([cls], sys.modules['__main__'])
+        subclasses = utils.find_subclasses_in_module([cls], module or sys.modules['__main__'])
         subclasses = [c for c in subclasses if c.__name__ != cls.__name__]
         return subclasses
 
@@ -365,6 +367,29 @@ def get_test_info(test_class, matter_test_config) -> list[TestInfo]:
     return info
 
 
+def new_default_controller(stack, matter_test_config):
+    """
+    Create the default controller of the tests on the stack, as configured by the Matter test configuration.
+
+    Args:
+        stack: The Matter stack (MatterStackState) to create the controller on
+        matter_test_config: Configuration for Matter tests
+
+    Returns:
+        ChipDeviceController: The new controller
+    """
+    # TODO: Steer to right FabricAdmin!
+    # TODO: If CASE Admin Subject is a CAT tag range, then make sure to
+    # issue NOC with that CAT tag
+    return stack.certificate_authorities[0].adminList[0].NewController(
+        nodeId=matter_test_config.controller_node_id,
+        paaTrustStorePath=str(
+            matter_test_config.paa_trust_store_path),
+        catTags=matter_test_config.controller_cat_tags,
+        dacRevocationSetPath=matter_test_config.dac_revocation_set_path if matter_test_config.dac_revocation_set_path else ""
+    )
+
+
 def run_tests_no_exit(
         test_class,
         matter_test_config,
@@ -429,17 +454,8 @@ def run_tests_no_exit(
 
         test_config.user_params["matter_stack"] = global_stash.stash_globally(stack)
 
-        # TODO: Steer to right FabricAdmin!
-        # TODO: If CASE Admin Subject is a CAT tag range, then make sure to
-        # issue NOC with that CAT tag
         if not default_controller:
-            default_controller = stack.certificate_authorities[0].adminList[0].NewController(
-                nodeId=matter_test_config.controller_node_id,
-                paaTrustStorePath=str(
-                    matter_test_config.paa_trust_store_path),
-                catTags=matter_test_config.controller_cat_tags,
-                dacRevocationSetPath=matter_test_config.dac_revocation_set_path if matter_test_config.dac_revocation_set_path else ""
-            )
+            default_controller = new_default_controller(stack, matter_test_config)
         test_config.user_params["default_controller"] = global_stash.stash_globally(
             default_controller)
         test_config.user_params["matter_test_config"] = global_stash.stash_globally(
@@ -677,6 +677,30 @@ def get_data_model_directory(data_model_directory: Union[PrebuiltDataModelDirect
     return zip_root / data_model_level.dirname
 
 
+# Parsed data models of the prebuilt directories, once enabled with cache_prebuilt_data_models().
+_prebuilt_data_model_cache: Optional[dict[tuple[DataModelLevel, PrebuiltDataModelDirectory], tuple]] = None
+
+
+def cache_prebuilt_data_models(enabled: bool = True):
+    """
+    Enable (or disable) the caching of the clusters and device types parsed from the prebuilt data model directories.
+
+    This is meant for long-lived processes running many tests, such as the test worker. Every call still returns
+    its own copy of the parsed data, so that a test changing it does not change what the next test gets.
+    """
+    global _prebuilt_data_model_cache
+    _prebuilt_data_model_cache = {} if enabled else None
+
+
+def _cached_prebuilt_data_model(level: DataModelLevel, data_model_directory, build: Callable[[], tuple]) -> tuple:
+    if _prebuilt_data_model_cache is None or not isinstance(data_model_directory, PrebuiltDataModelDirectory):
+        return build()
+    key = (level, data_model_directory)
+    if key not in _prebuilt_data_model_cache:
+        _prebuilt_data_model_cache[key] = build()
+    return deepcopy(_prebuilt_data_model_cache[key])
+
+
 def build_xml_clusters(data_model_directory: Union[PrebuiltDataModelDirectory, Traversable]) -> typing.Tuple[dict[uint, XmlCluster], list[ProblemNotice]]:
     """
     Build XML clusters from the specified data model directory.
@@ -686,7 +710,11 @@ def build_xml_clusters(data_model_directory: Union[PrebuiltDataModelDirectory, T
     If data_model_directory is a Traversable, it is assumed to already contain `clusters` (i.e. be a directory
     with all XML files in it)
     """
+    return _cached_prebuilt_data_model(DataModelLevel.kCluster, data_model_directory,
+                                       lambda: _build_xml_clusters(data_model_directory))
 
+
+def _build_xml_clusters(data_model_directory: Union[PrebuiltDataModelDirectory, Traversable]) -> typing.Tuple[dict[uint, XmlCluster], list[ProblemNotice]]:
     clusters: dict[uint, XmlCluster] = {}
     pure_base_clusters: dict[str, XmlCluster] = {}
     ids_by_name: dict[str, uint] = {}
@@ -1170,6 +1198,13 @@ def parse_single_device_type(root: ElementTree.Element, cluster_definition_xml:
 
 
 def build_xml_device_types(data_model_directory: typing.Union[PrebuiltDataModelDirectory, Traversable], cluster_definition_xml: Optional[dict[uint, XmlCluster]] = None) -> tuple[dict[int, XmlDeviceType], list[ProblemNotice]]:
+    if cluster_definition_xml:
+        return _build_xml_device_types(data_model_directory, cluster_definition_xml)
+    return _cached_prebuilt_data_model(DataModelLevel.kDeviceType, data_model_directory,
+                                       lambda: _build_xml_device_types(data_model_directory))
+
+
+def _build_xml_device_types(data_model_directory: typing.Union[PrebuiltDataModelDirectory, Traversable], cluster_definition_xml: Optional[dict[uint, XmlCluster]] = None) -> tuple[dict[int, XmlDeviceType], list[ProblemNotice]]:
     top = get_data_model_directory(data_model_directory, DataModelLevel.kDeviceType)
     device_types: dict[int, XmlDeviceType] = {}
     problems: list[ProblemNotice] = []
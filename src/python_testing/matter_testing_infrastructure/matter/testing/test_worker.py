@@ -0,0 +1,120 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import os
+import sys
+import tempfile
+import textwrap
+import unittest
+from unittest import mock
+
+from matter.testing import global_stash, worker
+
+TEST_SCRIPT = '''
+import helper
+
+from matter.testing.matter_testing import MatterBaseTest
+
+helper.runs += 1
+
+
+class TC_WORKER(MatterBaseTest):
+    def test_TC_WORKER(self):
+        pass
+'''
+
+
+class _StandInController:
+    def __init__(self, reachable: bool = True):
+        self.reachable = reachable
+        self.expired = []
+
+    def ExpireSessions(self, nodeid):
+        self.expired.append(nodeid)
+
+    async def GetConnectedDevice(self, nodeid, allowPASE=True, timeoutMs=None):
+        if not self.reachable:
+            raise TimeoutError()
+
+
+class TestWorker(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.script = os.path.join(directory.name, 'TC_WORKER.py')
+        with open(self.script, 'w') as f:
+            f.write(textwrap.dedent(TEST_SCRIPT))
+        with open(os.path.join(directory.name, 'helper.py'), 'w') as f:
+            f.write('runs = 0\n')
+
+        # The stack and the test run require the CHIP library, only the work of the worker around them is tested.
+        self.controller = _StandInController()
+        self.configs = []
+        self.helperRuns = []
+
+        def start_stack(test_worker, matter_test_config):
+            test_worker._stack = mock.Mock()
+            test_worker._stack_key = worker._stack_key(matter_test_config)
+            test_worker._default_controller = self.controller
+
+        def run_tests_no_exit(test_class, matter_test_config, event_loop, hooks, default_controller, external_stack):
+            self.assertEqual(test_class.__name__, 'TC_WORKER')
+            self.assertIs(default_controller, self.controller)
+            global_stash.stash_globally(test_class)
+            self.configs.append(matter_test_config)
+            self.helperRuns.append(sys.modules[test_class.__module__].helper.runs)
+            return True
+
+        for patcher in (mock.patch.object(worker.TestWorker, '_start_stack', start_stack),
+                        mock.patch.object(worker, 'run_tests_no_exit', run_tests_no_exit)):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.worker = worker.TestWorker()
+        self.addCleanup(self.worker.shutdown)
+
+    def _run(self, *args):
+        return self.worker.run_script(self.script, ['--storage-path', '/tmp/worker.json', '--dut-node-id', '1', *args])
+
+    def test_scripts_are_isolated(self):
+        argv, stash = list(sys.argv), global_stash.stashed_ids()
+        self.assertTrue(self._run())
+        self.assertTrue(self._run())
+        # Every script gets fresh helper modules.
+        self.assertEqual(self.helperRuns, [1, 1])
+        self.assertNotIn('helper', sys.modules)
+        self.assertEqual(sys.argv, argv)
+        self.assertEqual(global_stash.stashed_ids(), stash)
+        self.assertEqual(self.controller.expired, [1, 1])
+
+    def test_commissioning_is_reused(self):
+        self.assertTrue(self._run('--commissioning-method', 'on-network', '--passcode', '20202021', '--discriminator', '3840'))
+        self.assertTrue(self._run('--commissioning-method', 'on-network', '--passcode', '20202021', '--discriminator', '3840'))
+        self.assertEqual([config.commissioning_method for config in self.configs], ['on-network', None])
+
+        self.controller.reachable = False
+        self.assertTrue(self._run('--commissioning-method', 'on-network', '--passcode', '20202021', '--discriminator', '3840'))
+        self.assertEqual(self.configs[-1].commissioning_method, 'on-network')
+
+    def test_incompatible_scripts_are_rejected(self):
+        self.assertTrue(self._run())
+        with self.assertRaises(worker.IncompatibleScriptError):
+            self.worker.run_script(self.script, ['--storage-path', '/tmp/other.json'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,296 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+"""
+Long-lived worker running successive Matter test scripts in the same process.
+
+Running a test script loads the CHIP library, initializes the Matter stack, creates the default controller, parses
+the data model and commissions the DUT before the first test step. The worker does all that once, and then runs the
+test classes of the scripts it is sent with run_tests_no_exit(), keeping:
+
+    - the Matter stack, its storage and certificate authorities, and the default controller,
+    - the data model parsed from the prebuilt directories,
+    - the DUT commissioned, as long as it can still be reached over CASE.
+
+Between two scripts, the worker shuts down the controllers created by the previous script, expires the sessions to
+the DUT, drops the modules imported from the directory of the previous script, and restores sys.argv and sys.path.
+
+All the scripts sent to a worker must agree on the arguments the stack and the default controller are created with
+(e.g. --storage-path, --paa-trust-store-path, --controller-node-id); other scripts are rejected, and should be run in
+their own process.
+
+Start a worker with:
+
+    python3 -m matter.testing.worker --socket /tmp/matter-test-worker.sock
+
+and run scripts through it with `scripts/tests/run_python_test.py --worker-socket /tmp/matter-test-worker.sock`, or
+with run_in_worker().
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import logging
+import os
+import socket
+import sys
+import uuid
+from dataclasses import dataclass
+from typing import Any, List, Optional, Set
+
+import matter.testing.global_stash as global_stash
+from matter.ChipDeviceCtrl import ChipDeviceControllerBase
+from matter.testing import spec_parsing
+from matter.testing.runner import (InternalTestRunnerHooks, _find_test_class, new_default_controller, parse_matter_test_args,
+                                   run_tests_no_exit)
+
+LOGGER = logging.getLogger(__name__)
+
+# Time given to re-establish a CASE session with a commissioned DUT, before commissioning it again.
+DUT_REACHABLE_TIMEOUT_MS = 10000
+
+
+class IncompatibleScriptError(Exception):
+    """Raised when a script requires the Matter stack or the default controller to be created differently."""
+
+
+@dataclass
+class WorkerResult:
+    ok: bool
+    error: Optional[str] = None
+    incompatible: bool = False
+
+
+def _stack_key(matter_test_config) -> tuple:
+    """Arguments of a script that the Matter stack and the default controller are created with."""
+    return (
+        str(matter_test_config.storage_path),
+        str(matter_test_config.paa_trust_store_path),
+        str(matter_test_config.dac_revocation_set_path),
+        str(matter_test_config.chip_tool_credentials_path),
+        matter_test_config.ble_controller,
+        matter_test_config.root_of_trust_index,
+        matter_test_config.fabric_id,
+        matter_test_config.maximize_cert_chains,
+        matter_test_config.certificate_validity_period,
+        matter_test_config.controller_node_id,
+        tuple(matter_test_config.controller_cat_tags),
+    )
+
+
+class TestWorker:
+    """
+    Runs the test classes of Matter test scripts one after the other, on a Matter stack and a default controller
+    created for the first script.
+    """
+
+    def __init__(self):
+        self._runner = asyncio.Runner()
+        self._stack = None
+        self._stack_key: Optional[tuple] = None
+        self._default_controller = None
+        # DUT node IDs commissioned by a previous script.
+        self._commissioned_node_ids: Set[int] = set()
+        spec_parsing.cache_prebuilt_data_models()
+
+    def run_script(self, script: str, argv: List[str]) -> bool:
+        """
+        Run the test class of a test script, with the given script arguments.
+
+        Raises:
+            IncompatibleScriptError: If the script requires a different stack or default controller.
+
+        Returns:
+            bool: True if all tests passed, False otherwise
+        """
+        script = os.path.abspath(script)
+        try:
+            matter_test_config = parse_matter_test_args(argv)
+        except SystemExit:
+            LOGGER.error("Invalid arguments for %s: %r", script, argv)
+            return False
+
+        if self._stack is None:
+            self._start_stack(matter_test_config)
+        elif _stack_key(matter_test_config) != self._stack_key:
+            raise IncompatibleScriptError(f"{script} requires a different Matter stack or default controller")
+
+        if self._skip_commissioning(matter_test_config):
+            LOGGER.info("Re-using the commissioning of DUT node(s) %r", matter_test_config.dut_node_ids)
+            matter_test_config.commissioning_method = None
+        commissioning = matter_test_config.commissioning_method is not None
+
+        saved_argv, saved_path = sys.argv, list(sys.path)
+        saved_modules = set(sys.modules)
+        saved_controllers = set(ChipDeviceControllerBase.activeList)
+        saved_stash = global_stash.stashed_ids()
+        try:
+            sys.argv = [script] + argv
+            sys.path.insert(0, os.path.dirname(script))
+            try:
+                test_class = _find_test_class(self._load_script(script))
+            except SystemExit:
+                return False
+            ok = run_tests_no_exit(test_class, matter_test_config, self._runner.get_loop(), InternalTestRunnerHooks(),
+                                   self._default_controller, self._stack)
+            if commissioning:
+                # Whether the DUT is still commissioned is checked before the next script.
+                self._commissioned_node_ids.update(matter_test_config.dut_node_ids)
+            return ok
+        finally:
+            self._reset(os.path.dirname(script), saved_argv, saved_path, saved_modules, saved_controllers, saved_stash)
+            # Fresh sessions for the next script, as a script running in its own process would get.
+            for node_id in matter_test_config.dut_node_ids:
+                self._default_controller.ExpireSessions(node_id)
+
+    def shutdown(self):
+        if self._stack is not None:
+            self._stack.Shutdown()
+            self._stack = None
+        self._runner.close()
+
+    def _start_stack(self, matter_test_config):
+        # Lazy import, as the stack state imports the CHIP library.
+        from matter.testing.matter_stack_state import MatterStackState
+
+        self._stack = MatterStackState(matter_test_config)
+        self._stack_key = _stack_key(matter_test_config)
+        self._default_controller = new_default_controller(self._stack, matter_test_config)
+
+    def _skip_commissioning(self, matter_test_config) -> bool:
+        if matter_test_config.commissioning_method is None or matter_test_config.commission_only:
+            return False
+        if not matter_test_config.dut_node_ids or not self._commissioned_node_ids.issuperset(matter_test_config.dut_node_ids):
+            return False
+
+        async def reachable(node_id: int) -> bool:
+            try:
+                await self._default_controller.GetConnectedDevice(node_id, allowPASE=False, timeoutMs=DUT_REACHABLE_TIMEOUT_MS)
+            except Exception as e:
+                LOGGER.info("DUT node %d is no longer reachable, commissioning it again: %s", node_id, e)
+                return False
+            return True
+
+        for node_id in matter_test_config.dut_node_ids:
+            if not self._runner.run(reachable(node_id)):
+                self._commissioned_node_ids.difference_update(matter_test_config.dut_node_ids)
+                return False
+        return True
+
+    @staticmethod
+    def _load_script(script: str):
+        # A unique name, so that every script (and every run of the same script) gets a fresh module.
+        name = f"_matter_test_script_{uuid.uuid4().hex}"
+        spec = importlib.util.spec_from_file_location(name, script)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+        return module
+
+    def _reset(self, script_dir: str, argv: List[str], path: List[str], modules: Set[str], controllers: Set[Any], stash: Set[str]):
+        sys.argv = argv
+        sys.path[:] = path
+
+        # Helper modules next to the script keep their state in their module, give the next script fresh ones.
+        for name in set(sys.modules) - modules:
+            module_file = getattr(sys.modules[name], '__file__', None) or ''
+            if name.startswith('_matter_test_script_') or os.path.dirname(os.path.abspath(module_file)) == script_dir:
+                del sys.modules[name]
+
+        for controller in set(ChipDeviceControllerBase.activeList) - controllers:
+            try:
+                controller.Shutdown()
+            except Exception:
+                LOGGER.exception("Failed to shut down a controller left by the previous script")
+
+        global_stash.unstash_all_but(stash)
+
+
+def _send(sock: socket.socket, message: dict):
+    sock.sendall(json.dumps(message).encode() + b'\n')
+
+
+def _receive(sock: socket.socket) -> Optional[dict]:
+    data = b''
+    while not data.endswith(b'\n'):
+        chunk = sock.recv(4096)
+        if not chunk:
+            return None
+        data += chunk
+    return json.loads(data)
+
+
+def serve(socket_path: str):
+    """
+    Run test scripts sent to the given unix socket, one at a time, until asked to stop.
+
+    Every connection sends one JSON request on a line, either {"script": PATH, "args": [ARG, ...]} to run a script, or
+    {"command": "stop"}, and gets back a WorkerResult as JSON on a line.
+    """
+    worker = TestWorker()
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    server.bind(socket_path)
+    server.listen()
+    LOGGER.info("Test worker listening on %s", socket_path)
+    try:
+        while True:
+            connection, _ = server.accept()
+            with connection:
+                request = _receive(connection)
+                if request is None:
+                    continue
+                if request.get("command") == "stop":
+                    _send(connection, WorkerResult(ok=True).__dict__)
+                    return
+                try:
+                    result = WorkerResult(ok=worker.run_script(request["script"], request.get("args", [])))
+                except IncompatibleScriptError as e:
+                    result = WorkerResult(ok=False, error=str(e), incompatible=True)
+                except Exception as e:
+                    LOGGER.exception("Failed to run %s", request.get("script"))
+                    result = WorkerResult(ok=False, error=str(e))
+                _send(connection, result.__dict__)
+    finally:
+        server.close()
+        os.unlink(socket_path)
+        worker.shutdown()
+
+
+def run_in_worker(socket_path: str, script: str, args: List[str]) -> WorkerResult:
+    """Run a test script in the worker listening on the given unix socket, and wait for its result."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        _send(sock, {"script": os.path.abspath(script), "args": args})
+        response = _receive(sock)
+    if response is None:
+        return WorkerResult(ok=False, error="The test worker closed the connection")
+    return WorkerResult(**response)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--socket', required=True, help='Path of the unix socket to receive the test scripts on')
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    serve(args.socket)
+
+
+if __name__ == '__main__':
+    main()
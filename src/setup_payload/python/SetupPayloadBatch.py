@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+#
+# Copyright (c) 2026 Project CHIP Authors
+# All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Bulk generation and parsing of onboarding codes.
+#
+# Produces the same QR codes and manual pairing codes as SetupPayload.py, for
+# millions of devices: payloads are packed into integers, Base38 is encoded and
+# decoded two characters at a time with lookup tables and the Verhoeff check
+# digit uses per-position tables. Batch functions take scalars or sequences
+# (lists, CSV columns, NumPy arrays) of the same length.
+
+import csv
+import random
+import sys
+import time
+from collections import namedtuple
+from itertools import repeat
+
+import Base38
+import click
+
+QRCODE_PREFIX = 'MT:'
+# QR code payload without TLV data: 88 bits, i.e. 3 chunks of 3 bytes and one of 2 bytes
+QRCODE_PAYLOAD_LEN = 19
+MANUALCODE_SHORT_LEN = 11
+MANUALCODE_LONG_LEN = 21
+
+# Bit positions of the QR code payload fields, lsb first
+QR_VID_SHIFT = 3
+QR_PID_SHIFT = 19
+QR_FLOW_SHIFT = 35
+QR_DISCOVERY_SHIFT = 37
+QR_DISCRIMINATOR_SHIFT = 45
+QR_PINCODE_SHIFT = 57
+
+PINCODE_BITS = 27
+DISCRIMINATOR_BITS = 12
+STANDARD_FLOW = 0
+
+QRCodeFields = namedtuple('QRCodeFields', ['version', 'vid', 'pid', 'flow', 'discovery', 'discriminator', 'pincode'])
+ManualCodeFields = namedtuple('ManualCodeFields', ['vid_pid_present', 'short_discriminator', 'pincode', 'vid', 'pid'])
+
+# Two Base38 characters, least significant first, for each value below RADIX ** 2
+RADIX_2 = Base38.RADIX ** 2
+RADIX_4 = RADIX_2 ** 2
+BASE38_PAIRS = [Base38.CODES[v % Base38.RADIX] + Base38.CODES[v // Base38.RADIX] for v in range(RADIX_2)]
+BASE38_PAIR_VALUES = {pair: v for v, pair in enumerate(BASE38_PAIRS)}
+BASE38_VALUES = {c: v for v, c in enumerate(Base38.CODES)}
+
+# Verhoeff tables, see stdnum.verhoeff
+VERHOEFF_MULTIPLICATION = [
+    [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    [1, 2, 3, 4, 0, 6, 7, 8, 9, 5],
+    [2, 3, 4, 0, 1, 7, 8, 9, 5, 6],
+    [3, 4, 0, 1, 2, 8, 9, 5, 6, 7],
+    [4, 0, 1, 2, 3, 9, 5, 6, 7, 8],
+    [5, 9, 8, 7, 6, 0, 4, 3, 2, 1],
+    [6, 5, 9, 8, 7, 1, 0, 4, 3, 2],
+    [7, 6, 5, 9, 8, 2, 1, 0, 4, 3],
+    [8, 7, 6, 5, 9, 3, 2, 1, 0, 4],
+    [9, 8, 7, 6, 5, 4, 3, 2, 1, 0],
+]
+VERHOEFF_PERMUTATION = [
+    [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    [1, 5, 7, 6, 2, 8, 3, 0, 9, 4],
+    [5, 8, 0, 3, 7, 9, 6, 1, 4, 2],
+    [8, 9, 1, 6, 0, 4, 3, 5, 2, 7],
+    [9, 4, 5, 3, 1, 2, 6, 8, 7, 0],
+    [4, 2, 8, 6, 5, 7, 3, 9, 0, 1],
+    [2, 7, 9, 3, 8, 0, 6, 4, 1, 5],
+    [7, 0, 4, 6, 9, 1, 3, 2, 5, 8],
+]
+VERHOEFF_INVERSE = '0432156789'
+
+
+# For every digit of a payload, from the last one, the next checksum indexed by
+# checksum * 10 + digit; the check digit is appended at position 0
+VERHOEFF_TABLES = [[VERHOEFF_MULTIPLICATION[check][VERHOEFF_PERMUTATION[(i + 1) % 8][digit]]
+                    for check in range(10) for digit in range(10)]
+                   for i in range(MANUALCODE_LONG_LEN - 1)]
+
+
+def check_digit(payload):
+    check = 0
+    for table, c in zip(VERHOEFF_TABLES, reversed(payload.encode())):
+        check = table[check * 10 + c - 48]
+    return VERHOEFF_INVERSE[check]
+
+
+def base38_encode_chunk(value):
+    # 5 characters for 3 bytes
+    high, low = divmod(value, RADIX_2)
+    high, middle = divmod(high, RADIX_2)
+    return BASE38_PAIRS[low] + BASE38_PAIRS[middle] + Base38.CODES[high]
+
+
+def base38_decode_chunk(chunk):
+    # 3 bytes from 5 characters
+    return BASE38_PAIR_VALUES[chunk[0:2]] + BASE38_PAIR_VALUES[chunk[2:4]] * RADIX_2 + BASE38_VALUES[chunk[4]] * RADIX_4
+
+
+def check_fields(discriminator, pincode, discovery, flow, vid, pid):
+    # Values out of range, including negative ones, leave bits after the shift
+    if ((discriminator >> DISCRIMINATOR_BITS) | (pincode >> PINCODE_BITS) | (discovery >> 8) | (flow >> 2)
+            | (vid >> 16) | (pid >> 16)):
+        raise ValueError('Invalid setup payload: discriminator={} pincode={} discovery={} flow={} vid={} pid={}'.format(
+            discriminator, pincode, discovery, flow, vid, pid))
+
+
+def encode_qrcode(discriminator, pincode, discovery=4, flow=STANDARD_FLOW, vid=0, pid=0):
+    check_fields(discriminator, pincode, discovery, flow, vid, pid)
+    # Version 0, the 4 bits of padding are 0
+    value = ((vid << QR_VID_SHIFT) | (pid << QR_PID_SHIFT) | (flow << QR_FLOW_SHIFT)
+             | (discovery << QR_DISCOVERY_SHIFT) | (discriminator << QR_DISCRIMINATOR_SHIFT) | (pincode << QR_PINCODE_SHIFT))
+    # 4 characters for the last 2 bytes
+    high, low = divmod(value >> 72, RADIX_2)
+    return (QRCODE_PREFIX + base38_encode_chunk(value & 0xFFFFFF) + base38_encode_chunk((value >> 24) & 0xFFFFFF)
+            + base38_encode_chunk((value >> 48) & 0xFFFFFF) + BASE38_PAIRS[low] + BASE38_PAIRS[high])
+
+
+def encode_manualcode(discriminator, pincode, flow=STANDARD_FLOW, vid=0, pid=0):
+    check_fields(discriminator, pincode, 0, flow, vid, pid)
+    short_discriminator = discriminator >> 8
+    if flow == STANDARD_FLOW:
+        payload = '{}{:05}{:04}'.format(short_discriminator >> 2,
+                                        ((short_discriminator & 3) << 14) | (pincode & 0x3FFF), pincode >> 14)
+    else:
+        payload = '{}{:05}{:04}{:05}{:05}'.format(4 | (short_discriminator >> 2),
+                                                  ((short_discriminator & 3) << 14) | (pincode & 0x3FFF), pincode >> 14,
+                                                  vid, pid)
+    return payload + check_digit(payload)
+
+
+def decode_qrcode(qrcode):
+    if not qrcode.startswith(QRCODE_PREFIX) or len(qrcode) != len(QRCODE_PREFIX) + QRCODE_PAYLOAD_LEN:
+        raise ValueError('Invalid QR code: {}'.format(qrcode))
+    try:
+        chunk1 = base38_decode_chunk(qrcode[3:8])
+        chunk2 = base38_decode_chunk(qrcode[8:13])
+        chunk3 = base38_decode_chunk(qrcode[13:18])
+        chunk4 = BASE38_PAIR_VALUES[qrcode[18:20]] + BASE38_PAIR_VALUES[qrcode[20:22]] * RADIX_2
+    except KeyError:
+        raise ValueError('Invalid QR code characters: {}'.format(qrcode))
+    if (chunk1 >> 24) | (chunk2 >> 24) | (chunk3 >> 24) | (chunk4 >> 16):
+        raise ValueError('Invalid QR code: {}'.format(qrcode))
+
+    value = chunk1 | (chunk2 << 24) | (chunk3 << 48) | (chunk4 << 72)
+    return QRCodeFields(version=value & 0x7,
+                        vid=(value >> QR_VID_SHIFT) & 0xFFFF,
+                        pid=(value >> QR_PID_SHIFT) & 0xFFFF,
+                        flow=(value >> QR_FLOW_SHIFT) & 0x3,
+                        discovery=(value >> QR_DISCOVERY_SHIFT) & 0xFF,
+                        discriminator=(value >> QR_DISCRIMINATOR_SHIFT) & 0xFFF,
+                        pincode=(value >> QR_PINCODE_SHIFT) & 0x7FFFFFF)
+
+
+def decode_manualcode(manualcode):
+    if len(manualcode) not in (MANUALCODE_SHORT_LEN, MANUALCODE_LONG_LEN) or not manualcode.isdigit():
+        raise ValueError('Invalid manual code length or characters: {}'.format(manualcode))
+    if check_digit(manualcode[:-1]) != manualcode[-1]:
+        raise ValueError('Invalid manual code check digit: {}'.format(manualcode))
+
+    chunk1 = int(manualcode[0])
+    chunk2 = int(manualcode[1:6])
+    chunk3 = int(manualcode[6:10])
+    vid_pid_present = (chunk1 >> 2) & 1
+    # The first digit of version 0 is below 8 and the length matches the vid_pid_present bit
+    if chunk1 > 7 or chunk2 >> 16 or chunk3 >> 13 or (len(manualcode) == MANUALCODE_LONG_LEN) != bool(vid_pid_present):
+        raise ValueError('Invalid manual code: {}'.format(manualcode))
+
+    return ManualCodeFields(vid_pid_present=vid_pid_present,
+                            short_discriminator=((chunk1 & 3) << 2) | (chunk2 >> 14),
+                            pincode=(chunk3 << 14) | (chunk2 & 0x3FFF),
+                            vid=int(manualcode[10:15]) if vid_pid_present else None,
+                            pid=int(manualcode[15:20]) if vid_pid_present else None)
+
+
+def columns(*values):
+    # Sequences of the same length, scalars are repeated
+    values = [v.tolist() if hasattr(v, 'tolist') else v for v in values]
+    lengths = {len(v) for v in values if isinstance(v, (list, tuple, range))}
+    if len(lengths) != 1:
+        raise ValueError('Expected sequences of the same length, got lengths: {}'.format(sorted(lengths)))
+    return [v if isinstance(v, (list, tuple, range)) else repeat(v) for v in values]
+
+
+def generate_qrcodes(discriminators, pincodes, discovery=4, flow=STANDARD_FLOW, vid=0, pid=0):
+    return list(map(encode_qrcode, *columns(discriminators, pincodes, discovery, flow, vid, pid)))
+
+
+def generate_manualcodes(discriminators, pincodes, flow=STANDARD_FLOW, vid=0, pid=0):
+    return list(map(encode_manualcode, *columns(discriminators, pincodes, flow, vid, pid)))
+
+
+def parse_qrcodes(qrcodes):
+    return list(map(decode_qrcode, qrcodes))
+
+
+def parse_manualcodes(manualcodes):
+    return list(map(decode_manualcode, manualcodes))
+
+
+def parse_code(code):
+    if code.startswith(QRCODE_PREFIX):
+        return decode_qrcode(code)
+    return decode_manualcode(code)
+
+
+@click.group()
+def cli():
+    pass
+
+
+def device_options(command):
+    command = click.option('--vendor-id', '-vid', type=click.IntRange(0, 0xFFFF), default=0, help='Vendor ID')(command)
+    command = click.option('--product-id', '-pid', type=click.IntRange(0, 0xFFFF), default=0, help='Product ID')(command)
+    command = click.option('--discovery-cap-bitmask', '-dm', type=click.IntRange(0, 7), default=4,
+                           help='Commissionable device discovery capability bitmask. '
+                                '0:SoftAP, 1:BLE, 2:OnNetwork. Default: OnNetwork')(command)
+    command = click.option('--commissioning-flow', '-cf', type=click.IntRange(0, 2), default=0,
+                           help='Commissioning flow, 0:Standard, 1:User-Intent, 2:Custom')(command)
+    return command
+
+
+@cli.command()
+@click.argument('input', type=click.File('r'))
+@click.argument('output', type=click.File('w'))
+@click.option('--discriminator-column', default='Discriminator', show_default=True)
+@click.option('--passcode-column', default='PIN Code', show_default=True)
+@device_options
+def generate(input, output, discriminator_column, passcode_column, vendor_id, product_id, discovery_cap_bitmask,
+             commissioning_flow):
+    '''Adds the QR Code and Manual Code columns to the devices of a CSV file.'''
+    reader = csv.DictReader(input)
+    writer = csv.DictWriter(output, fieldnames=reader.fieldnames + ['QR Code', 'Manual Code'], lineterminator='\n')
+    writer.writeheader()
+    for row in reader:
+        discriminator = int(row[discriminator_column], 0)
+        passcode = int(row[passcode_column], 0)
+        row['QR Code'] = encode_qrcode(discriminator, passcode, discovery_cap_bitmask, commissioning_flow,
+                                       vendor_id, product_id)
+        row['Manual Code'] = encode_manualcode(discriminator, passcode, commissioning_flow, vendor_id, product_id)
+        writer.writerow(row)
+
+
+@cli.command()
+@click.argument('input', type=click.File('r'))
+@click.argument('output', type=click.File('w'))
+@click.option('--column', default='QR Code', show_default=True, help='Column of the QR codes or manual codes')
+def parse(input, output, column):
+    '''Parses the QR codes or manual codes of a column of a CSV file.'''
+    fields = ['Code', 'Version', 'Vendor Id', 'Product Id', 'Flow', 'Discovery', 'Discriminator', 'Short Discriminator',
+              'PIN Code', 'Error']
+    writer = csv.DictWriter(output, fieldnames=fields, lineterminator='\n')
+    writer.writeheader()
+    errors = 0
+    for row in csv.DictReader(input):
+        code = row[column]
+        try:
+            payload = parse_code(code)
+        except ValueError as e:
+            errors += 1
+            writer.writerow({'Code': code, 'Error': str(e)})
+            continue
+        if isinstance(payload, QRCodeFields):
+            writer.writerow({'Code': code, 'Version': payload.version, 'Vendor Id': payload.vid,
+                             'Product Id': payload.pid, 'Flow': payload.flow, 'Discovery': payload.discovery,
+                             'Discriminator': payload.discriminator, 'Short Discriminator': payload.discriminator >> 8,
+                             'PIN Code': payload.pincode})
+        else:
+            writer.writerow({'Code': code, 'Vendor Id': payload.vid, 'Product Id': payload.pid,
+                             'Flow': 2 if payload.vid_pid_present else 0,
+                             'Short Discriminator': payload.short_discriminator, 'PIN Code': payload.pincode})
+    if errors:
+        click.echo('{} invalid codes'.format(errors), err=True)
+        sys.exit(1)
+
+
+@cli.command()
+@click.argument('input', type=click.File('r'))
+@click.option('--discriminator-column', default='Discriminator', show_default=True)
+@click.option('--passcode-column', default='PIN Code', show_default=True)
+@click.option('--qrcode-column', default='QR Code', show_default=True)
+@click.option('--manualcode-column', default='Manual Code', show_default=True)
+@device_options
+def verify(input, discriminator_column, passcode_column, qrcode_column, manualcode_column, vendor_id, product_id,
+           discovery_cap_bitmask, commissioning_flow):
+    '''Checks the QR codes and manual codes of the devices of a CSV file, e.g. for a label audit.'''
+    count = 0
+    mismatches = 0
+    for line, row in enumerate(csv.DictReader(input), start=2):
+        count += 1
+        discriminator = int(row[discriminator_column], 0)
+        passcode = int(row[passcode_column], 0)
+        expected = (encode_qrcode(discriminator, passcode, discovery_cap_bitmask, commissioning_flow, vendor_id, product_id),
+                    encode_manualcode(discriminator, passcode, commissioning_flow, vendor_id, product_id))
+        if (row[qrcode_column], row[manualcode_column]) != expected:
+            mismatches += 1
+            click.echo('line {}: expected {} {}, got {} {}'.format(line, *expected, row[qrcode_column], row[manualcode_column]),
+                       err=True)
+    click.echo('{} devices, {} mismatches'.format(count, mismatches))
+    if mismatches:
+        sys.exit(1)
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+@cli.command()
+@click.option('--count', '-n', type=click.IntRange(1), default=100000, show_default=True, help='Number of payloads')
+@click.option('--check', type=click.IntRange(0), default=10000, show_default=True,
+              help='Number of payloads cross-checked against SetupPayload.py')
+@click.option('--seed', type=int, default=0, show_default=True)
+def benchmark(count, check, seed):
+    '''Measures the batch functions and cross-checks them against SetupPayload.py.'''
+    from SetupPayload import SetupPayload
+
+    rng = random.Random(seed)
+    discriminators = [rng.randrange(0x1000) for _ in range(count)]
+    pincodes = [rng.randrange(1, 0x5F5E0FF) for _ in range(count)]
+    discovery = [rng.randrange(8) for _ in range(count)]
+    flows = [rng.randrange(3) for _ in range(count)]
+    vids = [rng.randrange(0x10000) for _ in range(count)]
+    pids = [rng.randrange(0x10000) for _ in range(count)]
+
+    qrcodes, qrcode_time = timed(generate_qrcodes, discriminators, pincodes, discovery, flows, vids, pids)
+    manualcodes, manualcode_time = timed(generate_manualcodes, discriminators, pincodes, flows, vids, pids)
+    _, qrcode_parse_time = timed(parse_qrcodes, qrcodes)
+    _, manualcode_parse_time = timed(parse_manualcodes, manualcodes)
+
+    check = min(check, count)
+    payloads = [SetupPayload(discriminators[i], pincodes[i], discovery[i], flows[i], vids[i], pids[i]) for i in range(check)]
+    reference_qrcodes, reference_qrcode_time = timed(lambda: [p.generate_qrcode() for p in payloads])
+    reference_manualcodes, reference_manualcode_time = timed(lambda: [p.generate_manualcode() for p in payloads])
+    reference_parsed, reference_parse_time = timed(lambda: [SetupPayload.parse(c) for c in qrcodes[:check]])
+    _, reference_manualcode_parse_time = timed(lambda: [SetupPayload.parse(c) for c in manualcodes[:check]])
+
+    errors = 0
+    for i in range(check):
+        parsed_qrcode = decode_qrcode(qrcodes[i])
+        parsed_manualcode = decode_manualcode(manualcodes[i])
+        reference = reference_parsed[i]
+        if (qrcodes[i] != reference_qrcodes[i] or manualcodes[i] != reference_manualcodes[i]
+                or (parsed_qrcode.discriminator, parsed_qrcode.pincode, parsed_qrcode.discovery, parsed_qrcode.flow,
+                    parsed_qrcode.vid, parsed_qrcode.pid) != (reference.long_discriminator, reference.pincode,
+                                                              reference.discovery, int(reference.flow), reference.vid,
+                                                              reference.pid)
+                or (parsed_manualcode.short_discriminator, parsed_manualcode.pincode)
+                != (discriminators[i] >> 8, pincodes[i])):
+            errors += 1
+            click.echo('Mismatch for discriminator={} pincode={} discovery={} flow={} vid={} pid={}'.format(
+                discriminators[i], pincodes[i], discovery[i], flows[i], vids[i], pids[i]), err=True)
+
+    def rate(n, seconds):
+        return '{:>12,.0f} codes/s'.format(n / seconds) if seconds else '-'
+
+    click.echo('{:<24}{:>20}{:>20}'.format('', 'batch', 'SetupPayload.py'))
+    for name, batch_time, reference_time in [('QR code generation', qrcode_time, reference_qrcode_time),
+                                             ('Manual code generation', manualcode_time, reference_manualcode_time),
+                                             ('QR code parsing', qrcode_parse_time, reference_parse_time),
+                                             ('Manual code parsing', manualcode_parse_time,
+                                              reference_manualcode_parse_time)]:
+        click.echo('{:<24}{:>20}{:>20}'.format(name, rate(count, batch_time), rate(check, reference_time)))
+    click.echo('Cross-checked {} payloads against SetupPayload.py: {} mismatches'.format(check, errors))
+    if errors:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    cli()
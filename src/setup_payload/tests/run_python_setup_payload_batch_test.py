@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2026 Project CHIP Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Checks that SetupPayloadBatch.py generates and parses the same onboarding codes as SetupPayload.py.
+
+import itertools
+import os
+import sys
+
+CHIP_TOPDIR = os.path.dirname(os.path.realpath(__file__))[:-len(os.path.join('src', 'setup_payload', 'tests'))]
+sys.path.insert(0, os.path.join(CHIP_TOPDIR, 'src', 'setup_payload', 'python'))
+import SetupPayloadBatch  # noqa: E402
+from SetupPayload import CommissioningFlow, SetupPayload  # noqa: E402
+
+# Edge values of every field: the extremes, and the bits where the fields are split between manual code chunks
+DISCRIMINATORS = [0, 1, 0xFF, 0x100, 0x3FF, 0x400, 0xF00, 0xFFF]
+PASSCODES = [1, 0x3FFF, 0x4000, 20202021, 99999998, 0x7FFFFFF]
+DISCOVERY = [0, 2, 4, 7, 0xFF]
+FLOWS = [CommissioningFlow.Standard, CommissioningFlow.UserIntent, CommissioningFlow.Custom]
+VENDOR_PRODUCT_IDS = [(0, 0), (0xFFF1, 0x8000), (0xFFFF, 0xFFFF)]
+
+
+def payload_params():
+    for discriminator, passcode, discovery, flow, (vid, pid) in itertools.product(DISCRIMINATORS, PASSCODES, DISCOVERY, FLOWS,
+                                                                                  VENDOR_PRODUCT_IDS):
+        yield discriminator, passcode, discovery, int(flow), vid, pid
+
+
+def test_code_generation():
+    for discriminator, passcode, discovery, flow, vid, pid in payload_params():
+        reference = SetupPayload(discriminator, passcode, discovery, CommissioningFlow(flow), vid, pid)
+        assert SetupPayloadBatch.encode_qrcode(discriminator, passcode, discovery, flow, vid, pid) == reference.generate_qrcode()
+        assert SetupPayloadBatch.encode_manualcode(discriminator, passcode, flow, vid, pid) == reference.generate_manualcode()
+
+
+def test_batch_generation():
+    params = list(zip(*payload_params()))
+    discriminators, passcodes, discovery, flows, vids, pids = params
+    qrcodes = SetupPayloadBatch.generate_qrcodes(discriminators, passcodes, discovery, flows, vids, pids)
+    manualcodes = SetupPayloadBatch.generate_manualcodes(discriminators, passcodes, flows, vids, pids)
+    assert qrcodes == [SetupPayloadBatch.encode_qrcode(*p) for p in zip(*params)]
+    assert manualcodes == [SetupPayloadBatch.encode_manualcode(d, p, f, v, i) for d, p, _, f, v, i in zip(*params)]
+
+    # Scalars are repeated for every device
+    assert SetupPayloadBatch.generate_qrcodes(DISCRIMINATORS, 20202021, vid=0xFFF1, pid=0x8000) == [
+        SetupPayloadBatch.encode_qrcode(d, 20202021, vid=0xFFF1, pid=0x8000) for d in DISCRIMINATORS]
+
+
+def test_code_parsing():
+    for discriminator, passcode, discovery, flow, vid, pid in payload_params():
+        reference = SetupPayload(discriminator, passcode, discovery, CommissioningFlow(flow), vid, pid)
+
+        qrcode = reference.generate_qrcode()
+        parsed = SetupPayloadBatch.parse_code(qrcode)
+        expected = SetupPayload.parse(qrcode)
+        assert (parsed.discriminator, parsed.pincode, parsed.discovery, parsed.flow, parsed.vid, parsed.pid) == (
+            expected.long_discriminator, expected.pincode, expected.discovery, int(expected.flow), expected.vid, expected.pid)
+
+        manualcode = reference.generate_manualcode()
+        parsed = SetupPayloadBatch.parse_code(manualcode)
+        expected = SetupPayload.parse(manualcode)
+        assert (parsed.short_discriminator, parsed.pincode, parsed.vid, parsed.pid) == (
+            expected.short_discriminator, expected.pincode, expected.vid, expected.pid)
+        assert parsed.vid_pid_present == (flow != CommissioningFlow.Standard)
+
+
+def test_invalid_values():
+    for discriminator, passcode in [(0x1000, 20202021), (-1, 20202021), (3840, 0x8000000), (3840, -1)]:
+        for encode in (SetupPayloadBatch.encode_qrcode, SetupPayloadBatch.encode_manualcode):
+            try:
+                encode(discriminator, passcode)
+            except ValueError:
+                continue
+            raise AssertionError('{} accepted discriminator={} passcode={}'.format(encode.__name__, discriminator, passcode))
+
+    for code in ['MT:00000CQM00KA0648G0', 'MT:00000CQM00KA0648G0!', '34970112333', '3497011233']:
+        try:
+            SetupPayloadBatch.parse_code(code)
+        except ValueError:
+            continue
+        raise AssertionError('parse_code accepted {}'.format(code))
+
+
+def main():
+    test_code_generation()
+    test_batch_generation()
+    test_code_parsing()
+    test_invalid_values()
+
+
+if __name__ == '__main__':
+    main()